@@ -1,4 +1,4 @@
-metadata(version="0.1.0", description="Optional support for running `micropython -m mip`")
+metadata(version="0.2.0", description="Optional support for running `micropython -m mip`")
 
 require("argparse")
 require("mip")
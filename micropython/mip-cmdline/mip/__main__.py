@@ -27,6 +27,11 @@ def do_install():
         action="store_true",
         help="download as .py source files",
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="keep downloaded files in a local cache under the target",
+    )
     parser.add_argument("package", nargs="+")
     args = parser.parse_args(args=sys.argv[2:])
 
@@ -36,7 +41,7 @@ def do_install():
         version = None
         if "@" in package:
             package, version = package.split("@")
-        install(package, args.index, args.target, version, not args.no_mpy)
+        install(package, args.index, args.target, version, not args.no_mpy, args.cache)
 
 
 if len(sys.argv) >= 2:
@@ -1,4 +1,4 @@
-metadata(version="0.3.0", description="On-device package installer for network-capable boards")
+metadata(version="0.5.2", description="On-device package installer for network-capable boards")
 
 require("requests")
 
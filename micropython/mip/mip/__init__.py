@@ -2,12 +2,19 @@
 # MIT license; Copyright (c) 2022 Jim Mussared
 
 from micropython import const
-import requests
 import sys
 
 
 _PACKAGE_INDEX = const("https://micropython.org/pi/v2")
-_CHUNK_SIZE = 128
+_CHUNK_SIZE = const(1024)
+# Number of requests sent ahead of the response being read on a connection.
+_PIPELINE = const(4)
+# Default cache directory, relative to the install target.
+_CACHE_DIR = const(".mip-cache")
+# Record of installed files, relative to the install target.
+_MANIFEST = const(".mip-installed")
+# Suffix of files being downloaded, renamed into place once complete.
+_PART = const(".part")
 
 
 # This implements os.makedirs(os.dirname(path))
@@ -41,19 +48,23 @@ def _chunk(src, dest):
         dest(buf if n == _CHUNK_SIZE else buf[:n])
 
 
+def _short_hash(hs256, n):
+    import binascii
+
+    return str(binascii.hexlify(hs256.digest())[:n], "utf-8")
+
+
 # Check if the specified path exists and matches the hash.
 def _check_exists(path, short_hash):
     import os
 
     try:
-        import binascii
         import hashlib
 
         with open(path, "rb") as f:
             hs256 = hashlib.sha256()
             _chunk(f, hs256.update)
-            existing_hash = str(binascii.hexlify(hs256.digest())[: len(short_hash)], "utf-8")
-            return existing_hash == short_hash
+            return _short_hash(hs256, len(short_hash)) == short_hash
     except:
         return False
 
@@ -88,7 +99,208 @@ def _rewrite_url(url, branch=None):
     return url
 
 
+# Reads one response body from the connection: delimited by Content-Length,
+# chunked, or (length None) by the server closing the connection.
+class _Body:
+    def __init__(self, sock, length, chunked):
+        self._sock = sock
+        self._chunked = chunked
+        # Bytes left in the body, or in the current chunk.
+        self._left = 0 if chunked else length
+        self._done = length == 0 and not chunked
+
+    def readinto(self, buf):
+        if self._done:
+            return 0
+        s = self._sock
+        if self._chunked and not self._left:
+            line = s.readline()
+            if line == b"\r\n":
+                # End of the previous chunk.
+                line = s.readline()
+            n = int(line.split(b";", 1)[0].strip(), 16)
+            if not n:
+                # Skip any trailer.
+                while s.readline() not in (b"\r\n", b""):
+                    pass
+                self._done = True
+                return 0
+            self._left = n
+        mv = memoryview(buf)
+        if self._left is not None and self._left < len(mv):
+            mv = mv[: self._left]
+        n = s.readinto(mv)
+        if not n:
+            if self._left is not None:
+                raise OSError("connection closed")
+            self._done = True
+            return 0
+        if self._left is not None:
+            self._left -= n
+            if not self._left and not self._chunked:
+                self._done = True
+        return n
+
+    def read(self):
+        chunks = []
+        buf = bytearray(_CHUNK_SIZE)
+        while True:
+            n = self.readinto(buf)
+            if not n:
+                return b"".join(chunks)
+            chunks.append(bytes(buf[:n]))
+
+    def drain(self):
+        buf = bytearray(_CHUNK_SIZE)
+        while self.readinto(buf):
+            pass
+
+
+# A keep-alive HTTP/1.1 connection to one origin ("https://host[:port]"), on
+# which GET requests are pipelined so that the round trip of each request
+# overlaps with the transfer of the previous responses.
+class _Connection:
+    def __init__(self, origin):
+        proto, _, host = origin.split("/", 2)
+        self._tls = proto == "https:"
+        port = 443 if self._tls else 80
+        if ":" in host:
+            host, port = host.split(":", 1)
+            port = int(port)
+        self._host = host
+        self._port = port
+        self._sock = None
+
+    def _connect(self):
+        import socket
+
+        ai = socket.getaddrinfo(self._host, self._port, 0, socket.SOCK_STREAM)[0]
+        s = socket.socket(ai[0], socket.SOCK_STREAM, ai[2])
+        try:
+            s.connect(ai[-1])
+            if self._tls:
+                import tls
+
+                context = tls.SSLContext(tls.PROTOCOL_TLS_CLIENT)
+                context.verify_mode = tls.CERT_NONE
+                s = context.wrap_socket(s, server_hostname=self._host)
+        except:
+            s.close()
+            raise
+        self._sock = s
+
+    def close(self):
+        if self._sock:
+            self._sock.close()
+            self._sock = None
+
+    def _request(self, path, offset):
+        r = "GET /{} HTTP/1.1\r\nHost: {}\r\n".format(path, self._host)
+        if offset:
+            r += "Range: bytes={}-\r\n".format(offset)
+        self._sock.write((r + "\r\n").encode())
+
+    def _response(self):
+        s = self._sock
+        l = s.readline().split(None, 2)
+        if len(l) < 2:
+            raise OSError("connection closed")
+        status = int(l[1])
+        close = l[0] != b"HTTP/1.1"
+        length = None
+        chunked = False
+        while True:
+            l = s.readline()
+            if not l or l == b"\r\n":
+                break
+            k, v = l.split(b":", 1)
+            k = k.lower()
+            if k == b"content-length":
+                length = int(v.strip())
+            elif k == b"transfer-encoding":
+                chunked = b"chunked" in v.lower()
+            elif k == b"connection":
+                close = v.strip().lower() == b"close"
+        if length is None and not chunked:
+            # The body ends when the server closes the connection.
+            close = True
+        return status, _Body(s, length, chunked), close
+
+    # Request each (path, offset, arg) in items, from byte offset onwards, and
+    # call handler(arg, status, body) for each response, in order. The handler
+    # may read some or all of body.
+    def fetch(self, items, handler):
+        pending = list(items)
+        sent = 0
+        retried = False
+        while pending:
+            try:
+                if self._sock is None:
+                    self._connect()
+                    sent = 0
+                while sent < len(pending) and sent < _PIPELINE:
+                    self._request(pending[sent][0], pending[sent][1])
+                    sent += 1
+                status, body, close = self._response()
+            except OSError:
+                # The server may have closed an idle connection, or stopped
+                # accepting requests on it: resend the outstanding requests
+                # on a new connection, once.
+                self.close()
+                if retried:
+                    raise
+                retried = True
+                continue
+            retried = False
+            arg = pending.pop(0)[2]
+            sent -= 1
+            try:
+                handler(arg, status, body)
+                body.drain()
+            except:
+                self.close()
+                raise
+            if close:
+                self.close()
+
+
+# Open connections, by origin, for the duration of an install.
+_connections = {}
+
+
+# Fetch each of urls, calling handler(i, status, body) for urls[i]. Requests to
+# the same origin share one connection. If given, offsets[i] is the byte offset
+# in urls[i] to start from.
+def _fetch(urls, handler, offsets=None):
+    by_origin = {}
+    for i, url in enumerate(urls):
+        proto, _, host_path = url.partition("//")
+        host, _, path = host_path.partition("/")
+        origin = proto + "//" + host
+        if origin not in by_origin:
+            by_origin[origin] = []
+        by_origin[origin].append((path, offsets[i] if offsets else 0, i))
+    for origin, items in by_origin.items():
+        conn = _connections.get(origin)
+        if conn is None:
+            conn = _connections[origin] = _Connection(origin)
+        conn.fetch(items, handler)
+
+
+# Move the complete file tmp to dest.
+def _replace(tmp, dest):
+    import os
+
+    try:
+        os.remove(dest)
+    except OSError:
+        pass
+    os.rename(tmp, dest)
+
+
 def _download_file(url, dest):
+    import requests
+
     response = requests.get(url)
     try:
         if response.status_code != 200:
@@ -97,45 +309,223 @@ def _download_file(url, dest):
 
         print("Copying:", dest)
         _ensure_path_exists(dest)
-        with open(dest, "wb") as f:
+        with open(dest + _PART, "wb") as f:
             _chunk(response.raw, f.write)
+        _replace(dest + _PART, dest)
 
         return True
     finally:
         response.close()
 
 
-def _install_json(package_json_url, index, target, version, mpy):
-    response = requests.get(_rewrite_url(package_json_url, version))
+# Returns the parsed json at url, or None if it can't be fetched.
+def _download_json(url):
+    import requests
+
+    response = requests.get(url)
     try:
         if response.status_code != 200:
-            print("Package not found:", package_json_url)
-            return False
-
-        package_json = response.json()
+            return None
+        return response.json()
     finally:
         response.close()
-    for target_path, short_hash in package_json.get("hashes", ()):
-        fs_target_path = target + "/" + target_path
-        if _check_exists(fs_target_path, short_hash):
-            print("Exists:", fs_target_path)
-        else:
-            file_url = "{}/file/{}/{}".format(index, short_hash[:2], short_hash)
-            if not _download_file(file_url, fs_target_path):
-                print("File not found: {} {}".format(target_path, short_hash))
-                return False
-    for target_path, url in package_json.get("urls", ()):
-        fs_target_path = target + "/" + target_path
-        if not _download_file(_rewrite_url(url, version), fs_target_path):
-            print("File not found: {} {}".format(target_path, url))
-            return False
-    for dep, dep_version in package_json.get("deps", ()):
-        if not _install_package(dep, index, target, dep_version, mpy):
+
+
+# Copy the file at src to dest, returning False if src can't be read. If
+# short_hash is given, the copy is verified as it is written and, if it
+# doesn't match, src is removed and False returned.
+def _copy_file(src, dest, short_hash=None):
+    import os
+
+    hs256 = None
+    if short_hash:
+        import hashlib
+
+        hs256 = hashlib.sha256()
+    try:
+        with open(src, "rb") as fsrc:
+            _ensure_path_exists(dest)
+            with open(dest + _PART, "wb") as fdest:
+
+                def write(data):
+                    fdest.write(data)
+                    if hs256 is not None:
+                        hs256.update(data)
+
+                _chunk(fsrc, write)
+        if hs256 is not None and _short_hash(hs256, len(short_hash)) != short_hash:
+            print("Hash mismatch:", src)
+            os.remove(dest + _PART)
+            os.remove(src)
             return False
-    return True
+        _replace(dest + _PART, dest)
+        return True
+    except OSError:
+        return False
 
 
-def _install_package(package, index, target, version, mpy):
+# The manifest of a target has a line "short_hash size path" for each file
+# installed from the index, so that checking whether a file is already
+# installed needs a stat() rather than hashing it.
+def _load_manifest(target):
+    installed = {}
+    try:
+        with open(target + "/" + _MANIFEST) as f:
+            for line in f:
+                l = line.rstrip("\n").split(" ", 2)
+                if len(l) == 3:
+                    installed[l[2]] = (l[0], int(l[1]))
+    except (OSError, ValueError):
+        pass
+    return installed
+
+
+def _save_manifest(target, installed):
+    path = target + "/" + _MANIFEST
+    with open(path + _PART, "w") as f:
+        for name, (short_hash, size) in installed.items():
+            f.write("{} {} {}\n".format(short_hash, size, name))
+    _replace(path + _PART, path)
+
+
+def _file_size(path):
+    import os
+
+    try:
+        return os.stat(path)[6]
+    except OSError:
+        return -1
+
+
+# Download files, a list of (url, fs_target_path, short_hash or None), into
+# target, and store content-addressed ones in the cache directory (if given).
+# Each file is downloaded to a temporary file that is renamed into place once
+# its hash is verified. A temporary file left by an interrupted install is
+# resumed with a Range request.
+def _install_files(files, target, cache):
+    import hashlib
+
+    installed = _load_manifest(target)
+    changed = False
+    prefix_len = len(target) + 1
+    todo = []
+    offsets = []
+
+    try:
+        for url, fs_target_path, short_hash in files:
+            hs256 = None
+            offset = 0
+            if short_hash:
+                name = fs_target_path[prefix_len:]
+                record = installed.get(name)
+                if record and record[0] == short_hash:
+                    if _file_size(fs_target_path) == record[1]:
+                        print("Exists:", fs_target_path)
+                        continue
+                elif _check_exists(fs_target_path, short_hash):
+                    print("Exists:", fs_target_path)
+                    installed[name] = (short_hash, _file_size(fs_target_path))
+                    changed = True
+                    continue
+                if cache and _copy_file(cache + "/" + short_hash, fs_target_path, short_hash):
+                    print("Cached:", fs_target_path)
+                    installed[name] = (short_hash, _file_size(fs_target_path))
+                    changed = True
+                    continue
+                # Only files that can be verified by hash are resumed.
+                offset = max(_file_size(fs_target_path + _PART), 0)
+                if offset:
+                    hs256 = hashlib.sha256()
+                    with open(fs_target_path + _PART, "rb") as f:
+                        _chunk(f, hs256.update)
+            todo.append((url, fs_target_path, short_hash, hs256))
+            offsets.append(offset)
+
+        buf = memoryview(bytearray(_CHUNK_SIZE))
+        failed = []
+        retry = []
+        restart = []
+
+        def on_file(i, status, body):
+            nonlocal changed
+            url, fs_target_path, short_hash, hs256 = todo[i]
+            part = fs_target_path + _PART
+            if status == 206 and offsets[i]:
+                print("Resuming:", fs_target_path)
+                mode = "ab"
+            elif status == 200:
+                print("Copying:", fs_target_path)
+                mode = "wb"
+                hs256 = hashlib.sha256()
+            else:
+                if 300 <= status <= 399:
+                    # Let requests follow the redirect.
+                    retry.append(i)
+                elif status == 416 and offsets[i]:
+                    # The partial file can't be resumed, download all of it.
+                    restart.append(i)
+                else:
+                    print("Error", status, "requesting", url)
+                    failed.append(i)
+                return
+            _ensure_path_exists(fs_target_path)
+            with open(part, mode) as f:
+                while True:
+                    n = body.readinto(buf)
+                    if not n:
+                        break
+                    data = buf if n == _CHUNK_SIZE else buf[:n]
+                    f.write(data)
+                    hs256.update(data)
+            if short_hash and _short_hash(hs256, len(short_hash)) != short_hash:
+                import os
+
+                print("Hash mismatch:", fs_target_path)
+                os.remove(part)
+                failed.append(i)
+                return
+            _replace(part, fs_target_path)
+            if short_hash:
+                installed[fs_target_path[prefix_len:]] = (short_hash, _file_size(fs_target_path))
+                changed = True
+                if cache:
+                    _copy_file(fs_target_path, cache + "/" + short_hash)
+
+        _fetch([f[0] for f in todo], on_file, offsets)
+
+        if restart:
+            import os
+
+            for i in restart:
+                os.remove(todo[i][1] + _PART)
+                offsets[i] = 0
+            _fetch(
+                [todo[i][0] for i in restart],
+                lambda j, status, body: on_file(restart[j], status, body),
+            )
+
+        for i in retry:
+            url, fs_target_path, short_hash, _ = todo[i]
+            if not _download_file(url, fs_target_path) or (
+                short_hash and not _check_exists(fs_target_path, short_hash)
+            ):
+                failed.append(i)
+            elif short_hash:
+                installed[fs_target_path[prefix_len:]] = (short_hash, _file_size(fs_target_path))
+                changed = True
+    finally:
+        # Record whatever was installed, even if the install was interrupted.
+        if changed:
+            _save_manifest(target, installed)
+
+    for i in failed:
+        print("File not found: {} {}".format(todo[i][1], todo[i][2] or todo[i][0]))
+    return not failed
+
+
+# Returns the URL of the package json for package, or None if package is the
+# URL of a single .py/.mpy file.
+def _package_json_url(package, index, target, version, mpy):
     if (
         package.startswith("http://")
         or package.startswith("https://")
@@ -143,31 +533,81 @@ def _install_package(package, index, target, version, mpy):
         or package.startswith("gitlab:")
     ):
         if package.endswith(".py") or package.endswith(".mpy"):
-            print("Downloading {} to {}".format(package, target))
-            return _download_file(
-                _rewrite_url(package, version), target + "/" + package.rsplit("/")[-1]
-            )
-        else:
-            if not package.endswith(".json"):
-                if not package.endswith("/"):
-                    package += "/"
-                package += "package.json"
-            print("Installing {} to {}".format(package, target))
-    else:
-        if not version:
-            version = "latest"
-        print("Installing {} ({}) from {} to {}".format(package, version, index, target))
-
-        mpy_version = (
-            sys.implementation._mpy & 0xFF if mpy and hasattr(sys.implementation, "_mpy") else "py"
-        )
-
-        package = "{}/package/{}/{}/{}.json".format(index, mpy_version, package, version)
+            return None
+        if not package.endswith(".json"):
+            if not package.endswith("/"):
+                package += "/"
+            package += "package.json"
+        print("Installing {} to {}".format(package, target))
+        return _rewrite_url(package, version)
+
+    if not version:
+        version = "latest"
+    print("Installing {} ({}) from {} to {}".format(package, version, index, target))
+
+    mpy_version = (
+        sys.implementation._mpy & 0xFF if mpy and hasattr(sys.implementation, "_mpy") else "py"
+    )
+
+    return "{}/package/{}/{}/{}.json".format(index, mpy_version, package, version)
+
+
+# Install package and its dependencies. The package jsons of each level of
+# dependencies are fetched together, then all files are downloaded together.
+# A dependency shared by several packages is only installed once.
+def _install_package(package, index, target, version, mpy, cache=None):
+    import json
+
+    files = []
+    seen = set()
+    level = [(package, version)]
+    while level:
+        urls = []
+        versions = []
+        for package, version in level:
+            if (package, version) in seen:
+                continue
+            seen.add((package, version))
+            url = _package_json_url(package, index, target, version, mpy)
+            if url is None:
+                print("Downloading {} to {}".format(package, target))
+                dest = target + "/" + package.rsplit("/")[-1]
+                files.append((_rewrite_url(package, version), dest, None))
+            else:
+                urls.append(url)
+                versions.append(version)
+
+        package_jsons = [None] * len(urls)
+        retry = []
+
+        def on_json(i, status, body):
+            if status == 200:
+                package_jsons[i] = json.loads(body.read())
+            elif 300 <= status <= 399:
+                # Let requests follow the redirect.
+                retry.append(i)
+
+        _fetch(urls, on_json)
+
+        for i in retry:
+            package_jsons[i] = _download_json(urls[i])
+
+        level = []
+        for url, version, package_json in zip(urls, versions, package_jsons):
+            if package_json is None:
+                print("Package not found:", url)
+                return False
+            for target_path, short_hash in package_json.get("hashes", ()):
+                file_url = "{}/file/{}/{}".format(index, short_hash[:2], short_hash)
+                files.append((file_url, target + "/" + target_path, short_hash))
+            for target_path, url in package_json.get("urls", ()):
+                files.append((_rewrite_url(url, version), target + "/" + target_path, None))
+            level.extend(package_json.get("deps", ()))
 
-    return _install_json(package, index, target, version, mpy)
+    return _install_files(files, target, cache)
 
 
-def install(package, index=None, target=None, version=None, mpy=True):
+def install(package, index=None, target=None, version=None, mpy=True, cache=None):
     if not target:
         for p in sys.path:
             if p.endswith("/lib"):
@@ -180,7 +620,22 @@ def install(package, index=None, target=None, version=None, mpy=True):
     if not index:
         index = _PACKAGE_INDEX
 
-    if _install_package(package, index.rstrip("/"), target, version, mpy):
+    # cache=True keeps downloaded files in the default directory under target,
+    # so that reinstalling them needs no network access.
+    if cache is True:
+        cache = target + "/" + _CACHE_DIR
+
+    try:
+        ok = _install_package(package, index.rstrip("/"), target, version, mpy, cache)
+    except OSError as e:
+        print("Error:", e)
+        ok = False
+    finally:
+        for conn in _connections.values():
+            conn.close()
+        _connections.clear()
+
+    if ok:
         print("Done")
     else:
         print("Package may be partially installed")
@@ -1,4 +1,4 @@
-metadata(description="Simple XML tokenizer", version="0.2.1")
+metadata(description="Simple XML tokenizer and element tree", version="0.4.3")
 
 # Originally written by Paul Sokolovsky.
 
@@ -1,3 +1,4 @@
+import io
 import xmltok
 
 expected = [
@@ -23,3 +24,93 @@ ex = iter(expected)
 for i in xmltok.tokenize(open(dir + "/test.xml")):
     # print(i)
     assert i == next(ex)
+
+# Tokens must not depend on where the input is split into chunks.
+xml = open(dir + "/test.xml").read()
+for bufsize in (1, 2, 3, 7, 64):
+    assert list(xmltok.tokenize(open(dir + "/test.xml"), bufsize)) == expected
+
+
+# A token much longer than bufsize is read in growing pieces.
+class Reader:
+    def __init__(self, s):
+        self.f = io.StringIO(s)
+        self.reads = 0
+
+    def read(self, n):
+        self.reads += 1
+        return self.f.read(n)
+
+
+big = "x" * 100000
+r = Reader("<a>" + big + "</a>")
+assert list(xmltok.tokenize(r, 64)) == [
+    ("START_TAG", ("", "a")),
+    ("TEXT", big),
+    ("END_TAG", ("", "a")),
+]
+assert r.reads < 20, r.reads
+
+# Push mode, with bytes split inside a UTF-8 sequence.
+t = xmltok.XMLTokenizer(intern=True)
+data = xml.replace("foo", "föö").encode()
+tokens = []
+for i in range(0, len(data), 3):
+    tokens += t.feed(data[i : i + 3])
+t.close()
+assert tokens[8] == ("TEXT", "föö bar\n  baz\n  \n")
+assert tokens[:8] + tokens[9:] == expected[:8] + expected[9:]
+# Interned names are shared between tokens.
+assert tokens[2][1] is tokens[-1][1]
+
+# Element tree.
+root = xmltok.parse(open(dir + "/test.xml"))
+assert root.tag == "s:Envelope"
+assert root.get("s:encodingStyle") == "http://schemas.xmlsoap.org/soap/encoding/"
+assert root.findtext("Body/GetConnectionTypeInfo") == "foo bar\n  baz\n  \n"
+assert root.find("s:Body/*").get("xmlns:u") == "urn:schemas-upnp-org:service:WANIPConnection:1"
+assert root.find("Body/x:GetConnectionTypeInfo") is None
+
+doc = """<?xml version="1.0"?>
+<feed><title>t</title>
+<entry id="1"><name>a</name>tail1<sub><name>n</name></sub></entry>
+<entry id="2"><name>b</name></entry>
+<other><entry id="3"><name>c</name></entry></other>
+</feed>"""
+
+root = xmltok.parse(io.StringIO(doc))
+assert [e.get("id") for e in root.findall("entry")] == ["1", "2"]
+assert [e.get("id") for e in root.findall(".//entry")] == ["1", "2", "3"]
+assert [e.text for e in root.findall("entry/name")] == ["a", "b"]
+assert [e.text for e in root.findall("*/*/name")] == ["n", "c"]
+assert [e.text for e in root.iter("name")] == ["a", "n", "b", "c"]
+assert root[1][0].tail == "tail1"
+assert len(root) == 4
+
+events = [(ev, e.tag) for ev, e in xmltok.iterparse(io.StringIO(doc), ("start", "end"))]
+assert events[:4] == [("start", "feed"), ("start", "title"), ("end", "title"), ("start", "entry")]
+assert events[-1] == ("end", "feed")
+
+# Streaming matches: non-matching elements are dropped from the tree.
+found = []
+for e in xmltok.iterfind(io.StringIO(doc), "//entry"):
+    found.append((e.get("id"), e.findtext("name")))
+    e.clear()
+assert found == [("1", "a"), ("2", "b"), ("3", "c")]
+for e in xmltok.iterfind(io.StringIO(doc), "entry/sub/name"):
+    assert e.text == "n"
+
+# Text around a processing instruction inside an element is kept.
+root = xmltok.parse(io.StringIO('<a>hello<?pi x="1"?>world<b/>tail<?pi?>more</a>'))
+assert root.text == "helloworld"
+assert root[0].tail == "tailmore"
+
+# End tags must match their start tags.
+for bad in ("<a><b></a></b>", "<a></b>", "<a/></a>", "<x:a></y:a>"):
+    try:
+        xmltok.parse(io.StringIO(bad))
+    except xmltok.XMLSyntaxError:
+        pass
+    else:
+        raise AssertionError(bad)
+assert xmltok.parse(io.StringIO("<x:a><b/></x:a>")).tag == "x:a"
@@ -7,119 +7,191 @@ PI = "PI"
 ATTR = "ATTR"
 # ATTR_VAL = "ATTR_VAL"
 
+DEFAULT_BUFFER_SIZE = 1024
+
 
 class XMLSyntaxError(Exception):
     pass
 
 
+# Raised when a token continues past the end of the buffered data.
+class _NeedData(Exception):
+    pass
+
+
 class XMLTokenizer:
-    def __init__(self, f):
+    # The input is read in chunks of bufsize characters (or fed with feed())
+    # into a buffer, which is scanned by index; names, values and text are
+    # slices of it. A token that straddles the end of the buffer is scanned
+    # again once more data has arrived; tokenize() then reads at least as
+    # much again as is pending, so that a token much longer than bufsize is
+    # copied and scanned O(log n) rather than O(n / bufsize) times.
+    #
+    # If intern is true (or a dict, to share between tokenizers), each
+    # distinct tag/attribute name is returned as the same tuple object, so
+    # that documents with many repeated names use less memory.
+    def __init__(self, f=None, bufsize=DEFAULT_BUFFER_SIZE, intern=False):
         self.f = f
-        self.nextch()
+        self.bufsize = bufsize
+        self.names = {} if intern is True else intern or None
+        self.buf = ""
+        self.pos = 0
+        # Bytes of a UTF-8 sequence split across two chunks.
+        self.tail = b""
 
-    def curch(self):
-        return self.c
+    def _append(self, data):
+        if not isinstance(data, str):
+            if self.tail:
+                data = self.tail + data
+            # Hold back an incomplete UTF-8 sequence at the end.
+            end = len(data)
+            i = end - 1
+            while i > 0 and i > end - 4 and data[i] & 0xC0 == 0x80:
+                i -= 1
+            self.tail = b""
+            if i >= 0 and data[i] >= 0xC0:
+                need = 2 if data[i] < 0xE0 else 3 if data[i] < 0xF0 else 4
+                if end - i < need:
+                    self.tail = data[i:]
+                    data = data[:i]
+            data = str(data, "utf-8")
+        if self.pos:
+            self.buf = self.buf[self.pos :] + data
+            self.pos = 0
+        else:
+            self.buf += data
 
-    def getch(self):
-        c = self.c
-        self.nextch()
-        return c
+    def _skip_ws(self, pos):
+        buf = self.buf
+        n = len(buf)
+        while pos < n and buf[pos].isspace():
+            pos += 1
+        if pos == n:
+            raise _NeedData
+        return pos
 
-    def eof(self):
-        return self.c == ""
+    def _ident(self, pos):
+        buf = self.buf
+        n = len(buf)
+        pos = self._skip_ws(pos)
+        start = pos
+        while pos < n:
+            c = buf[pos]
+            if not (c.isalpha() or c.isdigit() or c in "_-."):
+                return start, pos
+            pos += 1
+        raise _NeedData
 
-    def nextch(self):
-        self.c = self.f.read(1)
-        if not self.c:
-            raise EOFError
-        return self.c
+    def _nsident(self, pos):
+        start, pos = self._ident(pos)
+        if self.buf[pos] == ":":
+            pos = self._ident(pos + 1)[1]
+        end = pos
+        names = self.names
+        if names is None:
+            return self._split_name(start, end), pos
+        raw = self.buf[start:end]
+        name = names.get(raw)
+        if name is None:
+            name = names[raw] = self._split_name(start, end)
+        return name, pos
 
-    def skip_ws(self):
-        while self.curch().isspace():
-            self.nextch()
+    def _split_name(self, start, end):
+        name = self.buf[start:end]
+        i = name.find(":")
+        if i < 0:
+            return ("", name)
+        return (name[:i], name[i + 1 :].lstrip())
 
-    def isident(self):
-        self.skip_ws()
-        return self.curch().isalpha()
+    def _expect(self, pos, c):
+        pos = self._skip_ws(pos)
+        if self.buf[pos] != c:
+            raise XMLSyntaxError
+        return pos + 1
 
-    def getident(self):
-        self.skip_ws()
-        ident = ""
+    def _attrs(self, pos, tokens):
+        buf = self.buf
         while True:
-            c = self.curch()
-            if not (c.isalpha() or c.isdigit() or c in "_-."):
-                break
-            ident += self.getch()
-        return ident
-
-    def getnsident(self):
-        ns = ""
-        ident = self.getident()
-        if self.curch() == ":":
-            self.nextch()
-            ns = ident
-            ident = self.getident()
-        return (ns, ident)
-
-    def match(self, c):
-        self.skip_ws()
-        if self.curch() == c:
-            self.nextch()
-            return True
-        return False
-
-    def expect(self, c):
-        if not self.match(c):
-            raise XMLSyntaxError
+            p = self._skip_ws(pos)
+            if not buf[p].isalpha():
+                return pos
+            attr, pos = self._nsident(p)
+            pos = self._expect(pos, "=")
+            pos = self._expect(pos, '"')
+            end = buf.find('"', pos)
+            if end < 0:
+                raise _NeedData
+            tokens.append((ATTR, attr, buf[pos:end]))
+            pos = end + 1
 
-    def lex_attrs_till(self):
-        while self.isident():
-            attr = self.getnsident()
-            # yield (ATTR, attr)
-            self.expect("=")
-            self.expect('"')
-            val = ""
-            while self.curch() != '"':
-                val += self.getch()
-            # yield (ATTR_VAL, val)
-            self.expect('"')
-            yield (ATTR, attr, val)
+    # Scan the token starting at pos, returning the list of tuples it
+    # produces and the position after it.
+    def _token(self, pos):
+        buf = self.buf
+        pos = self._skip_ws(pos)
+        if buf[pos] != "<":
+            end = buf.find("<", pos)
+            if end < 0:
+                raise _NeedData
+            return [(TEXT, buf[pos:end])], end
+        pos = self._skip_ws(pos + 1)
+        c = buf[pos]
+        if c == "/":
+            tag, pos = self._nsident(pos + 1)
+            return [(END_TAG, tag)], self._expect(pos, ">")
+        if c == "?":
+            start, pos = self._ident(pos + 1)
+            tokens = [(PI, buf[start:pos])]
+            pos = self._attrs(pos, tokens)
+            pos = self._expect(pos, "?")
+            return tokens, self._expect(pos, ">")
+        if c == "!":
+            pos = self._expect(pos + 1, "-")
+            pos = self._expect(pos, "-")
+            end = buf.find("-->", pos)
+            if end < 0:
+                raise _NeedData
+            return [], end + 3
+        tag, pos = self._nsident(pos)
+        tokens = [(START_TAG, tag)]
+        pos = self._attrs(pos, tokens)
+        pos = self._skip_ws(pos)
+        if buf[pos] == "/":
+            tokens.append((END_TAG, tag))
+            pos += 1
+        return tokens, self._expect(pos, ">")
 
-    def tokenize(self):
-        while not self.eof():
+    # Return the tokens that are complete in the buffer.
+    def _scan(self):
+        result = []
+        pos = self.pos
+        while True:
             try:
-                if self.match("<"):
-                    if self.match("/"):
-                        yield (END_TAG, self.getnsident())
-                        self.expect(">")
-                    elif self.match("?"):
-                        yield (PI, self.getident())
-                        yield from self.lex_attrs_till()
-                        self.expect("?")
-                        self.expect(">")
-                    elif self.match("!"):
-                        self.expect("-")
-                        self.expect("-")
-                        last3 = ""
-                        while True:
-                            last3 = last3[-2:] + self.getch()
-                            if last3 == "-->":
-                                break
-                    else:
-                        tag = self.getnsident()
-                        yield (START_TAG, tag)
-                        yield from self.lex_attrs_till()
-                        if self.match("/"):
-                            yield (END_TAG, tag)
-                        self.expect(">")
-                else:
-                    text = ""
-                    while self.curch() != "<":
-                        text += self.getch()
-                    if text:
-                        yield (TEXT, text)
-            except EOFError:
-                pass
+                tokens, pos = self._token(pos)
+            except _NeedData:
+                self.pos = pos
+                return result
+            result.extend(tokens)
+
+    def feed(self, data):
+        """Add data (str, or bytes in UTF-8) to the input and return a list
+        of the tokens completed by it."""
+        self._append(data)
+        return self._scan()
+
+    def close(self):
+        # As at the end of a file, an incomplete token is discarded.
+        self.buf = ""
+        self.pos = 0
+        self.tail = b""
+
+    def tokenize(self):
+        while True:
+            yield from self._scan()
+            data = self.f.read(max(self.bufsize, len(self.buf) - self.pos))
+            if not data:
+                return
+            self._append(data)
 
 
 def gfind(gen, pred):
@@ -144,5 +216,226 @@ def text_of(gen, tag):
     return val
 
 
-def tokenize(file):
-    return XMLTokenizer(file).tokenize()
+def tokenize(file, bufsize=DEFAULT_BUFFER_SIZE, intern=False):
+    return XMLTokenizer(file, bufsize, intern).tokenize()
+
+
+# Element tree, built incrementally from the tokens.
+
+
+class Element:
+    # tag is the qualified name ("ns:name", or "name" without a namespace);
+    # attrib maps qualified attribute names to values. text is the text
+    # before the first child and tail the text after the element's end tag.
+    __slots__ = ("tag", "attrib", "text", "tail", "_children")
+
+    def __init__(self, tag, attrib=None):
+        self.tag = tag
+        self.attrib = {} if attrib is None else attrib
+        self.text = None
+        self.tail = None
+        # Elements without children (the common case) share an empty tuple.
+        self._children = ()
+
+    def __repr__(self):
+        return "<Element %r>" % self.tag
+
+    def __len__(self):
+        return len(self._children)
+
+    def __iter__(self):
+        return iter(self._children)
+
+    def __getitem__(self, i):
+        return self._children[i]
+
+    def append(self, elem):
+        if not self._children:
+            self._children = []
+        self._children.append(elem)
+
+    def get(self, key, default=None):
+        return self.attrib.get(key, default)
+
+    def keys(self):
+        return self.attrib.keys()
+
+    def items(self):
+        return self.attrib.items()
+
+    def clear(self):
+        # Drop children, attributes and text, e.g. once an element returned
+        # by iterparse() has been processed.
+        self.attrib = {}
+        self.text = None
+        self.tail = None
+        self._children = ()
+
+    def iter(self, tag=None):
+        stack = [self]
+        while stack:
+            elem = stack.pop()
+            if tag is None or _tag_match(tag, elem.tag):
+                yield elem
+            stack.extend(reversed(elem._children))
+
+    def iterfind(self, path):
+        steps = _steps(path)
+        # Without "//" there is no need to look deeper than the path.
+        depth = len(steps) if "" not in steps else -1
+        stack = [(self, [])]
+        while stack:
+            elem, tags = stack.pop()
+            if tags and _match(steps, tags):
+                yield elem
+            if len(tags) != depth:
+                for child in reversed(elem._children):
+                    path = list(tags)
+                    path.append(child.tag)
+                    stack.append((child, path))
+
+    def findall(self, path):
+        return list(self.iterfind(path))
+
+    def find(self, path):
+        for elem in self.iterfind(path):
+            return elem
+        return None
+
+    def findtext(self, path, default=None):
+        elem = self.find(path)
+        if elem is None:
+            return default
+        return elem.text or ""
+
+
+# A path is a "/"-separated list of tags (or "*" for any tag), relative to
+# an element. "//" matches any number of levels. A tag without a namespace
+# prefix matches any namespace.
+def _steps(path):
+    steps = path.split("/")
+    while steps and steps[0] == ".":
+        steps.pop(0)
+    return steps
+
+
+def _tag_match(step, tag):
+    if step == "*" or step == tag:
+        return True
+    return ":" not in step and tag.endswith(step) and tag[-len(step) - 1] == ":"
+
+
+# Check whether tags, the tags of an element and its ancestors below the
+# element the path is relative to, matches steps.
+def _match(steps, tags, i=0, j=0):
+    while i < len(steps):
+        step = steps[i]
+        i += 1
+        if not step:
+            for k in range(j, len(tags) + 1):
+                if _match(steps, tags, i, k):
+                    return True
+            return False
+        if j == len(tags) or not _tag_match(step, tags[j]):
+            return False
+        j += 1
+    return j == len(tags)
+
+
+def iterparse(file, events=("end",), bufsize=DEFAULT_BUFFER_SIZE):
+    # Yield (event, elem) as each element starts ("start", once its
+    # attributes are known) or ends ("end", once its content is complete).
+    # Elements are added to their parent as they are parsed, so to keep
+    # memory use bounded clear() each one once processed.
+    want_start = "start" in events
+    want_end = "end" in events
+    qnames = {}
+    stack = []
+    # The element whose start tag is still being read, and the last element
+    # ended, which receives following text as its tail.
+    pending = None
+    last = None
+    for token in XMLTokenizer(file, bufsize, True).tokenize():
+        kind = token[0]
+        if kind == ATTR:
+            if pending is not None:
+                name = qnames.get(token[1])
+                if name is None:
+                    name = qnames[token[1]] = _qname(token[1])
+                pending.attrib[name] = token[2]
+            continue
+        if pending is not None:
+            if stack:
+                stack[-1].append(pending)
+            stack.append(pending)
+            if want_start:
+                yield "start", pending
+            pending = None
+        if kind == START_TAG:
+            name = qnames.get(token[1])
+            if name is None:
+                name = qnames[token[1]] = _qname(token[1])
+            pending = Element(name)
+            last = None
+        elif kind == END_TAG:
+            name = qnames.get(token[1])
+            if name is None:
+                name = _qname(token[1])
+            if not stack or stack[-1].tag != name:
+                raise XMLSyntaxError("mismatched end tag: " + name)
+            last = stack.pop()
+            if want_end:
+                yield "end", last
+        elif kind == TEXT:
+            if stack:
+                if last is not None:
+                    last.tail = last.tail + token[1] if last.tail else token[1]
+                else:
+                    top = stack[-1]
+                    top.text = top.text + token[1] if top.text else token[1]
+
+
+def _qname(name):
+    return name[0] + ":" + name[1] if name[0] else name[1]
+
+
+def parse(file, bufsize=DEFAULT_BUFFER_SIZE):
+    # Return the root element of the document.
+    root = None
+    for event, elem in iterparse(file, ("start",), bufsize):
+        if root is None:
+            root = elem
+    return root
+
+
+def iterfind(file, path, bufsize=DEFAULT_BUFFER_SIZE):
+    # Yield the elements of the document matching path (relative to the root
+    # element) as each one ends. Other elements are detached from the tree
+    # once they end, unless inside a match, so memory use is bounded by the
+    # size of a match plus the depth of the document.
+    steps = _steps(path)
+    elems = []
+    # Tags of the open elements below the root, and whether each open
+    # element matches.
+    tags = []
+    matches = []
+    inside = 0
+    for event, elem in iterparse(file, ("start", "end"), bufsize):
+        if event == "start":
+            matched = False
+            if elems:
+                tags.append(elem.tag)
+                matched = _match(steps, tags)
+            elems.append(elem)
+            matches.append(matched)
+            inside += matched
+            continue
+        elems.pop()
+        if matches.pop():
+            inside -= 1
+            yield elem
+        if elems:
+            tags.pop()
+            if not inside:
+                # elem is the last child of its parent.
+                elems[-1]._children.pop()
@@ -31,3 +31,4 @@ from ._decoder import loads
 from ._encoder import CBOREncoder
 from ._encoder import dump
 from ._encoder import dumps
+from ._encoder import dump_into
@@ -159,8 +159,17 @@ def decode_simple_value(decoder):
 
 
 def decode_float16(decoder):
-    decoder.read(2)
-    raise NotImplementedError  # no float16 unpack function
+    # struct has no "e" format on all ports; see RFC 7049 appendix D.
+    half = struct.unpack(">H", decoder.read(2))[0]
+    exp = (half >> 10) & 0x1F
+    mant = half & 0x3FF
+    if exp == 0:
+        value = mant * 2.0**-24
+    elif exp != 31:
+        value = (mant + 1024) * 2.0 ** (exp - 25)
+    else:
+        value = float("inf") if mant == 0 else float("nan")
+    return -value if half & 0x8000 else value
 
 
 def decode_float32(decoder):
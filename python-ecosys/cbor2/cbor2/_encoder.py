@@ -46,8 +46,35 @@ def encode_length(major_tag, length):
 
 
 def encode_semantic(encoder, tag, value):
-    encoder.write(encode_length(0xC0, tag))
-    encoder.encode(value)
+    encoder.write_head(0xC0, tag)
+    encoder.encode_value(value)
+
+
+# The largest finite float32; packing anything bigger as ">f" overflows.
+_FLT_MAX = 3.4028234663852886e38
+
+
+def _float16(bits):
+    # Return the float16 encoding of the float32 with the given bits, or None
+    # if it can't be represented exactly.  struct has no "e" format on all
+    # ports, so this is done by hand.
+    sign = (bits >> 16) & 0x8000
+    exp = ((bits >> 23) & 0xFF) - 127
+    mant = bits & 0x7FFFFF
+    if not bits & 0x7FFFFFFF:
+        return sign
+    if -14 <= exp <= 15:
+        if mant & 0x1FFF:
+            return None
+        return sign | (exp + 15) << 10 | mant >> 13
+    if -24 <= exp < -14:
+        # Subnormal: the whole significand shifted into the 10-bit field.
+        mant |= 0x800000
+        shift = -1 - exp
+        if mant & ((1 << shift) - 1):
+            return None
+        return sign | mant >> shift
+    return None
 
 
 def encode_float(encoder, value):
@@ -58,8 +85,20 @@ def encode_float(encoder, value):
         encoder.write(b"\xf9\x7e\x00")
     elif math.isinf(value):
         encoder.write(b"\xf9\x7c\x00" if value > 0 else b"\xf9\xfc\x00")
+    elif encoder.canonical and -_FLT_MAX <= value <= _FLT_MAX:
+        # Canonical mode uses the shortest of float16, float32 and float64
+        # that preserves the value (RFC 7049 section 3.9).
+        packed = struct.pack(">f", value)
+        if struct.unpack(">f", packed)[0] != value:
+            encoder.write_struct(">Bd", 9, 0xFB, value)
+            return
+        half = _float16(struct.unpack(">I", packed)[0])
+        if half is None:
+            encoder.write_struct(">Bf", 5, 0xFA, value)
+        else:
+            encoder.write_struct(">BH", 3, 0xF9, half)
     else:
-        encoder.write(struct.pack(">Bd", 0xFB, value))
+        encoder.write_struct(">Bd", 9, 0xFB, value)
 
 
 def encode_int(encoder, value):
@@ -79,35 +118,49 @@ def encode_int(encoder, value):
         payload = bytes(values)
         encode_semantic(encoder, major_type, payload)
     elif value >= 0:
-        encoder.write(encode_length(0, value))
+        encoder.write_head(0, value)
     else:
-        encoder.write(encode_length(0x20, abs(value) - 1))
+        encoder.write_head(0x20, -1 - value)
 
 
 def encode_bytestring(encoder, value):
-    encoder.write(encode_length(0x40, len(value)) + value)
+    encoder.write_head(0x40, len(value))
+    encoder.write(value)
 
 
 def encode_bytearray(encoder, value):
-    encode_bytestring(encoder, bytes(value))
+    encode_bytestring(encoder, value)
 
 
 def encode_string(encoder, value):
     encoded = value.encode("utf-8")
-    encoder.write(encode_length(0x60, len(encoded)) + encoded)
+    encoder.write_head(0x60, len(encoded))
+    encoder.write(encoded)
+
+
+def _canonical_key(item):
+    # RFC 7049 section 3.9: shorter encoded keys sort first, then bytewise.
+    return len(item[0]), item[0]
 
 
 def encode_map(encoder, value):
-    encoder.write(encode_length(0xA0, len(value)))
-    for key, val in value.items():
-        encoder.encode(key)
-        encoder.encode(val)
+    encoder.write_head(0xA0, len(value))
+    if encoder.canonical:
+        items = [(encoder.encode_to_bytes(key), val) for key, val in value.items()]
+        items.sort(key=_canonical_key)
+        for key, val in items:
+            encoder.write(key)
+            encoder.encode_value(val)
+    else:
+        for key, val in value.items():
+            encoder.encode_value(key)
+            encoder.encode_value(val)
 
 
 def encode_array(encoder, value):
-    encoder.write(encode_length(0x80, len(value)))
+    encoder.write_head(0x80, len(value))
     for item in value:
-        encoder.encode(item)
+        encoder.encode_value(item)
 
 
 def encode_boolean(encoder, value):
@@ -127,38 +180,167 @@ cbor_encoders = {  # supported data types and the encoder to use.
     bool: encode_boolean,
     type(None): encode_none,
     list: encode_array,
+    tuple: encode_array,
     dict: encode_map,
 }
 
+# Encoders resolved for subclasses of the types in cbor_encoders (e.g. OrderedDict).
+_subclass_encoders = {}
+
 
 class CBOREncoder(object):
     """
     Serializes objects to a byte stream using Concise Binary Object Representation.
+
+    Output is accumulated in an internal buffer of ``bufsize`` bytes and written to ``fp``
+    when the buffer fills or when a top-level :meth:`encode` completes.
+
+    :param fp: a file-like object to write to, or None to only encode into buffers
+    :param bool canonical: sort map keys and use the shortest float encoding (float16,
+        float32 or float64) so that
+        equal values always produce identical output (e.g. for signed payloads)
+    :param int bufsize: initial size of the internal write buffer
     """
 
-    def __init__(self, fp):
+    def __init__(self, fp=None, canonical=False, bufsize=256):
         self.fp = fp
-
-    def _find_encoder(self, obj):
-        return cbor_encoders[type(obj)]
+        self.canonical = canonical
+        self._buf = bytearray(bufsize)
+        self._pos = 0
+
+    def _find_encoder(self, obj_type):
+        encoder = _subclass_encoders.get(obj_type)
+        if encoder is None:
+            for base, base_encoder in cbor_encoders.items():
+                if issubclass(obj_type, base):
+                    encoder = _subclass_encoders[obj_type] = base_encoder
+                    break
+        return encoder
+
+    def _reserve(self, size):
+        # Make room for size bytes at the current position and return that position.
+        pos = self._pos
+        if pos + size > len(self._buf):
+            if self.fp is not None:
+                self.flush()
+                pos = 0
+            if pos + size > len(self._buf):
+                buf = self._buf
+                if not isinstance(buf, bytearray):
+                    raise CBOREncodeError("output buffer too small")
+                buf.extend(bytes(max(pos + size, 2 * len(buf)) - len(buf)))
+        return pos
 
     def write(self, data):
         """
         Write bytes to the data stream.
         :param data: the bytes to write
         """
-        self.fp.write(data)
+        size = len(data)
+        if self.fp is not None and size > len(self._buf):
+            # Too big to be worth buffering.
+            self.flush()
+            self.fp.write(data)
+            return
+        pos = self._reserve(size)
+        self._buf[pos : pos + size] = data
+        self._pos = pos + size
+
+    def write_struct(self, fmt, size, *values):
+        """
+        Pack values directly into the data stream.
+        :param str fmt: the struct format
+        :param int size: the packed size of fmt
+        """
+        pos = self._reserve(size)
+        struct.pack_into(fmt, self._buf, pos, *values)
+        self._pos = pos + size
 
-    def encode(self, obj):
+    def write_head(self, major_tag, length):
         """
-        Encode the given object using CBOR.
+        Write the initial byte of a data item and its length (or value) argument.
+        :param int major_tag: the major type, shifted into the upper 3 bits
+        :param int length: the argument, 0 to 2 ** 64 - 1
+        """
+        if length < 24:
+            pos = self._reserve(1)
+            self._buf[pos] = major_tag | length
+            self._pos = pos + 1
+        elif length < 256:
+            self.write_struct(">BB", 2, major_tag | 24, length)
+        elif length < 65536:
+            self.write_struct(">BH", 3, major_tag | 25, length)
+        elif length < 4294967296:
+            self.write_struct(">BL", 5, major_tag | 26, length)
+        else:
+            self.write_struct(">BQ", 9, major_tag | 27, length)
+
+    def flush(self):
+        """
+        Write any buffered bytes to the output file.
+        """
+        if self._pos:
+            self.fp.write(memoryview(self._buf)[: self._pos])
+            self._pos = 0
+
+    def encode_value(self, obj):
+        """
+        Encode the given object into the buffer without flushing it.
         :param obj: the object to encode
         """
-        encoder = self._find_encoder(obj)
+        obj_type = type(obj)
+        encoder = cbor_encoders.get(obj_type) or self._find_encoder(obj_type)
         if not encoder:
-            raise CBOREncodeError("cannot serialize type %s" % type(obj))
+            raise CBOREncodeError("cannot serialize type %s" % obj_type)
         encoder(self, obj)
 
+    def encode(self, obj):
+        """
+        Encode the given object using CBOR.
+        :param obj: the object to encode
+        """
+        self.encode_value(obj)
+        if self.fp is not None:
+            self.flush()
+
+    def encode_to_bytes(self, obj):
+        """
+        Encode the given object and return the result instead of writing it.
+        :param obj: the object to encode
+        :rtype: bytes
+        """
+        fp = self.fp
+        start = self._pos
+        self.fp = None
+        try:
+            self.encode_value(obj)
+            return bytes(self._buf[start : self._pos])
+        finally:
+            self.fp = fp
+            self._pos = start
+
+    def encode_into(self, obj, buf, offset=0):
+        """
+        Encode the given object directly into a caller-supplied buffer.
+
+        A bytearray is extended if the output does not fit; any other writable buffer
+        raises :class:`CBOREncodeError` instead.
+        :param obj: the object to encode
+        :param buf: the buffer to write to
+        :param int offset: the position in buf to start writing at
+        :return: the offset just past the encoded output
+        :rtype: int
+        """
+        saved = self.fp, self._buf, self._pos
+        self.fp = None
+        self._buf = buf
+        self._pos = offset
+        try:
+            self.encode_value(obj)
+            return self._pos
+        finally:
+            self.fp, self._buf, self._pos = saved
+
 
 def dumps(obj, **kwargs):
     """
@@ -168,9 +350,9 @@ def dumps(obj, **kwargs):
     :return: the serialized output
     :rtype: bytes
     """
-    fp = io.BytesIO()
-    dump(obj, fp, **kwargs)
-    return fp.getvalue()
+    encoder = CBOREncoder(None, **kwargs)
+    encoder.encode_value(obj)
+    return bytes(memoryview(encoder._buf)[: encoder._pos])
 
 
 def dump(obj, fp, **kwargs):
@@ -181,3 +363,18 @@ def dump(obj, fp, **kwargs):
     :param kwargs: keyword arguments passed to :class:`~.CBOREncoder`
     """
     CBOREncoder(fp, **kwargs).encode(obj)
+
+
+def dump_into(obj, buf, offset=0, **kwargs):
+    """
+    Serialize an object into a preallocated buffer.
+
+    Re-encoding a fixed-shape object into the same buffer performs no buffer allocation.
+    :param obj: the object to serialize
+    :param buf: a bytearray (extended as needed) or other writable buffer
+    :param int offset: the position in buf to start writing at
+    :param kwargs: keyword arguments passed to :class:`~.CBOREncoder`
+    :return: the offset just past the serialized output
+    :rtype: int
+    """
+    return CBOREncoder(None, bufsize=0, **kwargs).encode_into(obj, buf, offset)
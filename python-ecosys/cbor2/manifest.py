@@ -1,3 +1,3 @@
-metadata(version="1.0.0", pypi="cbor2")
+metadata(version="1.2.0", pypi="cbor2")
 
 package("cbor2")
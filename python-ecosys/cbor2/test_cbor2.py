@@ -0,0 +1,89 @@
+import io
+import struct
+from collections import OrderedDict
+
+import cbor2
+
+# Canonical map keys sort by encoded length, then bytewise.
+value = {"bb": 1, 10: 2, "a": 3, -1: 4, 1000: 5}
+data = cbor2.dumps(value, canonical=True)
+assert data == bytes.fromhex("a50a0220046161031903e80562626201")
+assert list(cbor2.loads(data)) == [10, -1, "a", 1000, "bb"]
+assert cbor2.loads(data) == value
+assert cbor2.dumps(OrderedDict(reversed(list(value.items()))), canonical=True) == data
+
+# Canonical floats use the shortest exact form: float16, float32 or float64.
+for x, encoded in (
+    (1.5, "f93e00"),
+    (-0.0, "f98000"),
+    (65504.0, "f97bff"),
+    (2.0**-14, "f90400"),
+    (2.0**-24, "f90001"),
+    (-3 * 2.0**-24, "f98003"),
+    (65520.0, "fa477ff000"),
+    (2.0**-25, "fa33000000"),
+    (100000.0, "fa47c35000"),
+):
+    assert cbor2.dumps(x, canonical=True) == bytes.fromhex(encoded), x
+    assert cbor2.loads(bytes.fromhex(encoded)) == x
+assert cbor2.dumps(1.5) == b"\xfb" + struct.pack(">d", 1.5)
+assert cbor2.dumps(0.1, canonical=True) == b"\xfb" + struct.pack(">d", 0.1)
+for x in (1e300, -1e300, 3.5e38, 1.7976931348623157e308):
+    assert cbor2.dumps(x, canonical=True) == b"\xfb" + struct.pack(">d", x), x
+    assert cbor2.loads(cbor2.dumps(x, canonical=True)) == x
+assert cbor2.dumps(float("inf"), canonical=True) == b"\xf9\x7c\x00"
+assert cbor2.dumps(float("nan"), canonical=True) == b"\xf9\x7e\x00"
+assert cbor2.loads(b"\xf9\xfc\x00") == float("-inf")
+
+# dump_into() writes at an offset and extends a bytearray as needed.
+value = [1, "two", b"three", {"four": 4.0}, None, True]
+expected = cbor2.dumps(value)
+buf = bytearray(4)
+end = cbor2.dump_into(value, buf, 2)
+assert end == 2 + len(expected)
+assert buf[2:end] == expected
+assert cbor2.dump_into(value, buf, 2) == end
+
+# A fixed-size buffer that is too small raises instead of growing.
+buf = memoryview(bytearray(4))
+try:
+    cbor2.dump_into(value, buf)
+except cbor2._encoder.CBOREncodeError:
+    pass
+else:
+    raise AssertionError("expected CBOREncodeError")
+buf = bytearray(len(expected))
+assert cbor2.dump_into(value, memoryview(buf)) == len(expected)
+assert buf == expected
+
+
+# Subclasses of supported types encode as their base type, and repeatedly.
+class MyList(list):
+    pass
+
+
+class MyBytes(bytearray):
+    pass
+
+
+for _ in range(2):
+    assert cbor2.dumps(MyList([1, 2])) == cbor2.dumps([1, 2])
+    assert cbor2.dumps(MyBytes(b"ab")) == cbor2.dumps(b"ab")
+    assert cbor2.dumps(OrderedDict([("a", 1)])) == cbor2.dumps({"a": 1})
+assert cbor2._encoder._subclass_encoders[MyList] is cbor2._encoder.encode_array
+try:
+    cbor2.dumps(object())
+except cbor2._encoder.CBOREncodeError:
+    pass
+else:
+    raise AssertionError("expected CBOREncodeError")
+
+# Buffered output is written once per top-level dump, whatever bufsize is.
+big = ["x" * 100] * 50
+for bufsize in (0, 16, 256, 10000):
+    fp = io.BytesIO()
+    cbor2.dump(big, fp, bufsize=bufsize)
+    assert fp.getvalue() == cbor2.dumps(big)
+    assert cbor2.loads(fp.getvalue()) == big
+
+print("OK")
@@ -3,15 +3,161 @@
 
 _WBITS = const(15)
 
-import builtins, io, deflate
+# Header flag bits.
+_FHCRC = const(2)
+_FEXTRA = const(4)
+_FNAME = const(8)
+_FCOMMENT = const(16)
 
+import binascii, builtins, io, deflate
 
-def GzipFile(fileobj):
-    return deflate.DeflateIO(fileobj, deflate.GZIP, _WBITS)
+
+class BadGzipFile(OSError):
+    pass
+
+
+def _read_exact(f, n):
+    data = b""
+    while len(data) < n:
+        chunk = f.read(n - len(data))
+        if not chunk:
+            raise EOFError("Compressed file ended before the end-of-stream marker was reached")
+        data += chunk
+    return data
+
+
+def _skip_string(f):
+    while _read_exact(f, 1) != b"\0":
+        pass
+
+
+def _read_header(f):
+    # Read a member header, returning False at a clean end of input.  Zero
+    # padding between members is skipped.
+    b = f.read(1)
+    while b == b"\0":
+        b = f.read(1)
+    if not b:
+        return False
+    header = b + _read_exact(f, 9)
+    if header[:2] != b"\x1f\x8b":
+        raise BadGzipFile("Not a gzipped file")
+    if header[2] != 8:
+        raise BadGzipFile("Unknown compression method")
+    flags = header[3]
+    if flags & _FEXTRA:
+        xlen = _read_exact(f, 2)
+        _read_exact(f, xlen[0] | xlen[1] << 8)
+    if flags & _FNAME:
+        _skip_string(f)
+    if flags & _FCOMMENT:
+        _skip_string(f)
+    if flags & _FHCRC:
+        _read_exact(f, 2)
+    return True
+
+
+class GzipFile:
+    # Reading parses each member's header and trailer here and decompresses
+    # the raw deflate data directly from fileobj, so any stream (including a
+    # socket) works and members are read one after another.  The file is
+    # opened for reading or writing by the first read or write call unless
+    # mode is given.
+    def __init__(self, filename=None, mode=None, compresslevel=9, fileobj=None, mtime=None):
+        if fileobj is None and not isinstance(filename, (str, bytes)):
+            # GzipFile(fileobj), as accepted by earlier versions.
+            fileobj = filename
+        self._close_fileobj = fileobj is None
+        if fileobj is None:
+            fileobj = builtins.open(filename, mode or "rb")
+        self.fileobj = fileobj
+        self.mode = mode
+        self._member = None
+        self._writer = None
+        self._eof = False
+        self._crc = 0
+        self._size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _read_member(self, size):
+        # Read up to size bytes (all if negative) from the current member,
+        # moving on to the next member as each one ends.
+        while not self._eof:
+            if self._member is None:
+                if not _read_header(self.fileobj):
+                    self._eof = True
+                    break
+                self._member = deflate.DeflateIO(self.fileobj, deflate.RAW, _WBITS)
+                self._crc = 0
+                self._size = 0
+            data = self._member.read(size) if size >= 0 else self._member.read()
+            if data:
+                return self._add(data)
+            self._read_trailer()
+        return b""
+
+    def _add(self, data):
+        self._crc = binascii.crc32(data, self._crc)
+        self._size += len(data)
+        return data
+
+    def _read_trailer(self):
+        # Check the member's CRC32 and ISIZE (its length modulo 2**32).
+        trailer = _read_exact(self.fileobj, 8)
+        if int.from_bytes(trailer[:4], "little") != self._crc:
+            raise BadGzipFile("CRC check failed")
+        if int.from_bytes(trailer[4:], "little") != self._size & 0xFFFFFFFF:
+            raise BadGzipFile("Incorrect length of data produced")
+        self._member = None
+
+    def read(self, size=-1):
+        if size >= 0:
+            return self._read_member(size)
+        chunks = []
+        while True:
+            data = self._read_member(-1)
+            if not data:
+                return b"".join(chunks)
+            chunks.append(data)
+
+    def readinto(self, buf):
+        data = self._read_member(len(buf))
+        buf[: len(data)] = data
+        return len(data)
+
+    def readline(self):
+        line = b""
+        while not line.endswith(b"\n"):
+            data = self._add(self._member.readline()) if self._member is not None else b""
+            if not data:
+                # Move on to the next member (or the end of input).
+                data = self._read_member(1)
+                if not data:
+                    break
+            line += data
+        return line
+
+    def write(self, data):
+        if self._writer is None:
+            self._writer = deflate.DeflateIO(self.fileobj, deflate.GZIP, _WBITS)
+        return self._writer.write(data)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self._member = None
+        if self._close_fileobj:
+            self.fileobj.close()
 
 
 def open(filename, mode="rb"):
-    return deflate.DeflateIO(builtins.open(filename, mode), deflate.GZIP, _WBITS, True)
+    return GzipFile(filename, mode)
 
 
 if hasattr(deflate.DeflateIO, "write"):
@@ -24,6 +170,5 @@ if hasattr(deflate.DeflateIO, "write"):
 
 
 def decompress(data):
-    f = io.BytesIO(data)
-    with GzipFile(fileobj=f) as g:
+    with GzipFile(fileobj=io.BytesIO(data)) as g:
         return g.read()
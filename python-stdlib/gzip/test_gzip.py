@@ -0,0 +1,67 @@
+import binascii
+import gzip
+import io
+import zlib
+
+a = b"first member\nsecond line\n" * 100
+b = bytes(range(256)) * 10 + b"\nlast line"
+
+
+def member(data, name=None):
+    # A gzip member, with a file name in its header if name is given.
+    c = zlib.compressobj(wbits=-15)
+    raw = c.compress(data) + c.flush()
+    header = b"\x1f\x8b\x08" + (b"\x08" if name else b"\x00") + bytes(6)
+    if name:
+        header += name + b"\0"
+    trailer = binascii.crc32(data).to_bytes(4, "little") + len(data).to_bytes(4, "little")
+    return header + raw + trailer
+
+
+# Concatenated members are read as one file, with zero padding between.
+archive = member(a) + member(b, b"b.bin") + bytes(16) + gzip.compress(a)
+assert gzip.decompress(archive) == a + b + a
+
+# GzipFile(fileobj) is still accepted positionally.
+with gzip.GzipFile(io.BytesIO(archive)) as f:
+    out = []
+    while True:
+        chunk = f.read(100)
+        if not chunk:
+            break
+        out.append(chunk)
+assert b"".join(out) == a + b + a
+
+# Lines run on across the end of a member.
+f = gzip.GzipFile(fileobj=io.BytesIO(archive))
+lines = []
+while True:
+    line = f.readline()
+    if not line:
+        break
+    lines.append(line)
+assert lines == [line + b"\n" for line in (a + b + a).split(b"\n")[:-1]]
+
+buf = bytearray(64)
+f = gzip.GzipFile(fileobj=io.BytesIO(member(a)))
+assert f.readinto(buf) == 64
+assert buf == a[:64]
+
+
+# A damaged trailer is an error.
+def expect(exc, data):
+    try:
+        gzip.decompress(data)
+    except exc:
+        pass
+    else:
+        raise AssertionError("expected %s" % exc.__name__)
+
+
+good = member(b)
+expect(gzip.BadGzipFile, good[:-8] + bytes([good[-8] ^ 1]) + good[-7:])
+expect(gzip.BadGzipFile, good[:-4] + bytes([good[-4] ^ 1]) + good[-3:])
+expect(gzip.BadGzipFile, member(a) + b"not gzip data")
+expect(EOFError, good[:-3])
+
+print("OK")
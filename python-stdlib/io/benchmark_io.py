@@ -0,0 +1,30 @@
+# Compare small-read throughput of a raw (unbuffered) file against the same
+# file wrapped in io.BufferedReader.
+import io
+import os
+import time
+
+FN = "benchmark_io.dat"
+LINES = 20000
+
+with open(FN, "wb") as f:
+    for i in range(LINES):
+        f.write(b"line %d of the benchmark file\n" % i)
+
+
+def run(name, f, op):
+    t = time.time()
+    n = 0
+    while op(f):
+        n += 1
+    t = time.time() - t
+    f.close()
+    print("%-24s %6d calls in %.3fs" % (name, n, t))
+
+
+run("raw read(16):", open(FN, "rb", 0), lambda f: f.read(16))
+run("buffered read(16):", io.BufferedReader(open(FN, "rb", 0)), lambda f: f.read(16))
+run("raw readline():", open(FN, "rb", 0), lambda f: f.readline())
+run("buffered readline():", io.BufferedReader(open(FN, "rb", 0)), lambda f: f.readline())
+
+os.unlink(FN)
@@ -3,3 +3,501 @@ from uio import *
 SEEK_SET = 0
 SEEK_CUR = 1
 SEEK_END = 2
+
+DEFAULT_BUFFER_SIZE = 8192
+
+# Buffered wrappers for raw streams (sockets, fds, files opened with
+# buffering=0, ...) so that many small reads or writes cost one call on the
+# raw stream per buffer_size bytes.  The raw stream must provide read()
+# (and readinto() for reads larger than the buffer) for reading, and
+# write() for writing; all may transfer fewer bytes than asked for.
+
+
+def _check_buffer_size(buffer_size):
+    if buffer_size <= 0:
+        raise ValueError("invalid buffer size")
+
+
+class _BufferedBase(IOBase):
+    def __init__(self, raw):
+        self.raw = raw
+
+    @property
+    def closed(self):
+        return getattr(self.raw, "closed", False)
+
+    def fileno(self):
+        return self.raw.fileno()
+
+    def seekable(self):
+        return hasattr(self.raw, "seek")
+
+    def readable(self):
+        return False
+
+    def writable(self):
+        return False
+
+    def flush(self):
+        pass
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            self.raw.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class BufferedReader(_BufferedBase):
+    def __init__(self, raw, buffer_size=DEFAULT_BUFFER_SIZE):
+        _check_buffer_size(buffer_size)
+        super().__init__(raw)
+        self.buffer_size = buffer_size
+        # Unread data is self._data[self._pos:].  It is kept as bytes, not in
+        # a bytearray, so that find() is available for readline().
+        self._data = b""
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def _fill(self):
+        # Replace the exhausted buffer with one raw read.  Returns the
+        # number of bytes now available, 0 at EOF or None if a non-blocking
+        # raw stream has no data.
+        data = self.raw.read(self.buffer_size)
+        self._pos = 0
+        if data is None:
+            self._data = b""
+            return None
+        self._data = data
+        return len(data)
+
+    def _take(self, n):
+        pos = self._pos
+        self._pos = pos + n
+        if not pos and n == len(self._data):
+            return self._data
+        return self._data[pos : pos + n]
+
+    def peek(self, size=0):
+        """Return buffered bytes without advancing the position, doing at
+        most one raw read if the buffer is empty."""
+        if self._pos == len(self._data):
+            self._fill()
+        return self._data[self._pos :]
+
+    def read1(self, size=-1):
+        """Read up to size bytes with at most one raw read."""
+        avail = len(self._data) - self._pos
+        if not avail:
+            if size >= self.buffer_size:
+                return self.raw.read(size)
+            avail = self._fill()
+            if not avail:
+                return None if avail is None else b""
+        if size < 0 or size > avail:
+            size = avail
+        return self._take(size)
+
+    def readinto1(self, b):
+        avail = len(self._data) - self._pos
+        if not avail:
+            if len(b) >= self.buffer_size:
+                return self.raw.readinto(b)
+            avail = self._fill()
+            if not avail:
+                return avail
+        n = min(avail, len(b))
+        b[:n] = self._take(n)
+        return n
+
+    def readinto(self, b):
+        """Read until b is full or at EOF, and return the number of bytes read."""
+        mv = memoryview(b)
+        size = len(mv)
+        # Buffered data first.
+        n = min(len(self._data) - self._pos, size)
+        if n:
+            mv[:n] = self._take(n)
+        r = 0
+        while n < size:
+            if size - n >= self.buffer_size:
+                # Large reads bypass the buffer.
+                r = self.raw.readinto(mv[n:])
+                if not r:
+                    break
+                n += r
+            else:
+                r = self._fill()
+                if not r:
+                    break
+                r = min(r, size - n)
+                mv[n : n + r] = self._take(r)
+                n += r
+        if not n and r is None:
+            return None
+        return n
+
+    def read(self, size=-1):
+        avail = len(self._data) - self._pos
+        if size is None or size < 0:
+            chunks = [self._take(avail)]
+            while True:
+                r = self._fill()
+                if not r:
+                    break
+                chunks.append(self._take(r))
+            if r is None and not avail and len(chunks) == 1:
+                return None
+            return b"".join(chunks)
+        if size <= avail:
+            # Fast path for small reads.
+            return self._take(size)
+        b = bytearray(size)
+        n = self.readinto(b)
+        if n is None:
+            return None
+        if n < size:
+            return bytes(memoryview(b)[:n])
+        return bytes(b)
+
+    def readline(self, size=-1):
+        chunks = []
+        while True:
+            pos = self._pos
+            data = self._data
+            if pos == len(data):
+                if not self._fill():
+                    break
+                pos = 0
+                data = self._data
+            i = data.find(b"\n", pos)
+            n = len(data) - pos if i < 0 else i + 1 - pos
+            if size >= 0 and n >= size:
+                chunks.append(self._take(size))
+                break
+            chunks.append(self._take(n))
+            if i >= 0:
+                break
+            if size >= 0:
+                size -= n
+        if len(chunks) == 1:
+            return chunks[0]
+        return b"".join(chunks)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+    def tell(self):
+        return self.raw.tell() - (len(self._data) - self._pos)
+
+    def seek(self, offset, whence=SEEK_SET):
+        if whence == SEEK_CUR:
+            offset -= len(self._data) - self._pos
+        self._data = b""
+        self._pos = 0
+        return self.raw.seek(offset, whence)
+
+
+class BufferedWriter(_BufferedBase):
+    def __init__(self, raw, buffer_size=DEFAULT_BUFFER_SIZE):
+        _check_buffer_size(buffer_size)
+        super().__init__(raw)
+        self._buf = bytearray(buffer_size)
+        self._mv = memoryview(self._buf)
+        # Pending data is self._buf[:self._len].
+        self._len = 0
+
+    def writable(self):
+        return True
+
+    def _write_raw(self, mv):
+        # Write all of mv to the raw stream.  Returns the number of bytes
+        # written if a non-blocking raw stream stops accepting data.
+        n = 0
+        size = len(mv)
+        while n < size:
+            r = self.raw.write(mv[n:])
+            if r is None:
+                return n
+            n += r
+        return n
+
+    def flush(self):
+        if self._len:
+            n = self._write_raw(self._mv[: self._len])
+            if n < self._len:
+                # Keep what could not be written yet.
+                self._mv[: self._len - n] = self._mv[n : self._len]
+                self._len -= n
+                raise OSError(11)  # EAGAIN
+            self._len = 0
+        if hasattr(self.raw, "flush"):
+            self.raw.flush()
+
+    def write(self, b):
+        n = len(b)
+        length = self._len
+        if length + n <= len(self._buf):
+            # Coalesce into the buffer.
+            self._mv[length : length + n] = b
+            self._len = length + n
+            return n
+        self.flush()
+        if n >= len(self._buf):
+            if self._write_raw(memoryview(b)) < n:
+                raise OSError(11)  # EAGAIN
+        else:
+            self._mv[:n] = b
+            self._len = n
+        return n
+
+    def tell(self):
+        return self.raw.tell() + self._len
+
+    def seek(self, offset, whence=SEEK_SET):
+        self.flush()
+        return self.raw.seek(offset, whence)
+
+
+class BufferedRandom(BufferedReader):
+    """Buffered reads and writes on a single seekable raw stream."""
+
+    def __init__(self, raw, buffer_size=DEFAULT_BUFFER_SIZE):
+        super().__init__(raw, buffer_size)
+        self._writer = BufferedWriter(raw, buffer_size)
+
+    def writable(self):
+        return True
+
+    def _sync_read(self):
+        self._writer.flush()
+
+    def _sync_write(self):
+        # Move the raw position back over read-ahead data before writing.
+        unread = len(self._data) - self._pos
+        if unread:
+            self.raw.seek(-unread, SEEK_CUR)
+        self._data = b""
+        self._pos = 0
+
+    def peek(self, size=0):
+        self._sync_read()
+        return super().peek(size)
+
+    def read1(self, size=-1):
+        self._sync_read()
+        return super().read1(size)
+
+    def readinto1(self, b):
+        self._sync_read()
+        return super().readinto1(b)
+
+    def readinto(self, b):
+        self._sync_read()
+        return super().readinto(b)
+
+    def read(self, size=-1):
+        self._sync_read()
+        return super().read(size)
+
+    def readline(self, size=-1):
+        self._sync_read()
+        return super().readline(size)
+
+    def write(self, b):
+        self._sync_write()
+        return self._writer.write(b)
+
+    def flush(self):
+        self._writer.flush()
+
+    def tell(self):
+        return super().tell() + self._writer._len
+
+    def seek(self, offset, whence=SEEK_SET):
+        self._writer.flush()
+        return super().seek(offset, whence)
+
+
+class BufferedRWPair(_BufferedBase):
+    """A buffered reader and writer on two raw streams, such as the two
+    ends of a pipe."""
+
+    def __init__(self, reader, writer, buffer_size=DEFAULT_BUFFER_SIZE):
+        super().__init__(reader)
+        self.reader = BufferedReader(reader, buffer_size)
+        self.writer = BufferedWriter(writer, buffer_size)
+
+    def readable(self):
+        return True
+
+    def writable(self):
+        return True
+
+    def peek(self, size=0):
+        return self.reader.peek(size)
+
+    def read1(self, size=-1):
+        return self.reader.read1(size)
+
+    def readinto(self, b):
+        return self.reader.readinto(b)
+
+    def read(self, size=-1):
+        return self.reader.read(size)
+
+    def readline(self, size=-1):
+        return self.reader.readline(size)
+
+    def __iter__(self):
+        return self.reader
+
+    def write(self, b):
+        return self.writer.write(b)
+
+    def flush(self):
+        self.writer.flush()
+
+    def close(self):
+        try:
+            self.writer.close()
+        finally:
+            self.reader.close()
+
+
+def _utf8_boundary(b):
+    # Return the length of the longest prefix of b that does not end in
+    # the middle of a UTF-8 sequence.
+    end = len(b)
+    i = end - 1
+    while i > 0 and i > end - 4 and b[i] & 0xC0 == 0x80:
+        i -= 1
+    if i >= 0:
+        lead = b[i]
+        if lead >= 0xC0:
+            need = 2 if lead < 0xE0 else 3 if lead < 0xF0 else 4
+            if end - i < need:
+                return i
+    return end
+
+
+class TextIOWrapper(IOBase):
+    """Text stream over a buffered binary stream, encoding and decoding
+    UTF-8 incrementally.  Line endings are not translated."""
+
+    def __init__(self, buffer, encoding=None, errors=None, newline=None, line_buffering=False):
+        if encoding is not None and encoding.replace("-", "").lower() not in ("utf8", "ascii"):
+            raise ValueError("unsupported encoding: %s" % encoding)
+        self.buffer = buffer
+        self.encoding = "utf-8"
+        self.errors = errors or "strict"
+        self.line_buffering = line_buffering
+        # Decoded text not yet returned, and the bytes of an incomplete
+        # character at the end of the last chunk read.
+        self._text = ""
+        self._tail = b""
+
+    @property
+    def closed(self):
+        return self.buffer.closed
+
+    def fileno(self):
+        return self.buffer.fileno()
+
+    def readable(self):
+        return self.buffer.readable()
+
+    def writable(self):
+        return self.buffer.writable()
+
+    def _decode(self, data, final=False):
+        if self._tail:
+            data = self._tail + data
+        n = len(data) if final else _utf8_boundary(data)
+        self._tail = data[n:]
+        return str(data[:n], "utf-8")
+
+    def _read_chunk(self):
+        # Decode one more chunk into self._text; False at EOF.
+        read1 = getattr(self.buffer, "read1", None)
+        data = read1(DEFAULT_BUFFER_SIZE) if read1 else self.buffer.read(DEFAULT_BUFFER_SIZE)
+        if not data:
+            if self._tail:
+                # Raises on the truncated character.
+                self._text += self._decode(b"", True)
+            return False
+        self._text += self._decode(data)
+        return True
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            text = self._text + self._decode(self.buffer.read() or b"", True)
+            self._text = ""
+            return text
+        while len(self._text) < size and self._read_chunk():
+            pass
+        text = self._text
+        self._text = text[size:]
+        return text[:size]
+
+    def readline(self, size=-1):
+        text = self._text
+        if text:
+            i = text.find("\n")
+            if i >= 0:
+                self._text = text[i + 1 :]
+                line = text[: i + 1]
+            else:
+                self._text = ""
+                line = text + self._decode(self.buffer.readline())
+        else:
+            # A whole line ends on a character boundary.
+            line = self._decode(self.buffer.readline())
+        if 0 <= size < len(line):
+            self._text = line[size:] + self._text
+            line = line[:size]
+        return line
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+    def write(self, s):
+        self.buffer.write(s.encode())
+        if self.line_buffering and "\n" in s:
+            self.buffer.flush()
+        return len(s)
+
+    def flush(self):
+        self.buffer.flush()
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            self.buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,151 @@
+import io
+import unittest
+
+
+class Raw(io.IOBase):
+    # A raw stream that returns at most `chunk` bytes per call and counts
+    # the calls made on it.
+    def __init__(self, data=b"", chunk=5):
+        self.data = bytearray(data)
+        self.pos = 0
+        self.chunk = chunk
+        self.calls = 0
+
+    def read(self, n=-1):
+        self.calls += 1
+        if n < 0:
+            n = len(self.data)
+        n = min(n, self.chunk)
+        b = bytes(self.data[self.pos : self.pos + n])
+        self.pos += len(b)
+        return b
+
+    def readinto(self, b):
+        data = self.read(len(b))
+        b[: len(data)] = data
+        return len(data)
+
+    def write(self, b):
+        self.calls += 1
+        b = bytes(b[: self.chunk])
+        self.data[self.pos : self.pos + len(b)] = b
+        self.pos += len(b)
+        return len(b)
+
+    def seek(self, offset, whence=0):
+        if whence == 1:
+            offset += self.pos
+        elif whence == 2:
+            offset += len(self.data)
+        self.pos = offset
+        return offset
+
+    def tell(self):
+        return self.pos
+
+    def close(self):
+        pass
+
+
+class TestBufferedReader(unittest.TestCase):
+    def test_read(self):
+        raw = Raw(b"0123456789" * 10, chunk=64)
+        f = io.BufferedReader(raw, 16)
+        self.assertEqual(f.read(1), b"0")
+        self.assertEqual(f.peek()[:2], b"12")
+        self.assertEqual(f.read(3), b"123")
+        self.assertEqual(f.read1(100), b"456789012345")
+        self.assertEqual(f.tell(), 16)
+        self.assertEqual(f.read(20), b"67890123456789012345")
+        self.assertEqual(len(f.read()), 64)
+        self.assertEqual(f.read(), b"")
+
+    def test_small_reads(self):
+        raw = Raw(bytes(1000), chunk=1000)
+        f = io.BufferedReader(raw, 100)
+        for _ in range(1000):
+            self.assertEqual(f.read(1), b"\x00")
+        self.assertEqual(raw.calls, 10)
+
+    def test_readinto(self):
+        f = io.BufferedReader(Raw(b"abcdefghij" * 5, chunk=7), 8)
+        b = bytearray(30)
+        self.assertEqual(f.readinto(b), 30)
+        self.assertEqual(bytes(b), b"abcdefghij" * 3)
+        self.assertEqual(f.readinto(b), 20)
+
+    def test_readline(self):
+        f = io.BufferedReader(Raw(b"one\ntwo\n\nthree long line\nend", chunk=3), 4)
+        self.assertEqual(f.readline(), b"one\n")
+        self.assertEqual(f.readline(2), b"tw")
+        self.assertEqual(list(f), [b"o\n", b"\n", b"three long line\n", b"end"])
+        self.assertEqual(f.readline(), b"")
+
+    def test_seek(self):
+        f = io.BufferedReader(Raw(b"0123456789", chunk=10))
+        f.read(2)
+        f.seek(3, 1)
+        self.assertEqual(f.read(1), b"5")
+        f.seek(1)
+        self.assertEqual(f.read(2), b"12")
+
+
+class TestBufferedWriter(unittest.TestCase):
+    def test_coalesce(self):
+        raw = Raw(chunk=100)
+        f = io.BufferedWriter(raw, 10)
+        for i in range(10):
+            f.write(b"ab")
+        self.assertEqual(raw.calls, 1)
+        self.assertEqual(f.tell(), 20)
+        f.flush()
+        self.assertEqual(bytes(raw.data), b"ab" * 10)
+
+    def test_partial_writes(self):
+        raw = Raw(chunk=3)
+        f = io.BufferedWriter(raw, 4)
+        f.write(b"x" * 10)
+        f.write(b"yy")
+        f.close()
+        self.assertEqual(bytes(raw.data), b"x" * 10 + b"yy")
+
+    def test_random(self):
+        raw = Raw(b"0123456789", chunk=4)
+        f = io.BufferedRandom(raw, 4)
+        self.assertEqual(f.read(2), b"01")
+        f.write(b"ab")
+        self.assertEqual(f.tell(), 4)
+        self.assertEqual(f.read(2), b"45")
+        f.seek(0)
+        self.assertEqual(f.read(), b"01ab456789")
+
+    def test_rwpair(self):
+        r = Raw(b"in\n")
+        w = Raw()
+        f = io.BufferedRWPair(r, w)
+        self.assertEqual(f.readline(), b"in\n")
+        f.write(b"out")
+        f.flush()
+        self.assertEqual(bytes(w.data), b"out")
+
+
+class TestTextIOWrapper(unittest.TestCase):
+    def test_read(self):
+        text = "héllo wörld €\n" * 3
+        raw = Raw(text.encode(), chunk=3)
+        f = io.TextIOWrapper(io.BufferedReader(raw, 5))
+        self.assertEqual(f.read(2), "hé")
+        self.assertEqual(f.readline(), "llo wörld €\n")
+        self.assertEqual(list(f), text.splitlines(True)[1:])
+
+    def test_write(self):
+        raw = Raw(chunk=100)
+        f = io.TextIOWrapper(io.BufferedWriter(raw), line_buffering=True)
+        self.assertEqual(f.write("€"), 1)
+        self.assertEqual(raw.data, b"")
+        f.write("\n")
+        self.assertEqual(bytes(raw.data), "€\n".encode())
+
+
+if __name__ == "__main__":
+    unittest.main()
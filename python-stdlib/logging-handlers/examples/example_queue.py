@@ -0,0 +1,29 @@
+import asyncio
+import logging
+import logging.handlers
+
+
+async def main():
+    # Log calls only enqueue the record; the listener task does the writing.
+    queue = asyncio.Queue()
+    logger = logging.getLogger("app")
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(logging.handlers.QueueHandler(queue))
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    # Write in batches of 16, or immediately on an error.
+    memory = logging.handlers.MemoryHandler(16, target=handler)
+
+    listener = logging.handlers.QueueListener(queue, memory)
+    listener.start()
+    for i in range(20):
+        logger.info("message %d", i)
+        await asyncio.sleep(0)
+    logger.error("flushes the batch")
+    listener.stop()
+    await asyncio.sleep(0)
+    memory.close()
+
+
+asyncio.run(main())
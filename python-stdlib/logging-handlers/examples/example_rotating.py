@@ -0,0 +1,23 @@
+import logging
+import logging.handlers
+
+logger = logging.getLogger("sensor")
+logger.setLevel(logging.INFO)
+
+# Keep at most 4 x 16kB of logs on flash.  Records are written out in
+# blocks of up to 1kB, and at least every 5 seconds.
+handler = logging.handlers.RotatingFileHandler(
+    "sensor.log", maxBytes=16 * 1024, backupCount=3, bufferSize=1024, flushInterval=5
+)
+handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+logger.addHandler(handler)
+
+# Alternatively, start a new file every day at midnight and keep a week.
+daily = logging.handlers.TimedRotatingFileHandler("daily.log", when="midnight", backupCount=7)
+daily.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+logger.addHandler(daily)
+
+for i in range(1000):
+    logger.info("reading %d", i)
+
+logging.shutdown()
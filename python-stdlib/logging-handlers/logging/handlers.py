@@ -0,0 +1,429 @@
+import logging
+import os
+import sys
+import time
+
+
+def _copy_record(record):
+    # Loggers reuse a single LogRecord, so keep a snapshot of any record
+    # that outlives the call to emit().
+    r = logging.LogRecord()
+    r.name = record.name
+    r.levelno = record.levelno
+    r.levelname = record.levelname
+    r.message = record.message
+    r.ct = record.ct
+    r.msecs = record.msecs
+    r.asctime = record.asctime
+    return r
+
+
+def _is_async_queue(queue):
+    try:
+        import asyncio
+
+        return isinstance(queue, asyncio.Queue)
+    except (ImportError, AttributeError):
+        return False
+
+
+def _is_queue_full(e):
+    try:
+        import asyncio
+
+        if isinstance(e, asyncio.QueueFull):
+            return True
+    except (ImportError, AttributeError):
+        pass
+    try:
+        import queue
+
+        return isinstance(e, queue.Full)
+    except (ImportError, AttributeError):
+        return False
+
+
+class QueueHandler(logging.Handler):
+    def __init__(self, queue):
+        super().__init__()
+        self.queue = queue
+
+    def enqueue(self, record):
+        self.queue.put_nowait(record)
+
+    def prepare(self, record):
+        record = _copy_record(record)
+        if self.formatter is not None:
+            record.message = self.format(record)
+        return record
+
+    def handleError(self, record, exc):
+        # As in CPython, report the failure on stderr instead of raising it
+        # into the code that logged.
+        sys.stderr.write("--- Logging error ---\n")
+        sys.print_exception(exc, sys.stderr)
+        sys.stderr.write("Message: %r\n" % (record.message,))
+
+    def emit(self, record):
+        if record.levelno >= self.level:
+            try:
+                self.enqueue(self.prepare(record))
+            except Exception as e:
+                # Drop the record rather than block when the queue is full.
+                if not _is_queue_full(e):
+                    self.handleError(record, e)
+
+
+class QueueListener:
+    _sentinel = None
+
+    def __init__(self, queue, *handlers, respect_handler_level=False):
+        self.queue = queue
+        self.handlers = handlers
+        self.respect_handler_level = respect_handler_level
+        self._done = None
+        self._task = None
+
+    def dequeue(self, block):
+        return self.queue.get() if block else self.queue.get_nowait()
+
+    def prepare(self, record):
+        return record
+
+    def handle(self, record):
+        record = self.prepare(record)
+        for handler in self.handlers:
+            if not self.respect_handler_level or record.levelno >= handler.level:
+                handler.emit(record)
+
+    def _monitor(self):
+        try:
+            while True:
+                record = self.dequeue(True)
+                if record is self._sentinel:
+                    break
+                self.handle(record)
+        finally:
+            self._done.release()
+
+    async def _amonitor(self):
+        while True:
+            record = await self.queue.get()
+            if record is self._sentinel:
+                break
+            self.handle(record)
+
+    def start(self):
+        # An asyncio.Queue is drained by a task on the running event loop,
+        # any other queue (with a blocking get) by a background thread.
+        if _is_async_queue(self.queue):
+            import asyncio
+
+            self._task = asyncio.create_task(self._amonitor())
+        else:
+            import _thread
+
+            self._done = _thread.allocate_lock()
+            self._done.acquire()
+            _thread.start_new_thread(self._monitor, ())
+
+    def enqueue_sentinel(self):
+        self.queue.put_nowait(self._sentinel)
+
+    def stop(self):
+        # Records already queued are handled before the listener exits.  For
+        # an asyncio queue this returns immediately and the task finishes on
+        # the event loop.
+        if self._done is not None:
+            self.enqueue_sentinel()
+            self._done.acquire()
+            self._done = None
+        elif self._task is not None:
+            self.enqueue_sentinel()
+            self._task = None
+
+
+class BufferingHandler(logging.Handler):
+    def __init__(self, capacity):
+        super().__init__()
+        self.capacity = capacity
+        self.buffer = []
+
+    def shouldFlush(self, record):
+        return len(self.buffer) >= self.capacity
+
+    def emit(self, record):
+        if record.levelno >= self.level:
+            self.buffer.append(_copy_record(record))
+            if self.shouldFlush(record):
+                self.flush()
+
+    def flush(self):
+        self.buffer = []
+
+    def close(self):
+        self.flush()
+
+
+class MemoryHandler(BufferingHandler):
+    def __init__(self, capacity, flushLevel=logging.ERROR, target=None, flushOnClose=True):
+        super().__init__(capacity)
+        self.flushLevel = flushLevel
+        self.target = target
+        self.flushOnClose = flushOnClose
+
+    def shouldFlush(self, record):
+        return len(self.buffer) >= self.capacity or record.levelno >= self.flushLevel
+
+    def setTarget(self, target):
+        self.target = target
+
+    def flush(self):
+        if self.target is not None:
+            buffer = self.buffer
+            self.buffer = []
+            for record in buffer:
+                self.target.emit(record)
+
+    def close(self):
+        if self.flushOnClose:
+            self.flush()
+        self.target = None
+        self.buffer = []
+
+
+class BaseRotatingHandler(logging.Handler):
+    # Writes go to an in-memory buffer that is written out once it reaches
+    # bufferSize bytes or when a record arrives flushInterval seconds after
+    # the last write.  A record at flushLevel or above is written out at
+    # once, so that it is not lost if the device then crashes or resets.
+    # The file size is tracked as data is written, so deciding whether to
+    # roll over needs no stat() call.
+    terminator = "\n"
+
+    def __init__(
+        self,
+        filename,
+        mode="a",
+        encoding=None,
+        delay=False,
+        bufferSize=512,
+        flushInterval=1,
+        flushLevel=logging.ERROR,
+    ):
+        super().__init__()
+        self.baseFilename = filename
+        self.mode = mode
+        self.encoding = encoding or "UTF-8"
+        self.bufferSize = bufferSize
+        self.flushInterval = flushInterval
+        self.flushLevel = flushLevel
+        self.stream = None
+        self._buffer = bytearray()
+        self._size = 0
+        self._flushed = 0
+        if not delay:
+            self._open(mode)
+
+    def _open(self, mode):
+        self.stream = open(self.baseFilename, mode[0] + "b")
+        self.stream.seek(0, 2)
+        self._size = self.stream.tell()
+
+    def shouldRollover(self, record, size):
+        return False
+
+    def doRollover(self):
+        pass
+
+    def emit(self, record):
+        if record.levelno >= self.level:
+            data = (self.format(record) + self.terminator).encode(self.encoding)
+            if self.stream is None:
+                self._open(self.mode)
+            if self.shouldRollover(record, len(data)):
+                self.doRollover()
+            self._buffer.extend(data)
+            self._size += len(data)
+            if (
+                len(self._buffer) >= self.bufferSize
+                or record.levelno >= self.flushLevel
+                or record.ct - self._flushed >= self.flushInterval
+            ):
+                self.flush()
+                self._flushed = record.ct
+
+    def flush(self):
+        if self.stream is not None:
+            if self._buffer:
+                self.stream.write(self._buffer)
+                self._buffer = bytearray()
+            self.stream.flush()
+
+    def _reopen(self, rotate):
+        # Close the current file, call rotate() to move it out of the way,
+        # then start a new, empty file.  If it could not be moved, keep
+        # appending to it rather than truncate it.
+        self.flush()
+        self.stream.close()
+        self.stream = None
+        mode = "w"
+        try:
+            rotate()
+        except OSError:
+            mode = "a"
+        self._open(mode)
+
+    def close(self):
+        if self.stream is not None:
+            self.flush()
+            self.stream.close()
+            self.stream = None
+
+
+def _replace(src, dst):
+    # rename() does not overwrite an existing file on all filesystems.  A
+    # missing src (there may be fewer backups than backupCount) is skipped;
+    # any other failure is raised.
+    try:
+        os.stat(src)
+    except OSError:
+        return
+    try:
+        os.remove(dst)
+    except OSError:
+        pass
+    os.rename(src, dst)
+
+
+class RotatingFileHandler(BaseRotatingHandler):
+    def __init__(
+        self,
+        filename,
+        mode="a",
+        maxBytes=0,
+        backupCount=0,
+        encoding=None,
+        delay=False,
+        bufferSize=512,
+        flushInterval=1,
+        flushLevel=logging.ERROR,
+    ):
+        self.maxBytes = maxBytes
+        self.backupCount = backupCount
+        super().__init__(filename, mode, encoding, delay, bufferSize, flushInterval, flushLevel)
+
+    def shouldRollover(self, record, size):
+        # As in CPython, there is no rollover without a backup to move the
+        # file to.
+        return (
+            self.maxBytes > 0
+            and self.backupCount > 0
+            and self._size > 0
+            and self._size + size > self.maxBytes
+        )
+
+    def _rotate(self):
+        # Only renames are needed: one per existing backup file.
+        base = self.baseFilename
+        for i in range(self.backupCount - 1, 0, -1):
+            _replace("%s.%d" % (base, i), "%s.%d" % (base, i + 1))
+        _replace(base, base + ".1")
+
+    def doRollover(self):
+        if self.backupCount > 0:
+            self._reopen(self._rotate)
+
+
+def _fits(s, template):
+    if len(s) != len(template):
+        return False
+    for c, t in zip(s, template):
+        if not (c.isdigit() if t == "0" else c == t):
+            return False
+    return True
+
+
+_WHEN = {
+    # when: (seconds per interval, suffix format for the localtime() fields)
+    "S": (1, "%04d-%02d-%02d_%02d-%02d-%02d"),
+    "M": (60, "%04d-%02d-%02d_%02d-%02d"),
+    "H": (3600, "%04d-%02d-%02d_%02d"),
+    "D": (86400, "%04d-%02d-%02d"),
+    "MIDNIGHT": (86400, "%04d-%02d-%02d"),
+}
+
+
+class TimedRotatingFileHandler(BaseRotatingHandler):
+    def __init__(
+        self,
+        filename,
+        when="h",
+        interval=1,
+        backupCount=0,
+        encoding=None,
+        delay=False,
+        utc=False,
+        bufferSize=512,
+        flushInterval=1,
+        flushLevel=logging.ERROR,
+    ):
+        self.when = when.upper()
+        seconds, self.suffix = _WHEN[self.when]
+        self.interval = seconds * interval
+        self.backupCount = backupCount
+        self.utc = utc
+        self._fields = self.suffix.count("%")
+        self.rolloverAt = self.computeRollover(time.time())
+        super().__init__(filename, "a", encoding, delay, bufferSize, flushInterval, flushLevel)
+
+    def _time(self, t):
+        return time.gmtime(t) if self.utc else time.localtime(t)
+
+    def computeRollover(self, t):
+        if self.when == "MIDNIGHT":
+            tm = self._time(t)
+            return t - tm[3] * 3600 - tm[4] * 60 - tm[5] + self.interval
+        return t + self.interval
+
+    def shouldRollover(self, record, size):
+        return record.ct >= self.rolloverAt
+
+    def _rotate(self):
+        base = self.baseFilename
+        tm = self._time(self.rolloverAt - self.interval)
+        _replace(base, base + "." + self.suffix % tuple(tm[: self._fields]))
+        if self.backupCount > 0:
+            for name in self.getFilesToDelete():
+                try:
+                    os.remove(name)
+                except OSError:
+                    pass
+
+    def getFilesToDelete(self):
+        i = self.baseFilename.rfind("/")
+        dirname = self.baseFilename[:i] if i > 0 else "/" if i == 0 else "."
+        prefix = self.baseFilename[i + 1 :] + "."
+        # Backups are the names whose suffix fits the pattern exactly: a digit
+        # wherever the template has one, and otherwise the same character.
+        template = self.suffix % ((0,) * self._fields)
+        names = sorted(
+            name
+            for name in os.listdir(dirname)
+            if name.startswith(prefix) and _fits(name[len(prefix) :], template)
+        )
+        if len(names) <= self.backupCount:
+            return []
+        if i >= 0:
+            prefix = self.baseFilename[: i + 1]
+        else:
+            prefix = ""
+        return [prefix + name for name in names[: len(names) - self.backupCount]]
+
+    def doRollover(self):
+        self._reopen(self._rotate)
+        now = time.time()
+        t = self.computeRollover(self.rolloverAt)
+        while t <= now:
+            t += self.interval
+        self.rolloverAt = t
@@ -0,0 +1,4 @@
+metadata(version="0.2.3")
+
+require("logging")
+package("logging")
@@ -0,0 +1,173 @@
+import asyncio
+import logging
+import logging.handlers
+import os
+import time
+
+
+class Handler(logging.handlers.QueueHandler):
+    def __init__(self, queue):
+        super().__init__(queue)
+        self.errors = []
+
+    def handleError(self, record, exc):
+        self.errors.append((record.message, exc))
+
+
+logger = logging.getLogger("test")
+logger.setLevel(logging.DEBUG)
+
+# Records are copied onto the queue, formatted if there is a formatter.
+queue = asyncio.Queue(2)
+handler = Handler(queue)
+handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+logger.addHandler(handler)
+logger.info("one")
+logger.warning("two")
+record = queue.get_nowait()
+assert (record.levelno, record.message) == (logging.INFO, "INFO one")
+assert queue.get_nowait().message == "WARNING two"
+
+# A full queue drops the record quietly.
+logger.info("three")
+logger.info("four")
+logger.info("five")
+assert queue.qsize() == 2
+assert handler.errors == []
+
+
+# Any other failure is reported and does not reach the caller.
+class BadFormatter(logging.Formatter):
+    def format(self, record):
+        raise ValueError("bad format")
+
+
+while not queue.empty():
+    queue.get_nowait()
+handler.setFormatter(BadFormatter())
+logger.error("six")
+assert queue.empty()
+assert len(handler.errors) == 1
+assert handler.errors[0][0] == "six"
+assert isinstance(handler.errors[0][1], ValueError)
+logger.handlers.remove(handler)
+
+
+# Rotating file handlers, writing through on every record.
+def read(name):
+    with open(name) as f:
+        return f.read()
+
+
+def clean(name):
+    for entry in os.listdir(name):
+        path = name + "/" + entry
+        if os.stat(path)[0] & 0x4000:
+            clean(path)
+        else:
+            os.remove(path)
+    os.rmdir(name)
+
+
+fmt = logging.Formatter("%(message)s")
+d = "test_handlers.tmp"
+os.mkdir(d)
+try:
+    # Without backups, the file is never rolled over (or truncated).
+    handler = logging.handlers.RotatingFileHandler(d + "/a.log", maxBytes=10, bufferSize=0)
+    handler.setFormatter(fmt)
+    logger.addHandler(handler)
+    for i in range(5):
+        logger.info("line %d", i)
+    handler.doRollover()
+    logger.info("line 5")
+    handler.close()
+    logger.handlers.remove(handler)
+    assert read(d + "/a.log") == "".join("line %d\n" % i for i in range(6))
+    assert os.listdir(d) == ["a.log"]
+    os.remove(d + "/a.log")
+
+    # With backups, the oldest ones are dropped.
+    handler = logging.handlers.RotatingFileHandler(
+        d + "/a.log", maxBytes=10, backupCount=2, bufferSize=0
+    )
+    handler.setFormatter(fmt)
+    logger.addHandler(handler)
+    for i in range(5):
+        logger.info("line %d", i)
+    assert read(d + "/a.log") == "line 4\n"
+    assert read(d + "/a.log.1") == "line 3\n"
+    assert read(d + "/a.log.2") == "line 2\n"
+    assert sorted(os.listdir(d)) == ["a.log", "a.log.1", "a.log.2"]
+
+    # If the file cannot be renamed, it is appended to.
+    for name in ("/a.log.1", "/a.log.2"):
+        os.remove(d + name)
+        os.mkdir(d + name)
+        with open(d + name + "/x", "w") as f:
+            f.write("x")
+    logger.info("line 5")
+    logger.info("line 6")
+    handler.close()
+    logger.handlers.remove(handler)
+    assert read(d + "/a.log") == "line 4\nline 5\nline 6\n"
+    assert read(d + "/a.log.1/x") == read(d + "/a.log.2/x") == "x"
+
+    # Buffered records are written out at once from flushLevel up.
+    handler = logging.handlers.RotatingFileHandler(
+        d + "/c.log", bufferSize=4096, flushInterval=3600
+    )
+    handler.setFormatter(fmt)
+    logger.addHandler(handler)
+    logger.info("first")
+    logger.info("buffered")
+    assert read(d + "/c.log") == "first\n"
+    logger.error("error")
+    assert read(d + "/c.log") == "first\nbuffered\nerror\n"
+    handler.flushLevel = logging.CRITICAL
+    logger.error("buffered")
+    assert read(d + "/c.log") == "first\nbuffered\nerror\n"
+    handler.close()
+    logger.handlers.remove(handler)
+    assert read(d + "/c.log") == "first\nbuffered\nerror\nbuffered\n"
+
+    # Timed rollover, forced by moving the rollover time into the past.
+    handler = logging.handlers.TimedRotatingFileHandler(
+        d + "/b.log", when="S", backupCount=1, bufferSize=0
+    )
+    handler.setFormatter(fmt)
+    logger.addHandler(handler)
+
+    def backup(t):
+        suffix = handler.suffix % tuple(time.localtime(t - 1)[:6])
+        return d + "/b.log." + suffix
+
+    # Only names that fit the backup suffix are counted as backups.
+    with open(d + "/b.log.notes-01-01_00-00-0", "w") as f:
+        f.write("keep")
+    logger.info("one")
+    t = handler.rolloverAt = int(time.time()) - 10
+    logger.info("two")
+    assert read(d + "/b.log") == "two\n"
+    assert read(backup(t)) == "one\n"
+    assert handler.rolloverAt > time.time()
+    handler.rolloverAt = t + 1
+    logger.info("three")
+    assert read(d + "/b.log") == "three\n"
+    assert read(backup(t + 1)) == "two\n"
+    assert not os.listdir(d).count(backup(t)[len(d) + 1 :])
+    assert read(d + "/b.log.notes-01-01_00-00-0") == "keep"
+
+    # If the file cannot be renamed, it is appended to.
+    os.mkdir(backup(t + 2))
+    with open(backup(t + 2) + "/x", "w") as f:
+        f.write("x")
+    handler.rolloverAt = t + 2
+    logger.info("four")
+    assert read(d + "/b.log") == "three\nfour\n"
+    handler.close()
+    logger.handlers.remove(handler)
+finally:
+    clean(d)
+
+print("OK")
@@ -58,6 +58,7 @@ class Handler:
 
 class StreamHandler(Handler):
     def __init__(self, stream=None):
+        super().__init__()
         self.stream = _stream if stream is None else stream
         self.terminator = "\n"
 
@@ -83,25 +84,51 @@ class Formatter:
     def __init__(self, fmt=None, datefmt=None):
         self.fmt = _default_fmt if fmt is None else fmt
         self.datefmt = _default_datefmt if datefmt is None else datefmt
+        self._compile()
+        # Most recently formatted time, reused while the second is unchanged.
+        self._asctime_key = None
+        self._asctime = None
+
+    def _compile(self):
+        # Convert "%(name)s" style placeholders into positional ones so that
+        # format() only looks up the attributes the format string uses.
+        fmt = self.fmt
+        parts = []
+        keys = []
+        i = 0
+        while True:
+            j = fmt.find("%", i)
+            if j < 0:
+                parts.append(fmt[i:])
+                break
+            if fmt[j + 1 : j + 2] == "(":
+                k = fmt.index(")", j)
+                parts.append(fmt[i : j + 1])
+                keys.append(fmt[j + 2 : k])
+                i = k + 1
+            else:
+                parts.append(fmt[i : j + 2])
+                i = j + 2
+        self._fmt = "".join(parts)
+        self._keys = tuple(keys)
+        self._uses_time = "asctime" in keys
 
     def usesTime(self):
         return "asctime" in self.fmt
 
     def formatTime(self, datefmt, record):
         if hasattr(time, "strftime"):
-            return time.strftime(datefmt, time.localtime(record.ct))
+            key = (int(record.ct), datefmt)
+            if key != self._asctime_key:
+                self._asctime = time.strftime(datefmt, time.localtime(record.ct))
+                self._asctime_key = key
+            return self._asctime
         return None
 
     def format(self, record):
-        if self.usesTime():
+        if self._uses_time:
             record.asctime = self.formatTime(self.datefmt, record)
-        return self.fmt % {
-            "name": record.name,
-            "message": record.message,
-            "msecs": record.msecs,
-            "asctime": record.asctime,
-            "levelname": record.levelname,
-        }
+        return self._fmt % tuple([getattr(record, key) for key in self._keys])
 
 
 class Logger:
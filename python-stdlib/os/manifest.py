@@ -1,4 +1,4 @@
-metadata(version="0.6.0")
+metadata(version="0.7.1")
 
 # Originally written by Paul Sokolovsky.
 
@@ -1,6 +1,8 @@
 # Replace built-in os module.
 from uos import *
 
+from ._scandir import DirEntry, scandir
+
 # Provide optional dependencies (which may be installed separately).
 try:
     from . import path
@@ -0,0 +1,100 @@
+# DirEntry and scandir(), shared by the os packages in python-stdlib and
+# unix-ffi.  The os package imports scandir() from here; stat() and
+# ilistdir() are looked up on it when called.
+import os
+from micropython import const
+
+# File type bits of st_mode, as reported by ilistdir().
+_S_IFMT = const(0xF000)
+_S_IFDIR = const(0x4000)
+_S_IFREG = const(0x8000)
+_S_IFLNK = const(0xA000)
+
+
+class DirEntry:
+    """A directory entry yielded by scandir().
+
+    The file type reported by the directory listing is kept, so is_dir() and
+    is_file() need no system call unless the filesystem did not report it.
+    stat() is called at most once per entry.
+    """
+
+    def __init__(self, prefix, name, type, ino):
+        self.name = name
+        self.path = prefix + name
+        self._type = type & _S_IFMT
+        self._ino = ino
+        self._stat = None
+
+    def __repr__(self):
+        return "<DirEntry %r>" % self.name
+
+    def __fspath__(self):
+        return self.path
+
+    def inode(self):
+        return self._ino
+
+    def stat(self, *, follow_symlinks=True):
+        if self._stat is None:
+            self._stat = os.stat(self.path)
+        return self._stat
+
+    def _mode(self, follow_symlinks):
+        t = self._type
+        if t and not (follow_symlinks and t == _S_IFLNK):
+            return t
+        if not follow_symlinks:
+            # Unknown type: without lstat() a symlink cannot be ruled out.
+            return 0
+        try:
+            return self.stat()[0] & _S_IFMT
+        except OSError:
+            return 0
+
+    def is_dir(self, *, follow_symlinks=True):
+        return self._mode(follow_symlinks) == _S_IFDIR
+
+    def is_file(self, *, follow_symlinks=True):
+        return self._mode(follow_symlinks) == _S_IFREG
+
+    def is_symlink(self):
+        return self._type == _S_IFLNK
+
+
+class _ScandirIterator:
+    def __init__(self, path):
+        self._it = os.ilistdir(path)
+        if isinstance(path, bytes):
+            self._prefix = path if path.endswith(b"/") else path + b"/"
+        else:
+            self._prefix = path if path.endswith("/") else path + "/"
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while True:
+            ent = next(self._it)
+            name = ent[0]
+            if name != "." and name != ".." and name != b"." and name != b"..":
+                return DirEntry(self._prefix, name, ent[1], ent[2] if len(ent) > 2 else 0)
+
+    def close(self):
+        # Closing the listing's generator (if it is one) releases the
+        # directory handle it holds open.
+        close = getattr(self._it, "close", None)
+        if close is not None:
+            close()
+        self._it = iter(())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def scandir(path="."):
+    """Return an iterator of DirEntry objects for the entries in path."""
+    return _ScandirIterator(path)
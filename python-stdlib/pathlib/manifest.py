@@ -1,3 +1,6 @@
-metadata(version="0.0.1")
+metadata(version="0.2.0")
+
+require("fnmatch")
+require("os")
 
 module("pathlib.py")
@@ -1,10 +1,16 @@
 import errno
 import os
 
+from fnmatch import _compile_pattern
 from micropython import const
 
 _SEP = const("/")
 
+# Kinds of compiled glob pattern segment.
+_LITERAL = const(0)  # plain name, no listing needed
+_WILDCARD = const(1)  # matched against each directory entry
+_RECURSIVE = const(2)  # "**", zero or more directories
+
 
 def _mode_if_exists(path):
     try:
@@ -30,6 +36,101 @@ def _clean_segment(segment):
     return segment
 
 
+def _compile_glob(pattern):
+    # Split a relative glob pattern into compiled segments.  Returns the
+    # segment list and whether only directories should match (trailing "/").
+    if not pattern:
+        raise ValueError("Unacceptable pattern: %r" % pattern)
+    if pattern[0] == _SEP:
+        raise NotImplementedError("Non-relative patterns are unsupported")
+    segments = []
+    for part in pattern.split(_SEP):
+        if not part or part == ".":
+            continue
+        if part == "**":
+            # "**/**" is the same as "**".
+            if not segments or segments[-1][0] != _RECURSIVE:
+                segments.append((_RECURSIVE, None))
+        elif "**" in part:
+            raise ValueError("Invalid pattern: '**' can only be an entire path component")
+        elif "*" in part or "?" in part or "[" in part:
+            segments.append((_WILDCARD, _compile_pattern(part)))
+        else:
+            segments.append((_LITERAL, part))
+    return segments, pattern[-1] == _SEP
+
+
+def _join(path, name):
+    return path + _SEP + name if path else name
+
+
+def _is_dir(path):
+    return bool(_mode_if_exists(path or ".") & 0x4000)
+
+
+def _select(top, segments, dironly):
+    # Yield paths below top matching the compiled segments.  The tree is
+    # walked with an explicit stack of (path, segment index): a directory
+    # is only listed when a wildcard segment needs it, and is only pushed
+    # when its name matches the segment at that position, so subtrees
+    # that cannot match are never entered.  Symlinks are not followed into
+    # for "**".
+    n = len(segments)
+    stack = [(top, 0)]
+    while stack:
+        path, i = stack.pop()
+        if i == n:
+            if not dironly or _is_dir(path):
+                yield path
+            continue
+        kind, match = segments[i]
+        if kind == _LITERAL:
+            path = _join(path, match)
+            if i + 1 < n or _mode_if_exists(path):
+                stack.append((path, i + 1))
+            continue
+
+        recursive = kind == _RECURSIVE
+        r = i
+        if recursive:
+            if i + 1 == n:
+                # Trailing "**" matches this directory and all below it.
+                yield path
+            else:
+                kind, match = segments[i + 1]
+                i += 1
+        last = i + 1 == n
+        pushed = []
+        try:
+            with os.scandir(path or ".") as it:
+                for entry in it:
+                    name = entry.name
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    if recursive and is_dir:
+                        pushed.append((_join(path, name), r))
+                    if kind == _RECURSIVE:
+                        # Trailing "**": every entry below matches.
+                        if not is_dir and not dironly:
+                            yield _join(path, name)
+                        continue
+                    if kind == _LITERAL:
+                        if name != match:
+                            continue
+                    elif not match(name):
+                        continue
+                    if last:
+                        if not dironly or entry.is_dir():
+                            yield _join(path, name)
+                    elif entry.is_dir():
+                        pushed.append((_join(path, name), i + 1))
+        except OSError:
+            # Not a directory, or not readable.
+            continue
+        # Pushed in reverse so that entries come out in listing order.
+        pushed.reverse()
+        stack.extend(pushed)
+
+
 class Path:
     def __init__(self, *segments):
         segments_cleaned = []
@@ -108,38 +209,30 @@ class Path:
     def is_file(self):
         return bool(_mode_if_exists(self._path) & 0x8000)
 
-    def _glob(self, path, pattern, recursive):
-        # Currently only supports a single "*" pattern.
-        n_wildcards = pattern.count("*")
-        n_single_wildcards = pattern.count("?")
-
-        if n_single_wildcards:
-            raise NotImplementedError("? single wildcards not implemented.")
-
-        if n_wildcards == 0:
-            raise ValueError
-        elif n_wildcards > 1:
-            raise NotImplementedError("Multiple * wildcards not implemented.")
-
-        prefix, suffix = pattern.split("*")
+    def iterdir(self):
+        """Iterate over the entries of this directory, yielding Path objects."""
+        for entry in os.scandir(self._path):
+            yield Path(entry.path)
 
-        for name, mode, *_ in os.ilistdir(path):
-            full_path = path + _SEP + name
-            if name.startswith(prefix) and name.endswith(suffix):
-                yield full_path
-            if recursive and mode & 0x4000:  # is_dir
-                yield from self._glob(full_path, pattern, recursive=recursive)
+    def _glob(self, pattern):
+        segments, dironly = _compile_glob(pattern)
+        top = "" if self._path == "." else self._path
+        for path in _select(top, segments, dironly):
+            yield Path(path)
 
     def glob(self, pattern):
         """Iterate over this subtree and yield all existing files (of any
         kind, including directories) matching the given relative pattern.
 
-        Currently only supports a single "*" pattern.
+        Supports "*", "?" and "[...]" within a path component, "**" as a
+        whole component to match any number of directories, and a trailing
+        "/" to match only directories.
         """
-        return self._glob(self._path, pattern, recursive=False)
+        return self._glob(pattern)
 
     def rglob(self, pattern):
-        return self._glob(self._path, pattern, recursive=True)
+        """Like glob(), with "**/" prepended to the pattern."""
+        return self._glob("**/" + pattern)
 
     def stat(self):
         return os.stat(self._path)
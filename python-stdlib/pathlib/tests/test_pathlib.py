@@ -196,6 +196,45 @@ class TestPathlib(unittest.TestCase):
         self.assertTrue(bar_txt in res)
         self.assertTrue(bap_txt in res)
 
+    def test_glob_patterns(self):
+        os.mkdir(self.tmp_path + "/a")
+        os.mkdir(self.tmp_path + "/a/b")
+        os.mkdir(self.tmp_path + "/x")
+        for fn in ("a/1.txt", "a/b/2.txt", "a/b/3.bin", "x/4.txt", "5.txt"):
+            with open(self.tmp_path + "/" + fn, "w"):
+                pass
+
+        path = Path(self.tmp_path)
+
+        def glob(pattern):
+            return sorted(str(x)[len(self.tmp_path) + 1 :] for x in path.glob(pattern))
+
+        self.assertEqual(glob("?.txt"), ["5.txt"])
+        self.assertEqual(glob("*/*.txt"), ["a/1.txt", "x/4.txt"])
+        self.assertEqual(glob("[!x]/*"), ["a/1.txt", "a/b"])
+        self.assertEqual(glob("**/*.txt"), ["5.txt", "a/1.txt", "a/b/2.txt", "x/4.txt"])
+        self.assertEqual(glob("a/**/*"), ["a/1.txt", "a/b", "a/b/2.txt", "a/b/3.bin"])
+        self.assertEqual(glob("*/"), ["a", "x"])
+        self.assertEqual(glob("a/b/3.bin"), ["a/b/3.bin"])
+        self.assertEqual(glob("a/c/*"), [])
+        self.assertEqual(
+            sorted(str(x) for x in path.rglob("*.bin")), [self.tmp_path + "/a/b/3.bin"]
+        )
+        with self.assertRaises(ValueError):
+            list(path.glob("a**"))
+
+    def test_iterdir(self):
+        foo_txt = self.tmp_path + "/foo.txt"
+        with open(foo_txt, "w"):
+            pass
+        os.mkdir(self.tmp_path + "/boop")
+
+        res = list(Path(self.tmp_path).iterdir())
+        self.assertTrue(len(res) == 2)
+        self.assertTrue(Path(foo_txt) in res)
+        self.assertTrue(all(isinstance(x, Path) for x in res))
+        self.assertTrue(sum(x.is_dir() for x in res) == 1)
+
     def test_stat(self):
         expected = os.stat(self.tmp_path)
         path = Path(self.tmp_path)
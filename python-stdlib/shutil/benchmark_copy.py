@@ -0,0 +1,37 @@
+# Measure copy throughput of copyfile() against a small-buffer
+# copyfileobj().  Run on a tmpfs (e.g. /dev/shm) to take the disk out of
+# the measurement.
+import os
+import sys
+import time
+import shutil
+
+DIR = sys.argv[1] if len(sys.argv) > 1 else "/dev/shm"
+SIZE_MB = 64
+
+src = DIR + "/benchmark_copy.src"
+dst = DIR + "/benchmark_copy.dst"
+
+block = bytes(1024 * 1024)
+with open(src, "wb") as f:
+    for _ in range(SIZE_MB):
+        f.write(block)
+
+
+def report(name, t):
+    print("%-20s %.2f GB/s" % (name + ":", SIZE_MB / 1024 / max(t, 1e-6)))
+
+
+t = time.time()
+shutil.copyfile(src, dst)
+report("copyfile", time.time() - t)
+
+for length in (512, shutil.COPY_BUFSIZE):
+    t = time.time()
+    with open(src, "rb") as fsrc:
+        with open(dst, "wb") as fdst:
+            shutil.copyfileobj(fsrc, fdst, length)
+    report("copyfileobj(%d)" % length, time.time() - t)
+
+os.unlink(src)
+os.unlink(dst)
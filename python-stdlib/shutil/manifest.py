@@ -1,3 +1,6 @@
-metadata(version="0.0.5")
+metadata(version="0.2.0")
+
+require("os")
+require("fnmatch")
 
 module("shutil.py")
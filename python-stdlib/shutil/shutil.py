@@ -1,35 +1,80 @@
 # Reimplement, because CPython3.3 impl is rather bloated
+import errno
 import os
 from collections import namedtuple
 
+from micropython import const
+
 _ntuple_diskusage = namedtuple("usage", ("total", "used", "free"))
 
+# Where the libc is reachable through ffi (the unix port), whole files are
+# copied in the kernel with copy_file_range() or sendfile().
+try:
+    import ffilib
+
+    _libc = ffilib.libc()
+except ImportError:
+    _libc = None
+
+_copy_file_range = None
+_sendfile = None
+if _libc:
+    try:
+        # ssize_t copy_file_range(int fd_in, loff_t *off_in, int fd_out,
+        #                         loff_t *off_out, size_t len, unsigned int flags);
+        _copy_file_range = _libc.func("l", "copy_file_range", "ipipLI")
+    except OSError:
+        pass
+    try:
+        # ssize_t sendfile(int out_fd, int in_fd, off_t *offset, size_t count);
+        _sendfile = _libc.func("l", "sendfile", "iipL")
+    except OSError:
+        pass
+
+# Bytes per kernel copy call.
+_KERNEL_CHUNK = const(0x10000000)
+
+COPY_BUFSIZE = 65536 if _libc else 4096
+
+
+class Error(OSError):
+    pass
+
+
+class SameFileError(Error):
+    """Raised when source and destination are the same file."""
+
 
 def rmtree(d):
     if not d:
         raise ValueError
 
-    for name, type, *_ in os.ilistdir(d):
-        path = d + "/" + name
-        if type & 0x4000:  # dir
-            rmtree(path)
-        else:  # file
-            os.unlink(path)
+    with os.scandir(d) as it:
+        for entry in it:
+            # Symlinks to directories are unlinked, not descended into.
+            if entry.is_dir(follow_symlinks=False):
+                rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
     os.rmdir(d)
 
 
-def copyfileobj(src, dest, length=512):
+def _copyfileobj(src, dest, buf):
+    mv = memoryview(buf)
+    length = len(buf)
+    while True:
+        sz = src.readinto(buf)
+        if not sz:
+            break
+        if sz == length:
+            dest.write(buf)
+        else:
+            dest.write(mv[:sz])
+
+
+def copyfileobj(src, dest, length=COPY_BUFSIZE):
     if hasattr(src, "readinto"):
-        buf = bytearray(length)
-        while True:
-            sz = src.readinto(buf)
-            if not sz:
-                break
-            if sz == length:
-                dest.write(buf)
-            else:
-                b = memoryview(buf)[:sz]
-                dest.write(b)
+        _copyfileobj(src, dest, bytearray(length))
     else:
         while True:
             buf = src.read(length)
@@ -38,6 +83,177 @@ def copyfileobj(src, dest, length=512):
             dest.write(buf)
 
 
+def _copy_kernel(src, dest):
+    # Copy from the current position of src to the end, within the kernel.
+    # Returns False if neither call is supported for these files, in which
+    # case the copy can be finished in user space from where it stopped.
+    try:
+        ifd = src.fileno()
+        ofd = dest.fileno()
+    except (AttributeError, OSError):
+        return False
+    if _copy_file_range:
+        while True:
+            n = _copy_file_range(ifd, None, ofd, None, _KERNEL_CHUNK, 0)
+            if n <= 0:
+                break
+        if n == 0:
+            return True
+    if _sendfile:
+        while True:
+            n = _sendfile(ofd, ifd, None, _KERNEL_CHUNK)
+            if n <= 0:
+                break
+        if n == 0:
+            return True
+    return False
+
+
+def _samefile(src, dst):
+    try:
+        s1 = os.stat(src)
+        s2 = os.stat(dst)
+    except OSError:
+        return False
+    # Compare inode and device, where the filesystem provides them.
+    return s1[1] != 0 and s1[1] == s2[1] and s1[2] == s2[2]
+
+
+def _isdir(path):
+    try:
+        return os.stat(path)[0] & 0x4000 != 0
+    except OSError:
+        return False
+
+
+def _basename(path):
+    return path.rstrip("/").rsplit("/", 1)[-1]
+
+
+def _copyfile(src, dst, buf):
+    if _samefile(src, dst):
+        raise SameFileError("{!r} and {!r} are the same file".format(src, dst))
+    with open(src, "rb") as fsrc:
+        with open(dst, "wb") as fdst:
+            if not _copy_kernel(fsrc, fdst):
+                _copyfileobj(fsrc, fdst, buf or bytearray(COPY_BUFSIZE))
+    return dst
+
+
+def copyfile(src, dst):
+    """Copy the contents of file src to file dst, and return dst."""
+    return _copyfile(src, dst, None)
+
+
+def copymode(src, dst):
+    if hasattr(os, "chmod"):
+        os.chmod(dst, os.stat(src)[0] & 0o7777)
+
+
+def copystat(src, dst):
+    st = os.stat(src)
+    if hasattr(os, "chmod"):
+        os.chmod(dst, st[0] & 0o7777)
+    if hasattr(os, "utime"):
+        os.utime(dst, (st[7], st[8]))
+
+
+def copy(src, dst):
+    """Copy file src to dst, which may be a directory, with permission bits
+    where the port supports them.  Returns the path of the new file."""
+    if _isdir(dst):
+        dst = dst.rstrip("/") + "/" + _basename(src)
+    copyfile(src, dst)
+    copymode(src, dst)
+    return dst
+
+
+def copy2(src, dst):
+    """Like copy(), also preserving timestamps where the port supports it."""
+    if _isdir(dst):
+        dst = dst.rstrip("/") + "/" + _basename(src)
+    copyfile(src, dst)
+    copystat(src, dst)
+    return dst
+
+
+def ignore_patterns(*patterns):
+    """Return an ignore function for copytree() that skips names matching
+    any of the glob-style patterns."""
+    import fnmatch
+
+    def _ignore_patterns(path, names):
+        ignored = set()
+        for pattern in patterns:
+            ignored.update(fnmatch.filter(names, pattern))
+        return ignored
+
+    return _ignore_patterns
+
+
+def _mkdir(path, exist_ok):
+    try:
+        os.mkdir(path)
+    except OSError as e:
+        if e.errno == errno.ENOENT and "/" in path.rstrip("/"):
+            _mkdir(path.rstrip("/").rsplit("/", 1)[0], True)
+            os.mkdir(path)
+        elif not (exist_ok and e.errno == errno.EEXIST and _isdir(path)):
+            raise
+
+
+def copytree(src, dst, ignore=None, copy_function=copy2, dirs_exist_ok=False):
+    """Recursively copy the directory tree src to dst, and return dst.
+
+    ignore(src, names) returns the subset of names in directory src that
+    should not be copied.  Files are copied with copy_function(src, dst).
+    """
+    # Files are copied through a single buffer, or in the kernel.
+    buf = bytearray(COPY_BUFSIZE) if copy_function is copy2 else None
+    stack = [(src, dst)]
+    while stack:
+        src, dst = stack.pop()
+        with os.scandir(src) as it:
+            entries = list(it)
+        if ignore is not None:
+            ignored = ignore(src, [entry.name for entry in entries])
+        _mkdir(dst, dirs_exist_ok)
+        for entry in entries:
+            if ignore is not None and entry.name in ignored:
+                continue
+            target = dst + "/" + entry.name
+            if entry.is_dir():
+                stack.append((entry.path, target))
+            elif buf is not None:
+                _copyfile(entry.path, target, buf)
+                copystat(entry.path, target)
+            else:
+                copy_function(entry.path, target)
+        # Subdirectories are new unless the top one already existed.
+        dirs_exist_ok = True
+    return dst
+
+
+def move(src, dst):
+    """Move file or directory src to dst, and return the new path.
+
+    This is a rename where possible, otherwise a copy then a delete.
+    """
+    if _isdir(dst):
+        dst = dst.rstrip("/") + "/" + _basename(src)
+    try:
+        os.rename(src, dst)
+    except OSError:
+        # E.g. EXDEV: src and dst are on different filesystems.
+        if _isdir(src):
+            copytree(src, dst)
+            rmtree(src)
+        else:
+            copy2(src, dst)
+            os.unlink(src)
+    return dst
+
+
 def disk_usage(path):
     bit_tuple = os.statvfs(path)
     blksize = bit_tuple[0]  # system block size
@@ -54,3 +54,62 @@ class TestRmtree(unittest.TestCase):
 
         with self.assertRaises(OSError):
             os.stat("foo")
+
+
+class TestCopy(unittest.TestCase):
+    def setUp(self):
+        # If this triggers, a previous test didn't clean up.
+        with self.assertRaises(OSError):
+            os.stat("foo")
+        os.mkdir("foo")
+        os.mkdir("foo/src")
+        os.mkdir("foo/src/sub")
+        self.data = bytes(range(256)) * 1000
+        with open("foo/src/a.bin", "wb") as f:
+            f.write(self.data)
+        with open("foo/src/sub/b.txt", "w") as f:
+            f.write("hello")
+        with open("foo/src/sub/c.pyc", "w"):
+            pass
+
+    def tearDown(self):
+        shutil.rmtree("foo")
+
+    def read(self, fn):
+        with open(fn, "rb") as f:
+            return f.read()
+
+    def test_copyfile(self):
+        self.assertEqual(shutil.copyfile("foo/src/a.bin", "foo/a.bin"), "foo/a.bin")
+        self.assertEqual(self.read("foo/a.bin"), self.data)
+
+        with self.assertRaises(shutil.SameFileError):
+            shutil.copyfile("foo/a.bin", "foo/a.bin")
+
+    def test_copyfileobj(self):
+        with open("foo/src/a.bin", "rb") as fsrc:
+            with open("foo/a.bin", "wb") as fdst:
+                shutil.copyfileobj(fsrc, fdst, 1000)
+        self.assertEqual(self.read("foo/a.bin"), self.data)
+
+    def test_copy_to_dir(self):
+        self.assertEqual(shutil.copy("foo/src/sub/b.txt", "foo"), "foo/b.txt")
+        self.assertEqual(self.read("foo/b.txt"), b"hello")
+
+    def test_copytree(self):
+        shutil.copytree("foo/src", "foo/dst", ignore=shutil.ignore_patterns("*.pyc"))
+        self.assertEqual(self.read("foo/dst/a.bin"), self.data)
+        self.assertEqual(self.read("foo/dst/sub/b.txt"), b"hello")
+        with self.assertRaises(OSError):
+            os.stat("foo/dst/sub/c.pyc")
+
+        with self.assertRaises(OSError):
+            shutil.copytree("foo/src", "foo/dst")
+        shutil.copytree("foo/src", "foo/dst", dirs_exist_ok=True)
+        os.stat("foo/dst/sub/c.pyc")
+
+    def test_move(self):
+        self.assertEqual(shutil.move("foo/src/sub", "foo"), "foo/sub")
+        self.assertEqual(self.read("foo/sub/b.txt"), b"hello")
+        with self.assertRaises(OSError):
+            os.stat("foo/src/sub")
@@ -1,4 +1,4 @@
-metadata(description="Read-only implementation of Python's tarfile.", version="0.4.1")
+metadata(description="Read-only implementation of Python's tarfile.", version="0.5.1")
 
 # Originally written by Paul Sokolovsky.
 
@@ -1,14 +1,19 @@
 """Subset of cpython tarfile class methods needed to decode tar files."""
 
-import uctypes
-
-# Minimal set of tar header fields for reading.
+# Tar header field offsets and lengths.
 # http://www.gnu.org/software/tar/manual/html_node/Standard.html
-# The "size" entry is 11 (not 12) to implicitly cut off the null terminator.
-_TAR_HEADER = {
-    "name": (uctypes.ARRAY | 0, uctypes.UINT8 | 100),
-    "size": (uctypes.ARRAY | 124, uctypes.UINT8 | 11),
-}
+_NAME = const(0)  # 100 bytes
+_MODE = const(100)  # 8
+_UID = const(108)  # 8
+_GID = const(116)  # 8
+_SIZE = const(124)  # 12
+_MTIME = const(136)  # 12
+_TYPEFLAG = const(156)  # 1
+_LINKNAME = const(157)  # 100
+_MAGIC = const(257)  # 6
+_UNAME = const(265)  # 32
+_GNAME = const(297)  # 32
+_PREFIX = const(345)  # 155
 
 DIRTYPE = const("dir")
 REGTYPE = const("file")
@@ -17,19 +22,70 @@ REGTYPE = const("file")
 _S_IFMT = const(0o170000)
 _S_IFREG = const(0o100000)
 _S_IFDIR = const(0o040000)
+_S_IFLNK = const(0o120000)
 
 _BLOCKSIZE = const(512)  # length of processing blocks
+_SKIP_BUFSIZE = const(4096)  # buffer size when skipping over unseekable input
 
 
 def _roundup(val, align):
     return (val + align - 1) & ~(align - 1)
 
 
+def _nts(b):
+    # Convert a null-terminated header field to a str.
+    i = b.find(b"\0")
+    if i >= 0:
+        b = b[:i]
+    return str(b, "utf-8")
+
+
+def _nti(b):
+    # Convert a numeric header field to an int.
+    if b[0] & 0x80:
+        # GNU base-256 encoding, used for values too large for octal.
+        n = b[0] & 0x7F
+        for c in b[1:]:
+            n = n << 8 | c
+        return n
+    i = b.find(b"\0")
+    if i >= 0:
+        b = b[:i]
+    b = b.strip()
+    return int(b, 8) if b else 0
+
+
+def _parse_pax(data):
+    # Parse "%d %s=%s\n" extended header records into a dict.
+    records = {}
+    pos = 0
+    while pos < len(data):
+        sp = data.find(b" ", pos)
+        if sp < 0:
+            break
+        length = int(data[pos:sp])
+        if length <= 0:
+            break
+        key, _, value = data[sp + 1 : pos + length - 1].partition(b"=")
+        records[str(key, "utf-8")] = str(value, "utf-8")
+        pos += length
+    return records
+
+
+def _is_seekable(f):
+    try:
+        f.seek(0, 1)
+        return True
+    except (AttributeError, OSError):
+        return False
+
+
 class FileSection:
-    def __init__(self, f, content_len, aligned_len):
+    def __init__(self, f, content_len, aligned_len, seekable=False):
         self.f = f
         self.content_len = content_len
         self.align = aligned_len - content_len
+        self.seekable = seekable
 
     def read(self, sz=65536):
         if self.content_len == 0:
@@ -52,18 +108,34 @@ class FileSection:
 
     def skip(self):
         sz = self.content_len + self.align
-        if sz:
-            buf = bytearray(16)
-            while sz:
-                s = min(sz, 16)
-                self.f.readinto(buf, s)
-                sz -= s
+        self.content_len = self.align = 0
+        if not sz:
+            return
+        if self.seekable:
+            self.f.seek(sz, 1)
+            return
+        buf = memoryview(bytearray(min(sz, _SKIP_BUFSIZE)))
+        while sz:
+            n = self.f.readinto(buf[: min(sz, len(buf))])
+            if not n:
+                break
+            sz -= n
 
 
 class TarInfo:
     def __init__(self, name=""):
         self.name = name
-        self.mode = _S_IFDIR if self.name[-1] == "/" else _S_IFREG
+        self.mode = _S_IFDIR if self.name.endswith("/") else _S_IFREG
+        self.size = 0
+        self.mtime = 0
+        self.uid = 0
+        self.gid = 0
+        self.linkname = ""
+        self.uname = ""
+        self.gname = ""
+        # Position of the member's header(s) and of its data in the archive.
+        self.offset = 0
+        self.offset_data = 0
 
     @property
     def type(self):
@@ -78,12 +150,23 @@ class TarInfo:
     def isreg(self):
         return (self.mode & _S_IFMT) == _S_IFREG
 
+    def issym(self):
+        return (self.mode & _S_IFMT) == _S_IFLNK
+
+    def islnk(self):
+        # Hard links have no file type bits.
+        return (self.mode & _S_IFMT) == 0
+
 
 class TarFile:
     def __init__(self, name=None, mode="r", fileobj=None):
         self.subf = None
         self.mode = mode
         self.offset = 0
+        # Index of all members, built on demand by getmembers().
+        self.members = None
+        self._names = None
+        self._seekable = None
         if mode == "r":
             if fileobj:
                 self.f = fileobj
@@ -101,28 +184,102 @@ class TarFile:
     def __exit__(self, unused_type, unused_value, unused_traceback):
         self.close()
 
+    def _check_seekable(self):
+        if self._seekable is None:
+            self._seekable = _is_seekable(self.f)
+            # Offsets are absolute, so account for a file object that was
+            # not at its start when passed in.
+            self._start = self.offset = self.f.tell() if self._seekable else 0
+        return self._seekable
+
+    def _read_data(self, size):
+        aligned = _roundup(size, _BLOCKSIZE)
+        data = self.f.read(aligned)
+        self.offset += aligned
+        return data[:size]
+
     def next(self):
-        if self.subf:
+        # On a seekable file, go straight to the next header instead of
+        # reading through the rest of the current member.
+        if self._check_seekable():
+            self.f.seek(self.offset)
+        elif self.subf:
             self.subf.skip()
-        buf = self.f.read(_BLOCKSIZE)
-        if not buf:
-            return None
-
-        h = uctypes.struct(uctypes.addressof(buf), _TAR_HEADER, uctypes.LITTLE_ENDIAN)
-
-        # Empty block means end of archive
-        if h.name[0] == 0:
-            return None
-
-        # Update the offset once we're sure it's not the run-out.
-        self.offset += len(buf)
-        d = TarInfo(str(h.name, "utf-8").rstrip("\0"))
-        d.size = int(bytes(h.size), 8)
-        self.subf = d.subf = FileSection(self.f, d.size, _roundup(d.size, _BLOCKSIZE))
-        self.offset += _roundup(d.size, _BLOCKSIZE)
+            self.subf = None
+
+        header_offset = self.offset
+        longname = longlink = None
+        pax = None
+        while True:
+            buf = self.f.read(_BLOCKSIZE)
+            if not buf:
+                return None
+
+            # Empty block means end of archive
+            if buf[_NAME] == 0:
+                return None
+
+            # Update the offset once we're sure it's not the run-out.
+            self.offset += len(buf)
+            typeflag = buf[_TYPEFLAG]
+            size = _nti(buf[_SIZE : _SIZE + 12])
+
+            # GNU long name/link and pax extended headers apply to the
+            # member that follows them.
+            if typeflag == 0x4C:  # "L"
+                longname = _nts(self._read_data(size))
+            elif typeflag == 0x4B:  # "K"
+                longlink = _nts(self._read_data(size))
+            elif typeflag == 0x78:  # "x"
+                pax = _parse_pax(self._read_data(size))
+            elif typeflag == 0x67:  # "g", global pax header (ignored)
+                self._read_data(size)
+            else:
+                break
+
+        name = longname
+        if name is None:
+            name = _nts(buf[_NAME : _NAME + 100])
+            if buf[_MAGIC : _MAGIC + 5] == b"ustar":
+                prefix = _nts(buf[_PREFIX : _PREFIX + 155])
+                if prefix:
+                    name = prefix + "/" + name
+        d = TarInfo(name)
+        d.size = size
+        d.mtime = _nti(buf[_MTIME : _MTIME + 12])
+        d.uid = _nti(buf[_UID : _UID + 8])
+        d.gid = _nti(buf[_GID : _GID + 8])
+        d.linkname = longlink or _nts(buf[_LINKNAME : _LINKNAME + 100])
+        d.uname = _nts(buf[_UNAME : _UNAME + 32])
+        d.gname = _nts(buf[_GNAME : _GNAME + 32])
+        if pax:
+            d.name = pax.get("path", d.name)
+            d.linkname = pax.get("linkpath", d.linkname)
+            if "size" in pax:
+                d.size = int(pax["size"])
+            if "mtime" in pax:
+                d.mtime = int(float(pax["mtime"]))
+
+        mode = _nti(buf[_MODE : _MODE + 8]) & 0o7777
+        if typeflag == 0x35 or d.name.endswith("/"):  # "5"
+            d.mode = _S_IFDIR | mode
+        elif typeflag == 0x32:  # "2"
+            d.mode = _S_IFLNK | mode
+        elif typeflag == 0x31:  # "1"
+            d.mode = mode
+        else:
+            d.mode = _S_IFREG | mode
+
+        d.offset = header_offset
+        d.offset_data = self.offset
+        aligned = _roundup(d.size, _BLOCKSIZE)
+        self.subf = d.subf = FileSection(self.f, d.size, aligned, self._seekable)
+        self.offset += aligned
         return d
 
     def __iter__(self):
+        if self.members is not None:
+            return iter(self.members)
         return self
 
     def __next__(self):
@@ -131,8 +288,85 @@ class TarFile:
             raise StopIteration
         return v
 
-    def extractfile(self, tarinfo):
-        return tarinfo.subf
+    def getmembers(self):
+        # Read every header once, seeking over the member data when the file
+        # allows it.  An unseekable file is indexed from its current position.
+        if self.members is None:
+            members = []
+            offset = self.offset
+            if self._check_seekable():
+                self.offset = self._start
+            while True:
+                m = self.next()
+                if m is None:
+                    break
+                members.append(m)
+            if self._seekable:
+                self.offset = offset
+            self.members = members
+        return self.members
+
+    def getnames(self):
+        return [m.name for m in self.getmembers()]
+
+    def getmember(self, name):
+        if self._names is None:
+            # Later entries replace earlier ones with the same name.
+            self._names = {m.name.rstrip("/"): m for m in self.getmembers()}
+        try:
+            return self._names[name.rstrip("/")]
+        except KeyError:
+            raise KeyError("filename %r not found" % name)
+
+    def save_index(self, fileobj):
+        # Write the member index as text, one member per line, so that it can
+        # be reloaded with load_index() without reading the archive headers.
+        for m in self.getmembers():
+            fileobj.write(
+                "%d %d %d %d %d %d %d %s\t%s\n"
+                % (
+                    m.offset,
+                    m.offset_data,
+                    m.size,
+                    m.mode,
+                    m.mtime,
+                    m.uid,
+                    m.gid,
+                    m.name,
+                    m.linkname,
+                )
+            )
+
+    def load_index(self, fileobj):
+        if not self._check_seekable():
+            raise ValueError("stream is not seekable")
+        members = []
+        for line in fileobj:
+            fields = line.rstrip("\n").split(" ", 7)
+            name, _, linkname = fields[7].rpartition("\t")
+            m = TarInfo(name)
+            m.offset, m.offset_data, m.size, m.mode, m.mtime, m.uid, m.gid = [
+                int(x) for x in fields[:7]
+            ]
+            m.linkname = linkname
+            members.append(m)
+        self.members = members
+        self._names = None
+
+    def extractfile(self, member):
+        if isinstance(member, str):
+            member = self.getmember(member)
+        if self._check_seekable():
+            # Random access: position the file at the member's data.
+            self.f.seek(member.offset_data)
+            return FileSection(
+                self.f, member.size, _roundup(member.size, _BLOCKSIZE), self._seekable
+            )
+        # Only the data of the member last read by next() is still ahead.
+        subf = getattr(member, "subf", None)
+        if subf is None or subf is not self.subf:
+            raise ValueError("stream is not seekable")
+        return subf
 
     def close(self):
         try:
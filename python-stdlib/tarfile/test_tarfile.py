@@ -0,0 +1,95 @@
+import io
+import tarfile
+
+
+def header(name, size, typeflag=b"0"):
+    # A ustar header block.
+    h = bytearray(512)
+    h[0 : len(name)] = name
+    h[100:108] = b"0000644\0"
+    h[124:136] = b"%011o\0" % size
+    h[136:148] = b"%011o\0" % 1700000000
+    h[148:156] = b" " * 8
+    h[156:157] = typeflag
+    h[257:263] = b"ustar\0"
+    h[263:265] = b"00"
+    h[148:155] = b"%06o\0" % sum(h)
+    return bytes(h)
+
+
+def member(name, data, typeflag=b"0"):
+    pad = -len(data) % 512
+    return header(name, len(data), typeflag) + data + bytes(pad)
+
+
+files = [(b"a.txt", b"alpha\n"), (b"dir/b.bin", bytes(range(256)) * 3), (b"c.txt", b"")]
+longname = b"long/" + b"x" * 150
+archive = b"".join(member(n, d) for n, d in files)
+archive += member(b"././@LongLink", longname + b"\0", b"L") + member(b"trunc", b"long\n")
+archive += bytes(1024)
+files.append((longname, b"long\n"))
+names = [str(n, "utf-8") for n, _ in files]
+
+
+class Unseekable:
+    def __init__(self, data):
+        self.f = io.BytesIO(data)
+
+    def read(self, n=-1):
+        return self.f.read(n)
+
+    def readinto(self, buf):
+        return self.f.readinto(buf)
+
+    def seek(self, *args):
+        raise OSError("unseekable")
+
+    def close(self):
+        pass
+
+
+# Seekable: members are indexed once and extracted in any order.
+t = tarfile.TarFile(fileobj=io.BytesIO(archive))
+assert t.getnames() == names
+for name, data in reversed(files):
+    assert t.extractfile(str(name, "utf-8")).read() == data
+assert t.getmember("dir/b.bin").size == 768
+assert [m.name for m in t] == names
+
+# The index can be saved and used instead of reading the headers.
+index = io.StringIO()
+t.save_index(index)
+index.seek(0)
+t2 = tarfile.TarFile(fileobj=io.BytesIO(archive))
+t2.load_index(index)
+assert t2.getnames() == names
+assert t2.extractfile("dir/b.bin").read() == files[1][1]
+assert t2.getmember("a.txt").offset_data == 512
+
+# Unseekable: the current member can be read while iterating.
+t = tarfile.TarFile(fileobj=Unseekable(archive))
+for m, (name, data) in zip(t, files):
+    assert m.name == str(name, "utf-8")
+    if m.name != "a.txt":
+        assert t.extractfile(m).read() == data
+
+# Members whose data has been passed cannot.
+t = tarfile.TarFile(fileobj=Unseekable(archive))
+assert t.getnames() == names
+for name in names:
+    try:
+        t.extractfile(name)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError")
+
+t = tarfile.TarFile(fileobj=Unseekable(archive))
+try:
+    t.load_index(io.StringIO())
+except ValueError:
+    pass
+else:
+    raise AssertionError("expected ValueError")
+
+print("OK")
@@ -1,3 +1,3 @@
-metadata(version="1.0.0", description="Compression and decompression using the deflate algorithm")
+metadata(version="1.1.1", description="Compression and decompression using the deflate algorithm")
 
 module("zlib.py")
@@ -0,0 +1,97 @@
+import zlib
+
+data = bytes(range(256)) * 20 + b"hello world " * 2000
+
+
+def chunks(b, n):
+    return [b[i : i + n] for i in range(0, len(b), n)]
+
+
+for wbits in (15, 31, -15):
+    # Streaming compression, in pieces.
+    c = zlib.compressobj(wbits=wbits)
+    comp = b"".join(c.compress(b) for b in chunks(data, 700)) + c.flush()
+    assert zlib.decompress(comp, wbits) == data
+
+    # Streaming decompression, in pieces.
+    d = zlib.decompressobj(wbits)
+    out = b"".join(d.decompress(b) for b in chunks(comp, 100))
+    out += d.flush()
+    assert out == data, wbits
+    assert d.eof
+    assert d.unused_data == b""
+
+    # Data after the end of the stream is kept in unused_data.
+    d = zlib.decompressobj(wbits)
+    out = d.decompress(comp + b"TRAIL") + d.flush()
+    assert out == data
+    assert d.eof
+    assert d.unused_data == b"TRAIL"
+
+    # max_length limits each call; the rest of the input is handed back.
+    d = zlib.decompressobj(wbits)
+    out = b""
+    buf = comp
+    while buf:
+        chunk = d.decompress(buf, 1000)
+        assert len(chunk) <= 1000
+        out += chunk
+        buf = d.unconsumed_tail
+    out += d.flush()
+    assert out == data
+
+# A short stream is decoded by decompress() alone, without flush().
+small = b"hello world " * 10
+for wbits in (15, 31, -15):
+    c = zlib.compressobj(wbits=wbits)
+    comp = c.compress(small) + c.flush()
+    d = zlib.decompressobj(wbits)
+    assert d.decompress(comp + b"TRAIL") == small
+    assert d.eof
+    assert d.unused_data == b"TRAIL"
+
+    # Also when it arrives in pieces: the loop ends once the last one is in.
+    d = zlib.decompressobj(wbits)
+    out = b""
+    pieces = chunks(comp, 7)
+    while not d.eof:
+        out += d.decompress(pieces.pop(0))
+    assert out == small
+    assert not pieces
+    assert d.flush() == b""
+
+# A longer stream holds back the end of its input until flush().
+x = 1
+noise = bytearray()
+for i in range(4000):
+    x = (x * 1103515245 + 12345) & 0x7FFFFFFF
+    noise.append(x >> 23)
+comp = zlib.compress(noise)
+assert len(comp) > 2048
+d = zlib.decompressobj()
+out = d.decompress(comp)
+assert 0 < len(out) < len(noise)
+assert noise.startswith(out)
+assert not d.eof
+out += d.flush()
+assert out == noise
+assert d.eof
+
+# A truncated stream gives what could be decoded.
+comp = zlib.compress(data)
+d = zlib.decompressobj()
+out = d.decompress(comp[: len(comp) // 2]) + d.flush()
+assert not d.eof
+assert data.startswith(out)
+
+# Compressing after the final flush is an error.
+c = zlib.compressobj()
+c.flush()
+try:
+    c.compress(b"x")
+except ValueError:
+    pass
+else:
+    raise AssertionError("expected ValueError")
+
+print("OK")
@@ -5,6 +5,20 @@ import io, deflate
 
 _MAX_WBITS = const(15)
 
+MAX_WBITS = _MAX_WBITS
+DEFLATED = const(8)
+DEF_BUF_SIZE = const(16384)
+
+Z_NO_FLUSH = const(0)
+Z_SYNC_FLUSH = const(2)
+Z_FULL_FLUSH = const(3)
+Z_FINISH = const(4)
+
+# Input held back by a decompressor so that DeflateIO never runs out of data
+# part way through a block header or symbol: more than the largest dynamic
+# Huffman block header plus a gzip header.  See decompressobj().
+_MARGIN = const(1024)
+
 
 def _decode_wbits(wbits, decompress):
     if -15 <= wbits <= -5:
@@ -24,6 +38,38 @@ def _decode_wbits(wbits, decompress):
         raise ValueError("wbits")
 
 
+class _Buffer(io.IOBase):
+    # In-memory FIFO used as the stream underneath a DeflateIO.
+    def __init__(self):
+        self._buf = bytearray()
+        self._pos = 0
+
+    def write(self, data):
+        self._buf.extend(data)
+        return len(data)
+
+    def readinto(self, buf):
+        n = min(len(buf), len(self._buf) - self._pos)
+        buf[:n] = memoryview(self._buf)[self._pos : self._pos + n]
+        self._pos += n
+        return n
+
+    def available(self):
+        return len(self._buf) - self._pos
+
+    def take(self):
+        # Return and remove everything not yet read.
+        data = bytes(memoryview(self._buf)[self._pos :])
+        self._buf = bytearray()
+        self._pos = 0
+        return data
+
+    def compact(self):
+        if self._pos:
+            self._buf = self._buf[self._pos :]
+            self._pos = 0
+
+
 if hasattr(deflate.DeflateIO, "write"):
 
     def compress(data, wbits=_MAX_WBITS):
@@ -32,8 +78,116 @@ if hasattr(deflate.DeflateIO, "write"):
             g.write(data)
         return f.getvalue()
 
+    class _Compress:
+        def __init__(self, wbits):
+            self._out = _Buffer()
+            self._f = deflate.DeflateIO(self._out, *_decode_wbits(wbits, False))
+
+        def compress(self, data):
+            if self._f is None:
+                raise ValueError("flushed")
+            self._f.write(data)
+            return self._out.take()
+
+        def flush(self, mode=Z_FINISH):
+            # DeflateIO can only be flushed by ending the stream, so modes
+            # other than Z_FINISH just return the output produced so far.
+            if mode == Z_FINISH and self._f is not None:
+                self._f.close()
+                self._f = None
+            return self._out.take()
+
+    def compressobj(level=-1, method=DEFLATED, wbits=_MAX_WBITS, memLevel=8, strategy=0):
+        return _Compress(wbits)
+
 
 def decompress(data, wbits=_MAX_WBITS):
     f = io.BytesIO(data)
     with deflate.DeflateIO(f, *_decode_wbits(wbits, True)) as g:
         return g.read()
+
+
+class _Decompress:
+    def __init__(self, wbits):
+        self._wbits = wbits
+        self._in = _Buffer()
+        self._f = self._open()
+        # True until the DeflateIO has consumed any input.
+        self._fresh = True
+        self.unused_data = b""
+        self.unconsumed_tail = b""
+        self.eof = False
+
+    def _open(self):
+        return deflate.DeflateIO(self._in, *_decode_wbits(self._wbits, True))
+
+    def _inflate(self, max_length, margin):
+        # Each output byte consumes at most two bytes of input (plus block
+        # headers, covered by the margin), so reading (available - margin) // 2
+        # bytes of output can't exhaust the input mid-symbol.
+        out = []
+        total = 0
+        while not self.eof:
+            n = (self._in.available() - margin) // 2 if margin else DEF_BUF_SIZE
+            if max_length:
+                n = min(n, max_length - total)
+            if n <= 0:
+                break
+            data = self._f.read(n)
+            if not data:
+                self.eof = True
+                self.unused_data = self._in.take()
+                break
+            out.append(data)
+            total += len(data)
+        return b"".join(out)
+
+    def decompress(self, data, max_length=0):
+        if self.eof:
+            self.unused_data += data
+            return b""
+        self._in.compact()
+        self._in.write(data)
+        if self._fresh and self._in.available() <= _MARGIN:
+            # A stream this short is decoded whole.  If it turns out to be
+            # incomplete, nothing has been lost: start again from the first
+            # byte when more input arrives.
+            try:
+                out = self._inflate(max_length, 0)
+                self._fresh = False
+            except EOFError:
+                self._in._pos = 0
+                self._f = self._open()
+                out = b""
+        else:
+            out = self._inflate(max_length, _MARGIN)
+            self._fresh = False
+        if max_length and len(out) >= max_length and not self.eof:
+            # The caller passes this back in on the next call.
+            self.unconsumed_tail = self._in.take()
+        else:
+            self.unconsumed_tail = b""
+        return out
+
+    def flush(self, length=DEF_BUF_SIZE):
+        if self.unconsumed_tail:
+            self._in.write(self.unconsumed_tail)
+            self.unconsumed_tail = b""
+        out = []
+        while not self.eof:
+            try:
+                out.append(self._inflate(length, 0))
+            except EOFError:
+                # Truncated stream: return what could be decoded.
+                break
+        return b"".join(out)
+
+
+# Unlike CPython's, a decompressor holds back the last _MARGIN bytes of its
+# input, because DeflateIO cannot resume after running out of input part way
+# through a symbol.  A stream no longer than that is decoded whole by
+# decompress(); for a longer one, the output of the held back input, along
+# with eof and unused_data, only comes from flush().  So once the input has
+# been exhausted, call flush() rather than wait for eof.
+def decompressobj(wbits=_MAX_WBITS):
+    return _Decompress(wbits)
@@ -28,7 +28,12 @@
 # into a directory suitable for serving to "mip" via a static web server.
 
 # Usage:
-# ./tools/build.py --output /tmp/micropython-lib/v2
+# ./tools/build.py --output /tmp/micropython-lib/v2 [--jobs N] [--cache-dir DIR]
+
+# Packages are built in parallel across --jobs processes. Compiled .mpy files
+# are kept in a content-addressed cache (--cache-dir), keyed by the tagged
+# source, its target path, the mpy-cross version and the optimisation level,
+# so that unchanged files are not recompiled on the next run.
 
 # The output directory (--output) will have the following layout
 # /
@@ -112,6 +117,7 @@
 
 # mip (or other tools) should request /package/{mpy_version}/{package_name}/{version}.json.
 
+import filecmp
 import glob
 import hashlib
 import json
@@ -120,6 +126,7 @@ import shutil
 import sys
 import tempfile
 import time
+import types
 
 
 _JSON_VERSION_INDEX = 1
@@ -144,11 +151,20 @@ def _get_file_hash(f):
     return hs256.hexdigest()
 
 
-# Returns true if the two files contain identical contents.
+# Returns true if the two files contain identical contents. Files of different
+# sizes are rejected without reading them, otherwise they are compared in
+# chunks up to the first difference.
 def _identical_files(path_a, path_b):
-    with open(path_a, "rb") as fa:
-        with open(path_b, "rb") as fb:
-            return fa.read() == fb.read()
+    return filecmp.cmp(path_a, path_b, shallow=False)
+
+
+# Copy src to dst via a temporary file, so that concurrent builders never see
+# a partially written dst.
+def _atomic_copy(src, dst):
+    ensure_path_exists(dst)
+    tmp = "{}.{}.tmp".format(dst, os.getpid())
+    shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
 
 
 # Helper to write the object as json to the specified path, creating any
@@ -176,10 +192,14 @@ def error_color(s):
     return _COLOR_ERROR_ON + s + _COLOR_ERROR_OFF
 
 
-# Copy src to "file"/{short_hash[0:2]}/{short_hash}.
-def _write_hashed_file(package_name, src, target_path, out_file_dir, hash_prefix_len):
+# Copy src to "file"/{short_hash[0:2]}/{short_hash}. The sha256 of src may be
+# passed in if already known.
+def _write_hashed_file(
+    package_name, src, target_path, out_file_dir, hash_prefix_len, file_hash=None
+):
     # Generate the full sha256 and the hash prefix to use as the output path.
-    file_hash = _get_file_hash(src)
+    if file_hash is None:
+        file_hash = _get_file_hash(src)
     short_file_hash = file_hash[:hash_prefix_len]
     # Group files into subdirectories using the first two bytes of the hash prefix.
     output_file = os.path.join(short_file_hash[:2], short_file_hash)
@@ -203,15 +223,44 @@ def _write_hashed_file(package_name, src, target_path, out_file_dir, hash_prefix
             sys.exit(1)
     else:
         # Create new file.
-        ensure_path_exists(output_file_path)
-        shutil.copyfile(src.name, output_file_path)
+        _atomic_copy(src.name, output_file_path)
 
     return short_file_hash
 
 
+# Compile the tagged .py file with mpy-cross to dest, exiting on error.
+def _run_mpy_cross(package_name, tagged_path, target_path, opt, mpy_cross, mpy_cross_path, dest):
+    try:
+        mpy_cross.compile(
+            tagged_path,
+            dest=dest,
+            src_path=target_path,
+            opt=opt,
+            mpy_cross=mpy_cross_path,
+        )
+    except mpy_cross.CrossCompileError as e:
+        print(
+            error_color("Error:"),
+            "Unable to compile",
+            target_path,
+            "in package",
+            package_name,
+            file=sys.stderr,
+        )
+        print(e)
+        sys.exit(1)
+
+
+# Returns the key of a compiled file in the build cache. The target path is
+# included because it is embedded in the .mpy as the source file name.
+def _cache_key(source_hash, target_path, opt, cache_tag):
+    key = "\0".join((source_hash, target_path, str(opt), cache_tag))
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
 # Convert the tagged .py file into a .mpy file and copy to the "file" output
 # directory with it's hashed name. Updates the package_json with the file
-# hash.
+# hash. Returns True if the .mpy was found in the build cache.
 def _compile_as_mpy(
     package_name,
     package_json,
@@ -222,48 +271,62 @@ def _compile_as_mpy(
     mpy_cross_path,
     out_file_dir,
     hash_prefix_len,
+    source_hash,
+    cache_dir,
+    cache_tag,
 ):
-    with tempfile.NamedTemporaryFile(mode="rb", suffix=".mpy", delete=True) as mpy_tempfile:
-        try:
-            mpy_cross.compile(
+    target_path_mpy = target_path[:-2] + "mpy"
+
+    if cache_dir is None:
+        with tempfile.NamedTemporaryFile(mode="rb", suffix=".mpy", delete=True) as mpy_tempfile:
+            _run_mpy_cross(
+                package_name,
                 tagged_path,
-                dest=mpy_tempfile.name,
-                src_path=target_path,
-                opt=opt,
-                mpy_cross=mpy_cross_path,
-            )
-        except mpy_cross.CrossCompileError as e:
-            print(
-                error_color("Error:"),
-                "Unable to compile",
                 target_path,
-                "in package",
-                package_name,
-                file=sys.stderr,
+                opt,
+                mpy_cross,
+                mpy_cross_path,
+                mpy_tempfile.name,
             )
-            print(e)
-            sys.exit(1)
-
+            short_mpy_hash = _write_hashed_file(
+                package_name, mpy_tempfile, target_path, out_file_dir, hash_prefix_len
+            )
+        package_json["hashes"].append((target_path_mpy, short_mpy_hash))
+        return False
+
+    key = _cache_key(source_hash, target_path, opt, cache_tag)
+    cached_path = os.path.join(cache_dir, key[:2], key + ".mpy")
+    hit = os.path.exists(cached_path)
+    if not hit:
+        ensure_path_exists(cached_path)
+        tmp = "{}.{}.tmp".format(cached_path, os.getpid())
+        _run_mpy_cross(package_name, tagged_path, target_path, opt, mpy_cross, mpy_cross_path, tmp)
+        os.replace(tmp, cached_path)
+
+    with open(cached_path, "rb") as mpy_file:
         short_mpy_hash = _write_hashed_file(
-            package_name, mpy_tempfile, target_path, out_file_dir, hash_prefix_len
+            package_name, mpy_file, target_path, out_file_dir, hash_prefix_len
         )
 
-        # Add the file to the package json.
-        target_path_mpy = target_path[:-2] + "mpy"
-        package_json["hashes"].append((target_path_mpy, short_mpy_hash))
+    # Add the file to the package json.
+    package_json["hashes"].append((target_path_mpy, short_mpy_hash))
+    return hit
 
 
 # Copy the tagged .py file to the "file" output directory with it's hashed
-# name. Updates the package_json with the file hash.
+# name. Updates the package_json with the file hash. Returns the sha256 of the
+# tagged file.
 def _copy_as_py(
     package_name, package_json, tagged_path, target_path, out_file_dir, hash_prefix_len
 ):
     with open(tagged_path, "rb") as tagged_file:
+        file_hash = _get_file_hash(tagged_file)
         short_py_hash = _write_hashed_file(
-            package_name, tagged_file, target_path, out_file_dir, hash_prefix_len
+            package_name, tagged_file, target_path, out_file_dir, hash_prefix_len, file_hash
         )
     # Add the file to the package json.
     package_json["hashes"].append((target_path, short_py_hash))
+    return file_hash
 
 
 # Update to the latest metadata, and add any new versions to the package in
@@ -284,10 +347,143 @@ def _update_index_package_metadata(index_package_json, metadata, mpy_version):
                 index_package_json["versions"][v].append(metadata.version)
 
 
-def build(output_path, hash_prefix_len, mpy_cross_path):
+# Worker process initialisation: make manifestfile and mpy_cross importable
+# when workers are spawned rather than forked.
+def _init_worker(path):
+    sys.path[:] = path
+
+
+# Compile one package and write its package json files. Runs in a worker
+# process. Returns the package name, its metadata and build statistics.
+def _build_package(
+    manifest_path,
+    path_vars,
+    mpy_version,
+    mpy_cross_path,
+    out_file_dir,
+    out_package_dir,
+    hash_prefix_len,
+    cache_dir,
+    cache_tag,
+):
     import manifestfile
     import mpy_cross
 
+    start = time.time()
+
+    # .../foo/manifest.py -> foo
+    package_name = os.path.basename(os.path.dirname(manifest_path))
+
+    # Compile the manifest.
+    manifest = manifestfile.ManifestFile(manifestfile.MODE_COMPILE, path_vars)
+    manifest.execute(manifest_path)
+    metadata = manifest.metadata()
+
+    # This is the package json that mip/mpremote downloads.
+    mpy_package_json = {
+        "v": _JSON_VERSION_PACKAGE,
+        "hashes": [],
+        "version": metadata.version or "",
+    }
+    py_package_json = {
+        "v": _JSON_VERSION_PACKAGE,
+        "hashes": [],
+        "version": metadata.version or "",
+    }
+
+    num_files = 0
+    num_cached = 0
+    for result in manifest.files():
+        # This isn't allowed in micropython-lib anyway.
+        if result.file_type != manifestfile.FILE_TYPE_LOCAL:
+            print(error_color("Error:"), "Non-local file not supported.", file=sys.stderr)
+            sys.exit(1)
+
+        if not result.target_path.endswith(".py"):
+            print(
+                error_color("Error:"),
+                "Target path isn't a .py file:",
+                result.target_path,
+                file=sys.stderr,
+            )
+            sys.exit(1)
+
+        # Tag each file with the package metadata, copy the .py directly and
+        # compile to .mpy (or take it from the cache, keyed by the hash of
+        # the tagged .py).
+        with manifestfile.tagged_py_file(result.full_path, result.metadata) as tagged_path:
+            source_hash = _copy_as_py(
+                package_name,
+                py_package_json,
+                tagged_path,
+                result.target_path,
+                out_file_dir,
+                hash_prefix_len,
+            )
+            if _compile_as_mpy(
+                package_name,
+                mpy_package_json,
+                tagged_path,
+                result.target_path,
+                result.opt,
+                mpy_cross,
+                mpy_cross_path,
+                out_file_dir,
+                hash_prefix_len,
+                source_hash,
+                cache_dir,
+                cache_tag,
+            ):
+                num_cached += 1
+        num_files += 1
+
+    # Create/replace {package}/latest.json.
+    _write_package_json(
+        mpy_package_json,
+        out_package_dir,
+        mpy_version,
+        package_name,
+        "latest",
+        replace=True,
+    )
+    _write_package_json(
+        py_package_json, out_package_dir, "py", package_name, "latest", replace=True
+    )
+
+    # Write {package}/{version}.json, but only if it doesn't already
+    # exist. A package version is "locked" the first time it's seen
+    # by this script.
+    if metadata.version:
+        _write_package_json(
+            mpy_package_json,
+            out_package_dir,
+            mpy_version,
+            package_name,
+            metadata.version,
+            replace=False,
+        )
+        _write_package_json(
+            py_package_json,
+            out_package_dir,
+            "py",
+            package_name,
+            metadata.version,
+            replace=False,
+        )
+
+    # Only plain values are sent back to the main process.
+    metadata = types.SimpleNamespace(
+        version=metadata.version,
+        description=metadata.description,
+        license=metadata.license,
+    )
+    stats = (num_files, num_cached, time.time() - start)
+    return package_name, metadata, stats
+
+
+def build(output_path, hash_prefix_len, mpy_cross_path, jobs=None, cache_dir=None):
+    import mpy_cross
+
     out_file_dir = os.path.join(output_path, "file")
     out_package_dir = os.path.join(output_path, "package")
 
@@ -316,18 +512,54 @@ def build(output_path, hash_prefix_len, mpy_cross_path):
     mpy_version = str(mpy_version)
     print("Generating bytecode version", mpy_version)
 
+    # Cached .mpy files are only valid for the exact mpy-cross that built them.
+    cache_tag = mpy_cross.description(mpy_cross=mpy_cross_path)
+    if cache_dir:
+        print("Using build cache", cache_dir)
+
+    manifest_paths = []
     for lib_dir in lib_dirs:
-        for manifest_path in glob.glob(os.path.join(lib_dir, "**", "manifest.py"), recursive=True):
-            print("{}".format(os.path.dirname(manifest_path)))
-            # .../foo/manifest.py -> foo
-            package_name = os.path.basename(os.path.dirname(manifest_path))
+        manifest_paths.extend(
+            sorted(glob.glob(os.path.join(lib_dir, "**", "manifest.py"), recursive=True))
+        )
+
+    args = (
+        path_vars,
+        mpy_version,
+        mpy_cross_path,
+        out_file_dir,
+        out_package_dir,
+        hash_prefix_len,
+        cache_dir,
+        cache_tag,
+    )
+
+    start = time.time()
+    timings = []
+    if jobs == 1:
+        results = (_build_package(path, *args) for path in manifest_paths)
+        executor = None
+    else:
+        import concurrent.futures
+
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker, initargs=(list(sys.path),)
+        )
+        futures = [executor.submit(_build_package, path, *args) for path in manifest_paths]
+        results = (f.result() for f in futures)
 
-            # Compile the manifest.
-            manifest = manifestfile.ManifestFile(manifestfile.MODE_COMPILE, path_vars)
-            manifest.execute(manifest_path)
+    try:
+        for manifest_path, (package_name, metadata, stats) in zip(manifest_paths, results):
+            num_files, num_cached, duration = stats
+            print(
+                "{} ({} files, {} cached, {:.2f}s)".format(
+                    os.path.dirname(manifest_path), num_files, num_cached, duration
+                )
+            )
+            timings.append((duration, package_name))
 
             # Append this package to the index.
-            if not manifest.metadata().version:
+            if not metadata.version:
                 print(error_color("Warning:"), package_name, "doesn't have a version.")
 
             # Try to find this package in the previous index.json.
@@ -342,96 +574,24 @@ def build(output_path, hash_prefix_len, mpy_cross_path):
                 }
                 index_json["packages"].append(index_package_json)
 
-            _update_index_package_metadata(index_package_json, manifest.metadata(), mpy_version)
-
-            # This is the package json that mip/mpremote downloads.
-            mpy_package_json = {
-                "v": _JSON_VERSION_PACKAGE,
-                "hashes": [],
-                "version": manifest.metadata().version or "",
-            }
-            py_package_json = {
-                "v": _JSON_VERSION_PACKAGE,
-                "hashes": [],
-                "version": manifest.metadata().version or "",
-            }
-
-            for result in manifest.files():
-                # This isn't allowed in micropython-lib anyway.
-                if result.file_type != manifestfile.FILE_TYPE_LOCAL:
-                    print(error_color("Error:"), "Non-local file not supported.", file=sys.stderr)
-                    sys.exit(1)
-
-                if not result.target_path.endswith(".py"):
-                    print(
-                        error_color("Error:"),
-                        "Target path isn't a .py file:",
-                        result.target_path,
-                        file=sys.stderr,
-                    )
-                    sys.exit(1)
-
-                # Tag each file with the package metadata and compile to .mpy
-                # (and copy the .py directly).
-                with manifestfile.tagged_py_file(result.full_path, result.metadata) as tagged_path:
-                    _compile_as_mpy(
-                        package_name,
-                        mpy_package_json,
-                        tagged_path,
-                        result.target_path,
-                        result.opt,
-                        mpy_cross,
-                        mpy_cross_path,
-                        out_file_dir,
-                        hash_prefix_len,
-                    )
-                    _copy_as_py(
-                        package_name,
-                        py_package_json,
-                        tagged_path,
-                        result.target_path,
-                        out_file_dir,
-                        hash_prefix_len,
-                    )
-
-            # Create/replace {package}/latest.json.
-            _write_package_json(
-                mpy_package_json,
-                out_package_dir,
-                mpy_version,
-                package_name,
-                "latest",
-                replace=True,
-            )
-            _write_package_json(
-                py_package_json, out_package_dir, "py", package_name, "latest", replace=True
-            )
-
-            # Write {package}/{version}.json, but only if it doesn't already
-            # exist. A package version is "locked" the first time it's seen
-            # by this script.
-            if manifest.metadata().version:
-                _write_package_json(
-                    mpy_package_json,
-                    out_package_dir,
-                    mpy_version,
-                    package_name,
-                    manifest.metadata().version,
-                    replace=False,
-                )
-                _write_package_json(
-                    py_package_json,
-                    out_package_dir,
-                    "py",
-                    package_name,
-                    manifest.metadata().version,
-                    replace=False,
-                )
+            _update_index_package_metadata(index_package_json, metadata, mpy_version)
+    finally:
+        if executor:
+            executor.shutdown(cancel_futures=True)
 
     # Write updated package index json, sorted by package name.
     index_json["packages"].sort(key=lambda p: p["name"])
     _write_json(index_json, index_json_path, minify=False)
 
+    timings.sort(reverse=True)
+    print(
+        "Built {} packages in {:.2f}s (slowest: {})".format(
+            len(timings),
+            time.time() - start,
+            ", ".join("{} {:.2f}s".format(name, t) for t, name in timings[:5]),
+        )
+    )
+
 
 def main():
     import argparse
@@ -441,13 +601,34 @@ def main():
     cmd_parser.add_argument("--hash-prefix", default=8, type=int, help="hash prefix length")
     cmd_parser.add_argument("--mpy-cross", default=None, help="optional path to mpy-cross binary")
     cmd_parser.add_argument("--micropython", default=None, help="path to micropython repo")
+    cmd_parser.add_argument(
+        "--jobs",
+        "-j",
+        default=None,
+        type=int,
+        help="number of packages to build in parallel (default: number of CPUs)",
+    )
+    cmd_parser.add_argument(
+        "--cache-dir",
+        default=os.path.join(os.path.expanduser("~"), ".cache", "micropython-lib-build"),
+        help="directory for cached .mpy files",
+    )
+    cmd_parser.add_argument(
+        "--no-cache", action="store_true", help="always compile, without using the cache"
+    )
     args = cmd_parser.parse_args()
 
     if args.micropython:
         sys.path.append(os.path.join(args.micropython, "tools"))  # for manifestfile
         sys.path.append(os.path.join(args.micropython, "mpy-cross"))  # for mpy_cross
 
-    build(args.output, hash_prefix_len=max(4, args.hash_prefix), mpy_cross_path=args.mpy_cross)
+    build(
+        args.output,
+        hash_prefix_len=max(4, args.hash_prefix),
+        mpy_cross_path=args.mpy_cross,
+        jobs=args.jobs,
+        cache_dir=None if args.no_cache else args.cache_dir,
+    )
 
 
 if __name__ == "__main__":
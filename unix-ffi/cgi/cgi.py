@@ -46,6 +46,7 @@ __all__ = [
     "parse_qsl",
     "parse_multipart",
     "parse_header",
+    "MultipartParser",
     "print_exception",
     "print_environ",
     "print_form",
@@ -910,6 +911,165 @@ class FieldStorage:
             return tempfile.TemporaryFile("w+", encoding=self.encoding, newline="\n")
 
 
+# Streaming multipart parser
+# ==========================
+
+# MultipartParser states.
+_PREAMBLE = 0
+_BOUNDARY = 1  # after a delimiter, before the end of its line
+_HEADERS = 2
+_BODY = 3
+_EPILOGUE = 4
+
+
+class MultipartParser:
+    """Streaming parser for multipart/form-data (or any multipart/*) bodies.
+
+    Instead of reading the body line by line, it searches blocks of data for
+    the boundary, so binary data with few line breaks costs the same as text.
+    Part contents are not stored: subclasses override the callbacks to write
+    each part wherever it should go, e.g. to a file or a socket.
+
+        class Saver(MultipartParser):
+            def on_part_begin(self, headers):
+                key, params = parse_header(headers.get("content-disposition", ""))
+                self.f = open(params["filename"], "wb")
+
+            def on_data(self, data):
+                self.f.write(data)
+
+            def on_part_end(self):
+                self.f.close()
+
+        _, params = parse_header(environ["CONTENT_TYPE"])
+        Saver(params["boundary"]).parse(sys.stdin.buffer, int(environ["CONTENT_LENGTH"]))
+
+    Data can be pushed with feed() and close(), or read from a file with
+    parse().
+    """
+
+    bufsize = 64 * 1024  # size of the blocks read by parse()
+    maxheaders = 64 * 1024  # limit on the size of a part's headers
+
+    def __init__(self, boundary):
+        if isinstance(boundary, str):
+            boundary = boundary.encode()
+        if not valid_boundary(boundary):
+            raise ValueError("Invalid boundary in multipart form: %r" % (boundary,))
+        # A boundary is a line of its own, and the line break before it is
+        # part of the delimiter.  Lines may end in "\r\n" or just "\n".
+        self._delim = b"\n--" + boundary
+        # Unprocessed data; the leading "\n" lets the first boundary be at
+        # the very start of the body.
+        self._buf = b"\n"
+        self._state = _PREAMBLE
+        self._headers = None
+        self._last = None
+        self.done = False
+
+    # Overridable -- a part starts; headers maps lower-case header names to
+    # values
+    def on_part_begin(self, headers):
+        pass
+
+    # Overridable -- some more content of the current part; data is a
+    # memoryview which is only valid during the call
+    def on_data(self, data):
+        pass
+
+    # Overridable -- the current part ends
+    def on_part_end(self):
+        pass
+
+    def feed(self, data):
+        """Parse the next block of the body."""
+        buf = self._buf + data if self._buf else data
+        delim = self._delim
+        pos = 0
+        state = self._state
+        while True:
+            if state == _PREAMBLE or state == _BODY:
+                i = buf.find(delim, pos)
+                if i < 0:
+                    # Hold back what may be the start of a delimiter, and the
+                    # "\r" before it.
+                    end = len(buf) - len(delim)
+                    if end > pos:
+                        if state == _BODY:
+                            self.on_data(memoryview(buf)[pos:end])
+                        pos = end
+                    break
+                if state == _BODY:
+                    end = i - 1 if i > pos and buf[i - 1] == 13 else i  # "\r"
+                    if end > pos:
+                        self.on_data(memoryview(buf)[pos:end])
+                    self.on_part_end()
+                pos = i + len(delim)
+                state = _BOUNDARY
+            elif state == _BOUNDARY:
+                if len(buf) - pos < 2:
+                    break
+                if buf[pos : pos + 2] == b"--":
+                    state = _EPILOGUE
+                    self.done = True
+                    continue
+                i = buf.find(b"\n", pos)
+                if i < 0:
+                    break
+                pos = i + 1
+                state = _HEADERS
+                self._headers = {}
+                self._last = None
+            elif state == _HEADERS:
+                i = buf.find(b"\n", pos)
+                if i < 0:
+                    if len(buf) - pos > self.maxheaders:
+                        raise ValueError("Multipart headers too long")
+                    break
+                line = buf[pos:i]
+                pos = i + 1
+                if line.endswith(b"\r"):
+                    line = line[:-1]
+                headers = self._headers
+                if not line:
+                    state = _BODY
+                    self.on_part_begin(headers)
+                elif line[:1] in (b" ", b"\t") and self._last:
+                    # Continuation of the previous header.
+                    headers[self._last] += " " + str(line.strip(), "utf-8")
+                else:
+                    name, _, value = line.partition(b":")
+                    name = str(name.strip(), "utf-8").lower()
+                    headers[name] = str(value.strip(), "utf-8")
+                    self._last = name
+            else:
+                pos = len(buf)
+                break
+        self._buf = buf[pos:]
+        self._state = state
+
+    def close(self):
+        """Finish parsing; raise ValueError if the body was incomplete."""
+        if not self.done:
+            raise ValueError("Incomplete multipart body")
+        self._buf = b""
+
+    def parse(self, fp, length=-1):
+        """Parse the body read from fp (a binary file), at most length bytes
+        of it if length is not negative."""
+        while not self.done and length:
+            n = self.bufsize
+            if 0 <= length < n:
+                n = length
+            data = fp.read(n)
+            if not data:
+                break
+            if length > 0:
+                length -= len(data)
+            self.feed(data)
+        self.close()
+
+
 # Test/debug code
 # ===============
 
@@ -1,3 +1,3 @@
-metadata(version="3.3.4")
+metadata(version="3.3.5")
 
 module("cgi.py")
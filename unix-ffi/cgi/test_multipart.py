@@ -0,0 +1,75 @@
+import io
+from cgi import MultipartParser
+
+
+class Collector(MultipartParser):
+    def __init__(self, boundary):
+        super().__init__(boundary)
+        self.parts = []
+
+    def on_part_begin(self, headers):
+        self.parts.append([headers, b""])
+
+    def on_data(self, data):
+        self.parts[-1][1] += bytes(data)
+
+    def on_part_end(self):
+        self.parts[-1].append("end")
+
+
+# Binary content with line breaks and near-misses of the boundary.
+blob = bytes(range(256)) * 40 + b"\r\n--xyzzX\r\n--xyz\r\n-" + b"\r" * 3
+body = (
+    b"preamble\r\n"
+    b"--xyzzy\r\n"
+    b'Content-Disposition: form-data; name="field"\r\n'
+    b"\r\n"
+    b"value\r\n"
+    b"--xyzzy\r\n"
+    b'Content-Disposition: form-data; name="file"; filename="fw.bin"\r\n'
+    b"Content-Type: application/octet-stream\r\n"
+    b"\r\n" + blob + b"\r\n"
+    b"--xyzzy\n"
+    b"X-Folded: a\n"
+    b" b\n"
+    b"\n"
+    b"\n"
+    b"--xyzzy--\r\n"
+    b"epilogue"
+)
+expected = [
+    [{"content-disposition": 'form-data; name="field"'}, b"value", "end"],
+    [
+        {
+            "content-disposition": 'form-data; name="file"; filename="fw.bin"',
+            "content-type": "application/octet-stream",
+        },
+        blob,
+        "end",
+    ],
+    [{"x-folded": "a b"}, b"", "end"],
+]
+
+p = Collector("xyzzy")
+p.parse(io.BytesIO(body))
+assert p.parts == expected, p.parts
+
+# The result doesn't depend on how the body is split into blocks.
+for size in (1, 2, 3, 5, 8, 13, 100):
+    p = Collector(b"xyzzy")
+    for i in range(0, len(body), size):
+        p.feed(body[i : i + size])
+    p.close()
+    assert p.parts == expected, size
+
+# The body may start with the boundary; parse() stops at length.
+p = Collector("b")
+p.parse(io.BytesIO(b"--b\r\n\r\nx\r\n--b--\r\ntrailing"), 17)
+assert p.parts == [[{}, b"x", "end"]]
+
+try:
+    Collector("b").parse(io.BytesIO(b"--b\r\n\r\ntruncated"))
+except ValueError:
+    pass
+else:
+    assert False
@@ -17,14 +17,24 @@ The other advantage of this parser is that it will never raise a parsing
 exception.  Instead, when it finds something unexpected, it adds a 'defect' to
 the current message.  Defects are just instances that live on the message
 object's .defects attribute.
+
+Large message bodies can be kept out of memory by passing spool to the
+FeedParser constructor: the payload of any non-multipart part larger than
+spool_threshold characters is then decoded according to its
+Content-Transfer-Encoding as it is fed, and written to a file instead of being
+stored in the message.  Uuencoded parts are the exception: they are always
+stored in the message, to be decoded by get_payload(decode=True).
 """
 
 __all__ = ["FeedParser", "BytesFeedParser"]
 
 import re
+import binascii
 
 from email import errors
 from email import message
+from email import utils
+from email._encoded_words import decode_b
 from email._policybase import compat32
 
 NLCRE = re.compile("\r\n|\r|\n")
@@ -39,6 +49,12 @@ NL = "\n"
 
 NeedMoreData = object()
 
+# Spooled payload text is decoded and written in chunks of about this size.
+_SPOOL_CHUNK = 8192
+_B64_INVALID = re.compile(b"[^A-Za-z0-9+/=]")
+# Content-Transfer-Encodings whose parts are never spooled.
+_UUENCODE = ("x-uuencode", "uuencode", "uue", "x-uue")
+
 
 class BufferedSubFile(object):
     """A file-ish object that can have new data loaded into it.
@@ -134,16 +150,30 @@ class BufferedSubFile(object):
 class FeedParser:
     """A feed-style parser of email."""
 
-    def __init__(self, _factory=message.Message, policy=compat32):
+    def __init__(
+        self, _factory=message.Message, policy=compat32, spool=None, spool_threshold=65536
+    ):
         """_factory is called with no arguments to create a new message obj
 
         The policy keyword specifies a policy object that controls a number of
         aspects of the parser's operation.  The default policy maintains
         backward compatibility.
 
+        If spool is given, the payload of a non-multipart part that is longer
+        than spool_threshold characters is not stored in the message.  It is
+        decoded (as by get_payload(decode=True)) while it is fed and written
+        to a binary file, which is left in the message's payload_file
+        attribute; get_payload() then returns an empty string.  If spool is
+        True the file is an unnamed temporary file, rewound ready to be read.
+        Otherwise spool is called with the message to obtain an object with
+        a write() method, and remains the caller's to close.  Uuencoded parts
+        are never spooled.
+
         """
         self._factory = _factory
         self.policy = policy
+        self._spool = spool
+        self._spool_threshold = spool_threshold
         try:
             _factory(policy=self.policy)
             self._factory_kwds = lambda: {"policy": self.policy}
@@ -161,6 +191,11 @@ class FeedParser:
     def _set_headersonly(self):
         self._headersonly = True
 
+    def _new_spool_file(self):
+        if self._spool is True:
+            return _temporary_file()
+        return self._spool(self._cur)
+
     def feed(self, data):
         """Push more data into the parser."""
         self._input.push(data)
@@ -453,12 +488,39 @@ class FeedParser:
         # Otherwise, it's some non-multipart type, so the entire rest of the
         # file contents becomes the payload.
         lines = []
+        size = 0
+        spool = None
+        can_spool = self._spool is not None and (
+            str(self._cur.get("content-transfer-encoding", "")).lower() not in _UUENCODE
+        )
         for line in self._input:
             if line is NeedMoreData:
                 yield NeedMoreData
                 continue
+            if spool is not None:
+                spool.write(line)
+                continue
             lines.append(line)
-        self._cur.set_payload(EMPTYSTRING.join(lines))
+            if can_spool:
+                size += len(line)
+                if size > self._spool_threshold:
+                    # Too big to keep: from now on the payload goes to a file.
+                    spool = _Spool(self._new_spool_file(), self._cur)
+                    for line in lines:
+                        spool.write(line)
+                    lines = None
+        if spool is None:
+            self._cur.set_payload(EMPTYSTRING.join(lines))
+            return
+        # If we stopped at a boundary (a false EOF, with the boundary line
+        # pushed back) then the last newline belongs to the boundary.
+        spool.close(not self._input._lines)
+        for defect in spool.defects:
+            self.policy.handle_defect(self._cur, defect)
+        if self._spool is True:
+            spool.sink.seek(0)
+        self._cur.set_payload("")
+        self._cur.payload_file = spool.sink
 
     def _parse_headers(self, lines):
         # Passed a list of lines that make up the headers for the current msg
@@ -512,6 +574,110 @@ class FeedParser:
             self._cur.set_raw(*self.policy.header_source_parse(lastvalue))
 
 
+def _temporary_file():
+    # A file that is removed as soon as it is opened, so the space it uses is
+    # freed when it is closed.
+    import os
+    import tempfile
+
+    d = tempfile.mkdtemp()
+    name = d + "/payload"
+    f = open(name, "w+b")
+    os.remove(name)
+    os.rmdir(d)
+    return f
+
+
+def _encode(text):
+    # As in Message.get_payload(), turn payload text back into bytes.
+    try:
+        return text.encode("ascii", "surrogateescape")
+    except UnicodeError:
+        return text.encode("raw-unicode-escape")
+
+
+class _Spool:
+    """Decodes payload lines as they are written, and writes the result to
+    sink in chunks."""
+
+    def __init__(self, sink, msg):
+        self.sink = sink
+        self.defects = []
+        self._cte = str(msg.get("content-transfer-encoding", "")).lower()
+        # Text not yet decoded, and the line ending of the last line written,
+        # which is held back until it is known not to precede a boundary.
+        self._text = []
+        self._size = 0
+        self._eol = ""
+        # Base64 characters left over from the last chunk.
+        self._b64 = b""
+
+    def write(self, line):
+        if self._eol:
+            self._text.append(self._eol)
+        if line.endswith("\r\n"):
+            n = 2
+        elif line.endswith("\n") or line.endswith("\r"):
+            n = 1
+        else:
+            n = 0
+        if n:
+            self._eol = line[-n:]
+            line = line[:-n]
+        else:
+            self._eol = ""
+        self._text.append(line)
+        self._size += len(line) + n
+        if self._size >= _SPOOL_CHUNK:
+            self._flush(False)
+
+    def close(self, keep_eol):
+        if keep_eol and self._eol:
+            self._text.append(self._eol)
+        self._eol = ""
+        self._flush(True)
+        if self._b64:
+            # Incomplete final group; decode_b() notes the padding defect.
+            data, defects = decode_b(self._b64)
+            self.sink.write(data)
+            self.defects.extend(defects)
+            self._b64 = b""
+
+    def _flush(self, final):
+        text = EMPTYSTRING.join(self._text)
+        self._text = []
+        self._size = 0
+        cte = self._cte
+        if cte == "quoted-printable":
+            if not final:
+                # Decode whole lines only, since an escape may be split.
+                i = max(text.rfind("\n"), text.rfind("\r")) + 1
+                if i < len(text):
+                    self._text.append(text[i:])
+                    self._size = len(text) - i
+                    text = text[:i]
+            if text:
+                self.sink.write(utils._qdecode(_encode(text)))
+        elif cte == "base64":
+            data = self._b64 + _encode(text.replace("\r", "").replace("\n", ""))
+            if _B64_INVALID.search(data):
+                if not self.defects:
+                    self.defects.append(errors.InvalidBase64CharactersDefect())
+                data = _B64_INVALID.sub(b"", data)
+            n = len(data) & ~3
+            if n:
+                try:
+                    self.sink.write(binascii.a2b_base64(data[:n]))
+                except binascii.Error:
+                    # Misplaced padding.
+                    decoded, defects = decode_b(data[:n])
+                    self.sink.write(decoded)
+                    self.defects.extend(defects)
+            self._b64 = data[n:]
+        elif text:
+            self.sink.write(_encode(text))
+
+
 class BytesFeedParser(FeedParser):
     """Like FeedParser, but feed accepts bytes."""
 
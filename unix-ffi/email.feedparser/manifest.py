@@ -1,8 +1,11 @@
-metadata(version="0.5.1")
+metadata(version="0.6.1")
 
 require("re")
+require("binascii")
+require("tempfile")
 require("email.errors")
 require("email.message")
 require("email.internal")
+require("email.utils")
 
 package("email")
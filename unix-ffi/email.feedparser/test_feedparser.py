@@ -0,0 +1,82 @@
+import io
+import base64
+from email.feedparser import FeedParser, BytesFeedParser
+
+
+data = bytes(range(256)) * 40
+text = "line one\nline two =3D caf=C3=A9\nsoft=\nbreak\n" * 200
+b64 = base64.encodebytes(data).decode()
+
+msg = (
+    "From: a@example.com\n"
+    "Content-Type: multipart/mixed; boundary=XX\n"
+    "\n"
+    "--XX\n"
+    "Content-Type: text/plain\n"
+    "\n"
+    "small\n"
+    "--XX\n"
+    "Content-Type: application/octet-stream\n"
+    "Content-Transfer-Encoding: base64\n"
+    "\n" + b64 + "--XX\n"
+    "Content-Type: text/plain\n"
+    "Content-Transfer-Encoding: quoted-printable\n"
+    "\n" + text + "--XX\n"
+    "Content-Type: text/plain\n"
+    "\n" + "x" * 5000 + "\n"
+    "--XX--\n"
+)
+
+
+def parse(parser, data, n):
+    for i in range(0, len(data), n):
+        parser.feed(data[i : i + n])
+    return parser.close()
+
+
+expected = parse(FeedParser(), msg, 100)
+parts = expected.get_payload()
+
+for n in (1, 7, 100, 4096, len(msg)):
+    sinks = []
+
+    def spool(m):
+        sinks.append(io.BytesIO())
+        return sinks[-1]
+
+    root = parse(BytesFeedParser(spool=spool, spool_threshold=1000), msg.encode(), n)
+    got = root.get_payload()
+    assert len(got) == 4
+    assert got[0].get_payload() == "small"
+    assert not hasattr(got[0], "payload_file")
+    for i in 1, 2, 3:
+        assert got[i].get_payload() == ""
+        assert got[i].payload_file is sinks[i - 1]
+        assert sinks[i - 1].getvalue() == parts[i].get_payload(decode=True), (n, i)
+    assert sinks[0].getvalue() == data
+    assert root.epilogue == expected.epilogue
+
+# A top-level payload keeps its final newline.
+root = parse(FeedParser(spool=True, spool_threshold=10), "Subject: x\n\n" + text, 64)
+assert root.payload_file.read() == parse(FeedParser(), "Subject: x\n\n" + text, 64).get_payload(
+    decode=True
+)
+root.payload_file.close()
+
+# Incomplete base64 is decoded as by get_payload(), with a defect.
+body = "Content-Transfer-Encoding: base64\n\n" + b64[:-3]
+sink = io.BytesIO()
+root = parse(FeedParser(spool=lambda m: sink, spool_threshold=100), body, 50)
+assert sink.getvalue() == parse(FeedParser(), body, 50).get_payload(decode=True)
+assert root.defects
+
+# Uuencoded parts are not spooled.
+uue = "begin 644 f\n" + ("M" + "A" * 60 + "\n") * 100 + "`\nend\n"
+body = "Content-Transfer-Encoding: x-uuencode\n\n" + uue
+root = parse(FeedParser(spool=True, spool_threshold=100), body, 50)
+assert not hasattr(root, "payload_file")
+assert root.get_payload() == parse(FeedParser(), body, 50).get_payload()
+
+# Without spool, nothing changes.
+root = parse(FeedParser(), msg, 100)
+assert root.get_payload()[1].get_payload(decode=True) == data
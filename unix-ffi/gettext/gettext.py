@@ -1,14 +1,445 @@
+import os
+import struct
 import ffilib
 
 libc = ffilib.libc()
 
 gettext_ = libc.func("s", "gettext", "s")
 ngettext_ = libc.func("s", "ngettext", "ssL")
+dgettext_ = libc.func("s", "dgettext", "ss")
+dngettext_ = libc.func("s", "dngettext", "sssL")
+textdomain_ = libc.func("s", "textdomain", "s")
+bindtextdomain_ = libc.func("s", "bindtextdomain", "ss")
+
+_default_localedir = "/usr/share/locale"
+
+# Results of lookups, per text domain for libc and per catalog for
+# GNUTranslations; a cache is emptied when it reaches this size.
+_CACHE_SIZE = 256
+_cache = {}
+# The domain set with textdomain(), "messages" being libc's default.
+_domain = "messages"
+
+
+def _results(domain):
+    d = _cache.get(domain)
+    if d is None or len(d) >= _CACHE_SIZE:
+        d = _cache[domain] = {}
+    return d
+
+
+# The results from libc depend on its text domain settings and locale, so
+# call textdomain() (which empties the caches) after changing the locale.
+def textdomain(domain=None):
+    global _domain
+    _cache.clear()
+    if domain is not None:
+        _domain = textdomain_(domain)
+    return _domain
+
+
+def bindtextdomain(domain, localedir=None):
+    _cache.pop(domain, None)
+    return bindtextdomain_(domain, localedir)
+
+
+def dgettext(domain, message):
+    d = _results(domain)
+    r = d.get(message)
+    if r is None:
+        r = d[message] = dgettext_(domain, message)
+    return r
+
+
+def dngettext(domain, singular, plural, n):
+    d = _results(domain)
+    key = (singular, plural, n)
+    r = d.get(key)
+    if r is None:
+        r = d[key] = dngettext_(domain, singular, plural, n)
+    return r
 
 
 def gettext(message):
-    return gettext_(message)
+    d = _results(_domain)
+    r = d.get(message)
+    if r is None:
+        r = d[message] = gettext_(message)
+    return r
 
 
 def ngettext(singular, plural, n):
-    return ngettext_(singular, plural, n)
+    d = _results(_domain)
+    key = (singular, plural, n)
+    r = d.get(key)
+    if r is None:
+        r = d[key] = ngettext_(singular, plural, n)
+    return r
+
+
+# Catalogs read from .mo files, without libc.
+
+
+def _plural_tokens(expr):
+    tokens = []
+    i = 0
+    while i < len(expr):
+        c = expr[i]
+        if c in " \t\n":
+            i += 1
+        elif c.isdigit():
+            j = i
+            while j < len(expr) and expr[j].isdigit():
+                j += 1
+            tokens.append(int(expr[i:j]))
+            i = j
+        elif expr[i : i + 2] in ("&&", "||", "==", "!=", "<=", ">="):
+            tokens.append(expr[i : i + 2])
+            i += 2
+        elif c in "n+-*/%<>!?:()":
+            tokens.append(c)
+            i += 1
+        else:
+            raise ValueError("invalid plural expression")
+    tokens.append(None)
+    return tokens
+
+
+_PLURAL_OPS = {
+    "||": lambda a, b: int(bool(a or b)),
+    "&&": lambda a, b: int(bool(a and b)),
+    "==": lambda a, b: int(a == b),
+    "!=": lambda a, b: int(a != b),
+    "<": lambda a, b: int(a < b),
+    ">": lambda a, b: int(a > b),
+    "<=": lambda a, b: int(a <= b),
+    ">=": lambda a, b: int(a >= b),
+    "+": lambda a, b: a + b,
+    "-": lambda a, b: a - b,
+    "*": lambda a, b: a * b,
+    "/": lambda a, b: a // b,
+    "%": lambda a, b: a % b,
+}
+# Binary operators by increasing precedence; the conditional operator is
+# below all of them.
+_PLURAL_LEVELS = (
+    ("||",),
+    ("&&",),
+    ("==", "!="),
+    ("<", ">", "<=", ">="),
+    ("+", "-"),
+    ("*", "/", "%"),
+)
+
+
+def _plural(expr):
+    # Compile the C expression of a Plural-Forms header into a function
+    # of n, without eval().
+    tokens = _plural_tokens(expr)
+    pos = 0
+
+    def take(t):
+        nonlocal pos
+        if tokens[pos] != t:
+            raise ValueError("invalid plural expression")
+        pos += 1
+
+    def unary():
+        nonlocal pos
+        t = tokens[pos]
+        pos += 1
+        if t == "n":
+            return lambda n: n
+        if isinstance(t, int):
+            return lambda n: t
+        if t == "!":
+            f = unary()
+            return lambda n: int(not f(n))
+        if t == "(":
+            f = cond()
+            take(")")
+            return f
+        raise ValueError("invalid plural expression")
+
+    def binary(level):
+        nonlocal pos
+        if level == len(_PLURAL_LEVELS):
+            return unary()
+        f = binary(level + 1)
+        while tokens[pos] in _PLURAL_LEVELS[level]:
+            op = _PLURAL_OPS[tokens[pos]]
+            pos += 1
+            f = _plural_op(op, f, binary(level + 1))
+        return f
+
+    def cond():
+        nonlocal pos
+        f = binary(0)
+        if tokens[pos] != "?":
+            return f
+        pos += 1
+        a = cond()
+        take(":")
+        b = cond()
+        return lambda n: a(n) if f(n) else b(n)
+
+    f = cond()
+    take(None)
+    return f
+
+
+def _plural_op(op, f, g):
+    return lambda n: op(f(n), g(n))
+
+
+def _hash(s):
+    # The hash function of GNU gettext's .mo hash table.
+    h = 0
+    for c in s:
+        h = (h << 4) + c
+        g = h & 0xF0000000
+        if g:
+            h ^= g >> 24
+            h ^= g
+    return h
+
+
+class NullTranslations:
+    def __init__(self, fp=None):
+        self._info = {}
+        self._charset = None
+        self._fallback = None
+        if fp is not None:
+            self._parse(fp)
+
+    def _parse(self, fp):
+        pass
+
+    def add_fallback(self, fallback):
+        if self._fallback:
+            self._fallback.add_fallback(fallback)
+        else:
+            self._fallback = fallback
+
+    def gettext(self, message):
+        if self._fallback:
+            return self._fallback.gettext(message)
+        return message
+
+    def ngettext(self, singular, plural, n):
+        if self._fallback:
+            return self._fallback.ngettext(singular, plural, n)
+        return singular if n == 1 else plural
+
+    def info(self):
+        return self._info
+
+    def charset(self):
+        return self._charset
+
+    def install(self, names=None):
+        import builtins
+
+        builtins._ = self.gettext
+        for name in names or ():
+            setattr(builtins, name, getattr(self, name))
+
+
+class GNUTranslations(NullTranslations):
+    # The catalog is used in place, as read from the file or, with
+    # use_mmap, as mapped into memory (which needs the mmap module): a
+    # string is found through the hash table of the file (or by binary
+    # search if it has none) and decoded when first looked up.
+    LE_MAGIC = 0x950412DE
+    BE_MAGIC = 0xDE120495
+
+    def __init__(self, fp=None, use_mmap=False):
+        self._use_mmap = use_mmap
+        super().__init__(fp)
+
+    def _parse(self, fp):
+        if self._use_mmap:
+            import mmap
+
+            self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            data = memoryview(self._mmap.buf)
+        else:
+            data = fp.read()
+        magic = struct.unpack_from("<I", data, 0)[0]
+        if magic == self.LE_MAGIC:
+            e = "<"
+        elif magic == self.BE_MAGIC:
+            e = ">"
+        else:
+            raise OSError(0, "Bad magic number")
+        version, self._n, self._orig, self._trans, self._hsize, self._hoff = struct.unpack_from(
+            e + "6I", data, 4
+        )
+        if version >> 16 not in (0, 1):
+            raise OSError(0, "Bad version number")
+        self._data = data
+        self._e = e
+        self._cache = {}
+        self._plural = lambda n: int(n != 1)
+        self._charset = "utf-8"
+        i = self._find(b"")
+        if i >= 0:
+            self._parse_header(self._string(self._trans, i).decode())
+
+    def _parse_header(self, header):
+        for line in header.split("\n"):
+            k, sep, v = line.partition(":")
+            if not sep:
+                continue
+            k = k.strip().lower()
+            v = v.strip()
+            self._info[k] = v
+            if k == "content-type":
+                i = v.find("charset=")
+                if i >= 0:
+                    self._charset = v[i + 8 :].split(";")[0].strip().lower()
+            elif k == "plural-forms":
+                for part in v.split(";"):
+                    part = part.strip()
+                    if part.startswith("plural="):
+                        self._plural = _plural(part[7:])
+
+    def _string(self, table, i):
+        length, offset = struct.unpack_from(self._e + "2I", self._data, table + 8 * i)
+        return bytes(self._data[offset : offset + length])
+
+    def _msgid(self, i):
+        # The singular form of an original string.
+        s = self._string(self._orig, i)
+        j = s.find(b"\0")
+        return s if j < 0 else s[:j]
+
+    def _find(self, key):
+        # Return the index of the original string key, or -1.
+        size = self._hsize
+        if size > 2:
+            h = _hash(key)
+            idx = h % size
+            incr = 1 + h % (size - 2)
+            while True:
+                i = struct.unpack_from(self._e + "I", self._data, self._hoff + 4 * idx)[0]
+                if not i:
+                    return -1
+                if self._msgid(i - 1) == key:
+                    return i - 1
+                idx = (idx + incr) % size
+        # Without a hash table, the original strings are sorted.
+        lo = 0
+        hi = self._n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            s = self._msgid(mid)
+            if s < key:
+                lo = mid + 1
+            elif s > key:
+                hi = mid
+            else:
+                return mid
+        return -1
+
+    def _lookup(self, message):
+        # Return the translations of message as a tuple, or None.
+        cache = self._cache
+        try:
+            return cache[message]
+        except KeyError:
+            pass
+        i = self._find(message.encode())
+        r = None
+        if i >= 0:
+            r = tuple(str(s, self._charset) for s in self._string(self._trans, i).split(b"\0"))
+        if len(cache) >= _CACHE_SIZE:
+            cache.clear()
+        cache[message] = r
+        return r
+
+    def gettext(self, message):
+        r = self._lookup(message)
+        if r is None:
+            return super().gettext(message)
+        return r[0]
+
+    def ngettext(self, singular, plural, n):
+        r = self._lookup(singular)
+        if r is None:
+            return super().ngettext(singular, plural, n)
+        # As in GNU gettext, an out of range form gives the first one.
+        i = self._plural(n)
+        return r[i] if 0 <= i < len(r) else r[0]
+
+
+def _expand_lang(lang):
+    # "de_DE.UTF-8@euro" -> de_DE.UTF-8@euro, de_DE.UTF-8, de_DE, de.
+    result = [lang]
+    for sep in "@._":
+        i = lang.find(sep)
+        if i >= 0:
+            lang = lang[:i]
+            if lang not in result:
+                result.append(lang)
+    return result
+
+
+def find(domain, localedir=None, languages=None, all=False):
+    if localedir is None:
+        localedir = _default_localedir
+    if languages is None:
+        languages = []
+        for envar in ("LANGUAGE", "LC_ALL", "LC_MESSAGES", "LANG"):
+            val = os.getenv(envar)
+            if val:
+                languages = val.split(":")
+                break
+        if "C" not in languages:
+            languages.append("C")
+    result = []
+    for lang in languages:
+        if lang == "C":
+            break
+        for elang in _expand_lang(lang):
+            mofile = "%s/%s/LC_MESSAGES/%s.mo" % (localedir, elang, domain)
+            try:
+                os.stat(mofile)
+            except OSError:
+                continue
+            if not all:
+                return mofile
+            if mofile not in result:
+                result.append(mofile)
+    return result if all else None
+
+
+_translations = {}
+
+
+def translation(
+    domain, localedir=None, languages=None, class_=None, fallback=False, use_mmap=False
+):
+    mofiles = find(domain, localedir, languages, all=True)
+    if not mofiles:
+        if fallback:
+            return NullTranslations()
+        raise OSError(2, "No translation file found for domain", domain)
+    if class_ is None:
+        class_ = GNUTranslations
+    key = (class_, tuple(mofiles), use_mmap)
+    t = _translations.get(key)
+    if t is None:
+        for mofile in mofiles:
+            with open(mofile, "rb") as fp:
+                u = class_(fp, use_mmap) if use_mmap else class_(fp)
+            if t is None:
+                t = u
+            else:
+                t.add_fallback(u)
+        _translations[key] = t
+    return t
+
+
+def install(domain, localedir=None, names=None):
+    translation(domain, localedir, fallback=True).install(names)
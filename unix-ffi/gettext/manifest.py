@@ -1,7 +1,8 @@
-metadata(version="0.1.0")
+metadata(version="0.2.0")
 
 # Originally written by Riccardo Magliocchetti.
 
 require("ffilib")
+require("os")
 
 module("gettext.py")
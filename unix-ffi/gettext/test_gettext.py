@@ -14,3 +14,90 @@ assert msg == "two"
 
 msg = gettext.ngettext("one", "two", "three")
 assert msg == "two"
+
+# Catalogs from .mo files.
+
+import os
+import struct
+
+catalog = {
+    "": "Content-Type: text/plain; charset=UTF-8\n"
+    "Plural-Forms: nplurals=3; plural=(n%10==1 && n%100!=11 ? 0 : "
+    "n%10>=2 && n%10<=4 && (n%100<10 || n%100>=20) ? 1 : 2);\n",
+    "yes": "tak",
+    "file": "plik",
+    "%d file\0%d files": "%d plik\0%d pliki\0%d plików",
+}
+
+
+def make_mo(catalog, hash_size):
+    # Write a .mo file as GNU msgfmt does, with a hash table of hash_size.
+    keys = sorted(k.encode() for k in catalog)
+    n = len(keys)
+    orig, trans, strings = [], [], b""
+    start = 28 + 16 * n + 4 * hash_size
+    for table, items in ((orig, keys), (trans, [catalog[k.decode()].encode() for k in keys])):
+        for s in items:
+            table.append((len(s), start + len(strings)))
+            strings += s + b"\0"
+    hashtab = [0] * hash_size
+    for i, k in enumerate(keys if hash_size else ()):
+        h = gettext._hash(k.split(b"\0")[0])
+        idx = h % hash_size
+        while hashtab[idx]:
+            idx = (idx + 1 + h % (hash_size - 2)) % hash_size
+        hashtab[idx] = i + 1
+    out = struct.pack("<7I", 0x950412DE, 0, n, 28, 28 + 8 * n, hash_size, 28 + 16 * n)
+    for length, offset in orig + trans:
+        out += struct.pack("<2I", length, offset)
+    for i in hashtab:
+        out += struct.pack("<I", i)
+    return out + strings
+
+
+LOCALEDIR = "test_gettext.dir"
+MODIR = LOCALEDIR + "/pl/LC_MESSAGES"
+MOFILE = MODIR + "/test.mo"
+os.mkdir(LOCALEDIR)
+os.mkdir(LOCALEDIR + "/pl")
+os.mkdir(MODIR)
+
+for hash_size in (7, 0):
+    with open(MOFILE, "wb") as f:
+        f.write(make_mo(catalog, hash_size))
+    for use_mmap in (False, True):
+        with open(MOFILE, "rb") as f:
+            t = gettext.GNUTranslations(f, use_mmap)
+        assert t.gettext("yes") == "tak"
+        assert t.gettext("file") == "plik"
+        assert t.gettext("no") == "no"
+        assert t.gettext("%d file") == "%d plik"
+        assert t.ngettext("%d file", "%d files", 1) == "%d plik"
+        assert t.ngettext("%d file", "%d files", 3) == "%d pliki"
+        assert t.ngettext("%d file", "%d files", 5) == "%d plików"
+        assert t.ngettext("%d file", "%d files", 22) == "%d pliki"
+        assert t.ngettext("%d dir", "%d dirs", 1) == "%d dir"
+        assert t.ngettext("%d dir", "%d dirs", 2) == "%d dirs"
+        assert t.charset() == "utf-8"
+        assert t.info()["content-type"] == "text/plain; charset=UTF-8"
+
+assert gettext.find("test", LOCALEDIR, ["pl_PL.UTF-8"]) == MOFILE
+assert gettext.find("test", LOCALEDIR, ["de", "C", "pl"]) is None
+t = gettext.translation("test", LOCALEDIR, ["pl"])
+assert gettext.translation("test", LOCALEDIR, ["pl"]) is t
+assert isinstance(
+    gettext.translation("test", LOCALEDIR, ["de"], fallback=True), gettext.NullTranslations
+)
+try:
+    gettext.translation("test", LOCALEDIR, ["de"])
+    assert False
+except OSError:
+    pass
+t.install(["ngettext"])
+assert _("yes") == "tak"
+assert ngettext("%d file", "%d files", 2) == "%d pliki"
+
+os.unlink(MOFILE)
+os.rmdir(MODIR)
+os.rmdir(LOCALEDIR + "/pl")
+os.rmdir(LOCALEDIR)
@@ -29,20 +29,26 @@ def iglob(pathname):
     patterns.
 
     """
+    return _iglob(pathname, False)
+
+
+def _iglob(pathname, dironly):
+    # With dironly, only directories are wanted: they are about to be
+    # listed in turn to match the rest of the pattern.
     if not has_magic(pathname):
         if os.path.lexists(pathname):
             yield pathname
         return
     dirname, basename = os.path.split(pathname)
     if not dirname:
-        for name in glob1(None, basename):
+        for name in glob1(None, basename, dironly):
             yield name
         return
     # `os.path.split()` returns the argument itself as a dirname if it is a
     # drive or UNC path.  Prevent an infinite recursion if a drive or UNC path
     # contains magic characters (i.e. r'\\?\C:').
     if dirname != pathname and has_magic(dirname):
-        dirs = iglob(dirname)
+        dirs = _iglob(dirname, True)
     else:
         dirs = [dirname]
     if has_magic(basename):
@@ -50,7 +56,7 @@ def iglob(pathname):
     else:
         glob_in_dir = glob0
     for dirname in dirs:
-        for name in glob_in_dir(dirname, basename):
+        for name in glob_in_dir(dirname, basename, dironly):
             yield os.path.join(dirname, name)
 
 
@@ -59,14 +65,17 @@ def iglob(pathname):
 # takes a literal basename (so it only has to check for its existence).
 
 
-def glob1(dirname, pattern):
+def glob1(dirname, pattern, dironly=False):
     if not dirname:
         if isinstance(pattern, bytes):
             dirname = bytes(os.curdir, "ASCII")
         else:
             dirname = os.curdir
+    # The entry type comes from the directory listing, so filtering for
+    # directories needs no stat() per entry.
     try:
-        names = os.listdir(dirname)
+        with os.scandir(dirname) as it:
+            names = [entry.name for entry in it if not dironly or entry.is_dir()]
     except os.error:
         return []
     if not _ishidden(pattern):
@@ -74,14 +83,15 @@ def glob1(dirname, pattern):
     return fnmatch.filter(names, pattern)
 
 
-def glob0(dirname, basename):
+def glob0(dirname, basename, dironly=False):
     if not basename:
         # `os.path.split()` returns an empty basename for paths ending with a
         # directory separator.  'q*x/' should match only directories.
         if os.path.isdir(dirname):
             return [basename]
     else:
-        if os.path.lexists(os.path.join(dirname, basename)):
+        path = os.path.join(dirname, basename)
+        if os.path.isdir(path) if dironly else os.path.lexists(path):
             return [basename]
     return []
 
@@ -1,4 +1,4 @@
-metadata(version="0.5.2")
+metadata(version="0.6.0")
 
 require("os")
 require("os-path")
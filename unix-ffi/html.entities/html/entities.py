@@ -1,2506 +1,845 @@
 """HTML character entity references."""
 
-# maps the HTML entity name to the Unicode codepoint
-name2codepoint = {
-    "AElig": 0x00C6,  # latin capital letter AE = latin capital ligature AE, U+00C6 ISOlat1
-    "Aacute": 0x00C1,  # latin capital letter A with acute, U+00C1 ISOlat1
-    "Acirc": 0x00C2,  # latin capital letter A with circumflex, U+00C2 ISOlat1
-    "Agrave": 0x00C0,  # latin capital letter A with grave = latin capital letter A grave, U+00C0 ISOlat1
-    "Alpha": 0x0391,  # greek capital letter alpha, U+0391
-    "Aring": 0x00C5,  # latin capital letter A with ring above = latin capital letter A ring, U+00C5 ISOlat1
-    "Atilde": 0x00C3,  # latin capital letter A with tilde, U+00C3 ISOlat1
-    "Auml": 0x00C4,  # latin capital letter A with diaeresis, U+00C4 ISOlat1
-    "Beta": 0x0392,  # greek capital letter beta, U+0392
-    "Ccedil": 0x00C7,  # latin capital letter C with cedilla, U+00C7 ISOlat1
-    "Chi": 0x03A7,  # greek capital letter chi, U+03A7
-    "Dagger": 0x2021,  # double dagger, U+2021 ISOpub
-    "Delta": 0x0394,  # greek capital letter delta, U+0394 ISOgrk3
-    "ETH": 0x00D0,  # latin capital letter ETH, U+00D0 ISOlat1
-    "Eacute": 0x00C9,  # latin capital letter E with acute, U+00C9 ISOlat1
-    "Ecirc": 0x00CA,  # latin capital letter E with circumflex, U+00CA ISOlat1
-    "Egrave": 0x00C8,  # latin capital letter E with grave, U+00C8 ISOlat1
-    "Epsilon": 0x0395,  # greek capital letter epsilon, U+0395
-    "Eta": 0x0397,  # greek capital letter eta, U+0397
-    "Euml": 0x00CB,  # latin capital letter E with diaeresis, U+00CB ISOlat1
-    "Gamma": 0x0393,  # greek capital letter gamma, U+0393 ISOgrk3
-    "Iacute": 0x00CD,  # latin capital letter I with acute, U+00CD ISOlat1
-    "Icirc": 0x00CE,  # latin capital letter I with circumflex, U+00CE ISOlat1
-    "Igrave": 0x00CC,  # latin capital letter I with grave, U+00CC ISOlat1
-    "Iota": 0x0399,  # greek capital letter iota, U+0399
-    "Iuml": 0x00CF,  # latin capital letter I with diaeresis, U+00CF ISOlat1
-    "Kappa": 0x039A,  # greek capital letter kappa, U+039A
-    "Lambda": 0x039B,  # greek capital letter lambda, U+039B ISOgrk3
-    "Mu": 0x039C,  # greek capital letter mu, U+039C
-    "Ntilde": 0x00D1,  # latin capital letter N with tilde, U+00D1 ISOlat1
-    "Nu": 0x039D,  # greek capital letter nu, U+039D
-    "OElig": 0x0152,  # latin capital ligature OE, U+0152 ISOlat2
-    "Oacute": 0x00D3,  # latin capital letter O with acute, U+00D3 ISOlat1
-    "Ocirc": 0x00D4,  # latin capital letter O with circumflex, U+00D4 ISOlat1
-    "Ograve": 0x00D2,  # latin capital letter O with grave, U+00D2 ISOlat1
-    "Omega": 0x03A9,  # greek capital letter omega, U+03A9 ISOgrk3
-    "Omicron": 0x039F,  # greek capital letter omicron, U+039F
-    "Oslash": 0x00D8,  # latin capital letter O with stroke = latin capital letter O slash, U+00D8 ISOlat1
-    "Otilde": 0x00D5,  # latin capital letter O with tilde, U+00D5 ISOlat1
-    "Ouml": 0x00D6,  # latin capital letter O with diaeresis, U+00D6 ISOlat1
-    "Phi": 0x03A6,  # greek capital letter phi, U+03A6 ISOgrk3
-    "Pi": 0x03A0,  # greek capital letter pi, U+03A0 ISOgrk3
-    "Prime": 0x2033,  # double prime = seconds = inches, U+2033 ISOtech
-    "Psi": 0x03A8,  # greek capital letter psi, U+03A8 ISOgrk3
-    "Rho": 0x03A1,  # greek capital letter rho, U+03A1
-    "Scaron": 0x0160,  # latin capital letter S with caron, U+0160 ISOlat2
-    "Sigma": 0x03A3,  # greek capital letter sigma, U+03A3 ISOgrk3
-    "THORN": 0x00DE,  # latin capital letter THORN, U+00DE ISOlat1
-    "Tau": 0x03A4,  # greek capital letter tau, U+03A4
-    "Theta": 0x0398,  # greek capital letter theta, U+0398 ISOgrk3
-    "Uacute": 0x00DA,  # latin capital letter U with acute, U+00DA ISOlat1
-    "Ucirc": 0x00DB,  # latin capital letter U with circumflex, U+00DB ISOlat1
-    "Ugrave": 0x00D9,  # latin capital letter U with grave, U+00D9 ISOlat1
-    "Upsilon": 0x03A5,  # greek capital letter upsilon, U+03A5 ISOgrk3
-    "Uuml": 0x00DC,  # latin capital letter U with diaeresis, U+00DC ISOlat1
-    "Xi": 0x039E,  # greek capital letter xi, U+039E ISOgrk3
-    "Yacute": 0x00DD,  # latin capital letter Y with acute, U+00DD ISOlat1
-    "Yuml": 0x0178,  # latin capital letter Y with diaeresis, U+0178 ISOlat2
-    "Zeta": 0x0396,  # greek capital letter zeta, U+0396
-    "aacute": 0x00E1,  # latin small letter a with acute, U+00E1 ISOlat1
-    "acirc": 0x00E2,  # latin small letter a with circumflex, U+00E2 ISOlat1
-    "acute": 0x00B4,  # acute accent = spacing acute, U+00B4 ISOdia
-    "aelig": 0x00E6,  # latin small letter ae = latin small ligature ae, U+00E6 ISOlat1
-    "agrave": 0x00E0,  # latin small letter a with grave = latin small letter a grave, U+00E0 ISOlat1
-    "alefsym": 0x2135,  # alef symbol = first transfinite cardinal, U+2135 NEW
-    "alpha": 0x03B1,  # greek small letter alpha, U+03B1 ISOgrk3
-    "amp": 0x0026,  # ampersand, U+0026 ISOnum
-    "and": 0x2227,  # logical and = wedge, U+2227 ISOtech
-    "ang": 0x2220,  # angle, U+2220 ISOamso
-    "aring": 0x00E5,  # latin small letter a with ring above = latin small letter a ring, U+00E5 ISOlat1
-    "asymp": 0x2248,  # almost equal to = asymptotic to, U+2248 ISOamsr
-    "atilde": 0x00E3,  # latin small letter a with tilde, U+00E3 ISOlat1
-    "auml": 0x00E4,  # latin small letter a with diaeresis, U+00E4 ISOlat1
-    "bdquo": 0x201E,  # double low-9 quotation mark, U+201E NEW
-    "beta": 0x03B2,  # greek small letter beta, U+03B2 ISOgrk3
-    "brvbar": 0x00A6,  # broken bar = broken vertical bar, U+00A6 ISOnum
-    "bull": 0x2022,  # bullet = black small circle, U+2022 ISOpub
-    "cap": 0x2229,  # intersection = cap, U+2229 ISOtech
-    "ccedil": 0x00E7,  # latin small letter c with cedilla, U+00E7 ISOlat1
-    "cedil": 0x00B8,  # cedilla = spacing cedilla, U+00B8 ISOdia
-    "cent": 0x00A2,  # cent sign, U+00A2 ISOnum
-    "chi": 0x03C7,  # greek small letter chi, U+03C7 ISOgrk3
-    "circ": 0x02C6,  # modifier letter circumflex accent, U+02C6 ISOpub
-    "clubs": 0x2663,  # black club suit = shamrock, U+2663 ISOpub
-    "cong": 0x2245,  # approximately equal to, U+2245 ISOtech
-    "copy": 0x00A9,  # copyright sign, U+00A9 ISOnum
-    "crarr": 0x21B5,  # downwards arrow with corner leftwards = carriage return, U+21B5 NEW
-    "cup": 0x222A,  # union = cup, U+222A ISOtech
-    "curren": 0x00A4,  # currency sign, U+00A4 ISOnum
-    "dArr": 0x21D3,  # downwards double arrow, U+21D3 ISOamsa
-    "dagger": 0x2020,  # dagger, U+2020 ISOpub
-    "darr": 0x2193,  # downwards arrow, U+2193 ISOnum
-    "deg": 0x00B0,  # degree sign, U+00B0 ISOnum
-    "delta": 0x03B4,  # greek small letter delta, U+03B4 ISOgrk3
-    "diams": 0x2666,  # black diamond suit, U+2666 ISOpub
-    "divide": 0x00F7,  # division sign, U+00F7 ISOnum
-    "eacute": 0x00E9,  # latin small letter e with acute, U+00E9 ISOlat1
-    "ecirc": 0x00EA,  # latin small letter e with circumflex, U+00EA ISOlat1
-    "egrave": 0x00E8,  # latin small letter e with grave, U+00E8 ISOlat1
-    "empty": 0x2205,  # empty set = null set = diameter, U+2205 ISOamso
-    "emsp": 0x2003,  # em space, U+2003 ISOpub
-    "ensp": 0x2002,  # en space, U+2002 ISOpub
-    "epsilon": 0x03B5,  # greek small letter epsilon, U+03B5 ISOgrk3
-    "equiv": 0x2261,  # identical to, U+2261 ISOtech
-    "eta": 0x03B7,  # greek small letter eta, U+03B7 ISOgrk3
-    "eth": 0x00F0,  # latin small letter eth, U+00F0 ISOlat1
-    "euml": 0x00EB,  # latin small letter e with diaeresis, U+00EB ISOlat1
-    "euro": 0x20AC,  # euro sign, U+20AC NEW
-    "exist": 0x2203,  # there exists, U+2203 ISOtech
-    "fnof": 0x0192,  # latin small f with hook = function = florin, U+0192 ISOtech
-    "forall": 0x2200,  # for all, U+2200 ISOtech
-    "frac12": 0x00BD,  # vulgar fraction one half = fraction one half, U+00BD ISOnum
-    "frac14": 0x00BC,  # vulgar fraction one quarter = fraction one quarter, U+00BC ISOnum
-    "frac34": 0x00BE,  # vulgar fraction three quarters = fraction three quarters, U+00BE ISOnum
-    "frasl": 0x2044,  # fraction slash, U+2044 NEW
-    "gamma": 0x03B3,  # greek small letter gamma, U+03B3 ISOgrk3
-    "ge": 0x2265,  # greater-than or equal to, U+2265 ISOtech
-    "gt": 0x003E,  # greater-than sign, U+003E ISOnum
-    "hArr": 0x21D4,  # left right double arrow, U+21D4 ISOamsa
-    "harr": 0x2194,  # left right arrow, U+2194 ISOamsa
-    "hearts": 0x2665,  # black heart suit = valentine, U+2665 ISOpub
-    "hellip": 0x2026,  # horizontal ellipsis = three dot leader, U+2026 ISOpub
-    "iacute": 0x00ED,  # latin small letter i with acute, U+00ED ISOlat1
-    "icirc": 0x00EE,  # latin small letter i with circumflex, U+00EE ISOlat1
-    "iexcl": 0x00A1,  # inverted exclamation mark, U+00A1 ISOnum
-    "igrave": 0x00EC,  # latin small letter i with grave, U+00EC ISOlat1
-    "image": 0x2111,  # blackletter capital I = imaginary part, U+2111 ISOamso
-    "infin": 0x221E,  # infinity, U+221E ISOtech
-    "int": 0x222B,  # integral, U+222B ISOtech
-    "iota": 0x03B9,  # greek small letter iota, U+03B9 ISOgrk3
-    "iquest": 0x00BF,  # inverted question mark = turned question mark, U+00BF ISOnum
-    "isin": 0x2208,  # element of, U+2208 ISOtech
-    "iuml": 0x00EF,  # latin small letter i with diaeresis, U+00EF ISOlat1
-    "kappa": 0x03BA,  # greek small letter kappa, U+03BA ISOgrk3
-    "lArr": 0x21D0,  # leftwards double arrow, U+21D0 ISOtech
-    "lambda": 0x03BB,  # greek small letter lambda, U+03BB ISOgrk3
-    "lang": 0x2329,  # left-pointing angle bracket = bra, U+2329 ISOtech
-    "laquo": 0x00AB,  # left-pointing double angle quotation mark = left pointing guillemet, U+00AB ISOnum
-    "larr": 0x2190,  # leftwards arrow, U+2190 ISOnum
-    "lceil": 0x2308,  # left ceiling = apl upstile, U+2308 ISOamsc
-    "ldquo": 0x201C,  # left double quotation mark, U+201C ISOnum
-    "le": 0x2264,  # less-than or equal to, U+2264 ISOtech
-    "lfloor": 0x230A,  # left floor = apl downstile, U+230A ISOamsc
-    "lowast": 0x2217,  # asterisk operator, U+2217 ISOtech
-    "loz": 0x25CA,  # lozenge, U+25CA ISOpub
-    "lrm": 0x200E,  # left-to-right mark, U+200E NEW RFC 2070
-    "lsaquo": 0x2039,  # single left-pointing angle quotation mark, U+2039 ISO proposed
-    "lsquo": 0x2018,  # left single quotation mark, U+2018 ISOnum
-    "lt": 0x003C,  # less-than sign, U+003C ISOnum
-    "macr": 0x00AF,  # macron = spacing macron = overline = APL overbar, U+00AF ISOdia
-    "mdash": 0x2014,  # em dash, U+2014 ISOpub
-    "micro": 0x00B5,  # micro sign, U+00B5 ISOnum
-    "middot": 0x00B7,  # middle dot = Georgian comma = Greek middle dot, U+00B7 ISOnum
-    "minus": 0x2212,  # minus sign, U+2212 ISOtech
-    "mu": 0x03BC,  # greek small letter mu, U+03BC ISOgrk3
-    "nabla": 0x2207,  # nabla = backward difference, U+2207 ISOtech
-    "nbsp": 0x00A0,  # no-break space = non-breaking space, U+00A0 ISOnum
-    "ndash": 0x2013,  # en dash, U+2013 ISOpub
-    "ne": 0x2260,  # not equal to, U+2260 ISOtech
-    "ni": 0x220B,  # contains as member, U+220B ISOtech
-    "not": 0x00AC,  # not sign, U+00AC ISOnum
-    "notin": 0x2209,  # not an element of, U+2209 ISOtech
-    "nsub": 0x2284,  # not a subset of, U+2284 ISOamsn
-    "ntilde": 0x00F1,  # latin small letter n with tilde, U+00F1 ISOlat1
-    "nu": 0x03BD,  # greek small letter nu, U+03BD ISOgrk3
-    "oacute": 0x00F3,  # latin small letter o with acute, U+00F3 ISOlat1
-    "ocirc": 0x00F4,  # latin small letter o with circumflex, U+00F4 ISOlat1
-    "oelig": 0x0153,  # latin small ligature oe, U+0153 ISOlat2
-    "ograve": 0x00F2,  # latin small letter o with grave, U+00F2 ISOlat1
-    "oline": 0x203E,  # overline = spacing overscore, U+203E NEW
-    "omega": 0x03C9,  # greek small letter omega, U+03C9 ISOgrk3
-    "omicron": 0x03BF,  # greek small letter omicron, U+03BF NEW
-    "oplus": 0x2295,  # circled plus = direct sum, U+2295 ISOamsb
-    "or": 0x2228,  # logical or = vee, U+2228 ISOtech
-    "ordf": 0x00AA,  # feminine ordinal indicator, U+00AA ISOnum
-    "ordm": 0x00BA,  # masculine ordinal indicator, U+00BA ISOnum
-    "oslash": 0x00F8,  # latin small letter o with stroke, = latin small letter o slash, U+00F8 ISOlat1
-    "otilde": 0x00F5,  # latin small letter o with tilde, U+00F5 ISOlat1
-    "otimes": 0x2297,  # circled times = vector product, U+2297 ISOamsb
-    "ouml": 0x00F6,  # latin small letter o with diaeresis, U+00F6 ISOlat1
-    "para": 0x00B6,  # pilcrow sign = paragraph sign, U+00B6 ISOnum
-    "part": 0x2202,  # partial differential, U+2202 ISOtech
-    "permil": 0x2030,  # per mille sign, U+2030 ISOtech
-    "perp": 0x22A5,  # up tack = orthogonal to = perpendicular, U+22A5 ISOtech
-    "phi": 0x03C6,  # greek small letter phi, U+03C6 ISOgrk3
-    "pi": 0x03C0,  # greek small letter pi, U+03C0 ISOgrk3
-    "piv": 0x03D6,  # greek pi symbol, U+03D6 ISOgrk3
-    "plusmn": 0x00B1,  # plus-minus sign = plus-or-minus sign, U+00B1 ISOnum
-    "pound": 0x00A3,  # pound sign, U+00A3 ISOnum
-    "prime": 0x2032,  # prime = minutes = feet, U+2032 ISOtech
-    "prod": 0x220F,  # n-ary product = product sign, U+220F ISOamsb
-    "prop": 0x221D,  # proportional to, U+221D ISOtech
-    "psi": 0x03C8,  # greek small letter psi, U+03C8 ISOgrk3
-    "quot": 0x0022,  # quotation mark = APL quote, U+0022 ISOnum
-    "rArr": 0x21D2,  # rightwards double arrow, U+21D2 ISOtech
-    "radic": 0x221A,  # square root = radical sign, U+221A ISOtech
-    "rang": 0x232A,  # right-pointing angle bracket = ket, U+232A ISOtech
-    "raquo": 0x00BB,  # right-pointing double angle quotation mark = right pointing guillemet, U+00BB ISOnum
-    "rarr": 0x2192,  # rightwards arrow, U+2192 ISOnum
-    "rceil": 0x2309,  # right ceiling, U+2309 ISOamsc
-    "rdquo": 0x201D,  # right double quotation mark, U+201D ISOnum
-    "real": 0x211C,  # blackletter capital R = real part symbol, U+211C ISOamso
-    "reg": 0x00AE,  # registered sign = registered trade mark sign, U+00AE ISOnum
-    "rfloor": 0x230B,  # right floor, U+230B ISOamsc
-    "rho": 0x03C1,  # greek small letter rho, U+03C1 ISOgrk3
-    "rlm": 0x200F,  # right-to-left mark, U+200F NEW RFC 2070
-    "rsaquo": 0x203A,  # single right-pointing angle quotation mark, U+203A ISO proposed
-    "rsquo": 0x2019,  # right single quotation mark, U+2019 ISOnum
-    "sbquo": 0x201A,  # single low-9 quotation mark, U+201A NEW
-    "scaron": 0x0161,  # latin small letter s with caron, U+0161 ISOlat2
-    "sdot": 0x22C5,  # dot operator, U+22C5 ISOamsb
-    "sect": 0x00A7,  # section sign, U+00A7 ISOnum
-    "shy": 0x00AD,  # soft hyphen = discretionary hyphen, U+00AD ISOnum
-    "sigma": 0x03C3,  # greek small letter sigma, U+03C3 ISOgrk3
-    "sigmaf": 0x03C2,  # greek small letter final sigma, U+03C2 ISOgrk3
-    "sim": 0x223C,  # tilde operator = varies with = similar to, U+223C ISOtech
-    "spades": 0x2660,  # black spade suit, U+2660 ISOpub
-    "sub": 0x2282,  # subset of, U+2282 ISOtech
-    "sube": 0x2286,  # subset of or equal to, U+2286 ISOtech
-    "sum": 0x2211,  # n-ary sumation, U+2211 ISOamsb
-    "sup": 0x2283,  # superset of, U+2283 ISOtech
-    "sup1": 0x00B9,  # superscript one = superscript digit one, U+00B9 ISOnum
-    "sup2": 0x00B2,  # superscript two = superscript digit two = squared, U+00B2 ISOnum
-    "sup3": 0x00B3,  # superscript three = superscript digit three = cubed, U+00B3 ISOnum
-    "supe": 0x2287,  # superset of or equal to, U+2287 ISOtech
-    "szlig": 0x00DF,  # latin small letter sharp s = ess-zed, U+00DF ISOlat1
-    "tau": 0x03C4,  # greek small letter tau, U+03C4 ISOgrk3
-    "there4": 0x2234,  # therefore, U+2234 ISOtech
-    "theta": 0x03B8,  # greek small letter theta, U+03B8 ISOgrk3
-    "thetasym": 0x03D1,  # greek small letter theta symbol, U+03D1 NEW
-    "thinsp": 0x2009,  # thin space, U+2009 ISOpub
-    "thorn": 0x00FE,  # latin small letter thorn with, U+00FE ISOlat1
-    "tilde": 0x02DC,  # small tilde, U+02DC ISOdia
-    "times": 0x00D7,  # multiplication sign, U+00D7 ISOnum
-    "trade": 0x2122,  # trade mark sign, U+2122 ISOnum
-    "uArr": 0x21D1,  # upwards double arrow, U+21D1 ISOamsa
-    "uacute": 0x00FA,  # latin small letter u with acute, U+00FA ISOlat1
-    "uarr": 0x2191,  # upwards arrow, U+2191 ISOnum
-    "ucirc": 0x00FB,  # latin small letter u with circumflex, U+00FB ISOlat1
-    "ugrave": 0x00F9,  # latin small letter u with grave, U+00F9 ISOlat1
-    "uml": 0x00A8,  # diaeresis = spacing diaeresis, U+00A8 ISOdia
-    "upsih": 0x03D2,  # greek upsilon with hook symbol, U+03D2 NEW
-    "upsilon": 0x03C5,  # greek small letter upsilon, U+03C5 ISOgrk3
-    "uuml": 0x00FC,  # latin small letter u with diaeresis, U+00FC ISOlat1
-    "weierp": 0x2118,  # script capital P = power set = Weierstrass p, U+2118 ISOamso
-    "xi": 0x03BE,  # greek small letter xi, U+03BE ISOgrk3
-    "yacute": 0x00FD,  # latin small letter y with acute, U+00FD ISOlat1
-    "yen": 0x00A5,  # yen sign = yuan sign, U+00A5 ISOnum
-    "yuml": 0x00FF,  # latin small letter y with diaeresis, U+00FF ISOlat1
-    "zeta": 0x03B6,  # greek small letter zeta, U+03B6 ISOgrk3
-    "zwj": 0x200D,  # zero width joiner, U+200D NEW RFC 2070
-    "zwnj": 0x200C,  # zero width non-joiner, U+200C NEW RFC 2070
-}
+# The entities are kept in compact tables that are searched in place, so that
+# importing this module doesn't build any dicts (and, when frozen, doesn't use
+# the heap). Each table is a sequence of UTF-8 "name\tvalue" records sorted by
+# name, with the offset of each record in the matching _INDEX table as a
+# 16-bit little-endian integer.
+#
+# name2codepoint, html5, codepoint2name and entitydefs are built as dicts the
+# first time they are accessed. Use html5_get() and name2codepoint_get() to
+# look up single entities without building them.
 
 
-# maps the HTML5 named character references to the equivalent Unicode character(s)
-html5 = {
-    "Aacute": "\xc1",
-    "aacute": "\xe1",
-    "Aacute;": "\xc1",
-    "aacute;": "\xe1",
-    "Abreve;": "\u0102",
-    "abreve;": "\u0103",
-    "ac;": "\u223e",
-    "acd;": "\u223f",
-    "acE;": "\u223e\u0333",
-    "Acirc": "\xc2",
-    "acirc": "\xe2",
-    "Acirc;": "\xc2",
-    "acirc;": "\xe2",
-    "acute": "\xb4",
-    "acute;": "\xb4",
-    "Acy;": "\u0410",
-    "acy;": "\u0430",
-    "AElig": "\xc6",
-    "aelig": "\xe6",
-    "AElig;": "\xc6",
-    "aelig;": "\xe6",
-    "af;": "\u2061",
-    "Afr;": "\U0001d504",
-    "afr;": "\U0001d51e",
-    "Agrave": "\xc0",
-    "agrave": "\xe0",
-    "Agrave;": "\xc0",
-    "agrave;": "\xe0",
-    "alefsym;": "\u2135",
-    "aleph;": "\u2135",
-    "Alpha;": "\u0391",
-    "alpha;": "\u03b1",
-    "Amacr;": "\u0100",
-    "amacr;": "\u0101",
-    "amalg;": "\u2a3f",
-    "AMP": "&",
-    "amp": "&",
-    "AMP;": "&",
-    "amp;": "&",
-    "And;": "\u2a53",
-    "and;": "\u2227",
-    "andand;": "\u2a55",
-    "andd;": "\u2a5c",
-    "andslope;": "\u2a58",
-    "andv;": "\u2a5a",
-    "ang;": "\u2220",
-    "ange;": "\u29a4",
-    "angle;": "\u2220",
-    "angmsd;": "\u2221",
-    "angmsdaa;": "\u29a8",
-    "angmsdab;": "\u29a9",
-    "angmsdac;": "\u29aa",
-    "angmsdad;": "\u29ab",
-    "angmsdae;": "\u29ac",
-    "angmsdaf;": "\u29ad",
-    "angmsdag;": "\u29ae",
-    "angmsdah;": "\u29af",
-    "angrt;": "\u221f",
-    "angrtvb;": "\u22be",
-    "angrtvbd;": "\u299d",
-    "angsph;": "\u2222",
-    "angst;": "\xc5",
-    "angzarr;": "\u237c",
-    "Aogon;": "\u0104",
-    "aogon;": "\u0105",
-    "Aopf;": "\U0001d538",
-    "aopf;": "\U0001d552",
-    "ap;": "\u2248",
-    "apacir;": "\u2a6f",
-    "apE;": "\u2a70",
-    "ape;": "\u224a",
-    "apid;": "\u224b",
-    "apos;": "'",
-    "ApplyFunction;": "\u2061",
-    "approx;": "\u2248",
-    "approxeq;": "\u224a",
-    "Aring": "\xc5",
-    "aring": "\xe5",
-    "Aring;": "\xc5",
-    "aring;": "\xe5",
-    "Ascr;": "\U0001d49c",
-    "ascr;": "\U0001d4b6",
-    "Assign;": "\u2254",
-    "ast;": "*",
-    "asymp;": "\u2248",
-    "asympeq;": "\u224d",
-    "Atilde": "\xc3",
-    "atilde": "\xe3",
-    "Atilde;": "\xc3",
-    "atilde;": "\xe3",
-    "Auml": "\xc4",
-    "auml": "\xe4",
-    "Auml;": "\xc4",
-    "auml;": "\xe4",
-    "awconint;": "\u2233",
-    "awint;": "\u2a11",
-    "backcong;": "\u224c",
-    "backepsilon;": "\u03f6",
-    "backprime;": "\u2035",
-    "backsim;": "\u223d",
-    "backsimeq;": "\u22cd",
-    "Backslash;": "\u2216",
-    "Barv;": "\u2ae7",
-    "barvee;": "\u22bd",
-    "Barwed;": "\u2306",
-    "barwed;": "\u2305",
-    "barwedge;": "\u2305",
-    "bbrk;": "\u23b5",
-    "bbrktbrk;": "\u23b6",
-    "bcong;": "\u224c",
-    "Bcy;": "\u0411",
-    "bcy;": "\u0431",
-    "bdquo;": "\u201e",
-    "becaus;": "\u2235",
-    "Because;": "\u2235",
-    "because;": "\u2235",
-    "bemptyv;": "\u29b0",
-    "bepsi;": "\u03f6",
-    "bernou;": "\u212c",
-    "Bernoullis;": "\u212c",
-    "Beta;": "\u0392",
-    "beta;": "\u03b2",
-    "beth;": "\u2136",
-    "between;": "\u226c",
-    "Bfr;": "\U0001d505",
-    "bfr;": "\U0001d51f",
-    "bigcap;": "\u22c2",
-    "bigcirc;": "\u25ef",
-    "bigcup;": "\u22c3",
-    "bigodot;": "\u2a00",
-    "bigoplus;": "\u2a01",
-    "bigotimes;": "\u2a02",
-    "bigsqcup;": "\u2a06",
-    "bigstar;": "\u2605",
-    "bigtriangledown;": "\u25bd",
-    "bigtriangleup;": "\u25b3",
-    "biguplus;": "\u2a04",
-    "bigvee;": "\u22c1",
-    "bigwedge;": "\u22c0",
-    "bkarow;": "\u290d",
-    "blacklozenge;": "\u29eb",
-    "blacksquare;": "\u25aa",
-    "blacktriangle;": "\u25b4",
-    "blacktriangledown;": "\u25be",
-    "blacktriangleleft;": "\u25c2",
-    "blacktriangleright;": "\u25b8",
-    "blank;": "\u2423",
-    "blk12;": "\u2592",
-    "blk14;": "\u2591",
-    "blk34;": "\u2593",
-    "block;": "\u2588",
-    "bne;": "=\u20e5",
-    "bnequiv;": "\u2261\u20e5",
-    "bNot;": "\u2aed",
-    "bnot;": "\u2310",
-    "Bopf;": "\U0001d539",
-    "bopf;": "\U0001d553",
-    "bot;": "\u22a5",
-    "bottom;": "\u22a5",
-    "bowtie;": "\u22c8",
-    "boxbox;": "\u29c9",
-    "boxDL;": "\u2557",
-    "boxDl;": "\u2556",
-    "boxdL;": "\u2555",
-    "boxdl;": "\u2510",
-    "boxDR;": "\u2554",
-    "boxDr;": "\u2553",
-    "boxdR;": "\u2552",
-    "boxdr;": "\u250c",
-    "boxH;": "\u2550",
-    "boxh;": "\u2500",
-    "boxHD;": "\u2566",
-    "boxHd;": "\u2564",
-    "boxhD;": "\u2565",
-    "boxhd;": "\u252c",
-    "boxHU;": "\u2569",
-    "boxHu;": "\u2567",
-    "boxhU;": "\u2568",
-    "boxhu;": "\u2534",
-    "boxminus;": "\u229f",
-    "boxplus;": "\u229e",
-    "boxtimes;": "\u22a0",
-    "boxUL;": "\u255d",
-    "boxUl;": "\u255c",
-    "boxuL;": "\u255b",
-    "boxul;": "\u2518",
-    "boxUR;": "\u255a",
-    "boxUr;": "\u2559",
-    "boxuR;": "\u2558",
-    "boxur;": "\u2514",
-    "boxV;": "\u2551",
-    "boxv;": "\u2502",
-    "boxVH;": "\u256c",
-    "boxVh;": "\u256b",
-    "boxvH;": "\u256a",
-    "boxvh;": "\u253c",
-    "boxVL;": "\u2563",
-    "boxVl;": "\u2562",
-    "boxvL;": "\u2561",
-    "boxvl;": "\u2524",
-    "boxVR;": "\u2560",
-    "boxVr;": "\u255f",
-    "boxvR;": "\u255e",
-    "boxvr;": "\u251c",
-    "bprime;": "\u2035",
-    "Breve;": "\u02d8",
-    "breve;": "\u02d8",
-    "brvbar": "\xa6",
-    "brvbar;": "\xa6",
-    "Bscr;": "\u212c",
-    "bscr;": "\U0001d4b7",
-    "bsemi;": "\u204f",
-    "bsim;": "\u223d",
-    "bsime;": "\u22cd",
-    "bsol;": "\\",
-    "bsolb;": "\u29c5",
-    "bsolhsub;": "\u27c8",
-    "bull;": "\u2022",
-    "bullet;": "\u2022",
-    "bump;": "\u224e",
-    "bumpE;": "\u2aae",
-    "bumpe;": "\u224f",
-    "Bumpeq;": "\u224e",
-    "bumpeq;": "\u224f",
-    "Cacute;": "\u0106",
-    "cacute;": "\u0107",
-    "Cap;": "\u22d2",
-    "cap;": "\u2229",
-    "capand;": "\u2a44",
-    "capbrcup;": "\u2a49",
-    "capcap;": "\u2a4b",
-    "capcup;": "\u2a47",
-    "capdot;": "\u2a40",
-    "CapitalDifferentialD;": "\u2145",
-    "caps;": "\u2229\ufe00",
-    "caret;": "\u2041",
-    "caron;": "\u02c7",
-    "Cayleys;": "\u212d",
-    "ccaps;": "\u2a4d",
-    "Ccaron;": "\u010c",
-    "ccaron;": "\u010d",
-    "Ccedil": "\xc7",
-    "ccedil": "\xe7",
-    "Ccedil;": "\xc7",
-    "ccedil;": "\xe7",
-    "Ccirc;": "\u0108",
-    "ccirc;": "\u0109",
-    "Cconint;": "\u2230",
-    "ccups;": "\u2a4c",
-    "ccupssm;": "\u2a50",
-    "Cdot;": "\u010a",
-    "cdot;": "\u010b",
-    "cedil": "\xb8",
-    "cedil;": "\xb8",
-    "Cedilla;": "\xb8",
-    "cemptyv;": "\u29b2",
-    "cent": "\xa2",
-    "cent;": "\xa2",
-    "CenterDot;": "\xb7",
-    "centerdot;": "\xb7",
-    "Cfr;": "\u212d",
-    "cfr;": "\U0001d520",
-    "CHcy;": "\u0427",
-    "chcy;": "\u0447",
-    "check;": "\u2713",
-    "checkmark;": "\u2713",
-    "Chi;": "\u03a7",
-    "chi;": "\u03c7",
-    "cir;": "\u25cb",
-    "circ;": "\u02c6",
-    "circeq;": "\u2257",
-    "circlearrowleft;": "\u21ba",
-    "circlearrowright;": "\u21bb",
-    "circledast;": "\u229b",
-    "circledcirc;": "\u229a",
-    "circleddash;": "\u229d",
-    "CircleDot;": "\u2299",
-    "circledR;": "\xae",
-    "circledS;": "\u24c8",
-    "CircleMinus;": "\u2296",
-    "CirclePlus;": "\u2295",
-    "CircleTimes;": "\u2297",
-    "cirE;": "\u29c3",
-    "cire;": "\u2257",
-    "cirfnint;": "\u2a10",
-    "cirmid;": "\u2aef",
-    "cirscir;": "\u29c2",
-    "ClockwiseContourIntegral;": "\u2232",
-    "CloseCurlyDoubleQuote;": "\u201d",
-    "CloseCurlyQuote;": "\u2019",
-    "clubs;": "\u2663",
-    "clubsuit;": "\u2663",
-    "Colon;": "\u2237",
-    "colon;": ":",
-    "Colone;": "\u2a74",
-    "colone;": "\u2254",
-    "coloneq;": "\u2254",
-    "comma;": ",",
-    "commat;": "@",
-    "comp;": "\u2201",
-    "compfn;": "\u2218",
-    "complement;": "\u2201",
-    "complexes;": "\u2102",
-    "cong;": "\u2245",
-    "congdot;": "\u2a6d",
-    "Congruent;": "\u2261",
-    "Conint;": "\u222f",
-    "conint;": "\u222e",
-    "ContourIntegral;": "\u222e",
-    "Copf;": "\u2102",
-    "copf;": "\U0001d554",
-    "coprod;": "\u2210",
-    "Coproduct;": "\u2210",
-    "COPY": "\xa9",
-    "copy": "\xa9",
-    "COPY;": "\xa9",
-    "copy;": "\xa9",
-    "copysr;": "\u2117",
-    "CounterClockwiseContourIntegral;": "\u2233",
-    "crarr;": "\u21b5",
-    "Cross;": "\u2a2f",
-    "cross;": "\u2717",
-    "Cscr;": "\U0001d49e",
-    "cscr;": "\U0001d4b8",
-    "csub;": "\u2acf",
-    "csube;": "\u2ad1",
-    "csup;": "\u2ad0",
-    "csupe;": "\u2ad2",
-    "ctdot;": "\u22ef",
-    "cudarrl;": "\u2938",
-    "cudarrr;": "\u2935",
-    "cuepr;": "\u22de",
-    "cuesc;": "\u22df",
-    "cularr;": "\u21b6",
-    "cularrp;": "\u293d",
-    "Cup;": "\u22d3",
-    "cup;": "\u222a",
-    "cupbrcap;": "\u2a48",
-    "CupCap;": "\u224d",
-    "cupcap;": "\u2a46",
-    "cupcup;": "\u2a4a",
-    "cupdot;": "\u228d",
-    "cupor;": "\u2a45",
-    "cups;": "\u222a\ufe00",
-    "curarr;": "\u21b7",
-    "curarrm;": "\u293c",
-    "curlyeqprec;": "\u22de",
-    "curlyeqsucc;": "\u22df",
-    "curlyvee;": "\u22ce",
-    "curlywedge;": "\u22cf",
-    "curren": "\xa4",
-    "curren;": "\xa4",
-    "curvearrowleft;": "\u21b6",
-    "curvearrowright;": "\u21b7",
-    "cuvee;": "\u22ce",
-    "cuwed;": "\u22cf",
-    "cwconint;": "\u2232",
-    "cwint;": "\u2231",
-    "cylcty;": "\u232d",
-    "Dagger;": "\u2021",
-    "dagger;": "\u2020",
-    "daleth;": "\u2138",
-    "Darr;": "\u21a1",
-    "dArr;": "\u21d3",
-    "darr;": "\u2193",
-    "dash;": "\u2010",
-    "Dashv;": "\u2ae4",
-    "dashv;": "\u22a3",
-    "dbkarow;": "\u290f",
-    "dblac;": "\u02dd",
-    "Dcaron;": "\u010e",
-    "dcaron;": "\u010f",
-    "Dcy;": "\u0414",
-    "dcy;": "\u0434",
-    "DD;": "\u2145",
-    "dd;": "\u2146",
-    "ddagger;": "\u2021",
-    "ddarr;": "\u21ca",
-    "DDotrahd;": "\u2911",
-    "ddotseq;": "\u2a77",
-    "deg": "\xb0",
-    "deg;": "\xb0",
-    "Del;": "\u2207",
-    "Delta;": "\u0394",
-    "delta;": "\u03b4",
-    "demptyv;": "\u29b1",
-    "dfisht;": "\u297f",
-    "Dfr;": "\U0001d507",
-    "dfr;": "\U0001d521",
-    "dHar;": "\u2965",
-    "dharl;": "\u21c3",
-    "dharr;": "\u21c2",
-    "DiacriticalAcute;": "\xb4",
-    "DiacriticalDot;": "\u02d9",
-    "DiacriticalDoubleAcute;": "\u02dd",
-    "DiacriticalGrave;": "`",
-    "DiacriticalTilde;": "\u02dc",
-    "diam;": "\u22c4",
-    "Diamond;": "\u22c4",
-    "diamond;": "\u22c4",
-    "diamondsuit;": "\u2666",
-    "diams;": "\u2666",
-    "die;": "\xa8",
-    "DifferentialD;": "\u2146",
-    "digamma;": "\u03dd",
-    "disin;": "\u22f2",
-    "div;": "\xf7",
-    "divide": "\xf7",
-    "divide;": "\xf7",
-    "divideontimes;": "\u22c7",
-    "divonx;": "\u22c7",
-    "DJcy;": "\u0402",
-    "djcy;": "\u0452",
-    "dlcorn;": "\u231e",
-    "dlcrop;": "\u230d",
-    "dollar;": "$",
-    "Dopf;": "\U0001d53b",
-    "dopf;": "\U0001d555",
-    "Dot;": "\xa8",
-    "dot;": "\u02d9",
-    "DotDot;": "\u20dc",
-    "doteq;": "\u2250",
-    "doteqdot;": "\u2251",
-    "DotEqual;": "\u2250",
-    "dotminus;": "\u2238",
-    "dotplus;": "\u2214",
-    "dotsquare;": "\u22a1",
-    "doublebarwedge;": "\u2306",
-    "DoubleContourIntegral;": "\u222f",
-    "DoubleDot;": "\xa8",
-    "DoubleDownArrow;": "\u21d3",
-    "DoubleLeftArrow;": "\u21d0",
-    "DoubleLeftRightArrow;": "\u21d4",
-    "DoubleLeftTee;": "\u2ae4",
-    "DoubleLongLeftArrow;": "\u27f8",
-    "DoubleLongLeftRightArrow;": "\u27fa",
-    "DoubleLongRightArrow;": "\u27f9",
-    "DoubleRightArrow;": "\u21d2",
-    "DoubleRightTee;": "\u22a8",
-    "DoubleUpArrow;": "\u21d1",
-    "DoubleUpDownArrow;": "\u21d5",
-    "DoubleVerticalBar;": "\u2225",
-    "DownArrow;": "\u2193",
-    "Downarrow;": "\u21d3",
-    "downarrow;": "\u2193",
-    "DownArrowBar;": "\u2913",
-    "DownArrowUpArrow;": "\u21f5",
-    "DownBreve;": "\u0311",
-    "downdownarrows;": "\u21ca",
-    "downharpoonleft;": "\u21c3",
-    "downharpoonright;": "\u21c2",
-    "DownLeftRightVector;": "\u2950",
-    "DownLeftTeeVector;": "\u295e",
-    "DownLeftVector;": "\u21bd",
-    "DownLeftVectorBar;": "\u2956",
-    "DownRightTeeVector;": "\u295f",
-    "DownRightVector;": "\u21c1",
-    "DownRightVectorBar;": "\u2957",
-    "DownTee;": "\u22a4",
-    "DownTeeArrow;": "\u21a7",
-    "drbkarow;": "\u2910",
-    "drcorn;": "\u231f",
-    "drcrop;": "\u230c",
-    "Dscr;": "\U0001d49f",
-    "dscr;": "\U0001d4b9",
-    "DScy;": "\u0405",
-    "dscy;": "\u0455",
-    "dsol;": "\u29f6",
-    "Dstrok;": "\u0110",
-    "dstrok;": "\u0111",
-    "dtdot;": "\u22f1",
-    "dtri;": "\u25bf",
-    "dtrif;": "\u25be",
-    "duarr;": "\u21f5",
-    "duhar;": "\u296f",
-    "dwangle;": "\u29a6",
-    "DZcy;": "\u040f",
-    "dzcy;": "\u045f",
-    "dzigrarr;": "\u27ff",
-    "Eacute": "\xc9",
-    "eacute": "\xe9",
-    "Eacute;": "\xc9",
-    "eacute;": "\xe9",
-    "easter;": "\u2a6e",
-    "Ecaron;": "\u011a",
-    "ecaron;": "\u011b",
-    "ecir;": "\u2256",
-    "Ecirc": "\xca",
-    "ecirc": "\xea",
-    "Ecirc;": "\xca",
-    "ecirc;": "\xea",
-    "ecolon;": "\u2255",
-    "Ecy;": "\u042d",
-    "ecy;": "\u044d",
-    "eDDot;": "\u2a77",
-    "Edot;": "\u0116",
-    "eDot;": "\u2251",
-    "edot;": "\u0117",
-    "ee;": "\u2147",
-    "efDot;": "\u2252",
-    "Efr;": "\U0001d508",
-    "efr;": "\U0001d522",
-    "eg;": "\u2a9a",
-    "Egrave": "\xc8",
-    "egrave": "\xe8",
-    "Egrave;": "\xc8",
-    "egrave;": "\xe8",
-    "egs;": "\u2a96",
-    "egsdot;": "\u2a98",
-    "el;": "\u2a99",
-    "Element;": "\u2208",
-    "elinters;": "\u23e7",
-    "ell;": "\u2113",
-    "els;": "\u2a95",
-    "elsdot;": "\u2a97",
-    "Emacr;": "\u0112",
-    "emacr;": "\u0113",
-    "empty;": "\u2205",
-    "emptyset;": "\u2205",
-    "EmptySmallSquare;": "\u25fb",
-    "emptyv;": "\u2205",
-    "EmptyVerySmallSquare;": "\u25ab",
-    "emsp13;": "\u2004",
-    "emsp14;": "\u2005",
-    "emsp;": "\u2003",
-    "ENG;": "\u014a",
-    "eng;": "\u014b",
-    "ensp;": "\u2002",
-    "Eogon;": "\u0118",
-    "eogon;": "\u0119",
-    "Eopf;": "\U0001d53c",
-    "eopf;": "\U0001d556",
-    "epar;": "\u22d5",
-    "eparsl;": "\u29e3",
-    "eplus;": "\u2a71",
-    "epsi;": "\u03b5",
-    "Epsilon;": "\u0395",
-    "epsilon;": "\u03b5",
-    "epsiv;": "\u03f5",
-    "eqcirc;": "\u2256",
-    "eqcolon;": "\u2255",
-    "eqsim;": "\u2242",
-    "eqslantgtr;": "\u2a96",
-    "eqslantless;": "\u2a95",
-    "Equal;": "\u2a75",
-    "equals;": "=",
-    "EqualTilde;": "\u2242",
-    "equest;": "\u225f",
-    "Equilibrium;": "\u21cc",
-    "equiv;": "\u2261",
-    "equivDD;": "\u2a78",
-    "eqvparsl;": "\u29e5",
-    "erarr;": "\u2971",
-    "erDot;": "\u2253",
-    "Escr;": "\u2130",
-    "escr;": "\u212f",
-    "esdot;": "\u2250",
-    "Esim;": "\u2a73",
-    "esim;": "\u2242",
-    "Eta;": "\u0397",
-    "eta;": "\u03b7",
-    "ETH": "\xd0",
-    "eth": "\xf0",
-    "ETH;": "\xd0",
-    "eth;": "\xf0",
-    "Euml": "\xcb",
-    "euml": "\xeb",
-    "Euml;": "\xcb",
-    "euml;": "\xeb",
-    "euro;": "\u20ac",
-    "excl;": "!",
-    "exist;": "\u2203",
-    "Exists;": "\u2203",
-    "expectation;": "\u2130",
-    "ExponentialE;": "\u2147",
-    "exponentiale;": "\u2147",
-    "fallingdotseq;": "\u2252",
-    "Fcy;": "\u0424",
-    "fcy;": "\u0444",
-    "female;": "\u2640",
-    "ffilig;": "\ufb03",
-    "fflig;": "\ufb00",
-    "ffllig;": "\ufb04",
-    "Ffr;": "\U0001d509",
-    "ffr;": "\U0001d523",
-    "filig;": "\ufb01",
-    "FilledSmallSquare;": "\u25fc",
-    "FilledVerySmallSquare;": "\u25aa",
-    "fjlig;": "fj",
-    "flat;": "\u266d",
-    "fllig;": "\ufb02",
-    "fltns;": "\u25b1",
-    "fnof;": "\u0192",
-    "Fopf;": "\U0001d53d",
-    "fopf;": "\U0001d557",
-    "ForAll;": "\u2200",
-    "forall;": "\u2200",
-    "fork;": "\u22d4",
-    "forkv;": "\u2ad9",
-    "Fouriertrf;": "\u2131",
-    "fpartint;": "\u2a0d",
-    "frac12": "\xbd",
-    "frac12;": "\xbd",
-    "frac13;": "\u2153",
-    "frac14": "\xbc",
-    "frac14;": "\xbc",
-    "frac15;": "\u2155",
-    "frac16;": "\u2159",
-    "frac18;": "\u215b",
-    "frac23;": "\u2154",
-    "frac25;": "\u2156",
-    "frac34": "\xbe",
-    "frac34;": "\xbe",
-    "frac35;": "\u2157",
-    "frac38;": "\u215c",
-    "frac45;": "\u2158",
-    "frac56;": "\u215a",
-    "frac58;": "\u215d",
-    "frac78;": "\u215e",
-    "frasl;": "\u2044",
-    "frown;": "\u2322",
-    "Fscr;": "\u2131",
-    "fscr;": "\U0001d4bb",
-    "gacute;": "\u01f5",
-    "Gamma;": "\u0393",
-    "gamma;": "\u03b3",
-    "Gammad;": "\u03dc",
-    "gammad;": "\u03dd",
-    "gap;": "\u2a86",
-    "Gbreve;": "\u011e",
-    "gbreve;": "\u011f",
-    "Gcedil;": "\u0122",
-    "Gcirc;": "\u011c",
-    "gcirc;": "\u011d",
-    "Gcy;": "\u0413",
-    "gcy;": "\u0433",
-    "Gdot;": "\u0120",
-    "gdot;": "\u0121",
-    "gE;": "\u2267",
-    "ge;": "\u2265",
-    "gEl;": "\u2a8c",
-    "gel;": "\u22db",
-    "geq;": "\u2265",
-    "geqq;": "\u2267",
-    "geqslant;": "\u2a7e",
-    "ges;": "\u2a7e",
-    "gescc;": "\u2aa9",
-    "gesdot;": "\u2a80",
-    "gesdoto;": "\u2a82",
-    "gesdotol;": "\u2a84",
-    "gesl;": "\u22db\ufe00",
-    "gesles;": "\u2a94",
-    "Gfr;": "\U0001d50a",
-    "gfr;": "\U0001d524",
-    "Gg;": "\u22d9",
-    "gg;": "\u226b",
-    "ggg;": "\u22d9",
-    "gimel;": "\u2137",
-    "GJcy;": "\u0403",
-    "gjcy;": "\u0453",
-    "gl;": "\u2277",
-    "gla;": "\u2aa5",
-    "glE;": "\u2a92",
-    "glj;": "\u2aa4",
-    "gnap;": "\u2a8a",
-    "gnapprox;": "\u2a8a",
-    "gnE;": "\u2269",
-    "gne;": "\u2a88",
-    "gneq;": "\u2a88",
-    "gneqq;": "\u2269",
-    "gnsim;": "\u22e7",
-    "Gopf;": "\U0001d53e",
-    "gopf;": "\U0001d558",
-    "grave;": "`",
-    "GreaterEqual;": "\u2265",
-    "GreaterEqualLess;": "\u22db",
-    "GreaterFullEqual;": "\u2267",
-    "GreaterGreater;": "\u2aa2",
-    "GreaterLess;": "\u2277",
-    "GreaterSlantEqual;": "\u2a7e",
-    "GreaterTilde;": "\u2273",
-    "Gscr;": "\U0001d4a2",
-    "gscr;": "\u210a",
-    "gsim;": "\u2273",
-    "gsime;": "\u2a8e",
-    "gsiml;": "\u2a90",
-    "GT": ">",
-    "gt": ">",
-    "GT;": ">",
-    "Gt;": "\u226b",
-    "gt;": ">",
-    "gtcc;": "\u2aa7",
-    "gtcir;": "\u2a7a",
-    "gtdot;": "\u22d7",
-    "gtlPar;": "\u2995",
-    "gtquest;": "\u2a7c",
-    "gtrapprox;": "\u2a86",
-    "gtrarr;": "\u2978",
-    "gtrdot;": "\u22d7",
-    "gtreqless;": "\u22db",
-    "gtreqqless;": "\u2a8c",
-    "gtrless;": "\u2277",
-    "gtrsim;": "\u2273",
-    "gvertneqq;": "\u2269\ufe00",
-    "gvnE;": "\u2269\ufe00",
-    "Hacek;": "\u02c7",
-    "hairsp;": "\u200a",
-    "half;": "\xbd",
-    "hamilt;": "\u210b",
-    "HARDcy;": "\u042a",
-    "hardcy;": "\u044a",
-    "hArr;": "\u21d4",
-    "harr;": "\u2194",
-    "harrcir;": "\u2948",
-    "harrw;": "\u21ad",
-    "Hat;": "^",
-    "hbar;": "\u210f",
-    "Hcirc;": "\u0124",
-    "hcirc;": "\u0125",
-    "hearts;": "\u2665",
-    "heartsuit;": "\u2665",
-    "hellip;": "\u2026",
-    "hercon;": "\u22b9",
-    "Hfr;": "\u210c",
-    "hfr;": "\U0001d525",
-    "HilbertSpace;": "\u210b",
-    "hksearow;": "\u2925",
-    "hkswarow;": "\u2926",
-    "hoarr;": "\u21ff",
-    "homtht;": "\u223b",
-    "hookleftarrow;": "\u21a9",
-    "hookrightarrow;": "\u21aa",
-    "Hopf;": "\u210d",
-    "hopf;": "\U0001d559",
-    "horbar;": "\u2015",
-    "HorizontalLine;": "\u2500",
-    "Hscr;": "\u210b",
-    "hscr;": "\U0001d4bd",
-    "hslash;": "\u210f",
-    "Hstrok;": "\u0126",
-    "hstrok;": "\u0127",
-    "HumpDownHump;": "\u224e",
-    "HumpEqual;": "\u224f",
-    "hybull;": "\u2043",
-    "hyphen;": "\u2010",
-    "Iacute": "\xcd",
-    "iacute": "\xed",
-    "Iacute;": "\xcd",
-    "iacute;": "\xed",
-    "ic;": "\u2063",
-    "Icirc": "\xce",
-    "icirc": "\xee",
-    "Icirc;": "\xce",
-    "icirc;": "\xee",
-    "Icy;": "\u0418",
-    "icy;": "\u0438",
-    "Idot;": "\u0130",
-    "IEcy;": "\u0415",
-    "iecy;": "\u0435",
-    "iexcl": "\xa1",
-    "iexcl;": "\xa1",
-    "iff;": "\u21d4",
-    "Ifr;": "\u2111",
-    "ifr;": "\U0001d526",
-    "Igrave": "\xcc",
-    "igrave": "\xec",
-    "Igrave;": "\xcc",
-    "igrave;": "\xec",
-    "ii;": "\u2148",
-    "iiiint;": "\u2a0c",
-    "iiint;": "\u222d",
-    "iinfin;": "\u29dc",
-    "iiota;": "\u2129",
-    "IJlig;": "\u0132",
-    "ijlig;": "\u0133",
-    "Im;": "\u2111",
-    "Imacr;": "\u012a",
-    "imacr;": "\u012b",
-    "image;": "\u2111",
-    "ImaginaryI;": "\u2148",
-    "imagline;": "\u2110",
-    "imagpart;": "\u2111",
-    "imath;": "\u0131",
-    "imof;": "\u22b7",
-    "imped;": "\u01b5",
-    "Implies;": "\u21d2",
-    "in;": "\u2208",
-    "incare;": "\u2105",
-    "infin;": "\u221e",
-    "infintie;": "\u29dd",
-    "inodot;": "\u0131",
-    "Int;": "\u222c",
-    "int;": "\u222b",
-    "intcal;": "\u22ba",
-    "integers;": "\u2124",
-    "Integral;": "\u222b",
-    "intercal;": "\u22ba",
-    "Intersection;": "\u22c2",
-    "intlarhk;": "\u2a17",
-    "intprod;": "\u2a3c",
-    "InvisibleComma;": "\u2063",
-    "InvisibleTimes;": "\u2062",
-    "IOcy;": "\u0401",
-    "iocy;": "\u0451",
-    "Iogon;": "\u012e",
-    "iogon;": "\u012f",
-    "Iopf;": "\U0001d540",
-    "iopf;": "\U0001d55a",
-    "Iota;": "\u0399",
-    "iota;": "\u03b9",
-    "iprod;": "\u2a3c",
-    "iquest": "\xbf",
-    "iquest;": "\xbf",
-    "Iscr;": "\u2110",
-    "iscr;": "\U0001d4be",
-    "isin;": "\u2208",
-    "isindot;": "\u22f5",
-    "isinE;": "\u22f9",
-    "isins;": "\u22f4",
-    "isinsv;": "\u22f3",
-    "isinv;": "\u2208",
-    "it;": "\u2062",
-    "Itilde;": "\u0128",
-    "itilde;": "\u0129",
-    "Iukcy;": "\u0406",
-    "iukcy;": "\u0456",
-    "Iuml": "\xcf",
-    "iuml": "\xef",
-    "Iuml;": "\xcf",
-    "iuml;": "\xef",
-    "Jcirc;": "\u0134",
-    "jcirc;": "\u0135",
-    "Jcy;": "\u0419",
-    "jcy;": "\u0439",
-    "Jfr;": "\U0001d50d",
-    "jfr;": "\U0001d527",
-    "jmath;": "\u0237",
-    "Jopf;": "\U0001d541",
-    "jopf;": "\U0001d55b",
-    "Jscr;": "\U0001d4a5",
-    "jscr;": "\U0001d4bf",
-    "Jsercy;": "\u0408",
-    "jsercy;": "\u0458",
-    "Jukcy;": "\u0404",
-    "jukcy;": "\u0454",
-    "Kappa;": "\u039a",
-    "kappa;": "\u03ba",
-    "kappav;": "\u03f0",
-    "Kcedil;": "\u0136",
-    "kcedil;": "\u0137",
-    "Kcy;": "\u041a",
-    "kcy;": "\u043a",
-    "Kfr;": "\U0001d50e",
-    "kfr;": "\U0001d528",
-    "kgreen;": "\u0138",
-    "KHcy;": "\u0425",
-    "khcy;": "\u0445",
-    "KJcy;": "\u040c",
-    "kjcy;": "\u045c",
-    "Kopf;": "\U0001d542",
-    "kopf;": "\U0001d55c",
-    "Kscr;": "\U0001d4a6",
-    "kscr;": "\U0001d4c0",
-    "lAarr;": "\u21da",
-    "Lacute;": "\u0139",
-    "lacute;": "\u013a",
-    "laemptyv;": "\u29b4",
-    "lagran;": "\u2112",
-    "Lambda;": "\u039b",
-    "lambda;": "\u03bb",
-    "Lang;": "\u27ea",
-    "lang;": "\u27e8",
-    "langd;": "\u2991",
-    "langle;": "\u27e8",
-    "lap;": "\u2a85",
-    "Laplacetrf;": "\u2112",
-    "laquo": "\xab",
-    "laquo;": "\xab",
-    "Larr;": "\u219e",
-    "lArr;": "\u21d0",
-    "larr;": "\u2190",
-    "larrb;": "\u21e4",
-    "larrbfs;": "\u291f",
-    "larrfs;": "\u291d",
-    "larrhk;": "\u21a9",
-    "larrlp;": "\u21ab",
-    "larrpl;": "\u2939",
-    "larrsim;": "\u2973",
-    "larrtl;": "\u21a2",
-    "lat;": "\u2aab",
-    "lAtail;": "\u291b",
-    "latail;": "\u2919",
-    "late;": "\u2aad",
-    "lates;": "\u2aad\ufe00",
-    "lBarr;": "\u290e",
-    "lbarr;": "\u290c",
-    "lbbrk;": "\u2772",
-    "lbrace;": "{",
-    "lbrack;": "[",
-    "lbrke;": "\u298b",
-    "lbrksld;": "\u298f",
-    "lbrkslu;": "\u298d",
-    "Lcaron;": "\u013d",
-    "lcaron;": "\u013e",
-    "Lcedil;": "\u013b",
-    "lcedil;": "\u013c",
-    "lceil;": "\u2308",
-    "lcub;": "{",
-    "Lcy;": "\u041b",
-    "lcy;": "\u043b",
-    "ldca;": "\u2936",
-    "ldquo;": "\u201c",
-    "ldquor;": "\u201e",
-    "ldrdhar;": "\u2967",
-    "ldrushar;": "\u294b",
-    "ldsh;": "\u21b2",
-    "lE;": "\u2266",
-    "le;": "\u2264",
-    "LeftAngleBracket;": "\u27e8",
-    "LeftArrow;": "\u2190",
-    "Leftarrow;": "\u21d0",
-    "leftarrow;": "\u2190",
-    "LeftArrowBar;": "\u21e4",
-    "LeftArrowRightArrow;": "\u21c6",
-    "leftarrowtail;": "\u21a2",
-    "LeftCeiling;": "\u2308",
-    "LeftDoubleBracket;": "\u27e6",
-    "LeftDownTeeVector;": "\u2961",
-    "LeftDownVector;": "\u21c3",
-    "LeftDownVectorBar;": "\u2959",
-    "LeftFloor;": "\u230a",
-    "leftharpoondown;": "\u21bd",
-    "leftharpoonup;": "\u21bc",
-    "leftleftarrows;": "\u21c7",
-    "LeftRightArrow;": "\u2194",
-    "Leftrightarrow;": "\u21d4",
-    "leftrightarrow;": "\u2194",
-    "leftrightarrows;": "\u21c6",
-    "leftrightharpoons;": "\u21cb",
-    "leftrightsquigarrow;": "\u21ad",
-    "LeftRightVector;": "\u294e",
-    "LeftTee;": "\u22a3",
-    "LeftTeeArrow;": "\u21a4",
-    "LeftTeeVector;": "\u295a",
-    "leftthreetimes;": "\u22cb",
-    "LeftTriangle;": "\u22b2",
-    "LeftTriangleBar;": "\u29cf",
-    "LeftTriangleEqual;": "\u22b4",
-    "LeftUpDownVector;": "\u2951",
-    "LeftUpTeeVector;": "\u2960",
-    "LeftUpVector;": "\u21bf",
-    "LeftUpVectorBar;": "\u2958",
-    "LeftVector;": "\u21bc",
-    "LeftVectorBar;": "\u2952",
-    "lEg;": "\u2a8b",
-    "leg;": "\u22da",
-    "leq;": "\u2264",
-    "leqq;": "\u2266",
-    "leqslant;": "\u2a7d",
-    "les;": "\u2a7d",
-    "lescc;": "\u2aa8",
-    "lesdot;": "\u2a7f",
-    "lesdoto;": "\u2a81",
-    "lesdotor;": "\u2a83",
-    "lesg;": "\u22da\ufe00",
-    "lesges;": "\u2a93",
-    "lessapprox;": "\u2a85",
-    "lessdot;": "\u22d6",
-    "lesseqgtr;": "\u22da",
-    "lesseqqgtr;": "\u2a8b",
-    "LessEqualGreater;": "\u22da",
-    "LessFullEqual;": "\u2266",
-    "LessGreater;": "\u2276",
-    "lessgtr;": "\u2276",
-    "LessLess;": "\u2aa1",
-    "lesssim;": "\u2272",
-    "LessSlantEqual;": "\u2a7d",
-    "LessTilde;": "\u2272",
-    "lfisht;": "\u297c",
-    "lfloor;": "\u230a",
-    "Lfr;": "\U0001d50f",
-    "lfr;": "\U0001d529",
-    "lg;": "\u2276",
-    "lgE;": "\u2a91",
-    "lHar;": "\u2962",
-    "lhard;": "\u21bd",
-    "lharu;": "\u21bc",
-    "lharul;": "\u296a",
-    "lhblk;": "\u2584",
-    "LJcy;": "\u0409",
-    "ljcy;": "\u0459",
-    "Ll;": "\u22d8",
-    "ll;": "\u226a",
-    "llarr;": "\u21c7",
-    "llcorner;": "\u231e",
-    "Lleftarrow;": "\u21da",
-    "llhard;": "\u296b",
-    "lltri;": "\u25fa",
-    "Lmidot;": "\u013f",
-    "lmidot;": "\u0140",
-    "lmoust;": "\u23b0",
-    "lmoustache;": "\u23b0",
-    "lnap;": "\u2a89",
-    "lnapprox;": "\u2a89",
-    "lnE;": "\u2268",
-    "lne;": "\u2a87",
-    "lneq;": "\u2a87",
-    "lneqq;": "\u2268",
-    "lnsim;": "\u22e6",
-    "loang;": "\u27ec",
-    "loarr;": "\u21fd",
-    "lobrk;": "\u27e6",
-    "LongLeftArrow;": "\u27f5",
-    "Longleftarrow;": "\u27f8",
-    "longleftarrow;": "\u27f5",
-    "LongLeftRightArrow;": "\u27f7",
-    "Longleftrightarrow;": "\u27fa",
-    "longleftrightarrow;": "\u27f7",
-    "longmapsto;": "\u27fc",
-    "LongRightArrow;": "\u27f6",
-    "Longrightarrow;": "\u27f9",
-    "longrightarrow;": "\u27f6",
-    "looparrowleft;": "\u21ab",
-    "looparrowright;": "\u21ac",
-    "lopar;": "\u2985",
-    "Lopf;": "\U0001d543",
-    "lopf;": "\U0001d55d",
-    "loplus;": "\u2a2d",
-    "lotimes;": "\u2a34",
-    "lowast;": "\u2217",
-    "lowbar;": "_",
-    "LowerLeftArrow;": "\u2199",
-    "LowerRightArrow;": "\u2198",
-    "loz;": "\u25ca",
-    "lozenge;": "\u25ca",
-    "lozf;": "\u29eb",
-    "lpar;": "(",
-    "lparlt;": "\u2993",
-    "lrarr;": "\u21c6",
-    "lrcorner;": "\u231f",
-    "lrhar;": "\u21cb",
-    "lrhard;": "\u296d",
-    "lrm;": "\u200e",
-    "lrtri;": "\u22bf",
-    "lsaquo;": "\u2039",
-    "Lscr;": "\u2112",
-    "lscr;": "\U0001d4c1",
-    "Lsh;": "\u21b0",
-    "lsh;": "\u21b0",
-    "lsim;": "\u2272",
-    "lsime;": "\u2a8d",
-    "lsimg;": "\u2a8f",
-    "lsqb;": "[",
-    "lsquo;": "\u2018",
-    "lsquor;": "\u201a",
-    "Lstrok;": "\u0141",
-    "lstrok;": "\u0142",
-    "LT": "<",
-    "lt": "<",
-    "LT;": "<",
-    "Lt;": "\u226a",
-    "lt;": "<",
-    "ltcc;": "\u2aa6",
-    "ltcir;": "\u2a79",
-    "ltdot;": "\u22d6",
-    "lthree;": "\u22cb",
-    "ltimes;": "\u22c9",
-    "ltlarr;": "\u2976",
-    "ltquest;": "\u2a7b",
-    "ltri;": "\u25c3",
-    "ltrie;": "\u22b4",
-    "ltrif;": "\u25c2",
-    "ltrPar;": "\u2996",
-    "lurdshar;": "\u294a",
-    "luruhar;": "\u2966",
-    "lvertneqq;": "\u2268\ufe00",
-    "lvnE;": "\u2268\ufe00",
-    "macr": "\xaf",
-    "macr;": "\xaf",
-    "male;": "\u2642",
-    "malt;": "\u2720",
-    "maltese;": "\u2720",
-    "Map;": "\u2905",
-    "map;": "\u21a6",
-    "mapsto;": "\u21a6",
-    "mapstodown;": "\u21a7",
-    "mapstoleft;": "\u21a4",
-    "mapstoup;": "\u21a5",
-    "marker;": "\u25ae",
-    "mcomma;": "\u2a29",
-    "Mcy;": "\u041c",
-    "mcy;": "\u043c",
-    "mdash;": "\u2014",
-    "mDDot;": "\u223a",
-    "measuredangle;": "\u2221",
-    "MediumSpace;": "\u205f",
-    "Mellintrf;": "\u2133",
-    "Mfr;": "\U0001d510",
-    "mfr;": "\U0001d52a",
-    "mho;": "\u2127",
-    "micro": "\xb5",
-    "micro;": "\xb5",
-    "mid;": "\u2223",
-    "midast;": "*",
-    "midcir;": "\u2af0",
-    "middot": "\xb7",
-    "middot;": "\xb7",
-    "minus;": "\u2212",
-    "minusb;": "\u229f",
-    "minusd;": "\u2238",
-    "minusdu;": "\u2a2a",
-    "MinusPlus;": "\u2213",
-    "mlcp;": "\u2adb",
-    "mldr;": "\u2026",
-    "mnplus;": "\u2213",
-    "models;": "\u22a7",
-    "Mopf;": "\U0001d544",
-    "mopf;": "\U0001d55e",
-    "mp;": "\u2213",
-    "Mscr;": "\u2133",
-    "mscr;": "\U0001d4c2",
-    "mstpos;": "\u223e",
-    "Mu;": "\u039c",
-    "mu;": "\u03bc",
-    "multimap;": "\u22b8",
-    "mumap;": "\u22b8",
-    "nabla;": "\u2207",
-    "Nacute;": "\u0143",
-    "nacute;": "\u0144",
-    "nang;": "\u2220\u20d2",
-    "nap;": "\u2249",
-    "napE;": "\u2a70\u0338",
-    "napid;": "\u224b\u0338",
-    "napos;": "\u0149",
-    "napprox;": "\u2249",
-    "natur;": "\u266e",
-    "natural;": "\u266e",
-    "naturals;": "\u2115",
-    "nbsp": "\xa0",
-    "nbsp;": "\xa0",
-    "nbump;": "\u224e\u0338",
-    "nbumpe;": "\u224f\u0338",
-    "ncap;": "\u2a43",
-    "Ncaron;": "\u0147",
-    "ncaron;": "\u0148",
-    "Ncedil;": "\u0145",
-    "ncedil;": "\u0146",
-    "ncong;": "\u2247",
-    "ncongdot;": "\u2a6d\u0338",
-    "ncup;": "\u2a42",
-    "Ncy;": "\u041d",
-    "ncy;": "\u043d",
-    "ndash;": "\u2013",
-    "ne;": "\u2260",
-    "nearhk;": "\u2924",
-    "neArr;": "\u21d7",
-    "nearr;": "\u2197",
-    "nearrow;": "\u2197",
-    "nedot;": "\u2250\u0338",
-    "NegativeMediumSpace;": "\u200b",
-    "NegativeThickSpace;": "\u200b",
-    "NegativeThinSpace;": "\u200b",
-    "NegativeVeryThinSpace;": "\u200b",
-    "nequiv;": "\u2262",
-    "nesear;": "\u2928",
-    "nesim;": "\u2242\u0338",
-    "NestedGreaterGreater;": "\u226b",
-    "NestedLessLess;": "\u226a",
-    "NewLine;": "\n",
-    "nexist;": "\u2204",
-    "nexists;": "\u2204",
-    "Nfr;": "\U0001d511",
-    "nfr;": "\U0001d52b",
-    "ngE;": "\u2267\u0338",
-    "nge;": "\u2271",
-    "ngeq;": "\u2271",
-    "ngeqq;": "\u2267\u0338",
-    "ngeqslant;": "\u2a7e\u0338",
-    "nges;": "\u2a7e\u0338",
-    "nGg;": "\u22d9\u0338",
-    "ngsim;": "\u2275",
-    "nGt;": "\u226b\u20d2",
-    "ngt;": "\u226f",
-    "ngtr;": "\u226f",
-    "nGtv;": "\u226b\u0338",
-    "nhArr;": "\u21ce",
-    "nharr;": "\u21ae",
-    "nhpar;": "\u2af2",
-    "ni;": "\u220b",
-    "nis;": "\u22fc",
-    "nisd;": "\u22fa",
-    "niv;": "\u220b",
-    "NJcy;": "\u040a",
-    "njcy;": "\u045a",
-    "nlArr;": "\u21cd",
-    "nlarr;": "\u219a",
-    "nldr;": "\u2025",
-    "nlE;": "\u2266\u0338",
-    "nle;": "\u2270",
-    "nLeftarrow;": "\u21cd",
-    "nleftarrow;": "\u219a",
-    "nLeftrightarrow;": "\u21ce",
-    "nleftrightarrow;": "\u21ae",
-    "nleq;": "\u2270",
-    "nleqq;": "\u2266\u0338",
-    "nleqslant;": "\u2a7d\u0338",
-    "nles;": "\u2a7d\u0338",
-    "nless;": "\u226e",
-    "nLl;": "\u22d8\u0338",
-    "nlsim;": "\u2274",
-    "nLt;": "\u226a\u20d2",
-    "nlt;": "\u226e",
-    "nltri;": "\u22ea",
-    "nltrie;": "\u22ec",
-    "nLtv;": "\u226a\u0338",
-    "nmid;": "\u2224",
-    "NoBreak;": "\u2060",
-    "NonBreakingSpace;": "\xa0",
-    "Nopf;": "\u2115",
-    "nopf;": "\U0001d55f",
-    "not": "\xac",
-    "Not;": "\u2aec",
-    "not;": "\xac",
-    "NotCongruent;": "\u2262",
-    "NotCupCap;": "\u226d",
-    "NotDoubleVerticalBar;": "\u2226",
-    "NotElement;": "\u2209",
-    "NotEqual;": "\u2260",
-    "NotEqualTilde;": "\u2242\u0338",
-    "NotExists;": "\u2204",
-    "NotGreater;": "\u226f",
-    "NotGreaterEqual;": "\u2271",
-    "NotGreaterFullEqual;": "\u2267\u0338",
-    "NotGreaterGreater;": "\u226b\u0338",
-    "NotGreaterLess;": "\u2279",
-    "NotGreaterSlantEqual;": "\u2a7e\u0338",
-    "NotGreaterTilde;": "\u2275",
-    "NotHumpDownHump;": "\u224e\u0338",
-    "NotHumpEqual;": "\u224f\u0338",
-    "notin;": "\u2209",
-    "notindot;": "\u22f5\u0338",
-    "notinE;": "\u22f9\u0338",
-    "notinva;": "\u2209",
-    "notinvb;": "\u22f7",
-    "notinvc;": "\u22f6",
-    "NotLeftTriangle;": "\u22ea",
-    "NotLeftTriangleBar;": "\u29cf\u0338",
-    "NotLeftTriangleEqual;": "\u22ec",
-    "NotLess;": "\u226e",
-    "NotLessEqual;": "\u2270",
-    "NotLessGreater;": "\u2278",
-    "NotLessLess;": "\u226a\u0338",
-    "NotLessSlantEqual;": "\u2a7d\u0338",
-    "NotLessTilde;": "\u2274",
-    "NotNestedGreaterGreater;": "\u2aa2\u0338",
-    "NotNestedLessLess;": "\u2aa1\u0338",
-    "notni;": "\u220c",
-    "notniva;": "\u220c",
-    "notnivb;": "\u22fe",
-    "notnivc;": "\u22fd",
-    "NotPrecedes;": "\u2280",
-    "NotPrecedesEqual;": "\u2aaf\u0338",
-    "NotPrecedesSlantEqual;": "\u22e0",
-    "NotReverseElement;": "\u220c",
-    "NotRightTriangle;": "\u22eb",
-    "NotRightTriangleBar;": "\u29d0\u0338",
-    "NotRightTriangleEqual;": "\u22ed",
-    "NotSquareSubset;": "\u228f\u0338",
-    "NotSquareSubsetEqual;": "\u22e2",
-    "NotSquareSuperset;": "\u2290\u0338",
-    "NotSquareSupersetEqual;": "\u22e3",
-    "NotSubset;": "\u2282\u20d2",
-    "NotSubsetEqual;": "\u2288",
-    "NotSucceeds;": "\u2281",
-    "NotSucceedsEqual;": "\u2ab0\u0338",
-    "NotSucceedsSlantEqual;": "\u22e1",
-    "NotSucceedsTilde;": "\u227f\u0338",
-    "NotSuperset;": "\u2283\u20d2",
-    "NotSupersetEqual;": "\u2289",
-    "NotTilde;": "\u2241",
-    "NotTildeEqual;": "\u2244",
-    "NotTildeFullEqual;": "\u2247",
-    "NotTildeTilde;": "\u2249",
-    "NotVerticalBar;": "\u2224",
-    "npar;": "\u2226",
-    "nparallel;": "\u2226",
-    "nparsl;": "\u2afd\u20e5",
-    "npart;": "\u2202\u0338",
-    "npolint;": "\u2a14",
-    "npr;": "\u2280",
-    "nprcue;": "\u22e0",
-    "npre;": "\u2aaf\u0338",
-    "nprec;": "\u2280",
-    "npreceq;": "\u2aaf\u0338",
-    "nrArr;": "\u21cf",
-    "nrarr;": "\u219b",
-    "nrarrc;": "\u2933\u0338",
-    "nrarrw;": "\u219d\u0338",
-    "nRightarrow;": "\u21cf",
-    "nrightarrow;": "\u219b",
-    "nrtri;": "\u22eb",
-    "nrtrie;": "\u22ed",
-    "nsc;": "\u2281",
-    "nsccue;": "\u22e1",
-    "nsce;": "\u2ab0\u0338",
-    "Nscr;": "\U0001d4a9",
-    "nscr;": "\U0001d4c3",
-    "nshortmid;": "\u2224",
-    "nshortparallel;": "\u2226",
-    "nsim;": "\u2241",
-    "nsime;": "\u2244",
-    "nsimeq;": "\u2244",
-    "nsmid;": "\u2224",
-    "nspar;": "\u2226",
-    "nsqsube;": "\u22e2",
-    "nsqsupe;": "\u22e3",
-    "nsub;": "\u2284",
-    "nsubE;": "\u2ac5\u0338",
-    "nsube;": "\u2288",
-    "nsubset;": "\u2282\u20d2",
-    "nsubseteq;": "\u2288",
-    "nsubseteqq;": "\u2ac5\u0338",
-    "nsucc;": "\u2281",
-    "nsucceq;": "\u2ab0\u0338",
-    "nsup;": "\u2285",
-    "nsupE;": "\u2ac6\u0338",
-    "nsupe;": "\u2289",
-    "nsupset;": "\u2283\u20d2",
-    "nsupseteq;": "\u2289",
-    "nsupseteqq;": "\u2ac6\u0338",
-    "ntgl;": "\u2279",
-    "Ntilde": "\xd1",
-    "ntilde": "\xf1",
-    "Ntilde;": "\xd1",
-    "ntilde;": "\xf1",
-    "ntlg;": "\u2278",
-    "ntriangleleft;": "\u22ea",
-    "ntrianglelefteq;": "\u22ec",
-    "ntriangleright;": "\u22eb",
-    "ntrianglerighteq;": "\u22ed",
-    "Nu;": "\u039d",
-    "nu;": "\u03bd",
-    "num;": "#",
-    "numero;": "\u2116",
-    "numsp;": "\u2007",
-    "nvap;": "\u224d\u20d2",
-    "nVDash;": "\u22af",
-    "nVdash;": "\u22ae",
-    "nvDash;": "\u22ad",
-    "nvdash;": "\u22ac",
-    "nvge;": "\u2265\u20d2",
-    "nvgt;": ">\u20d2",
-    "nvHarr;": "\u2904",
-    "nvinfin;": "\u29de",
-    "nvlArr;": "\u2902",
-    "nvle;": "\u2264\u20d2",
-    "nvlt;": "<\u20d2",
-    "nvltrie;": "\u22b4\u20d2",
-    "nvrArr;": "\u2903",
-    "nvrtrie;": "\u22b5\u20d2",
-    "nvsim;": "\u223c\u20d2",
-    "nwarhk;": "\u2923",
-    "nwArr;": "\u21d6",
-    "nwarr;": "\u2196",
-    "nwarrow;": "\u2196",
-    "nwnear;": "\u2927",
-    "Oacute": "\xd3",
-    "oacute": "\xf3",
-    "Oacute;": "\xd3",
-    "oacute;": "\xf3",
-    "oast;": "\u229b",
-    "ocir;": "\u229a",
-    "Ocirc": "\xd4",
-    "ocirc": "\xf4",
-    "Ocirc;": "\xd4",
-    "ocirc;": "\xf4",
-    "Ocy;": "\u041e",
-    "ocy;": "\u043e",
-    "odash;": "\u229d",
-    "Odblac;": "\u0150",
-    "odblac;": "\u0151",
-    "odiv;": "\u2a38",
-    "odot;": "\u2299",
-    "odsold;": "\u29bc",
-    "OElig;": "\u0152",
-    "oelig;": "\u0153",
-    "ofcir;": "\u29bf",
-    "Ofr;": "\U0001d512",
-    "ofr;": "\U0001d52c",
-    "ogon;": "\u02db",
-    "Ograve": "\xd2",
-    "ograve": "\xf2",
-    "Ograve;": "\xd2",
-    "ograve;": "\xf2",
-    "ogt;": "\u29c1",
-    "ohbar;": "\u29b5",
-    "ohm;": "\u03a9",
-    "oint;": "\u222e",
-    "olarr;": "\u21ba",
-    "olcir;": "\u29be",
-    "olcross;": "\u29bb",
-    "oline;": "\u203e",
-    "olt;": "\u29c0",
-    "Omacr;": "\u014c",
-    "omacr;": "\u014d",
-    "Omega;": "\u03a9",
-    "omega;": "\u03c9",
-    "Omicron;": "\u039f",
-    "omicron;": "\u03bf",
-    "omid;": "\u29b6",
-    "ominus;": "\u2296",
-    "Oopf;": "\U0001d546",
-    "oopf;": "\U0001d560",
-    "opar;": "\u29b7",
-    "OpenCurlyDoubleQuote;": "\u201c",
-    "OpenCurlyQuote;": "\u2018",
-    "operp;": "\u29b9",
-    "oplus;": "\u2295",
-    "Or;": "\u2a54",
-    "or;": "\u2228",
-    "orarr;": "\u21bb",
-    "ord;": "\u2a5d",
-    "order;": "\u2134",
-    "orderof;": "\u2134",
-    "ordf": "\xaa",
-    "ordf;": "\xaa",
-    "ordm": "\xba",
-    "ordm;": "\xba",
-    "origof;": "\u22b6",
-    "oror;": "\u2a56",
-    "orslope;": "\u2a57",
-    "orv;": "\u2a5b",
-    "oS;": "\u24c8",
-    "Oscr;": "\U0001d4aa",
-    "oscr;": "\u2134",
-    "Oslash": "\xd8",
-    "oslash": "\xf8",
-    "Oslash;": "\xd8",
-    "oslash;": "\xf8",
-    "osol;": "\u2298",
-    "Otilde": "\xd5",
-    "otilde": "\xf5",
-    "Otilde;": "\xd5",
-    "otilde;": "\xf5",
-    "Otimes;": "\u2a37",
-    "otimes;": "\u2297",
-    "otimesas;": "\u2a36",
-    "Ouml": "\xd6",
-    "ouml": "\xf6",
-    "Ouml;": "\xd6",
-    "ouml;": "\xf6",
-    "ovbar;": "\u233d",
-    "OverBar;": "\u203e",
-    "OverBrace;": "\u23de",
-    "OverBracket;": "\u23b4",
-    "OverParenthesis;": "\u23dc",
-    "par;": "\u2225",
-    "para": "\xb6",
-    "para;": "\xb6",
-    "parallel;": "\u2225",
-    "parsim;": "\u2af3",
-    "parsl;": "\u2afd",
-    "part;": "\u2202",
-    "PartialD;": "\u2202",
-    "Pcy;": "\u041f",
-    "pcy;": "\u043f",
-    "percnt;": "%",
-    "period;": ".",
-    "permil;": "\u2030",
-    "perp;": "\u22a5",
-    "pertenk;": "\u2031",
-    "Pfr;": "\U0001d513",
-    "pfr;": "\U0001d52d",
-    "Phi;": "\u03a6",
-    "phi;": "\u03c6",
-    "phiv;": "\u03d5",
-    "phmmat;": "\u2133",
-    "phone;": "\u260e",
-    "Pi;": "\u03a0",
-    "pi;": "\u03c0",
-    "pitchfork;": "\u22d4",
-    "piv;": "\u03d6",
-    "planck;": "\u210f",
-    "planckh;": "\u210e",
-    "plankv;": "\u210f",
-    "plus;": "+",
-    "plusacir;": "\u2a23",
-    "plusb;": "\u229e",
-    "pluscir;": "\u2a22",
-    "plusdo;": "\u2214",
-    "plusdu;": "\u2a25",
-    "pluse;": "\u2a72",
-    "PlusMinus;": "\xb1",
-    "plusmn": "\xb1",
-    "plusmn;": "\xb1",
-    "plussim;": "\u2a26",
-    "plustwo;": "\u2a27",
-    "pm;": "\xb1",
-    "Poincareplane;": "\u210c",
-    "pointint;": "\u2a15",
-    "Popf;": "\u2119",
-    "popf;": "\U0001d561",
-    "pound": "\xa3",
-    "pound;": "\xa3",
-    "Pr;": "\u2abb",
-    "pr;": "\u227a",
-    "prap;": "\u2ab7",
-    "prcue;": "\u227c",
-    "prE;": "\u2ab3",
-    "pre;": "\u2aaf",
-    "prec;": "\u227a",
-    "precapprox;": "\u2ab7",
-    "preccurlyeq;": "\u227c",
-    "Precedes;": "\u227a",
-    "PrecedesEqual;": "\u2aaf",
-    "PrecedesSlantEqual;": "\u227c",
-    "PrecedesTilde;": "\u227e",
-    "preceq;": "\u2aaf",
-    "precnapprox;": "\u2ab9",
-    "precneqq;": "\u2ab5",
-    "precnsim;": "\u22e8",
-    "precsim;": "\u227e",
-    "Prime;": "\u2033",
-    "prime;": "\u2032",
-    "primes;": "\u2119",
-    "prnap;": "\u2ab9",
-    "prnE;": "\u2ab5",
-    "prnsim;": "\u22e8",
-    "prod;": "\u220f",
-    "Product;": "\u220f",
-    "profalar;": "\u232e",
-    "profline;": "\u2312",
-    "profsurf;": "\u2313",
-    "prop;": "\u221d",
-    "Proportion;": "\u2237",
-    "Proportional;": "\u221d",
-    "propto;": "\u221d",
-    "prsim;": "\u227e",
-    "prurel;": "\u22b0",
-    "Pscr;": "\U0001d4ab",
-    "pscr;": "\U0001d4c5",
-    "Psi;": "\u03a8",
-    "psi;": "\u03c8",
-    "puncsp;": "\u2008",
-    "Qfr;": "\U0001d514",
-    "qfr;": "\U0001d52e",
-    "qint;": "\u2a0c",
-    "Qopf;": "\u211a",
-    "qopf;": "\U0001d562",
-    "qprime;": "\u2057",
-    "Qscr;": "\U0001d4ac",
-    "qscr;": "\U0001d4c6",
-    "quaternions;": "\u210d",
-    "quatint;": "\u2a16",
-    "quest;": "?",
-    "questeq;": "\u225f",
-    "QUOT": '"',
-    "quot": '"',
-    "QUOT;": '"',
-    "quot;": '"',
-    "rAarr;": "\u21db",
-    "race;": "\u223d\u0331",
-    "Racute;": "\u0154",
-    "racute;": "\u0155",
-    "radic;": "\u221a",
-    "raemptyv;": "\u29b3",
-    "Rang;": "\u27eb",
-    "rang;": "\u27e9",
-    "rangd;": "\u2992",
-    "range;": "\u29a5",
-    "rangle;": "\u27e9",
-    "raquo": "\xbb",
-    "raquo;": "\xbb",
-    "Rarr;": "\u21a0",
-    "rArr;": "\u21d2",
-    "rarr;": "\u2192",
-    "rarrap;": "\u2975",
-    "rarrb;": "\u21e5",
-    "rarrbfs;": "\u2920",
-    "rarrc;": "\u2933",
-    "rarrfs;": "\u291e",
-    "rarrhk;": "\u21aa",
-    "rarrlp;": "\u21ac",
-    "rarrpl;": "\u2945",
-    "rarrsim;": "\u2974",
-    "Rarrtl;": "\u2916",
-    "rarrtl;": "\u21a3",
-    "rarrw;": "\u219d",
-    "rAtail;": "\u291c",
-    "ratail;": "\u291a",
-    "ratio;": "\u2236",
-    "rationals;": "\u211a",
-    "RBarr;": "\u2910",
-    "rBarr;": "\u290f",
-    "rbarr;": "\u290d",
-    "rbbrk;": "\u2773",
-    "rbrace;": "}",
-    "rbrack;": "]",
-    "rbrke;": "\u298c",
-    "rbrksld;": "\u298e",
-    "rbrkslu;": "\u2990",
-    "Rcaron;": "\u0158",
-    "rcaron;": "\u0159",
-    "Rcedil;": "\u0156",
-    "rcedil;": "\u0157",
-    "rceil;": "\u2309",
-    "rcub;": "}",
-    "Rcy;": "\u0420",
-    "rcy;": "\u0440",
-    "rdca;": "\u2937",
-    "rdldhar;": "\u2969",
-    "rdquo;": "\u201d",
-    "rdquor;": "\u201d",
-    "rdsh;": "\u21b3",
-    "Re;": "\u211c",
-    "real;": "\u211c",
-    "realine;": "\u211b",
-    "realpart;": "\u211c",
-    "reals;": "\u211d",
-    "rect;": "\u25ad",
-    "REG": "\xae",
-    "reg": "\xae",
-    "REG;": "\xae",
-    "reg;": "\xae",
-    "ReverseElement;": "\u220b",
-    "ReverseEquilibrium;": "\u21cb",
-    "ReverseUpEquilibrium;": "\u296f",
-    "rfisht;": "\u297d",
-    "rfloor;": "\u230b",
-    "Rfr;": "\u211c",
-    "rfr;": "\U0001d52f",
-    "rHar;": "\u2964",
-    "rhard;": "\u21c1",
-    "rharu;": "\u21c0",
-    "rharul;": "\u296c",
-    "Rho;": "\u03a1",
-    "rho;": "\u03c1",
-    "rhov;": "\u03f1",
-    "RightAngleBracket;": "\u27e9",
-    "RightArrow;": "\u2192",
-    "Rightarrow;": "\u21d2",
-    "rightarrow;": "\u2192",
-    "RightArrowBar;": "\u21e5",
-    "RightArrowLeftArrow;": "\u21c4",
-    "rightarrowtail;": "\u21a3",
-    "RightCeiling;": "\u2309",
-    "RightDoubleBracket;": "\u27e7",
-    "RightDownTeeVector;": "\u295d",
-    "RightDownVector;": "\u21c2",
-    "RightDownVectorBar;": "\u2955",
-    "RightFloor;": "\u230b",
-    "rightharpoondown;": "\u21c1",
-    "rightharpoonup;": "\u21c0",
-    "rightleftarrows;": "\u21c4",
-    "rightleftharpoons;": "\u21cc",
-    "rightrightarrows;": "\u21c9",
-    "rightsquigarrow;": "\u219d",
-    "RightTee;": "\u22a2",
-    "RightTeeArrow;": "\u21a6",
-    "RightTeeVector;": "\u295b",
-    "rightthreetimes;": "\u22cc",
-    "RightTriangle;": "\u22b3",
-    "RightTriangleBar;": "\u29d0",
-    "RightTriangleEqual;": "\u22b5",
-    "RightUpDownVector;": "\u294f",
-    "RightUpTeeVector;": "\u295c",
-    "RightUpVector;": "\u21be",
-    "RightUpVectorBar;": "\u2954",
-    "RightVector;": "\u21c0",
-    "RightVectorBar;": "\u2953",
-    "ring;": "\u02da",
-    "risingdotseq;": "\u2253",
-    "rlarr;": "\u21c4",
-    "rlhar;": "\u21cc",
-    "rlm;": "\u200f",
-    "rmoust;": "\u23b1",
-    "rmoustache;": "\u23b1",
-    "rnmid;": "\u2aee",
-    "roang;": "\u27ed",
-    "roarr;": "\u21fe",
-    "robrk;": "\u27e7",
-    "ropar;": "\u2986",
-    "Ropf;": "\u211d",
-    "ropf;": "\U0001d563",
-    "roplus;": "\u2a2e",
-    "rotimes;": "\u2a35",
-    "RoundImplies;": "\u2970",
-    "rpar;": ")",
-    "rpargt;": "\u2994",
-    "rppolint;": "\u2a12",
-    "rrarr;": "\u21c9",
-    "Rrightarrow;": "\u21db",
-    "rsaquo;": "\u203a",
-    "Rscr;": "\u211b",
-    "rscr;": "\U0001d4c7",
-    "Rsh;": "\u21b1",
-    "rsh;": "\u21b1",
-    "rsqb;": "]",
-    "rsquo;": "\u2019",
-    "rsquor;": "\u2019",
-    "rthree;": "\u22cc",
-    "rtimes;": "\u22ca",
-    "rtri;": "\u25b9",
-    "rtrie;": "\u22b5",
-    "rtrif;": "\u25b8",
-    "rtriltri;": "\u29ce",
-    "RuleDelayed;": "\u29f4",
-    "ruluhar;": "\u2968",
-    "rx;": "\u211e",
-    "Sacute;": "\u015a",
-    "sacute;": "\u015b",
-    "sbquo;": "\u201a",
-    "Sc;": "\u2abc",
-    "sc;": "\u227b",
-    "scap;": "\u2ab8",
-    "Scaron;": "\u0160",
-    "scaron;": "\u0161",
-    "sccue;": "\u227d",
-    "scE;": "\u2ab4",
-    "sce;": "\u2ab0",
-    "Scedil;": "\u015e",
-    "scedil;": "\u015f",
-    "Scirc;": "\u015c",
-    "scirc;": "\u015d",
-    "scnap;": "\u2aba",
-    "scnE;": "\u2ab6",
-    "scnsim;": "\u22e9",
-    "scpolint;": "\u2a13",
-    "scsim;": "\u227f",
-    "Scy;": "\u0421",
-    "scy;": "\u0441",
-    "sdot;": "\u22c5",
-    "sdotb;": "\u22a1",
-    "sdote;": "\u2a66",
-    "searhk;": "\u2925",
-    "seArr;": "\u21d8",
-    "searr;": "\u2198",
-    "searrow;": "\u2198",
-    "sect": "\xa7",
-    "sect;": "\xa7",
-    "semi;": ";",
-    "seswar;": "\u2929",
-    "setminus;": "\u2216",
-    "setmn;": "\u2216",
-    "sext;": "\u2736",
-    "Sfr;": "\U0001d516",
-    "sfr;": "\U0001d530",
-    "sfrown;": "\u2322",
-    "sharp;": "\u266f",
-    "SHCHcy;": "\u0429",
-    "shchcy;": "\u0449",
-    "SHcy;": "\u0428",
-    "shcy;": "\u0448",
-    "ShortDownArrow;": "\u2193",
-    "ShortLeftArrow;": "\u2190",
-    "shortmid;": "\u2223",
-    "shortparallel;": "\u2225",
-    "ShortRightArrow;": "\u2192",
-    "ShortUpArrow;": "\u2191",
-    "shy": "\xad",
-    "shy;": "\xad",
-    "Sigma;": "\u03a3",
-    "sigma;": "\u03c3",
-    "sigmaf;": "\u03c2",
-    "sigmav;": "\u03c2",
-    "sim;": "\u223c",
-    "simdot;": "\u2a6a",
-    "sime;": "\u2243",
-    "simeq;": "\u2243",
-    "simg;": "\u2a9e",
-    "simgE;": "\u2aa0",
-    "siml;": "\u2a9d",
-    "simlE;": "\u2a9f",
-    "simne;": "\u2246",
-    "simplus;": "\u2a24",
-    "simrarr;": "\u2972",
-    "slarr;": "\u2190",
-    "SmallCircle;": "\u2218",
-    "smallsetminus;": "\u2216",
-    "smashp;": "\u2a33",
-    "smeparsl;": "\u29e4",
-    "smid;": "\u2223",
-    "smile;": "\u2323",
-    "smt;": "\u2aaa",
-    "smte;": "\u2aac",
-    "smtes;": "\u2aac\ufe00",
-    "SOFTcy;": "\u042c",
-    "softcy;": "\u044c",
-    "sol;": "/",
-    "solb;": "\u29c4",
-    "solbar;": "\u233f",
-    "Sopf;": "\U0001d54a",
-    "sopf;": "\U0001d564",
-    "spades;": "\u2660",
-    "spadesuit;": "\u2660",
-    "spar;": "\u2225",
-    "sqcap;": "\u2293",
-    "sqcaps;": "\u2293\ufe00",
-    "sqcup;": "\u2294",
-    "sqcups;": "\u2294\ufe00",
-    "Sqrt;": "\u221a",
-    "sqsub;": "\u228f",
-    "sqsube;": "\u2291",
-    "sqsubset;": "\u228f",
-    "sqsubseteq;": "\u2291",
-    "sqsup;": "\u2290",
-    "sqsupe;": "\u2292",
-    "sqsupset;": "\u2290",
-    "sqsupseteq;": "\u2292",
-    "squ;": "\u25a1",
-    "Square;": "\u25a1",
-    "square;": "\u25a1",
-    "SquareIntersection;": "\u2293",
-    "SquareSubset;": "\u228f",
-    "SquareSubsetEqual;": "\u2291",
-    "SquareSuperset;": "\u2290",
-    "SquareSupersetEqual;": "\u2292",
-    "SquareUnion;": "\u2294",
-    "squarf;": "\u25aa",
-    "squf;": "\u25aa",
-    "srarr;": "\u2192",
-    "Sscr;": "\U0001d4ae",
-    "sscr;": "\U0001d4c8",
-    "ssetmn;": "\u2216",
-    "ssmile;": "\u2323",
-    "sstarf;": "\u22c6",
-    "Star;": "\u22c6",
-    "star;": "\u2606",
-    "starf;": "\u2605",
-    "straightepsilon;": "\u03f5",
-    "straightphi;": "\u03d5",
-    "strns;": "\xaf",
-    "Sub;": "\u22d0",
-    "sub;": "\u2282",
-    "subdot;": "\u2abd",
-    "subE;": "\u2ac5",
-    "sube;": "\u2286",
-    "subedot;": "\u2ac3",
-    "submult;": "\u2ac1",
-    "subnE;": "\u2acb",
-    "subne;": "\u228a",
-    "subplus;": "\u2abf",
-    "subrarr;": "\u2979",
-    "Subset;": "\u22d0",
-    "subset;": "\u2282",
-    "subseteq;": "\u2286",
-    "subseteqq;": "\u2ac5",
-    "SubsetEqual;": "\u2286",
-    "subsetneq;": "\u228a",
-    "subsetneqq;": "\u2acb",
-    "subsim;": "\u2ac7",
-    "subsub;": "\u2ad5",
-    "subsup;": "\u2ad3",
-    "succ;": "\u227b",
-    "succapprox;": "\u2ab8",
-    "succcurlyeq;": "\u227d",
-    "Succeeds;": "\u227b",
-    "SucceedsEqual;": "\u2ab0",
-    "SucceedsSlantEqual;": "\u227d",
-    "SucceedsTilde;": "\u227f",
-    "succeq;": "\u2ab0",
-    "succnapprox;": "\u2aba",
-    "succneqq;": "\u2ab6",
-    "succnsim;": "\u22e9",
-    "succsim;": "\u227f",
-    "SuchThat;": "\u220b",
-    "Sum;": "\u2211",
-    "sum;": "\u2211",
-    "sung;": "\u266a",
-    "sup1": "\xb9",
-    "sup1;": "\xb9",
-    "sup2": "\xb2",
-    "sup2;": "\xb2",
-    "sup3": "\xb3",
-    "sup3;": "\xb3",
-    "Sup;": "\u22d1",
-    "sup;": "\u2283",
-    "supdot;": "\u2abe",
-    "supdsub;": "\u2ad8",
-    "supE;": "\u2ac6",
-    "supe;": "\u2287",
-    "supedot;": "\u2ac4",
-    "Superset;": "\u2283",
-    "SupersetEqual;": "\u2287",
-    "suphsol;": "\u27c9",
-    "suphsub;": "\u2ad7",
-    "suplarr;": "\u297b",
-    "supmult;": "\u2ac2",
-    "supnE;": "\u2acc",
-    "supne;": "\u228b",
-    "supplus;": "\u2ac0",
-    "Supset;": "\u22d1",
-    "supset;": "\u2283",
-    "supseteq;": "\u2287",
-    "supseteqq;": "\u2ac6",
-    "supsetneq;": "\u228b",
-    "supsetneqq;": "\u2acc",
-    "supsim;": "\u2ac8",
-    "supsub;": "\u2ad4",
-    "supsup;": "\u2ad6",
-    "swarhk;": "\u2926",
-    "swArr;": "\u21d9",
-    "swarr;": "\u2199",
-    "swarrow;": "\u2199",
-    "swnwar;": "\u292a",
-    "szlig": "\xdf",
-    "szlig;": "\xdf",
-    "Tab;": "\t",
-    "target;": "\u2316",
-    "Tau;": "\u03a4",
-    "tau;": "\u03c4",
-    "tbrk;": "\u23b4",
-    "Tcaron;": "\u0164",
-    "tcaron;": "\u0165",
-    "Tcedil;": "\u0162",
-    "tcedil;": "\u0163",
-    "Tcy;": "\u0422",
-    "tcy;": "\u0442",
-    "tdot;": "\u20db",
-    "telrec;": "\u2315",
-    "Tfr;": "\U0001d517",
-    "tfr;": "\U0001d531",
-    "there4;": "\u2234",
-    "Therefore;": "\u2234",
-    "therefore;": "\u2234",
-    "Theta;": "\u0398",
-    "theta;": "\u03b8",
-    "thetasym;": "\u03d1",
-    "thetav;": "\u03d1",
-    "thickapprox;": "\u2248",
-    "thicksim;": "\u223c",
-    "ThickSpace;": "\u205f\u200a",
-    "thinsp;": "\u2009",
-    "ThinSpace;": "\u2009",
-    "thkap;": "\u2248",
-    "thksim;": "\u223c",
-    "THORN": "\xde",
-    "thorn": "\xfe",
-    "THORN;": "\xde",
-    "thorn;": "\xfe",
-    "Tilde;": "\u223c",
-    "tilde;": "\u02dc",
-    "TildeEqual;": "\u2243",
-    "TildeFullEqual;": "\u2245",
-    "TildeTilde;": "\u2248",
-    "times": "\xd7",
-    "times;": "\xd7",
-    "timesb;": "\u22a0",
-    "timesbar;": "\u2a31",
-    "timesd;": "\u2a30",
-    "tint;": "\u222d",
-    "toea;": "\u2928",
-    "top;": "\u22a4",
-    "topbot;": "\u2336",
-    "topcir;": "\u2af1",
-    "Topf;": "\U0001d54b",
-    "topf;": "\U0001d565",
-    "topfork;": "\u2ada",
-    "tosa;": "\u2929",
-    "tprime;": "\u2034",
-    "TRADE;": "\u2122",
-    "trade;": "\u2122",
-    "triangle;": "\u25b5",
-    "triangledown;": "\u25bf",
-    "triangleleft;": "\u25c3",
-    "trianglelefteq;": "\u22b4",
-    "triangleq;": "\u225c",
-    "triangleright;": "\u25b9",
-    "trianglerighteq;": "\u22b5",
-    "tridot;": "\u25ec",
-    "trie;": "\u225c",
-    "triminus;": "\u2a3a",
-    "TripleDot;": "\u20db",
-    "triplus;": "\u2a39",
-    "trisb;": "\u29cd",
-    "tritime;": "\u2a3b",
-    "trpezium;": "\u23e2",
-    "Tscr;": "\U0001d4af",
-    "tscr;": "\U0001d4c9",
-    "TScy;": "\u0426",
-    "tscy;": "\u0446",
-    "TSHcy;": "\u040b",
-    "tshcy;": "\u045b",
-    "Tstrok;": "\u0166",
-    "tstrok;": "\u0167",
-    "twixt;": "\u226c",
-    "twoheadleftarrow;": "\u219e",
-    "twoheadrightarrow;": "\u21a0",
-    "Uacute": "\xda",
-    "uacute": "\xfa",
-    "Uacute;": "\xda",
-    "uacute;": "\xfa",
-    "Uarr;": "\u219f",
-    "uArr;": "\u21d1",
-    "uarr;": "\u2191",
-    "Uarrocir;": "\u2949",
-    "Ubrcy;": "\u040e",
-    "ubrcy;": "\u045e",
-    "Ubreve;": "\u016c",
-    "ubreve;": "\u016d",
-    "Ucirc": "\xdb",
-    "ucirc": "\xfb",
-    "Ucirc;": "\xdb",
-    "ucirc;": "\xfb",
-    "Ucy;": "\u0423",
-    "ucy;": "\u0443",
-    "udarr;": "\u21c5",
-    "Udblac;": "\u0170",
-    "udblac;": "\u0171",
-    "udhar;": "\u296e",
-    "ufisht;": "\u297e",
-    "Ufr;": "\U0001d518",
-    "ufr;": "\U0001d532",
-    "Ugrave": "\xd9",
-    "ugrave": "\xf9",
-    "Ugrave;": "\xd9",
-    "ugrave;": "\xf9",
-    "uHar;": "\u2963",
-    "uharl;": "\u21bf",
-    "uharr;": "\u21be",
-    "uhblk;": "\u2580",
-    "ulcorn;": "\u231c",
-    "ulcorner;": "\u231c",
-    "ulcrop;": "\u230f",
-    "ultri;": "\u25f8",
-    "Umacr;": "\u016a",
-    "umacr;": "\u016b",
-    "uml": "\xa8",
-    "uml;": "\xa8",
-    "UnderBar;": "_",
-    "UnderBrace;": "\u23df",
-    "UnderBracket;": "\u23b5",
-    "UnderParenthesis;": "\u23dd",
-    "Union;": "\u22c3",
-    "UnionPlus;": "\u228e",
-    "Uogon;": "\u0172",
-    "uogon;": "\u0173",
-    "Uopf;": "\U0001d54c",
-    "uopf;": "\U0001d566",
-    "UpArrow;": "\u2191",
-    "Uparrow;": "\u21d1",
-    "uparrow;": "\u2191",
-    "UpArrowBar;": "\u2912",
-    "UpArrowDownArrow;": "\u21c5",
-    "UpDownArrow;": "\u2195",
-    "Updownarrow;": "\u21d5",
-    "updownarrow;": "\u2195",
-    "UpEquilibrium;": "\u296e",
-    "upharpoonleft;": "\u21bf",
-    "upharpoonright;": "\u21be",
-    "uplus;": "\u228e",
-    "UpperLeftArrow;": "\u2196",
-    "UpperRightArrow;": "\u2197",
-    "Upsi;": "\u03d2",
-    "upsi;": "\u03c5",
-    "upsih;": "\u03d2",
-    "Upsilon;": "\u03a5",
-    "upsilon;": "\u03c5",
-    "UpTee;": "\u22a5",
-    "UpTeeArrow;": "\u21a5",
-    "upuparrows;": "\u21c8",
-    "urcorn;": "\u231d",
-    "urcorner;": "\u231d",
-    "urcrop;": "\u230e",
-    "Uring;": "\u016e",
-    "uring;": "\u016f",
-    "urtri;": "\u25f9",
-    "Uscr;": "\U0001d4b0",
-    "uscr;": "\U0001d4ca",
-    "utdot;": "\u22f0",
-    "Utilde;": "\u0168",
-    "utilde;": "\u0169",
-    "utri;": "\u25b5",
-    "utrif;": "\u25b4",
-    "uuarr;": "\u21c8",
-    "Uuml": "\xdc",
-    "uuml": "\xfc",
-    "Uuml;": "\xdc",
-    "uuml;": "\xfc",
-    "uwangle;": "\u29a7",
-    "vangrt;": "\u299c",
-    "varepsilon;": "\u03f5",
-    "varkappa;": "\u03f0",
-    "varnothing;": "\u2205",
-    "varphi;": "\u03d5",
-    "varpi;": "\u03d6",
-    "varpropto;": "\u221d",
-    "vArr;": "\u21d5",
-    "varr;": "\u2195",
-    "varrho;": "\u03f1",
-    "varsigma;": "\u03c2",
-    "varsubsetneq;": "\u228a\ufe00",
-    "varsubsetneqq;": "\u2acb\ufe00",
-    "varsupsetneq;": "\u228b\ufe00",
-    "varsupsetneqq;": "\u2acc\ufe00",
-    "vartheta;": "\u03d1",
-    "vartriangleleft;": "\u22b2",
-    "vartriangleright;": "\u22b3",
-    "Vbar;": "\u2aeb",
-    "vBar;": "\u2ae8",
-    "vBarv;": "\u2ae9",
-    "Vcy;": "\u0412",
-    "vcy;": "\u0432",
-    "VDash;": "\u22ab",
-    "Vdash;": "\u22a9",
-    "vDash;": "\u22a8",
-    "vdash;": "\u22a2",
-    "Vdashl;": "\u2ae6",
-    "Vee;": "\u22c1",
-    "vee;": "\u2228",
-    "veebar;": "\u22bb",
-    "veeeq;": "\u225a",
-    "vellip;": "\u22ee",
-    "Verbar;": "\u2016",
-    "verbar;": "|",
-    "Vert;": "\u2016",
-    "vert;": "|",
-    "VerticalBar;": "\u2223",
-    "VerticalLine;": "|",
-    "VerticalSeparator;": "\u2758",
-    "VerticalTilde;": "\u2240",
-    "VeryThinSpace;": "\u200a",
-    "Vfr;": "\U0001d519",
-    "vfr;": "\U0001d533",
-    "vltri;": "\u22b2",
-    "vnsub;": "\u2282\u20d2",
-    "vnsup;": "\u2283\u20d2",
-    "Vopf;": "\U0001d54d",
-    "vopf;": "\U0001d567",
-    "vprop;": "\u221d",
-    "vrtri;": "\u22b3",
-    "Vscr;": "\U0001d4b1",
-    "vscr;": "\U0001d4cb",
-    "vsubnE;": "\u2acb\ufe00",
-    "vsubne;": "\u228a\ufe00",
-    "vsupnE;": "\u2acc\ufe00",
-    "vsupne;": "\u228b\ufe00",
-    "Vvdash;": "\u22aa",
-    "vzigzag;": "\u299a",
-    "Wcirc;": "\u0174",
-    "wcirc;": "\u0175",
-    "wedbar;": "\u2a5f",
-    "Wedge;": "\u22c0",
-    "wedge;": "\u2227",
-    "wedgeq;": "\u2259",
-    "weierp;": "\u2118",
-    "Wfr;": "\U0001d51a",
-    "wfr;": "\U0001d534",
-    "Wopf;": "\U0001d54e",
-    "wopf;": "\U0001d568",
-    "wp;": "\u2118",
-    "wr;": "\u2240",
-    "wreath;": "\u2240",
-    "Wscr;": "\U0001d4b2",
-    "wscr;": "\U0001d4cc",
-    "xcap;": "\u22c2",
-    "xcirc;": "\u25ef",
-    "xcup;": "\u22c3",
-    "xdtri;": "\u25bd",
-    "Xfr;": "\U0001d51b",
-    "xfr;": "\U0001d535",
-    "xhArr;": "\u27fa",
-    "xharr;": "\u27f7",
-    "Xi;": "\u039e",
-    "xi;": "\u03be",
-    "xlArr;": "\u27f8",
-    "xlarr;": "\u27f5",
-    "xmap;": "\u27fc",
-    "xnis;": "\u22fb",
-    "xodot;": "\u2a00",
-    "Xopf;": "\U0001d54f",
-    "xopf;": "\U0001d569",
-    "xoplus;": "\u2a01",
-    "xotime;": "\u2a02",
-    "xrArr;": "\u27f9",
-    "xrarr;": "\u27f6",
-    "Xscr;": "\U0001d4b3",
-    "xscr;": "\U0001d4cd",
-    "xsqcup;": "\u2a06",
-    "xuplus;": "\u2a04",
-    "xutri;": "\u25b3",
-    "xvee;": "\u22c1",
-    "xwedge;": "\u22c0",
-    "Yacute": "\xdd",
-    "yacute": "\xfd",
-    "Yacute;": "\xdd",
-    "yacute;": "\xfd",
-    "YAcy;": "\u042f",
-    "yacy;": "\u044f",
-    "Ycirc;": "\u0176",
-    "ycirc;": "\u0177",
-    "Ycy;": "\u042b",
-    "ycy;": "\u044b",
-    "yen": "\xa5",
-    "yen;": "\xa5",
-    "Yfr;": "\U0001d51c",
-    "yfr;": "\U0001d536",
-    "YIcy;": "\u0407",
-    "yicy;": "\u0457",
-    "Yopf;": "\U0001d550",
-    "yopf;": "\U0001d56a",
-    "Yscr;": "\U0001d4b4",
-    "yscr;": "\U0001d4ce",
-    "YUcy;": "\u042e",
-    "yucy;": "\u044e",
-    "yuml": "\xff",
-    "Yuml;": "\u0178",
-    "yuml;": "\xff",
-    "Zacute;": "\u0179",
-    "zacute;": "\u017a",
-    "Zcaron;": "\u017d",
-    "zcaron;": "\u017e",
-    "Zcy;": "\u0417",
-    "zcy;": "\u0437",
-    "Zdot;": "\u017b",
-    "zdot;": "\u017c",
-    "zeetrf;": "\u2128",
-    "ZeroWidthSpace;": "\u200b",
-    "Zeta;": "\u0396",
-    "zeta;": "\u03b6",
-    "Zfr;": "\u2128",
-    "zfr;": "\U0001d537",
-    "ZHcy;": "\u0416",
-    "zhcy;": "\u0436",
-    "zigrarr;": "\u21dd",
-    "Zopf;": "\u2124",
-    "zopf;": "\U0001d56b",
-    "Zscr;": "\U0001d4b5",
-    "zscr;": "\U0001d4cf",
-    "zwj;": "\u200d",
-    "zwnj;": "\u200c",
-}
+def _offset(index, i):
+    return index[2 * i] | index[2 * i + 1] << 8
 
-# maps the Unicode codepoint to the HTML entity name
-codepoint2name = {}
 
-# maps the HTML entity name to the character
-# (or a character reference if the character is outside the Latin-1 range)
-entitydefs = {}
+def _find(data, index, name, default):
+    key = name.encode()
+    lo = 0
+    hi = len(index) // 2
+    while lo < hi:
+        mid = (lo + hi) // 2
+        start = _offset(index, mid)
+        tab = data.find(b"\t", start)
+        k = data[start:tab]
+        if k < key:
+            lo = mid + 1
+        elif k > key:
+            hi = mid
+        else:
+            end = _offset(index, mid + 1) if mid + 1 < len(index) // 2 else len(data)
+            return str(data[tab + 1 : end], "utf-8")
+    return default
 
-for name, codepoint in name2codepoint.items():
-    codepoint2name[codepoint] = name
-    entitydefs[name] = chr(codepoint)
 
-del name, codepoint
+def _items(data, index):
+    n = len(index) // 2
+    for i in range(n):
+        start = _offset(index, i)
+        end = _offset(index, i + 1) if i + 1 < n else len(data)
+        tab = data.find(b"\t", start)
+        yield str(data[start:tab], "utf-8"), str(data[tab + 1 : end], "utf-8")
+
+
+def html5_get(name, default=None):
+    """Return the character(s) for the HTML5 named character reference name
+    (e.g. "amp;" or "amp"), or default."""
+    return _find(_HTML5, _HTML5_INDEX, name, default)
+
+
+def name2codepoint_get(name, default=None):
+    """Return the codepoint of the HTML 4 entity name, or default."""
+    c = _find(_NAME2CODEPOINT, _NAME2CODEPOINT_INDEX, name, None)
+    if c is None:
+        return default
+    return ord(c)
+
+
+def __getattr__(attr):
+    if attr == "name2codepoint":
+        # maps the HTML entity name to the Unicode codepoint
+        value = {k: ord(v) for k, v in _items(_NAME2CODEPOINT, _NAME2CODEPOINT_INDEX)}
+    elif attr == "html5":
+        # maps the HTML5 named character references to the equivalent Unicode character(s)
+        value = dict(_items(_HTML5, _HTML5_INDEX))
+    elif attr == "codepoint2name":
+        # maps the Unicode codepoint to the HTML entity name
+        value = {ord(v): k for k, v in _items(_NAME2CODEPOINT, _NAME2CODEPOINT_INDEX)}
+    elif attr == "entitydefs":
+        # maps the HTML entity name to the character
+        value = dict(_items(_NAME2CODEPOINT, _NAME2CODEPOINT_INDEX))
+    else:
+        raise AttributeError(attr)
+    globals()[attr] = value
+    return value
+
+
+# Generated by make_entities.py.
+# BEGIN TABLES
+_NAME2CODEPOINT = (
+    b"AElig\x09\xc3\x86Aacute\x09\xc3\x81Acirc\x09\xc3\x82Agrave\x09\xc3\x80Alpha\x09\xce\x91Aring\x09\xc3\x85Atilde\x09\xc3\x83"
+    b"Auml\x09\xc3\x84Beta\x09\xce\x92Ccedil\x09\xc3\x87Chi\x09\xce\xa7Dagger\x09\xe2\x80\xa1Delta\x09\xce\x94ETH\x09\xc3\x90"
+    b"Eacute\x09\xc3\x89Ecirc\x09\xc3\x8aEgrave\x09\xc3\x88Epsilon\x09\xce\x95Eta\x09\xce\x97Euml\x09\xc3\x8bGamma\x09\xce\x93"
+    b"Iacute\x09\xc3\x8dIcirc\x09\xc3\x8eIgrave\x09\xc3\x8cIota\x09\xce\x99Iuml\x09\xc3\x8fKappa\x09\xce\x9aLambda\x09\xce\x9b"
+    b"Mu\x09\xce\x9cNtilde\x09\xc3\x91Nu\x09\xce\x9dOElig\x09\xc5\x92Oacute\x09\xc3\x93Ocirc\x09\xc3\x94Ograve\x09\xc3\x92"
+    b"Omega\x09\xce\xa9Omicron\x09\xce\x9fOslash\x09\xc3\x98Otilde\x09\xc3\x95Ouml\x09\xc3\x96Phi\x09\xce\xa6Pi\x09\xce\xa0"
+    b"Prime\x09\xe2\x80\xb3Psi\x09\xce\xa8Rho\x09\xce\xa1Scaron\x09\xc5\xa0Sigma\x09\xce\xa3THORN\x09\xc3\x9eTau\x09\xce\xa4Theta\x09\xce\x98"
+    b"Uacute\x09\xc3\x9aUcirc\x09\xc3\x9bUgrave\x09\xc3\x99Upsilon\x09\xce\xa5Uuml\x09\xc3\x9cXi\x09\xce\x9eYacute\x09\xc3\x9d"
+    b"Yuml\x09\xc5\xb8Zeta\x09\xce\x96aacute\x09\xc3\xa1acirc\x09\xc3\xa2acute\x09\xc2\xb4aelig\x09\xc3\xa6agrave\x09\xc3\xa0"
+    b"alefsym\x09\xe2\x84\xb5alpha\x09\xce\xb1amp\x09&and\x09\xe2\x88\xa7ang\x09\xe2\x88\xa0aring\x09\xc3\xa5asymp\x09\xe2\x89\x88"
+    b"atilde\x09\xc3\xa3auml\x09\xc3\xa4bdquo\x09\xe2\x80\x9ebeta\x09\xce\xb2brvbar\x09\xc2\xa6bull\x09\xe2\x80\xa2cap\x09\xe2\x88\xa9"
+    b"ccedil\x09\xc3\xa7cedil\x09\xc2\xb8cent\x09\xc2\xa2chi\x09\xcf\x87circ\x09\xcb\x86clubs\x09\xe2\x99\xa3cong\x09\xe2\x89\x85"
+    b"copy\x09\xc2\xa9crarr\x09\xe2\x86\xb5cup\x09\xe2\x88\xaacurren\x09\xc2\xa4dArr\x09\xe2\x87\x93dagger\x09\xe2\x80\xa0darr\x09\xe2\x86\x93"
+    b"deg\x09\xc2\xb0delta\x09\xce\xb4diams\x09\xe2\x99\xa6divide\x09\xc3\xb7eacute\x09\xc3\xa9ecirc\x09\xc3\xaaegrave\x09\xc3\xa8"
+    b"empty\x09\xe2\x88\x85emsp\x09\xe2\x80\x83ensp\x09\xe2\x80\x82epsilon\x09\xce\xb5equiv\x09\xe2\x89\xa1eta\x09\xce\xb7eth\x09\xc3\xb0"
+    b"euml\x09\xc3\xabeuro\x09\xe2\x82\xacexist\x09\xe2\x88\x83fnof\x09\xc6\x92forall\x09\xe2\x88\x80frac12\x09\xc2\xbdfrac14\x09\xc2\xbc"
+    b"frac34\x09\xc2\xbefrasl\x09\xe2\x81\x84gamma\x09\xce\xb3ge\x09\xe2\x89\xa5gt\x09>hArr\x09\xe2\x87\x94harr\x09\xe2\x86\x94"
+    b"hearts\x09\xe2\x99\xa5hellip\x09\xe2\x80\xa6iacute\x09\xc3\xadicirc\x09\xc3\xaeiexcl\x09\xc2\xa1igrave\x09\xc3\xac"
+    b"image\x09\xe2\x84\x91infin\x09\xe2\x88\x9eint\x09\xe2\x88\xabiota\x09\xce\xb9iquest\x09\xc2\xbfisin\x09\xe2\x88\x88iuml\x09\xc3\xaf"
+    b"kappa\x09\xce\xbalArr\x09\xe2\x87\x90lambda\x09\xce\xbblang\x09\xe2\x8c\xa9laquo\x09\xc2\xablarr\x09\xe2\x86\x90lceil\x09\xe2\x8c\x88"
+    b"ldquo\x09\xe2\x80\x9cle\x09\xe2\x89\xa4lfloor\x09\xe2\x8c\x8alowast\x09\xe2\x88\x97loz\x09\xe2\x97\x8alrm\x09\xe2\x80\x8elsaquo\x09\xe2\x80\xb9"
+    b"lsquo\x09\xe2\x80\x98lt\x09<macr\x09\xc2\xafmdash\x09\xe2\x80\x94micro\x09\xc2\xb5middot\x09\xc2\xb7minus\x09\xe2\x88\x92mu\x09\xce\xbc"
+    b"nabla\x09\xe2\x88\x87nbsp\x09\xc2\xa0ndash\x09\xe2\x80\x93ne\x09\xe2\x89\xa0ni\x09\xe2\x88\x8bnot\x09\xc2\xacnotin\x09\xe2\x88\x89nsub\x09\xe2\x8a\x84"
+    b"ntilde\x09\xc3\xb1nu\x09\xce\xbdoacute\x09\xc3\xb3ocirc\x09\xc3\xb4oelig\x09\xc5\x93ograve\x09\xc3\xb2oline\x09\xe2\x80\xbe"
+    b"omega\x09\xcf\x89omicron\x09\xce\xbfoplus\x09\xe2\x8a\x95or\x09\xe2\x88\xa8ordf\x09\xc2\xaaordm\x09\xc2\xbaoslash\x09\xc3\xb8"
+    b"otilde\x09\xc3\xb5otimes\x09\xe2\x8a\x97ouml\x09\xc3\xb6para\x09\xc2\xb6part\x09\xe2\x88\x82permil\x09\xe2\x80\xb0perp\x09\xe2\x8a\xa5"
+    b"phi\x09\xcf\x86pi\x09\xcf\x80piv\x09\xcf\x96plusmn\x09\xc2\xb1pound\x09\xc2\xa3prime\x09\xe2\x80\xb2prod\x09\xe2\x88\x8fprop\x09\xe2\x88\x9d"
+    b"psi\x09\xcf\x88quot\x09\"rArr\x09\xe2\x87\x92radic\x09\xe2\x88\x9arang\x09\xe2\x8c\xaaraquo\x09\xc2\xbbrarr\x09\xe2\x86\x92"
+    b"rceil\x09\xe2\x8c\x89rdquo\x09\xe2\x80\x9dreal\x09\xe2\x84\x9creg\x09\xc2\xaerfloor\x09\xe2\x8c\x8brho\x09\xcf\x81rlm\x09\xe2\x80\x8f"
+    b"rsaquo\x09\xe2\x80\xbarsquo\x09\xe2\x80\x99sbquo\x09\xe2\x80\x9ascaron\x09\xc5\xa1sdot\x09\xe2\x8b\x85sect\x09\xc2\xa7shy\x09\xc2\xad"
+    b"sigma\x09\xcf\x83sigmaf\x09\xcf\x82sim\x09\xe2\x88\xbcspades\x09\xe2\x99\xa0sub\x09\xe2\x8a\x82sube\x09\xe2\x8a\x86sum\x09\xe2\x88\x91"
+    b"sup\x09\xe2\x8a\x83sup1\x09\xc2\xb9sup2\x09\xc2\xb2sup3\x09\xc2\xb3supe\x09\xe2\x8a\x87szlig\x09\xc3\x9ftau\x09\xcf\x84there4\x09\xe2\x88\xb4"
+    b"theta\x09\xce\xb8thetasym\x09\xcf\x91thinsp\x09\xe2\x80\x89thorn\x09\xc3\xbetilde\x09\xcb\x9ctimes\x09\xc3\x97"
+    b"trade\x09\xe2\x84\xa2uArr\x09\xe2\x87\x91uacute\x09\xc3\xbauarr\x09\xe2\x86\x91ucirc\x09\xc3\xbbugrave\x09\xc3\xb9uml\x09\xc2\xa8"
+    b"upsih\x09\xcf\x92upsilon\x09\xcf\x85uuml\x09\xc3\xbcweierp\x09\xe2\x84\x98xi\x09\xce\xbeyacute\x09\xc3\xbdyen\x09\xc2\xa5"
+    b"yuml\x09\xc3\xbfzeta\x09\xce\xb6zwj\x09\xe2\x80\x8dzwnj\x09\xe2\x80\x8c"
+)
+_NAME2CODEPOINT_INDEX = (
+    b"\x00\x00\x08\x00\x11\x00\x19\x00\"\x00*\x002\x00;\x00B\x00I\x00"
+    b"R\x00X\x00b\x00j\x00p\x00y\x00\x81\x00\x8a\x00\x94\x00\x9a\x00"
+    b"\xa1\x00\xa9\x00\xb2\x00\xba\x00\xc3\x00\xca\x00\xd1\x00\xd9\x00\xe2\x00\xe7\x00"
+    b"\xf0\x00\xf5\x00\xfd\x00\x06\x01\x0e\x01\x17\x01\x1f\x01)\x012\x01;\x01"
+    b"B\x01H\x01M\x01V\x01\\\x01b\x01k\x01s\x01{\x01\x81\x01"
+    b"\x89\x01\x92\x01\x9a\x01\xa3\x01\xad\x01\xb4\x01\xb9\x01\xc2\x01\xc9\x01\xd0\x01"
+    b"\xd9\x01\xe1\x01\xe9\x01\xf1\x01\xfa\x01\x05\x02\x0d\x02\x12\x02\x19\x02 \x02"
+    b"(\x021\x02:\x02A\x02J\x02Q\x02Z\x02b\x02i\x02r\x02"
+    b"z\x02\x81\x02\x87\x02\x8e\x02\x97\x02\x9f\x02\xa6\x02\xaf\x02\xb6\x02\xbf\x02"
+    b"\xc7\x02\xd1\x02\xd9\x02\xdf\x02\xe7\x02\xf0\x02\xf9\x02\x02\x03\x0a\x03\x13\x03"
+    b"\x1c\x03$\x03,\x036\x03?\x03E\x03K\x03R\x03Z\x03c\x03"
+    b"j\x03t\x03}\x03\x86\x03\x8f\x03\x98\x03\xa0\x03\xa6\x03\xaa\x03\xb2\x03"
+    b"\xba\x03\xc4\x03\xce\x03\xd7\x03\xdf\x03\xe7\x03\xf0\x03\xf9\x03\x02\x04\x09\x04"
+    b"\x10\x04\x19\x04!\x04(\x040\x048\x04A\x04I\x04Q\x04Y\x04"
+    b"b\x04k\x04q\x04{\x04\x85\x04\x8c\x04\x93\x04\x9d\x04\xa6\x04\xaa\x04"
+    b"\xb1\x04\xba\x04\xc2\x04\xcb\x04\xd4\x04\xd9\x04\xe2\x04\xe9\x04\xf2\x04\xf8\x04"
+    b"\xfe\x04\x04\x05\x0d\x05\x15\x05\x1e\x05#\x05,\x054\x05<\x05E\x05"
+    b"N\x05V\x05`\x05i\x05o\x05v\x05}\x05\x86\x05\x8f\x05\x99\x05"
+    b"\xa0\x05\xa7\x05\xaf\x05\xb9\x05\xc1\x05\xc7\x05\xcc\x05\xd2\x05\xdb\x05\xe3\x05"
+    b"\xec\x05\xf4\x05\xfc\x05\x02\x06\x08\x06\x10\x06\x19\x06!\x06)\x061\x06"
+    b":\x06C\x06K\x06Q\x06[\x06a\x06h\x06r\x06{\x06\x84\x06"
+    b"\x8d\x06\x95\x06\x9c\x06\xa2\x06\xaa\x06\xb3\x06\xba\x06\xc4\x06\xcb\x06\xd3\x06"
+    b"\xda\x06\xe1\x06\xe8\x06\xef\x06\xf6\x06\xfe\x06\x06\x07\x0c\x07\x16\x07\x1e\x07"
+    b")\x073\x07;\x07C\x07K\x07T\x07\\\x07e\x07m\x07u\x07"
+    b"~\x07\x84\x07\x8c\x07\x96\x07\x9d\x07\xa7\x07\xac\x07\xb5\x07\xbb\x07\xc2\x07"
+    b"\xc9\x07\xd0\x07"
+)
+_HTML5 = (
+    b"AElig\x09\xc3\x86AElig;\x09\xc3\x86AMP\x09&AMP;\x09&Aacute\x09\xc3\x81Aacute;\x09\xc3\x81Abreve;\x09\xc4\x82"
+    b"Acirc\x09\xc3\x82Acirc;\x09\xc3\x82Acy;\x09\xd0\x90Afr;\x09\xf0\x9d\x94\x84Agrave\x09\xc3\x80Agrave;\x09\xc3\x80"
+    b"Alpha;\x09\xce\x91Amacr;\x09\xc4\x80And;\x09\xe2\xa9\x93Aogon;\x09\xc4\x84Aopf;\x09\xf0\x9d\x94\xb8"
+    b"ApplyFunction;\x09\xe2\x81\xa1Aring\x09\xc3\x85Aring;\x09\xc3\x85Ascr;\x09\xf0\x9d\x92\x9cAssign;\x09\xe2\x89\x94"
+    b"Atilde\x09\xc3\x83Atilde;\x09\xc3\x83Auml\x09\xc3\x84Auml;\x09\xc3\x84Backslash;\x09\xe2\x88\x96Barv;\x09\xe2\xab\xa7"
+    b"Barwed;\x09\xe2\x8c\x86Bcy;\x09\xd0\x91Because;\x09\xe2\x88\xb5Bernoullis;\x09\xe2\x84\xacBeta;\x09\xce\x92"
+    b"Bfr;\x09\xf0\x9d\x94\x85Bopf;\x09\xf0\x9d\x94\xb9Breve;\x09\xcb\x98Bscr;\x09\xe2\x84\xacBumpeq;\x09\xe2\x89\x8eCHcy;\x09\xd0\xa7"
+    b"COPY\x09\xc2\xa9COPY;\x09\xc2\xa9Cacute;\x09\xc4\x86Cap;\x09\xe2\x8b\x92CapitalDifferentialD;\x09\xe2\x85\x85"
+    b"Cayleys;\x09\xe2\x84\xadCcaron;\x09\xc4\x8cCcedil\x09\xc3\x87Ccedil;\x09\xc3\x87Ccirc;\x09\xc4\x88"
+    b"Cconint;\x09\xe2\x88\xb0Cdot;\x09\xc4\x8aCedilla;\x09\xc2\xb8CenterDot;\x09\xc2\xb7Cfr;\x09\xe2\x84\xadChi;\x09\xce\xa7"
+    b"CircleDot;\x09\xe2\x8a\x99CircleMinus;\x09\xe2\x8a\x96CirclePlus;\x09\xe2\x8a\x95"
+    b"CircleTimes;\x09\xe2\x8a\x97ClockwiseContourIntegral;\x09\xe2\x88\xb2"
+    b"CloseCurlyDoubleQuote;\x09\xe2\x80\x9dCloseCurlyQuote;\x09\xe2\x80\x99Colon;\x09\xe2\x88\xb7"
+    b"Colone;\x09\xe2\xa9\xb4Congruent;\x09\xe2\x89\xa1Conint;\x09\xe2\x88\xafContourIntegral;\x09\xe2\x88\xae"
+    b"Copf;\x09\xe2\x84\x82Coproduct;\x09\xe2\x88\x90CounterClockwiseContourIntegral;\x09\xe2\x88\xb3"
+    b"Cross;\x09\xe2\xa8\xafCscr;\x09\xf0\x9d\x92\x9eCup;\x09\xe2\x8b\x93CupCap;\x09\xe2\x89\x8dDD;\x09\xe2\x85\x85DDotrahd;\x09\xe2\xa4\x91"
+    b"DJcy;\x09\xd0\x82DScy;\x09\xd0\x85DZcy;\x09\xd0\x8fDagger;\x09\xe2\x80\xa1Darr;\x09\xe2\x86\xa1Dashv;\x09\xe2\xab\xa4"
+    b"Dcaron;\x09\xc4\x8eDcy;\x09\xd0\x94Del;\x09\xe2\x88\x87Delta;\x09\xce\x94Dfr;\x09\xf0\x9d\x94\x87"
+    b"DiacriticalAcute;\x09\xc2\xb4DiacriticalDot;\x09\xcb\x99"
+    b"DiacriticalDoubleAcute;\x09\xcb\x9dDiacriticalGrave;\x09`"
+    b"DiacriticalTilde;\x09\xcb\x9cDiamond;\x09\xe2\x8b\x84DifferentialD;\x09\xe2\x85\x86Dopf;\x09\xf0\x9d\x94\xbb"
+    b"Dot;\x09\xc2\xa8DotDot;\x09\xe2\x83\x9cDotEqual;\x09\xe2\x89\x90DoubleContourIntegral;\x09\xe2\x88\xaf"
+    b"DoubleDot;\x09\xc2\xa8DoubleDownArrow;\x09\xe2\x87\x93DoubleLeftArrow;\x09\xe2\x87\x90"
+    b"DoubleLeftRightArrow;\x09\xe2\x87\x94DoubleLeftTee;\x09\xe2\xab\xa4"
+    b"DoubleLongLeftArrow;\x09\xe2\x9f\xb8DoubleLongLeftRightArrow;\x09\xe2\x9f\xba"
+    b"DoubleLongRightArrow;\x09\xe2\x9f\xb9DoubleRightArrow;\x09\xe2\x87\x92"
+    b"DoubleRightTee;\x09\xe2\x8a\xa8DoubleUpArrow;\x09\xe2\x87\x91DoubleUpDownArrow;\x09\xe2\x87\x95"
+    b"DoubleVerticalBar;\x09\xe2\x88\xa5DownArrow;\x09\xe2\x86\x93DownArrowBar;\x09\xe2\xa4\x93"
+    b"DownArrowUpArrow;\x09\xe2\x87\xb5DownBreve;\x09\xcc\x91DownLeftRightVector;\x09\xe2\xa5\x90"
+    b"DownLeftTeeVector;\x09\xe2\xa5\x9eDownLeftVector;\x09\xe2\x86\xbd"
+    b"DownLeftVectorBar;\x09\xe2\xa5\x96DownRightTeeVector;\x09\xe2\xa5\x9f"
+    b"DownRightVector;\x09\xe2\x87\x81DownRightVectorBar;\x09\xe2\xa5\x97DownTee;\x09\xe2\x8a\xa4"
+    b"DownTeeArrow;\x09\xe2\x86\xa7Downarrow;\x09\xe2\x87\x93Dscr;\x09\xf0\x9d\x92\x9fDstrok;\x09\xc4\x90ENG;\x09\xc5\x8a"
+    b"ETH\x09\xc3\x90ETH;\x09\xc3\x90Eacute\x09\xc3\x89Eacute;\x09\xc3\x89Ecaron;\x09\xc4\x9aEcirc\x09\xc3\x8aEcirc;\x09\xc3\x8a"
+    b"Ecy;\x09\xd0\xadEdot;\x09\xc4\x96Efr;\x09\xf0\x9d\x94\x88Egrave\x09\xc3\x88Egrave;\x09\xc3\x88Element;\x09\xe2\x88\x88"
+    b"Emacr;\x09\xc4\x92EmptySmallSquare;\x09\xe2\x97\xbbEmptyVerySmallSquare;\x09\xe2\x96\xab"
+    b"Eogon;\x09\xc4\x98Eopf;\x09\xf0\x9d\x94\xbcEpsilon;\x09\xce\x95Equal;\x09\xe2\xa9\xb5EqualTilde;\x09\xe2\x89\x82"
+    b"Equilibrium;\x09\xe2\x87\x8cEscr;\x09\xe2\x84\xb0Esim;\x09\xe2\xa9\xb3Eta;\x09\xce\x97Euml\x09\xc3\x8bEuml;\x09\xc3\x8b"
+    b"Exists;\x09\xe2\x88\x83ExponentialE;\x09\xe2\x85\x87Fcy;\x09\xd0\xa4Ffr;\x09\xf0\x9d\x94\x89"
+    b"FilledSmallSquare;\x09\xe2\x97\xbcFilledVerySmallSquare;\x09\xe2\x96\xaaFopf;\x09\xf0\x9d\x94\xbd"
+    b"ForAll;\x09\xe2\x88\x80Fouriertrf;\x09\xe2\x84\xb1Fscr;\x09\xe2\x84\xb1GJcy;\x09\xd0\x83GT\x09>GT;\x09>"
+    b"Gamma;\x09\xce\x93Gammad;\x09\xcf\x9cGbreve;\x09\xc4\x9eGcedil;\x09\xc4\xa2Gcirc;\x09\xc4\x9cGcy;\x09\xd0\x93"
+    b"Gdot;\x09\xc4\xa0Gfr;\x09\xf0\x9d\x94\x8aGg;\x09\xe2\x8b\x99Gopf;\x09\xf0\x9d\x94\xbeGreaterEqual;\x09\xe2\x89\xa5"
+    b"GreaterEqualLess;\x09\xe2\x8b\x9bGreaterFullEqual;\x09\xe2\x89\xa7"
+    b"GreaterGreater;\x09\xe2\xaa\xa2GreaterLess;\x09\xe2\x89\xb7GreaterSlantEqual;\x09\xe2\xa9\xbe"
+    b"GreaterTilde;\x09\xe2\x89\xb3Gscr;\x09\xf0\x9d\x92\xa2Gt;\x09\xe2\x89\xabHARDcy;\x09\xd0\xaaHacek;\x09\xcb\x87Hat;\x09^"
+    b"Hcirc;\x09\xc4\xa4Hfr;\x09\xe2\x84\x8cHilbertSpace;\x09\xe2\x84\x8bHopf;\x09\xe2\x84\x8d"
+    b"HorizontalLine;\x09\xe2\x94\x80Hscr;\x09\xe2\x84\x8bHstrok;\x09\xc4\xa6HumpDownHump;\x09\xe2\x89\x8e"
+    b"HumpEqual;\x09\xe2\x89\x8fIEcy;\x09\xd0\x95IJlig;\x09\xc4\xb2IOcy;\x09\xd0\x81Iacute\x09\xc3\x8dIacute;\x09\xc3\x8d"
+    b"Icirc\x09\xc3\x8eIcirc;\x09\xc3\x8eIcy;\x09\xd0\x98Idot;\x09\xc4\xb0Ifr;\x09\xe2\x84\x91Igrave\x09\xc3\x8cIgrave;\x09\xc3\x8c"
+    b"Im;\x09\xe2\x84\x91Imacr;\x09\xc4\xaaImaginaryI;\x09\xe2\x85\x88Implies;\x09\xe2\x87\x92Int;\x09\xe2\x88\xac"
+    b"Integral;\x09\xe2\x88\xabIntersection;\x09\xe2\x8b\x82InvisibleComma;\x09\xe2\x81\xa3"
+    b"InvisibleTimes;\x09\xe2\x81\xa2Iogon;\x09\xc4\xaeIopf;\x09\xf0\x9d\x95\x80Iota;\x09\xce\x99Iscr;\x09\xe2\x84\x90"
+    b"Itilde;\x09\xc4\xa8Iukcy;\x09\xd0\x86Iuml\x09\xc3\x8fIuml;\x09\xc3\x8fJcirc;\x09\xc4\xb4Jcy;\x09\xd0\x99Jfr;\x09\xf0\x9d\x94\x8d"
+    b"Jopf;\x09\xf0\x9d\x95\x81Jscr;\x09\xf0\x9d\x92\xa5Jsercy;\x09\xd0\x88Jukcy;\x09\xd0\x84KHcy;\x09\xd0\xa5KJcy;\x09\xd0\x8c"
+    b"Kappa;\x09\xce\x9aKcedil;\x09\xc4\xb6Kcy;\x09\xd0\x9aKfr;\x09\xf0\x9d\x94\x8eKopf;\x09\xf0\x9d\x95\x82Kscr;\x09\xf0\x9d\x92\xa6"
+    b"LJcy;\x09\xd0\x89LT\x09<LT;\x09<Lacute;\x09\xc4\xb9Lambda;\x09\xce\x9bLang;\x09\xe2\x9f\xaa"
+    b"Laplacetrf;\x09\xe2\x84\x92Larr;\x09\xe2\x86\x9eLcaron;\x09\xc4\xbdLcedil;\x09\xc4\xbbLcy;\x09\xd0\x9b"
+    b"LeftAngleBracket;\x09\xe2\x9f\xa8LeftArrow;\x09\xe2\x86\x90LeftArrowBar;\x09\xe2\x87\xa4"
+    b"LeftArrowRightArrow;\x09\xe2\x87\x86LeftCeiling;\x09\xe2\x8c\x88"
+    b"LeftDoubleBracket;\x09\xe2\x9f\xa6LeftDownTeeVector;\x09\xe2\xa5\xa1"
+    b"LeftDownVector;\x09\xe2\x87\x83LeftDownVectorBar;\x09\xe2\xa5\x99LeftFloor;\x09\xe2\x8c\x8a"
+    b"LeftRightArrow;\x09\xe2\x86\x94LeftRightVector;\x09\xe2\xa5\x8eLeftTee;\x09\xe2\x8a\xa3"
+    b"LeftTeeArrow;\x09\xe2\x86\xa4LeftTeeVector;\x09\xe2\xa5\x9aLeftTriangle;\x09\xe2\x8a\xb2"
+    b"LeftTriangleBar;\x09\xe2\xa7\x8fLeftTriangleEqual;\x09\xe2\x8a\xb4"
+    b"LeftUpDownVector;\x09\xe2\xa5\x91LeftUpTeeVector;\x09\xe2\xa5\xa0LeftUpVector;\x09\xe2\x86\xbf"
+    b"LeftUpVectorBar;\x09\xe2\xa5\x98LeftVector;\x09\xe2\x86\xbcLeftVectorBar;\x09\xe2\xa5\x92"
+    b"Leftarrow;\x09\xe2\x87\x90Leftrightarrow;\x09\xe2\x87\x94LessEqualGreater;\x09\xe2\x8b\x9a"
+    b"LessFullEqual;\x09\xe2\x89\xa6LessGreater;\x09\xe2\x89\xb6LessLess;\x09\xe2\xaa\xa1"
+    b"LessSlantEqual;\x09\xe2\xa9\xbdLessTilde;\x09\xe2\x89\xb2Lfr;\x09\xf0\x9d\x94\x8fLl;\x09\xe2\x8b\x98"
+    b"Lleftarrow;\x09\xe2\x87\x9aLmidot;\x09\xc4\xbfLongLeftArrow;\x09\xe2\x9f\xb5"
+    b"LongLeftRightArrow;\x09\xe2\x9f\xb7LongRightArrow;\x09\xe2\x9f\xb6Longleftarrow;\x09\xe2\x9f\xb8"
+    b"Longleftrightarrow;\x09\xe2\x9f\xbaLongrightarrow;\x09\xe2\x9f\xb9Lopf;\x09\xf0\x9d\x95\x83"
+    b"LowerLeftArrow;\x09\xe2\x86\x99LowerRightArrow;\x09\xe2\x86\x98Lscr;\x09\xe2\x84\x92Lsh;\x09\xe2\x86\xb0"
+    b"Lstrok;\x09\xc5\x81Lt;\x09\xe2\x89\xaaMap;\x09\xe2\xa4\x85Mcy;\x09\xd0\x9cMediumSpace;\x09\xe2\x81\x9f"
+    b"Mellintrf;\x09\xe2\x84\xb3Mfr;\x09\xf0\x9d\x94\x90MinusPlus;\x09\xe2\x88\x93Mopf;\x09\xf0\x9d\x95\x84Mscr;\x09\xe2\x84\xb3"
+    b"Mu;\x09\xce\x9cNJcy;\x09\xd0\x8aNacute;\x09\xc5\x83Ncaron;\x09\xc5\x87Ncedil;\x09\xc5\x85Ncy;\x09\xd0\x9d"
+    b"NegativeMediumSpace;\x09\xe2\x80\x8bNegativeThickSpace;\x09\xe2\x80\x8b"
+    b"NegativeThinSpace;\x09\xe2\x80\x8bNegativeVeryThinSpace;\x09\xe2\x80\x8b"
+    b"NestedGreaterGreater;\x09\xe2\x89\xabNestedLessLess;\x09\xe2\x89\xaaNewLine;\x09\x0a"
+    b"Nfr;\x09\xf0\x9d\x94\x91NoBreak;\x09\xe2\x81\xa0NonBreakingSpace;\x09\xc2\xa0Nopf;\x09\xe2\x84\x95Not;\x09\xe2\xab\xac"
+    b"NotCongruent;\x09\xe2\x89\xa2NotCupCap;\x09\xe2\x89\xadNotDoubleVerticalBar;\x09\xe2\x88\xa6"
+    b"NotElement;\x09\xe2\x88\x89NotEqual;\x09\xe2\x89\xa0NotEqualTilde;\x09\xe2\x89\x82\xcc\xb8"
+    b"NotExists;\x09\xe2\x88\x84NotGreater;\x09\xe2\x89\xafNotGreaterEqual;\x09\xe2\x89\xb1"
+    b"NotGreaterFullEqual;\x09\xe2\x89\xa7\xcc\xb8NotGreaterGreater;\x09\xe2\x89\xab\xcc\xb8"
+    b"NotGreaterLess;\x09\xe2\x89\xb9NotGreaterSlantEqual;\x09\xe2\xa9\xbe\xcc\xb8"
+    b"NotGreaterTilde;\x09\xe2\x89\xb5NotHumpDownHump;\x09\xe2\x89\x8e\xcc\xb8"
+    b"NotHumpEqual;\x09\xe2\x89\x8f\xcc\xb8NotLeftTriangle;\x09\xe2\x8b\xaa"
+    b"NotLeftTriangleBar;\x09\xe2\xa7\x8f\xcc\xb8NotLeftTriangleEqual;\x09\xe2\x8b\xac"
+    b"NotLess;\x09\xe2\x89\xaeNotLessEqual;\x09\xe2\x89\xb0NotLessGreater;\x09\xe2\x89\xb8"
+    b"NotLessLess;\x09\xe2\x89\xaa\xcc\xb8NotLessSlantEqual;\x09\xe2\xa9\xbd\xcc\xb8NotLessTilde;\x09\xe2\x89\xb4"
+    b"NotNestedGreaterGreater;\x09\xe2\xaa\xa2\xcc\xb8NotNestedLessLess;\x09\xe2\xaa\xa1\xcc\xb8"
+    b"NotPrecedes;\x09\xe2\x8a\x80NotPrecedesEqual;\x09\xe2\xaa\xaf\xcc\xb8"
+    b"NotPrecedesSlantEqual;\x09\xe2\x8b\xa0NotReverseElement;\x09\xe2\x88\x8c"
+    b"NotRightTriangle;\x09\xe2\x8b\xabNotRightTriangleBar;\x09\xe2\xa7\x90\xcc\xb8"
+    b"NotRightTriangleEqual;\x09\xe2\x8b\xadNotSquareSubset;\x09\xe2\x8a\x8f\xcc\xb8"
+    b"NotSquareSubsetEqual;\x09\xe2\x8b\xa2NotSquareSuperset;\x09\xe2\x8a\x90\xcc\xb8"
+    b"NotSquareSupersetEqual;\x09\xe2\x8b\xa3NotSubset;\x09\xe2\x8a\x82\xe2\x83\x92"
+    b"NotSubsetEqual;\x09\xe2\x8a\x88NotSucceeds;\x09\xe2\x8a\x81NotSucceedsEqual;\x09\xe2\xaa\xb0\xcc\xb8"
+    b"NotSucceedsSlantEqual;\x09\xe2\x8b\xa1NotSucceedsTilde;\x09\xe2\x89\xbf\xcc\xb8"
+    b"NotSuperset;\x09\xe2\x8a\x83\xe2\x83\x92NotSupersetEqual;\x09\xe2\x8a\x89NotTilde;\x09\xe2\x89\x81"
+    b"NotTildeEqual;\x09\xe2\x89\x84NotTildeFullEqual;\x09\xe2\x89\x87NotTildeTilde;\x09\xe2\x89\x89"
+    b"NotVerticalBar;\x09\xe2\x88\xa4Nscr;\x09\xf0\x9d\x92\xa9Ntilde\x09\xc3\x91Ntilde;\x09\xc3\x91Nu;\x09\xce\x9d"
+    b"OElig;\x09\xc5\x92Oacute\x09\xc3\x93Oacute;\x09\xc3\x93Ocirc\x09\xc3\x94Ocirc;\x09\xc3\x94Ocy;\x09\xd0\x9e"
+    b"Odblac;\x09\xc5\x90Ofr;\x09\xf0\x9d\x94\x92Ograve\x09\xc3\x92Ograve;\x09\xc3\x92Omacr;\x09\xc5\x8cOmega;\x09\xce\xa9"
+    b"Omicron;\x09\xce\x9fOopf;\x09\xf0\x9d\x95\x86OpenCurlyDoubleQuote;\x09\xe2\x80\x9c"
+    b"OpenCurlyQuote;\x09\xe2\x80\x98Or;\x09\xe2\xa9\x94Oscr;\x09\xf0\x9d\x92\xaaOslash\x09\xc3\x98Oslash;\x09\xc3\x98"
+    b"Otilde\x09\xc3\x95Otilde;\x09\xc3\x95Otimes;\x09\xe2\xa8\xb7Ouml\x09\xc3\x96Ouml;\x09\xc3\x96OverBar;\x09\xe2\x80\xbe"
+    b"OverBrace;\x09\xe2\x8f\x9eOverBracket;\x09\xe2\x8e\xb4OverParenthesis;\x09\xe2\x8f\x9c"
+    b"PartialD;\x09\xe2\x88\x82Pcy;\x09\xd0\x9fPfr;\x09\xf0\x9d\x94\x93Phi;\x09\xce\xa6Pi;\x09\xce\xa0PlusMinus;\x09\xc2\xb1"
+    b"Poincareplane;\x09\xe2\x84\x8cPopf;\x09\xe2\x84\x99Pr;\x09\xe2\xaa\xbbPrecedes;\x09\xe2\x89\xba"
+    b"PrecedesEqual;\x09\xe2\xaa\xafPrecedesSlantEqual;\x09\xe2\x89\xbcPrecedesTilde;\x09\xe2\x89\xbe"
+    b"Prime;\x09\xe2\x80\xb3Product;\x09\xe2\x88\x8fProportion;\x09\xe2\x88\xb7Proportional;\x09\xe2\x88\x9d"
+    b"Pscr;\x09\xf0\x9d\x92\xabPsi;\x09\xce\xa8QUOT\x09\"QUOT;\x09\"Qfr;\x09\xf0\x9d\x94\x94Qopf;\x09\xe2\x84\x9aQscr;\x09\xf0\x9d\x92\xac"
+    b"RBarr;\x09\xe2\xa4\x90REG\x09\xc2\xaeREG;\x09\xc2\xaeRacute;\x09\xc5\x94Rang;\x09\xe2\x9f\xabRarr;\x09\xe2\x86\xa0"
+    b"Rarrtl;\x09\xe2\xa4\x96Rcaron;\x09\xc5\x98Rcedil;\x09\xc5\x96Rcy;\x09\xd0\xa0Re;\x09\xe2\x84\x9c"
+    b"ReverseElement;\x09\xe2\x88\x8bReverseEquilibrium;\x09\xe2\x87\x8b"
+    b"ReverseUpEquilibrium;\x09\xe2\xa5\xafRfr;\x09\xe2\x84\x9cRho;\x09\xce\xa1"
+    b"RightAngleBracket;\x09\xe2\x9f\xa9RightArrow;\x09\xe2\x86\x92RightArrowBar;\x09\xe2\x87\xa5"
+    b"RightArrowLeftArrow;\x09\xe2\x87\x84RightCeiling;\x09\xe2\x8c\x89"
+    b"RightDoubleBracket;\x09\xe2\x9f\xa7RightDownTeeVector;\x09\xe2\xa5\x9d"
+    b"RightDownVector;\x09\xe2\x87\x82RightDownVectorBar;\x09\xe2\xa5\x95RightFloor;\x09\xe2\x8c\x8b"
+    b"RightTee;\x09\xe2\x8a\xa2RightTeeArrow;\x09\xe2\x86\xa6RightTeeVector;\x09\xe2\xa5\x9b"
+    b"RightTriangle;\x09\xe2\x8a\xb3RightTriangleBar;\x09\xe2\xa7\x90"
+    b"RightTriangleEqual;\x09\xe2\x8a\xb5RightUpDownVector;\x09\xe2\xa5\x8f"
+    b"RightUpTeeVector;\x09\xe2\xa5\x9cRightUpVector;\x09\xe2\x86\xbeRightUpVectorBar;\x09\xe2\xa5\x94"
+    b"RightVector;\x09\xe2\x87\x80RightVectorBar;\x09\xe2\xa5\x93Rightarrow;\x09\xe2\x87\x92Ropf;\x09\xe2\x84\x9d"
+    b"RoundImplies;\x09\xe2\xa5\xb0Rrightarrow;\x09\xe2\x87\x9bRscr;\x09\xe2\x84\x9bRsh;\x09\xe2\x86\xb1"
+    b"RuleDelayed;\x09\xe2\xa7\xb4SHCHcy;\x09\xd0\xa9SHcy;\x09\xd0\xa8SOFTcy;\x09\xd0\xacSacute;\x09\xc5\x9a"
+    b"Sc;\x09\xe2\xaa\xbcScaron;\x09\xc5\xa0Scedil;\x09\xc5\x9eScirc;\x09\xc5\x9cScy;\x09\xd0\xa1Sfr;\x09\xf0\x9d\x94\x96"
+    b"ShortDownArrow;\x09\xe2\x86\x93ShortLeftArrow;\x09\xe2\x86\x90ShortRightArrow;\x09\xe2\x86\x92"
+    b"ShortUpArrow;\x09\xe2\x86\x91Sigma;\x09\xce\xa3SmallCircle;\x09\xe2\x88\x98Sopf;\x09\xf0\x9d\x95\x8a"
+    b"Sqrt;\x09\xe2\x88\x9aSquare;\x09\xe2\x96\xa1SquareIntersection;\x09\xe2\x8a\x93SquareSubset;\x09\xe2\x8a\x8f"
+    b"SquareSubsetEqual;\x09\xe2\x8a\x91SquareSuperset;\x09\xe2\x8a\x90"
+    b"SquareSupersetEqual;\x09\xe2\x8a\x92SquareUnion;\x09\xe2\x8a\x94Sscr;\x09\xf0\x9d\x92\xaeStar;\x09\xe2\x8b\x86"
+    b"Sub;\x09\xe2\x8b\x90Subset;\x09\xe2\x8b\x90SubsetEqual;\x09\xe2\x8a\x86Succeeds;\x09\xe2\x89\xbb"
+    b"SucceedsEqual;\x09\xe2\xaa\xb0SucceedsSlantEqual;\x09\xe2\x89\xbdSucceedsTilde;\x09\xe2\x89\xbf"
+    b"SuchThat;\x09\xe2\x88\x8bSum;\x09\xe2\x88\x91Sup;\x09\xe2\x8b\x91Superset;\x09\xe2\x8a\x83SupersetEqual;\x09\xe2\x8a\x87"
+    b"Supset;\x09\xe2\x8b\x91THORN\x09\xc3\x9eTHORN;\x09\xc3\x9eTRADE;\x09\xe2\x84\xa2TSHcy;\x09\xd0\x8bTScy;\x09\xd0\xa6"
+    b"Tab;\x09\x09Tau;\x09\xce\xa4Tcaron;\x09\xc5\xa4Tcedil;\x09\xc5\xa2Tcy;\x09\xd0\xa2Tfr;\x09\xf0\x9d\x94\x97"
+    b"Therefore;\x09\xe2\x88\xb4Theta;\x09\xce\x98ThickSpace;\x09\xe2\x81\x9f\xe2\x80\x8aThinSpace;\x09\xe2\x80\x89"
+    b"Tilde;\x09\xe2\x88\xbcTildeEqual;\x09\xe2\x89\x83TildeFullEqual;\x09\xe2\x89\x85TildeTilde;\x09\xe2\x89\x88"
+    b"Topf;\x09\xf0\x9d\x95\x8bTripleDot;\x09\xe2\x83\x9bTscr;\x09\xf0\x9d\x92\xafTstrok;\x09\xc5\xa6Uacute\x09\xc3\x9a"
+    b"Uacute;\x09\xc3\x9aUarr;\x09\xe2\x86\x9fUarrocir;\x09\xe2\xa5\x89Ubrcy;\x09\xd0\x8eUbreve;\x09\xc5\xacUcirc\x09\xc3\x9b"
+    b"Ucirc;\x09\xc3\x9bUcy;\x09\xd0\xa3Udblac;\x09\xc5\xb0Ufr;\x09\xf0\x9d\x94\x98Ugrave\x09\xc3\x99Ugrave;\x09\xc3\x99"
+    b"Umacr;\x09\xc5\xaaUnderBar;\x09_UnderBrace;\x09\xe2\x8f\x9fUnderBracket;\x09\xe2\x8e\xb5"
+    b"UnderParenthesis;\x09\xe2\x8f\x9dUnion;\x09\xe2\x8b\x83UnionPlus;\x09\xe2\x8a\x8eUogon;\x09\xc5\xb2"
+    b"Uopf;\x09\xf0\x9d\x95\x8cUpArrow;\x09\xe2\x86\x91UpArrowBar;\x09\xe2\xa4\x92UpArrowDownArrow;\x09\xe2\x87\x85"
+    b"UpDownArrow;\x09\xe2\x86\x95UpEquilibrium;\x09\xe2\xa5\xaeUpTee;\x09\xe2\x8a\xa5UpTeeArrow;\x09\xe2\x86\xa5"
+    b"Uparrow;\x09\xe2\x87\x91Updownarrow;\x09\xe2\x87\x95UpperLeftArrow;\x09\xe2\x86\x96"
+    b"UpperRightArrow;\x09\xe2\x86\x97Upsi;\x09\xcf\x92Upsilon;\x09\xce\xa5Uring;\x09\xc5\xaeUscr;\x09\xf0\x9d\x92\xb0"
+    b"Utilde;\x09\xc5\xa8Uuml\x09\xc3\x9cUuml;\x09\xc3\x9cVDash;\x09\xe2\x8a\xabVbar;\x09\xe2\xab\xabVcy;\x09\xd0\x92"
+    b"Vdash;\x09\xe2\x8a\xa9Vdashl;\x09\xe2\xab\xa6Vee;\x09\xe2\x8b\x81Verbar;\x09\xe2\x80\x96Vert;\x09\xe2\x80\x96"
+    b"VerticalBar;\x09\xe2\x88\xa3VerticalLine;\x09|VerticalSeparator;\x09\xe2\x9d\x98"
+    b"VerticalTilde;\x09\xe2\x89\x80VeryThinSpace;\x09\xe2\x80\x8aVfr;\x09\xf0\x9d\x94\x99Vopf;\x09\xf0\x9d\x95\x8d"
+    b"Vscr;\x09\xf0\x9d\x92\xb1Vvdash;\x09\xe2\x8a\xaaWcirc;\x09\xc5\xb4Wedge;\x09\xe2\x8b\x80Wfr;\x09\xf0\x9d\x94\x9aWopf;\x09\xf0\x9d\x95\x8e"
+    b"Wscr;\x09\xf0\x9d\x92\xb2Xfr;\x09\xf0\x9d\x94\x9bXi;\x09\xce\x9eXopf;\x09\xf0\x9d\x95\x8fXscr;\x09\xf0\x9d\x92\xb3YAcy;\x09\xd0\xaf"
+    b"YIcy;\x09\xd0\x87YUcy;\x09\xd0\xaeYacute\x09\xc3\x9dYacute;\x09\xc3\x9dYcirc;\x09\xc5\xb6Ycy;\x09\xd0\xabYfr;\x09\xf0\x9d\x94\x9c"
+    b"Yopf;\x09\xf0\x9d\x95\x90Yscr;\x09\xf0\x9d\x92\xb4Yuml;\x09\xc5\xb8ZHcy;\x09\xd0\x96Zacute;\x09\xc5\xb9Zcaron;\x09\xc5\xbd"
+    b"Zcy;\x09\xd0\x97Zdot;\x09\xc5\xbbZeroWidthSpace;\x09\xe2\x80\x8bZeta;\x09\xce\x96Zfr;\x09\xe2\x84\xa8Zopf;\x09\xe2\x84\xa4"
+    b"Zscr;\x09\xf0\x9d\x92\xb5aacute\x09\xc3\xa1aacute;\x09\xc3\xa1abreve;\x09\xc4\x83ac;\x09\xe2\x88\xbeacE;\x09\xe2\x88\xbe\xcc\xb3"
+    b"acd;\x09\xe2\x88\xbfacirc\x09\xc3\xa2acirc;\x09\xc3\xa2acute\x09\xc2\xb4acute;\x09\xc2\xb4acy;\x09\xd0\xb0aelig\x09\xc3\xa6"
+    b"aelig;\x09\xc3\xa6af;\x09\xe2\x81\xa1afr;\x09\xf0\x9d\x94\x9eagrave\x09\xc3\xa0agrave;\x09\xc3\xa0alefsym;\x09\xe2\x84\xb5"
+    b"aleph;\x09\xe2\x84\xb5alpha;\x09\xce\xb1amacr;\x09\xc4\x81amalg;\x09\xe2\xa8\xbfamp\x09&amp;\x09&and;\x09\xe2\x88\xa7"
+    b"andand;\x09\xe2\xa9\x95andd;\x09\xe2\xa9\x9candslope;\x09\xe2\xa9\x98andv;\x09\xe2\xa9\x9aang;\x09\xe2\x88\xa0ange;\x09\xe2\xa6\xa4"
+    b"angle;\x09\xe2\x88\xa0angmsd;\x09\xe2\x88\xa1angmsdaa;\x09\xe2\xa6\xa8angmsdab;\x09\xe2\xa6\xa9angmsdac;\x09\xe2\xa6\xaa"
+    b"angmsdad;\x09\xe2\xa6\xabangmsdae;\x09\xe2\xa6\xacangmsdaf;\x09\xe2\xa6\xadangmsdag;\x09\xe2\xa6\xae"
+    b"angmsdah;\x09\xe2\xa6\xafangrt;\x09\xe2\x88\x9fangrtvb;\x09\xe2\x8a\xbeangrtvbd;\x09\xe2\xa6\x9dangsph;\x09\xe2\x88\xa2"
+    b"angst;\x09\xc3\x85angzarr;\x09\xe2\x8d\xbcaogon;\x09\xc4\x85aopf;\x09\xf0\x9d\x95\x92ap;\x09\xe2\x89\x88apE;\x09\xe2\xa9\xb0"
+    b"apacir;\x09\xe2\xa9\xafape;\x09\xe2\x89\x8aapid;\x09\xe2\x89\x8bapos;\x09'approx;\x09\xe2\x89\x88approxeq;\x09\xe2\x89\x8a"
+    b"aring\x09\xc3\xa5aring;\x09\xc3\xa5ascr;\x09\xf0\x9d\x92\xb6ast;\x09*asymp;\x09\xe2\x89\x88asympeq;\x09\xe2\x89\x8d"
+    b"atilde\x09\xc3\xa3atilde;\x09\xc3\xa3auml\x09\xc3\xa4auml;\x09\xc3\xa4awconint;\x09\xe2\x88\xb3awint;\x09\xe2\xa8\x91"
+    b"bNot;\x09\xe2\xab\xadbackcong;\x09\xe2\x89\x8cbackepsilon;\x09\xcf\xb6backprime;\x09\xe2\x80\xb5"
+    b"backsim;\x09\xe2\x88\xbdbacksimeq;\x09\xe2\x8b\x8dbarvee;\x09\xe2\x8a\xbdbarwed;\x09\xe2\x8c\x85"
+    b"barwedge;\x09\xe2\x8c\x85bbrk;\x09\xe2\x8e\xb5bbrktbrk;\x09\xe2\x8e\xb6bcong;\x09\xe2\x89\x8cbcy;\x09\xd0\xb1"
+    b"bdquo;\x09\xe2\x80\x9ebecaus;\x09\xe2\x88\xb5because;\x09\xe2\x88\xb5bemptyv;\x09\xe2\xa6\xb0bepsi;\x09\xcf\xb6"
+    b"bernou;\x09\xe2\x84\xacbeta;\x09\xce\xb2beth;\x09\xe2\x84\xb6between;\x09\xe2\x89\xacbfr;\x09\xf0\x9d\x94\x9fbigcap;\x09\xe2\x8b\x82"
+    b"bigcirc;\x09\xe2\x97\xafbigcup;\x09\xe2\x8b\x83bigodot;\x09\xe2\xa8\x80bigoplus;\x09\xe2\xa8\x81"
+    b"bigotimes;\x09\xe2\xa8\x82bigsqcup;\x09\xe2\xa8\x86bigstar;\x09\xe2\x98\x85bigtriangledown;\x09\xe2\x96\xbd"
+    b"bigtriangleup;\x09\xe2\x96\xb3biguplus;\x09\xe2\xa8\x84bigvee;\x09\xe2\x8b\x81bigwedge;\x09\xe2\x8b\x80"
+    b"bkarow;\x09\xe2\xa4\x8dblacklozenge;\x09\xe2\xa7\xabblacksquare;\x09\xe2\x96\xaa"
+    b"blacktriangle;\x09\xe2\x96\xb4blacktriangledown;\x09\xe2\x96\xbe"
+    b"blacktriangleleft;\x09\xe2\x97\x82blacktriangleright;\x09\xe2\x96\xb8blank;\x09\xe2\x90\xa3"
+    b"blk12;\x09\xe2\x96\x92blk14;\x09\xe2\x96\x91blk34;\x09\xe2\x96\x93block;\x09\xe2\x96\x88bne;\x09=\xe2\x83\xa5"
+    b"bnequiv;\x09\xe2\x89\xa1\xe2\x83\xa5bnot;\x09\xe2\x8c\x90bopf;\x09\xf0\x9d\x95\x93bot;\x09\xe2\x8a\xa5bottom;\x09\xe2\x8a\xa5"
+    b"bowtie;\x09\xe2\x8b\x88boxDL;\x09\xe2\x95\x97boxDR;\x09\xe2\x95\x94boxDl;\x09\xe2\x95\x96boxDr;\x09\xe2\x95\x93boxH;\x09\xe2\x95\x90"
+    b"boxHD;\x09\xe2\x95\xa6boxHU;\x09\xe2\x95\xa9boxHd;\x09\xe2\x95\xa4boxHu;\x09\xe2\x95\xa7boxUL;\x09\xe2\x95\x9dboxUR;\x09\xe2\x95\x9a"
+    b"boxUl;\x09\xe2\x95\x9cboxUr;\x09\xe2\x95\x99boxV;\x09\xe2\x95\x91boxVH;\x09\xe2\x95\xacboxVL;\x09\xe2\x95\xa3boxVR;\x09\xe2\x95\xa0"
+    b"boxVh;\x09\xe2\x95\xabboxVl;\x09\xe2\x95\xa2boxVr;\x09\xe2\x95\x9fboxbox;\x09\xe2\xa7\x89boxdL;\x09\xe2\x95\x95"
+    b"boxdR;\x09\xe2\x95\x92boxdl;\x09\xe2\x94\x90boxdr;\x09\xe2\x94\x8cboxh;\x09\xe2\x94\x80boxhD;\x09\xe2\x95\xa5boxhU;\x09\xe2\x95\xa8"
+    b"boxhd;\x09\xe2\x94\xacboxhu;\x09\xe2\x94\xb4boxminus;\x09\xe2\x8a\x9fboxplus;\x09\xe2\x8a\x9eboxtimes;\x09\xe2\x8a\xa0"
+    b"boxuL;\x09\xe2\x95\x9bboxuR;\x09\xe2\x95\x98boxul;\x09\xe2\x94\x98boxur;\x09\xe2\x94\x94boxv;\x09\xe2\x94\x82boxvH;\x09\xe2\x95\xaa"
+    b"boxvL;\x09\xe2\x95\xa1boxvR;\x09\xe2\x95\x9eboxvh;\x09\xe2\x94\xbcboxvl;\x09\xe2\x94\xa4boxvr;\x09\xe2\x94\x9c"
+    b"bprime;\x09\xe2\x80\xb5breve;\x09\xcb\x98brvbar\x09\xc2\xa6brvbar;\x09\xc2\xa6bscr;\x09\xf0\x9d\x92\xb7bsemi;\x09\xe2\x81\x8f"
+    b"bsim;\x09\xe2\x88\xbdbsime;\x09\xe2\x8b\x8dbsol;\x09\\bsolb;\x09\xe2\xa7\x85bsolhsub;\x09\xe2\x9f\x88bull;\x09\xe2\x80\xa2"
+    b"bullet;\x09\xe2\x80\xa2bump;\x09\xe2\x89\x8ebumpE;\x09\xe2\xaa\xaebumpe;\x09\xe2\x89\x8fbumpeq;\x09\xe2\x89\x8f"
+    b"cacute;\x09\xc4\x87cap;\x09\xe2\x88\xa9capand;\x09\xe2\xa9\x84capbrcup;\x09\xe2\xa9\x89capcap;\x09\xe2\xa9\x8b"
+    b"capcup;\x09\xe2\xa9\x87capdot;\x09\xe2\xa9\x80caps;\x09\xe2\x88\xa9\xef\xb8\x80caret;\x09\xe2\x81\x81caron;\x09\xcb\x87"
+    b"ccaps;\x09\xe2\xa9\x8dccaron;\x09\xc4\x8dccedil\x09\xc3\xa7ccedil;\x09\xc3\xa7ccirc;\x09\xc4\x89ccups;\x09\xe2\xa9\x8c"
+    b"ccupssm;\x09\xe2\xa9\x90cdot;\x09\xc4\x8bcedil\x09\xc2\xb8cedil;\x09\xc2\xb8cemptyv;\x09\xe2\xa6\xb2cent\x09\xc2\xa2"
+    b"cent;\x09\xc2\xa2centerdot;\x09\xc2\xb7cfr;\x09\xf0\x9d\x94\xa0chcy;\x09\xd1\x87check;\x09\xe2\x9c\x93"
+    b"checkmark;\x09\xe2\x9c\x93chi;\x09\xcf\x87cir;\x09\xe2\x97\x8bcirE;\x09\xe2\xa7\x83circ;\x09\xcb\x86circeq;\x09\xe2\x89\x97"
+    b"circlearrowleft;\x09\xe2\x86\xbacirclearrowright;\x09\xe2\x86\xbbcircledR;\x09\xc2\xae"
+    b"circledS;\x09\xe2\x93\x88circledast;\x09\xe2\x8a\x9bcircledcirc;\x09\xe2\x8a\x9acircleddash;\x09\xe2\x8a\x9d"
+    b"cire;\x09\xe2\x89\x97cirfnint;\x09\xe2\xa8\x90cirmid;\x09\xe2\xab\xafcirscir;\x09\xe2\xa7\x82clubs;\x09\xe2\x99\xa3"
+    b"clubsuit;\x09\xe2\x99\xa3colon;\x09:colone;\x09\xe2\x89\x94coloneq;\x09\xe2\x89\x94comma;\x09,"
+    b"commat;\x09@comp;\x09\xe2\x88\x81compfn;\x09\xe2\x88\x98complement;\x09\xe2\x88\x81complexes;\x09\xe2\x84\x82"
+    b"cong;\x09\xe2\x89\x85congdot;\x09\xe2\xa9\xadconint;\x09\xe2\x88\xaecopf;\x09\xf0\x9d\x95\x94coprod;\x09\xe2\x88\x90copy\x09\xc2\xa9"
+    b"copy;\x09\xc2\xa9copysr;\x09\xe2\x84\x97crarr;\x09\xe2\x86\xb5cross;\x09\xe2\x9c\x97cscr;\x09\xf0\x9d\x92\xb8csub;\x09\xe2\xab\x8f"
+    b"csube;\x09\xe2\xab\x91csup;\x09\xe2\xab\x90csupe;\x09\xe2\xab\x92ctdot;\x09\xe2\x8b\xafcudarrl;\x09\xe2\xa4\xb8"
+    b"cudarrr;\x09\xe2\xa4\xb5cuepr;\x09\xe2\x8b\x9ecuesc;\x09\xe2\x8b\x9fcularr;\x09\xe2\x86\xb6cularrp;\x09\xe2\xa4\xbd"
+    b"cup;\x09\xe2\x88\xaacupbrcap;\x09\xe2\xa9\x88cupcap;\x09\xe2\xa9\x86cupcup;\x09\xe2\xa9\x8acupdot;\x09\xe2\x8a\x8d"
+    b"cupor;\x09\xe2\xa9\x85cups;\x09\xe2\x88\xaa\xef\xb8\x80curarr;\x09\xe2\x86\xb7curarrm;\x09\xe2\xa4\xbc"
+    b"curlyeqprec;\x09\xe2\x8b\x9ecurlyeqsucc;\x09\xe2\x8b\x9fcurlyvee;\x09\xe2\x8b\x8ecurlywedge;\x09\xe2\x8b\x8f"
+    b"curren\x09\xc2\xa4curren;\x09\xc2\xa4curvearrowleft;\x09\xe2\x86\xb6curvearrowright;\x09\xe2\x86\xb7"
+    b"cuvee;\x09\xe2\x8b\x8ecuwed;\x09\xe2\x8b\x8fcwconint;\x09\xe2\x88\xb2cwint;\x09\xe2\x88\xb1cylcty;\x09\xe2\x8c\xad"
+    b"dArr;\x09\xe2\x87\x93dHar;\x09\xe2\xa5\xa5dagger;\x09\xe2\x80\xa0daleth;\x09\xe2\x84\xb8darr;\x09\xe2\x86\x93dash;\x09\xe2\x80\x90"
+    b"dashv;\x09\xe2\x8a\xa3dbkarow;\x09\xe2\xa4\x8fdblac;\x09\xcb\x9ddcaron;\x09\xc4\x8fdcy;\x09\xd0\xb4dd;\x09\xe2\x85\x86"
+    b"ddagger;\x09\xe2\x80\xa1ddarr;\x09\xe2\x87\x8addotseq;\x09\xe2\xa9\xb7deg\x09\xc2\xb0deg;\x09\xc2\xb0delta;\x09\xce\xb4"
+    b"demptyv;\x09\xe2\xa6\xb1dfisht;\x09\xe2\xa5\xbfdfr;\x09\xf0\x9d\x94\xa1dharl;\x09\xe2\x87\x83dharr;\x09\xe2\x87\x82"
+    b"diam;\x09\xe2\x8b\x84diamond;\x09\xe2\x8b\x84diamondsuit;\x09\xe2\x99\xa6diams;\x09\xe2\x99\xa6die;\x09\xc2\xa8"
+    b"digamma;\x09\xcf\x9ddisin;\x09\xe2\x8b\xb2div;\x09\xc3\xb7divide\x09\xc3\xb7divide;\x09\xc3\xb7"
+    b"divideontimes;\x09\xe2\x8b\x87divonx;\x09\xe2\x8b\x87djcy;\x09\xd1\x92dlcorn;\x09\xe2\x8c\x9edlcrop;\x09\xe2\x8c\x8d"
+    b"dollar;\x09$dopf;\x09\xf0\x9d\x95\x95dot;\x09\xcb\x99doteq;\x09\xe2\x89\x90doteqdot;\x09\xe2\x89\x91"
+    b"dotminus;\x09\xe2\x88\xb8dotplus;\x09\xe2\x88\x94dotsquare;\x09\xe2\x8a\xa1doublebarwedge;\x09\xe2\x8c\x86"
+    b"downarrow;\x09\xe2\x86\x93downdownarrows;\x09\xe2\x87\x8adownharpoonleft;\x09\xe2\x87\x83"
+    b"downharpoonright;\x09\xe2\x87\x82drbkarow;\x09\xe2\xa4\x90drcorn;\x09\xe2\x8c\x9fdrcrop;\x09\xe2\x8c\x8c"
+    b"dscr;\x09\xf0\x9d\x92\xb9dscy;\x09\xd1\x95dsol;\x09\xe2\xa7\xb6dstrok;\x09\xc4\x91dtdot;\x09\xe2\x8b\xb1dtri;\x09\xe2\x96\xbf"
+    b"dtrif;\x09\xe2\x96\xbeduarr;\x09\xe2\x87\xb5duhar;\x09\xe2\xa5\xafdwangle;\x09\xe2\xa6\xa6dzcy;\x09\xd1\x9f"
+    b"dzigrarr;\x09\xe2\x9f\xbfeDDot;\x09\xe2\xa9\xb7eDot;\x09\xe2\x89\x91eacute\x09\xc3\xa9eacute;\x09\xc3\xa9"
+    b"easter;\x09\xe2\xa9\xaeecaron;\x09\xc4\x9becir;\x09\xe2\x89\x96ecirc\x09\xc3\xaaecirc;\x09\xc3\xaaecolon;\x09\xe2\x89\x95"
+    b"ecy;\x09\xd1\x8dedot;\x09\xc4\x97ee;\x09\xe2\x85\x87efDot;\x09\xe2\x89\x92efr;\x09\xf0\x9d\x94\xa2eg;\x09\xe2\xaa\x9aegrave\x09\xc3\xa8"
+    b"egrave;\x09\xc3\xa8egs;\x09\xe2\xaa\x96egsdot;\x09\xe2\xaa\x98el;\x09\xe2\xaa\x99elinters;\x09\xe2\x8f\xa7ell;\x09\xe2\x84\x93"
+    b"els;\x09\xe2\xaa\x95elsdot;\x09\xe2\xaa\x97emacr;\x09\xc4\x93empty;\x09\xe2\x88\x85emptyset;\x09\xe2\x88\x85"
+    b"emptyv;\x09\xe2\x88\x85emsp13;\x09\xe2\x80\x84emsp14;\x09\xe2\x80\x85emsp;\x09\xe2\x80\x83eng;\x09\xc5\x8bensp;\x09\xe2\x80\x82"
+    b"eogon;\x09\xc4\x99eopf;\x09\xf0\x9d\x95\x96epar;\x09\xe2\x8b\x95eparsl;\x09\xe2\xa7\xa3eplus;\x09\xe2\xa9\xb1epsi;\x09\xce\xb5"
+    b"epsilon;\x09\xce\xb5epsiv;\x09\xcf\xb5eqcirc;\x09\xe2\x89\x96eqcolon;\x09\xe2\x89\x95eqsim;\x09\xe2\x89\x82"
+    b"eqslantgtr;\x09\xe2\xaa\x96eqslantless;\x09\xe2\xaa\x95equals;\x09=equest;\x09\xe2\x89\x9f"
+    b"equiv;\x09\xe2\x89\xa1equivDD;\x09\xe2\xa9\xb8eqvparsl;\x09\xe2\xa7\xa5erDot;\x09\xe2\x89\x93erarr;\x09\xe2\xa5\xb1"
+    b"escr;\x09\xe2\x84\xafesdot;\x09\xe2\x89\x90esim;\x09\xe2\x89\x82eta;\x09\xce\xb7eth\x09\xc3\xb0eth;\x09\xc3\xb0euml\x09\xc3\xab"
+    b"euml;\x09\xc3\xabeuro;\x09\xe2\x82\xacexcl;\x09!exist;\x09\xe2\x88\x83expectation;\x09\xe2\x84\xb0"
+    b"exponentiale;\x09\xe2\x85\x87fallingdotseq;\x09\xe2\x89\x92fcy;\x09\xd1\x84female;\x09\xe2\x99\x80"
+    b"ffilig;\x09\xef\xac\x83fflig;\x09\xef\xac\x80ffllig;\x09\xef\xac\x84ffr;\x09\xf0\x9d\x94\xa3filig;\x09\xef\xac\x81fjlig;\x09fj"
+    b"flat;\x09\xe2\x99\xadfllig;\x09\xef\xac\x82fltns;\x09\xe2\x96\xb1fnof;\x09\xc6\x92fopf;\x09\xf0\x9d\x95\x97forall;\x09\xe2\x88\x80"
+    b"fork;\x09\xe2\x8b\x94forkv;\x09\xe2\xab\x99fpartint;\x09\xe2\xa8\x8dfrac12\x09\xc2\xbdfrac12;\x09\xc2\xbd"
+    b"frac13;\x09\xe2\x85\x93frac14\x09\xc2\xbcfrac14;\x09\xc2\xbcfrac15;\x09\xe2\x85\x95frac16;\x09\xe2\x85\x99"
+    b"frac18;\x09\xe2\x85\x9bfrac23;\x09\xe2\x85\x94frac25;\x09\xe2\x85\x96frac34\x09\xc2\xbefrac34;\x09\xc2\xbe"
+    b"frac35;\x09\xe2\x85\x97frac38;\x09\xe2\x85\x9cfrac45;\x09\xe2\x85\x98frac56;\x09\xe2\x85\x9afrac58;\x09\xe2\x85\x9d"
+    b"frac78;\x09\xe2\x85\x9efrasl;\x09\xe2\x81\x84frown;\x09\xe2\x8c\xa2fscr;\x09\xf0\x9d\x92\xbbgE;\x09\xe2\x89\xa7gEl;\x09\xe2\xaa\x8c"
+    b"gacute;\x09\xc7\xb5gamma;\x09\xce\xb3gammad;\x09\xcf\x9dgap;\x09\xe2\xaa\x86gbreve;\x09\xc4\x9fgcirc;\x09\xc4\x9d"
+    b"gcy;\x09\xd0\xb3gdot;\x09\xc4\xa1ge;\x09\xe2\x89\xa5gel;\x09\xe2\x8b\x9bgeq;\x09\xe2\x89\xa5geqq;\x09\xe2\x89\xa7geqslant;\x09\xe2\xa9\xbe"
+    b"ges;\x09\xe2\xa9\xbegescc;\x09\xe2\xaa\xa9gesdot;\x09\xe2\xaa\x80gesdoto;\x09\xe2\xaa\x82gesdotol;\x09\xe2\xaa\x84"
+    b"gesl;\x09\xe2\x8b\x9b\xef\xb8\x80gesles;\x09\xe2\xaa\x94gfr;\x09\xf0\x9d\x94\xa4gg;\x09\xe2\x89\xabggg;\x09\xe2\x8b\x99gimel;\x09\xe2\x84\xb7"
+    b"gjcy;\x09\xd1\x93gl;\x09\xe2\x89\xb7glE;\x09\xe2\xaa\x92gla;\x09\xe2\xaa\xa5glj;\x09\xe2\xaa\xa4gnE;\x09\xe2\x89\xa9gnap;\x09\xe2\xaa\x8a"
+    b"gnapprox;\x09\xe2\xaa\x8agne;\x09\xe2\xaa\x88gneq;\x09\xe2\xaa\x88gneqq;\x09\xe2\x89\xa9gnsim;\x09\xe2\x8b\xa7gopf;\x09\xf0\x9d\x95\x98"
+    b"grave;\x09`gscr;\x09\xe2\x84\x8agsim;\x09\xe2\x89\xb3gsime;\x09\xe2\xaa\x8egsiml;\x09\xe2\xaa\x90gt\x09>gt;\x09>"
+    b"gtcc;\x09\xe2\xaa\xa7gtcir;\x09\xe2\xa9\xbagtdot;\x09\xe2\x8b\x97gtlPar;\x09\xe2\xa6\x95gtquest;\x09\xe2\xa9\xbc"
+    b"gtrapprox;\x09\xe2\xaa\x86gtrarr;\x09\xe2\xa5\xb8gtrdot;\x09\xe2\x8b\x97gtreqless;\x09\xe2\x8b\x9b"
+    b"gtreqqless;\x09\xe2\xaa\x8cgtrless;\x09\xe2\x89\xb7gtrsim;\x09\xe2\x89\xb3gvertneqq;\x09\xe2\x89\xa9\xef\xb8\x80"
+    b"gvnE;\x09\xe2\x89\xa9\xef\xb8\x80hArr;\x09\xe2\x87\x94hairsp;\x09\xe2\x80\x8ahalf;\x09\xc2\xbdhamilt;\x09\xe2\x84\x8b"
+    b"hardcy;\x09\xd1\x8aharr;\x09\xe2\x86\x94harrcir;\x09\xe2\xa5\x88harrw;\x09\xe2\x86\xadhbar;\x09\xe2\x84\x8fhcirc;\x09\xc4\xa5"
+    b"hearts;\x09\xe2\x99\xa5heartsuit;\x09\xe2\x99\xa5hellip;\x09\xe2\x80\xa6hercon;\x09\xe2\x8a\xb9hfr;\x09\xf0\x9d\x94\xa5"
+    b"hksearow;\x09\xe2\xa4\xa5hkswarow;\x09\xe2\xa4\xa6hoarr;\x09\xe2\x87\xbfhomtht;\x09\xe2\x88\xbb"
+    b"hookleftarrow;\x09\xe2\x86\xa9hookrightarrow;\x09\xe2\x86\xaahopf;\x09\xf0\x9d\x95\x99horbar;\x09\xe2\x80\x95"
+    b"hscr;\x09\xf0\x9d\x92\xbdhslash;\x09\xe2\x84\x8fhstrok;\x09\xc4\xa7hybull;\x09\xe2\x81\x83hyphen;\x09\xe2\x80\x90"
+    b"iacute\x09\xc3\xadiacute;\x09\xc3\xadic;\x09\xe2\x81\xa3icirc\x09\xc3\xaeicirc;\x09\xc3\xaeicy;\x09\xd0\xb8iecy;\x09\xd0\xb5"
+    b"iexcl\x09\xc2\xa1iexcl;\x09\xc2\xa1iff;\x09\xe2\x87\x94ifr;\x09\xf0\x9d\x94\xa6igrave\x09\xc3\xacigrave;\x09\xc3\xacii;\x09\xe2\x85\x88"
+    b"iiiint;\x09\xe2\xa8\x8ciiint;\x09\xe2\x88\xadiinfin;\x09\xe2\xa7\x9ciiota;\x09\xe2\x84\xa9ijlig;\x09\xc4\xb3imacr;\x09\xc4\xab"
+    b"image;\x09\xe2\x84\x91imagline;\x09\xe2\x84\x90imagpart;\x09\xe2\x84\x91imath;\x09\xc4\xb1imof;\x09\xe2\x8a\xb7"
+    b"imped;\x09\xc6\xb5in;\x09\xe2\x88\x88incare;\x09\xe2\x84\x85infin;\x09\xe2\x88\x9einfintie;\x09\xe2\xa7\x9dinodot;\x09\xc4\xb1"
+    b"int;\x09\xe2\x88\xabintcal;\x09\xe2\x8a\xbaintegers;\x09\xe2\x84\xa4intercal;\x09\xe2\x8a\xbaintlarhk;\x09\xe2\xa8\x97"
+    b"intprod;\x09\xe2\xa8\xbciocy;\x09\xd1\x91iogon;\x09\xc4\xafiopf;\x09\xf0\x9d\x95\x9aiota;\x09\xce\xb9iprod;\x09\xe2\xa8\xbc"
+    b"iquest\x09\xc2\xbfiquest;\x09\xc2\xbfiscr;\x09\xf0\x9d\x92\xbeisin;\x09\xe2\x88\x88isinE;\x09\xe2\x8b\xb9isindot;\x09\xe2\x8b\xb5"
+    b"isins;\x09\xe2\x8b\xb4isinsv;\x09\xe2\x8b\xb3isinv;\x09\xe2\x88\x88it;\x09\xe2\x81\xa2itilde;\x09\xc4\xa9iukcy;\x09\xd1\x96"
+    b"iuml\x09\xc3\xafiuml;\x09\xc3\xafjcirc;\x09\xc4\xb5jcy;\x09\xd0\xb9jfr;\x09\xf0\x9d\x94\xa7jmath;\x09\xc8\xb7jopf;\x09\xf0\x9d\x95\x9b"
+    b"jscr;\x09\xf0\x9d\x92\xbfjsercy;\x09\xd1\x98jukcy;\x09\xd1\x94kappa;\x09\xce\xbakappav;\x09\xcf\xb0kcedil;\x09\xc4\xb7"
+    b"kcy;\x09\xd0\xbakfr;\x09\xf0\x9d\x94\xa8kgreen;\x09\xc4\xb8khcy;\x09\xd1\x85kjcy;\x09\xd1\x9ckopf;\x09\xf0\x9d\x95\x9c"
+    b"kscr;\x09\xf0\x9d\x93\x80lAarr;\x09\xe2\x87\x9alArr;\x09\xe2\x87\x90lAtail;\x09\xe2\xa4\x9blBarr;\x09\xe2\xa4\x8elE;\x09\xe2\x89\xa6"
+    b"lEg;\x09\xe2\xaa\x8blHar;\x09\xe2\xa5\xa2lacute;\x09\xc4\xbalaemptyv;\x09\xe2\xa6\xb4lagran;\x09\xe2\x84\x92"
+    b"lambda;\x09\xce\xbblang;\x09\xe2\x9f\xa8langd;\x09\xe2\xa6\x91langle;\x09\xe2\x9f\xa8lap;\x09\xe2\xaa\x85laquo\x09\xc2\xab"
+    b"laquo;\x09\xc2\xablarr;\x09\xe2\x86\x90larrb;\x09\xe2\x87\xa4larrbfs;\x09\xe2\xa4\x9flarrfs;\x09\xe2\xa4\x9d"
+    b"larrhk;\x09\xe2\x86\xa9larrlp;\x09\xe2\x86\xablarrpl;\x09\xe2\xa4\xb9larrsim;\x09\xe2\xa5\xb3larrtl;\x09\xe2\x86\xa2"
+    b"lat;\x09\xe2\xaa\xablatail;\x09\xe2\xa4\x99late;\x09\xe2\xaa\xadlates;\x09\xe2\xaa\xad\xef\xb8\x80lbarr;\x09\xe2\xa4\x8c"
+    b"lbbrk;\x09\xe2\x9d\xb2lbrace;\x09{lbrack;\x09[lbrke;\x09\xe2\xa6\x8blbrksld;\x09\xe2\xa6\x8f"
+    b"lbrkslu;\x09\xe2\xa6\x8dlcaron;\x09\xc4\xbelcedil;\x09\xc4\xbclceil;\x09\xe2\x8c\x88lcub;\x09{lcy;\x09\xd0\xbb"
+    b"ldca;\x09\xe2\xa4\xb6ldquo;\x09\xe2\x80\x9cldquor;\x09\xe2\x80\x9eldrdhar;\x09\xe2\xa5\xa7ldrushar;\x09\xe2\xa5\x8b"
+    b"ldsh;\x09\xe2\x86\xb2le;\x09\xe2\x89\xa4leftarrow;\x09\xe2\x86\x90leftarrowtail;\x09\xe2\x86\xa2"
+    b"leftharpoondown;\x09\xe2\x86\xbdleftharpoonup;\x09\xe2\x86\xbcleftleftarrows;\x09\xe2\x87\x87"
+    b"leftrightarrow;\x09\xe2\x86\x94leftrightarrows;\x09\xe2\x87\x86"
+    b"leftrightharpoons;\x09\xe2\x87\x8bleftrightsquigarrow;\x09\xe2\x86\xad"
+    b"leftthreetimes;\x09\xe2\x8b\x8bleg;\x09\xe2\x8b\x9aleq;\x09\xe2\x89\xa4leqq;\x09\xe2\x89\xa6leqslant;\x09\xe2\xa9\xbd"
+    b"les;\x09\xe2\xa9\xbdlescc;\x09\xe2\xaa\xa8lesdot;\x09\xe2\xa9\xbflesdoto;\x09\xe2\xaa\x81lesdotor;\x09\xe2\xaa\x83"
+    b"lesg;\x09\xe2\x8b\x9a\xef\xb8\x80lesges;\x09\xe2\xaa\x93lessapprox;\x09\xe2\xaa\x85lessdot;\x09\xe2\x8b\x96"
+    b"lesseqgtr;\x09\xe2\x8b\x9alesseqqgtr;\x09\xe2\xaa\x8blessgtr;\x09\xe2\x89\xb6lesssim;\x09\xe2\x89\xb2"
+    b"lfisht;\x09\xe2\xa5\xbclfloor;\x09\xe2\x8c\x8alfr;\x09\xf0\x9d\x94\xa9lg;\x09\xe2\x89\xb6lgE;\x09\xe2\xaa\x91lhard;\x09\xe2\x86\xbd"
+    b"lharu;\x09\xe2\x86\xbclharul;\x09\xe2\xa5\xaalhblk;\x09\xe2\x96\x84ljcy;\x09\xd1\x99ll;\x09\xe2\x89\xaallarr;\x09\xe2\x87\x87"
+    b"llcorner;\x09\xe2\x8c\x9ellhard;\x09\xe2\xa5\xablltri;\x09\xe2\x97\xbalmidot;\x09\xc5\x80lmoust;\x09\xe2\x8e\xb0"
+    b"lmoustache;\x09\xe2\x8e\xb0lnE;\x09\xe2\x89\xa8lnap;\x09\xe2\xaa\x89lnapprox;\x09\xe2\xaa\x89lne;\x09\xe2\xaa\x87"
+    b"lneq;\x09\xe2\xaa\x87lneqq;\x09\xe2\x89\xa8lnsim;\x09\xe2\x8b\xa6loang;\x09\xe2\x9f\xacloarr;\x09\xe2\x87\xbdlobrk;\x09\xe2\x9f\xa6"
+    b"longleftarrow;\x09\xe2\x9f\xb5longleftrightarrow;\x09\xe2\x9f\xb7longmapsto;\x09\xe2\x9f\xbc"
+    b"longrightarrow;\x09\xe2\x9f\xb6looparrowleft;\x09\xe2\x86\xablooparrowright;\x09\xe2\x86\xac"
+    b"lopar;\x09\xe2\xa6\x85lopf;\x09\xf0\x9d\x95\x9dloplus;\x09\xe2\xa8\xadlotimes;\x09\xe2\xa8\xb4lowast;\x09\xe2\x88\x97"
+    b"lowbar;\x09_loz;\x09\xe2\x97\x8alozenge;\x09\xe2\x97\x8alozf;\x09\xe2\xa7\xablpar;\x09(lparlt;\x09\xe2\xa6\x93"
+    b"lrarr;\x09\xe2\x87\x86lrcorner;\x09\xe2\x8c\x9flrhar;\x09\xe2\x87\x8blrhard;\x09\xe2\xa5\xadlrm;\x09\xe2\x80\x8e"
+    b"lrtri;\x09\xe2\x8a\xbflsaquo;\x09\xe2\x80\xb9lscr;\x09\xf0\x9d\x93\x81lsh;\x09\xe2\x86\xb0lsim;\x09\xe2\x89\xb2lsime;\x09\xe2\xaa\x8d"
+    b"lsimg;\x09\xe2\xaa\x8flsqb;\x09[lsquo;\x09\xe2\x80\x98lsquor;\x09\xe2\x80\x9alstrok;\x09\xc5\x82lt\x09<lt;\x09<"
+    b"ltcc;\x09\xe2\xaa\xa6ltcir;\x09\xe2\xa9\xb9ltdot;\x09\xe2\x8b\x96lthree;\x09\xe2\x8b\x8bltimes;\x09\xe2\x8b\x89"
+    b"ltlarr;\x09\xe2\xa5\xb6ltquest;\x09\xe2\xa9\xbbltrPar;\x09\xe2\xa6\x96ltri;\x09\xe2\x97\x83ltrie;\x09\xe2\x8a\xb4"
+    b"ltrif;\x09\xe2\x97\x82lurdshar;\x09\xe2\xa5\x8aluruhar;\x09\xe2\xa5\xa6lvertneqq;\x09\xe2\x89\xa8\xef\xb8\x80"
+    b"lvnE;\x09\xe2\x89\xa8\xef\xb8\x80mDDot;\x09\xe2\x88\xbamacr\x09\xc2\xafmacr;\x09\xc2\xafmale;\x09\xe2\x99\x82malt;\x09\xe2\x9c\xa0"
+    b"maltese;\x09\xe2\x9c\xa0map;\x09\xe2\x86\xa6mapsto;\x09\xe2\x86\xa6mapstodown;\x09\xe2\x86\xa7"
+    b"mapstoleft;\x09\xe2\x86\xa4mapstoup;\x09\xe2\x86\xa5marker;\x09\xe2\x96\xaemcomma;\x09\xe2\xa8\xa9mcy;\x09\xd0\xbc"
+    b"mdash;\x09\xe2\x80\x94measuredangle;\x09\xe2\x88\xa1mfr;\x09\xf0\x9d\x94\xaamho;\x09\xe2\x84\xa7micro\x09\xc2\xb5"
+    b"micro;\x09\xc2\xb5mid;\x09\xe2\x88\xa3midast;\x09*midcir;\x09\xe2\xab\xb0middot\x09\xc2\xb7middot;\x09\xc2\xb7"
+    b"minus;\x09\xe2\x88\x92minusb;\x09\xe2\x8a\x9fminusd;\x09\xe2\x88\xb8minusdu;\x09\xe2\xa8\xaamlcp;\x09\xe2\xab\x9b"
+    b"mldr;\x09\xe2\x80\xa6mnplus;\x09\xe2\x88\x93models;\x09\xe2\x8a\xa7mopf;\x09\xf0\x9d\x95\x9emp;\x09\xe2\x88\x93mscr;\x09\xf0\x9d\x93\x82"
+    b"mstpos;\x09\xe2\x88\xbemu;\x09\xce\xbcmultimap;\x09\xe2\x8a\xb8mumap;\x09\xe2\x8a\xb8nGg;\x09\xe2\x8b\x99\xcc\xb8"
+    b"nGt;\x09\xe2\x89\xab\xe2\x83\x92nGtv;\x09\xe2\x89\xab\xcc\xb8nLeftarrow;\x09\xe2\x87\x8dnLeftrightarrow;\x09\xe2\x87\x8e"
+    b"nLl;\x09\xe2\x8b\x98\xcc\xb8nLt;\x09\xe2\x89\xaa\xe2\x83\x92nLtv;\x09\xe2\x89\xaa\xcc\xb8nRightarrow;\x09\xe2\x87\x8fnVDash;\x09\xe2\x8a\xaf"
+    b"nVdash;\x09\xe2\x8a\xaenabla;\x09\xe2\x88\x87nacute;\x09\xc5\x84nang;\x09\xe2\x88\xa0\xe2\x83\x92nap;\x09\xe2\x89\x89"
+    b"napE;\x09\xe2\xa9\xb0\xcc\xb8napid;\x09\xe2\x89\x8b\xcc\xb8napos;\x09\xc5\x89napprox;\x09\xe2\x89\x89natur;\x09\xe2\x99\xae"
+    b"natural;\x09\xe2\x99\xaenaturals;\x09\xe2\x84\x95nbsp\x09\xc2\xa0nbsp;\x09\xc2\xa0nbump;\x09\xe2\x89\x8e\xcc\xb8"
+    b"nbumpe;\x09\xe2\x89\x8f\xcc\xb8ncap;\x09\xe2\xa9\x83ncaron;\x09\xc5\x88ncedil;\x09\xc5\x86ncong;\x09\xe2\x89\x87"
+    b"ncongdot;\x09\xe2\xa9\xad\xcc\xb8ncup;\x09\xe2\xa9\x82ncy;\x09\xd0\xbdndash;\x09\xe2\x80\x93ne;\x09\xe2\x89\xa0neArr;\x09\xe2\x87\x97"
+    b"nearhk;\x09\xe2\xa4\xa4nearr;\x09\xe2\x86\x97nearrow;\x09\xe2\x86\x97nedot;\x09\xe2\x89\x90\xcc\xb8nequiv;\x09\xe2\x89\xa2"
+    b"nesear;\x09\xe2\xa4\xa8nesim;\x09\xe2\x89\x82\xcc\xb8nexist;\x09\xe2\x88\x84nexists;\x09\xe2\x88\x84nfr;\x09\xf0\x9d\x94\xab"
+    b"ngE;\x09\xe2\x89\xa7\xcc\xb8nge;\x09\xe2\x89\xb1ngeq;\x09\xe2\x89\xb1ngeqq;\x09\xe2\x89\xa7\xcc\xb8ngeqslant;\x09\xe2\xa9\xbe\xcc\xb8"
+    b"nges;\x09\xe2\xa9\xbe\xcc\xb8ngsim;\x09\xe2\x89\xb5ngt;\x09\xe2\x89\xafngtr;\x09\xe2\x89\xafnhArr;\x09\xe2\x87\x8enharr;\x09\xe2\x86\xae"
+    b"nhpar;\x09\xe2\xab\xb2ni;\x09\xe2\x88\x8bnis;\x09\xe2\x8b\xbcnisd;\x09\xe2\x8b\xbaniv;\x09\xe2\x88\x8bnjcy;\x09\xd1\x9anlArr;\x09\xe2\x87\x8d"
+    b"nlE;\x09\xe2\x89\xa6\xcc\xb8nlarr;\x09\xe2\x86\x9anldr;\x09\xe2\x80\xa5nle;\x09\xe2\x89\xb0nleftarrow;\x09\xe2\x86\x9a"
+    b"nleftrightarrow;\x09\xe2\x86\xaenleq;\x09\xe2\x89\xb0nleqq;\x09\xe2\x89\xa6\xcc\xb8nleqslant;\x09\xe2\xa9\xbd\xcc\xb8"
+    b"nles;\x09\xe2\xa9\xbd\xcc\xb8nless;\x09\xe2\x89\xaenlsim;\x09\xe2\x89\xb4nlt;\x09\xe2\x89\xaenltri;\x09\xe2\x8b\xaanltrie;\x09\xe2\x8b\xac"
+    b"nmid;\x09\xe2\x88\xa4nopf;\x09\xf0\x9d\x95\x9fnot\x09\xc2\xacnot;\x09\xc2\xacnotin;\x09\xe2\x88\x89notinE;\x09\xe2\x8b\xb9\xcc\xb8"
+    b"notindot;\x09\xe2\x8b\xb5\xcc\xb8notinva;\x09\xe2\x88\x89notinvb;\x09\xe2\x8b\xb7notinvc;\x09\xe2\x8b\xb6"
+    b"notni;\x09\xe2\x88\x8cnotniva;\x09\xe2\x88\x8cnotnivb;\x09\xe2\x8b\xbenotnivc;\x09\xe2\x8b\xbdnpar;\x09\xe2\x88\xa6"
+    b"nparallel;\x09\xe2\x88\xa6nparsl;\x09\xe2\xab\xbd\xe2\x83\xa5npart;\x09\xe2\x88\x82\xcc\xb8npolint;\x09\xe2\xa8\x94npr;\x09\xe2\x8a\x80"
+    b"nprcue;\x09\xe2\x8b\xa0npre;\x09\xe2\xaa\xaf\xcc\xb8nprec;\x09\xe2\x8a\x80npreceq;\x09\xe2\xaa\xaf\xcc\xb8nrArr;\x09\xe2\x87\x8f"
+    b"nrarr;\x09\xe2\x86\x9bnrarrc;\x09\xe2\xa4\xb3\xcc\xb8nrarrw;\x09\xe2\x86\x9d\xcc\xb8nrightarrow;\x09\xe2\x86\x9b"
+    b"nrtri;\x09\xe2\x8b\xabnrtrie;\x09\xe2\x8b\xadnsc;\x09\xe2\x8a\x81nsccue;\x09\xe2\x8b\xa1nsce;\x09\xe2\xaa\xb0\xcc\xb8"
+    b"nscr;\x09\xf0\x9d\x93\x83nshortmid;\x09\xe2\x88\xa4nshortparallel;\x09\xe2\x88\xa6nsim;\x09\xe2\x89\x81"
+    b"nsime;\x09\xe2\x89\x84nsimeq;\x09\xe2\x89\x84nsmid;\x09\xe2\x88\xa4nspar;\x09\xe2\x88\xa6nsqsube;\x09\xe2\x8b\xa2"
+    b"nsqsupe;\x09\xe2\x8b\xa3nsub;\x09\xe2\x8a\x84nsubE;\x09\xe2\xab\x85\xcc\xb8nsube;\x09\xe2\x8a\x88nsubset;\x09\xe2\x8a\x82\xe2\x83\x92"
+    b"nsubseteq;\x09\xe2\x8a\x88nsubseteqq;\x09\xe2\xab\x85\xcc\xb8nsucc;\x09\xe2\x8a\x81nsucceq;\x09\xe2\xaa\xb0\xcc\xb8"
+    b"nsup;\x09\xe2\x8a\x85nsupE;\x09\xe2\xab\x86\xcc\xb8nsupe;\x09\xe2\x8a\x89nsupset;\x09\xe2\x8a\x83\xe2\x83\x92nsupseteq;\x09\xe2\x8a\x89"
+    b"nsupseteqq;\x09\xe2\xab\x86\xcc\xb8ntgl;\x09\xe2\x89\xb9ntilde\x09\xc3\xb1ntilde;\x09\xc3\xb1ntlg;\x09\xe2\x89\xb8"
+    b"ntriangleleft;\x09\xe2\x8b\xaantrianglelefteq;\x09\xe2\x8b\xacntriangleright;\x09\xe2\x8b\xab"
+    b"ntrianglerighteq;\x09\xe2\x8b\xadnu;\x09\xce\xbdnum;\x09#numero;\x09\xe2\x84\x96numsp;\x09\xe2\x80\x87"
+    b"nvDash;\x09\xe2\x8a\xadnvHarr;\x09\xe2\xa4\x84nvap;\x09\xe2\x89\x8d\xe2\x83\x92nvdash;\x09\xe2\x8a\xacnvge;\x09\xe2\x89\xa5\xe2\x83\x92"
+    b"nvgt;\x09>\xe2\x83\x92nvinfin;\x09\xe2\xa7\x9envlArr;\x09\xe2\xa4\x82nvle;\x09\xe2\x89\xa4\xe2\x83\x92nvlt;\x09<\xe2\x83\x92"
+    b"nvltrie;\x09\xe2\x8a\xb4\xe2\x83\x92nvrArr;\x09\xe2\xa4\x83nvrtrie;\x09\xe2\x8a\xb5\xe2\x83\x92nvsim;\x09\xe2\x88\xbc\xe2\x83\x92"
+    b"nwArr;\x09\xe2\x87\x96nwarhk;\x09\xe2\xa4\xa3nwarr;\x09\xe2\x86\x96nwarrow;\x09\xe2\x86\x96nwnear;\x09\xe2\xa4\xa7"
+    b"oS;\x09\xe2\x93\x88oacute\x09\xc3\xb3oacute;\x09\xc3\xb3oast;\x09\xe2\x8a\x9bocir;\x09\xe2\x8a\x9aocirc\x09\xc3\xb4"
+    b"ocirc;\x09\xc3\xb4ocy;\x09\xd0\xbeodash;\x09\xe2\x8a\x9dodblac;\x09\xc5\x91odiv;\x09\xe2\xa8\xb8odot;\x09\xe2\x8a\x99"
+    b"odsold;\x09\xe2\xa6\xbcoelig;\x09\xc5\x93ofcir;\x09\xe2\xa6\xbfofr;\x09\xf0\x9d\x94\xacogon;\x09\xcb\x9bograve\x09\xc3\xb2"
+    b"ograve;\x09\xc3\xb2ogt;\x09\xe2\xa7\x81ohbar;\x09\xe2\xa6\xb5ohm;\x09\xce\xa9oint;\x09\xe2\x88\xaeolarr;\x09\xe2\x86\xba"
+    b"olcir;\x09\xe2\xa6\xbeolcross;\x09\xe2\xa6\xbboline;\x09\xe2\x80\xbeolt;\x09\xe2\xa7\x80omacr;\x09\xc5\x8domega;\x09\xcf\x89"
+    b"omicron;\x09\xce\xbfomid;\x09\xe2\xa6\xb6ominus;\x09\xe2\x8a\x96oopf;\x09\xf0\x9d\x95\xa0opar;\x09\xe2\xa6\xb7operp;\x09\xe2\xa6\xb9"
+    b"oplus;\x09\xe2\x8a\x95or;\x09\xe2\x88\xa8orarr;\x09\xe2\x86\xbbord;\x09\xe2\xa9\x9dorder;\x09\xe2\x84\xb4orderof;\x09\xe2\x84\xb4"
+    b"ordf\x09\xc2\xaaordf;\x09\xc2\xaaordm\x09\xc2\xbaordm;\x09\xc2\xbaorigof;\x09\xe2\x8a\xb6oror;\x09\xe2\xa9\x96"
+    b"orslope;\x09\xe2\xa9\x97orv;\x09\xe2\xa9\x9boscr;\x09\xe2\x84\xb4oslash\x09\xc3\xb8oslash;\x09\xc3\xb8osol;\x09\xe2\x8a\x98"
+    b"otilde\x09\xc3\xb5otilde;\x09\xc3\xb5otimes;\x09\xe2\x8a\x97otimesas;\x09\xe2\xa8\xb6ouml\x09\xc3\xb6ouml;\x09\xc3\xb6"
+    b"ovbar;\x09\xe2\x8c\xbdpar;\x09\xe2\x88\xa5para\x09\xc2\xb6para;\x09\xc2\xb6parallel;\x09\xe2\x88\xa5parsim;\x09\xe2\xab\xb3"
+    b"parsl;\x09\xe2\xab\xbdpart;\x09\xe2\x88\x82pcy;\x09\xd0\xbfpercnt;\x09%period;\x09.permil;\x09\xe2\x80\xb0"
+    b"perp;\x09\xe2\x8a\xa5pertenk;\x09\xe2\x80\xb1pfr;\x09\xf0\x9d\x94\xadphi;\x09\xcf\x86phiv;\x09\xcf\x95phmmat;\x09\xe2\x84\xb3"
+    b"phone;\x09\xe2\x98\x8epi;\x09\xcf\x80pitchfork;\x09\xe2\x8b\x94piv;\x09\xcf\x96planck;\x09\xe2\x84\x8fplanckh;\x09\xe2\x84\x8e"
+    b"plankv;\x09\xe2\x84\x8fplus;\x09+plusacir;\x09\xe2\xa8\xa3plusb;\x09\xe2\x8a\x9epluscir;\x09\xe2\xa8\xa2"
+    b"plusdo;\x09\xe2\x88\x94plusdu;\x09\xe2\xa8\xa5pluse;\x09\xe2\xa9\xb2plusmn\x09\xc2\xb1plusmn;\x09\xc2\xb1"
+    b"plussim;\x09\xe2\xa8\xa6plustwo;\x09\xe2\xa8\xa7pm;\x09\xc2\xb1pointint;\x09\xe2\xa8\x95popf;\x09\xf0\x9d\x95\xa1"
+    b"pound\x09\xc2\xa3pound;\x09\xc2\xa3pr;\x09\xe2\x89\xbaprE;\x09\xe2\xaa\xb3prap;\x09\xe2\xaa\xb7prcue;\x09\xe2\x89\xbcpre;\x09\xe2\xaa\xaf"
+    b"prec;\x09\xe2\x89\xbaprecapprox;\x09\xe2\xaa\xb7preccurlyeq;\x09\xe2\x89\xbcpreceq;\x09\xe2\xaa\xaf"
+    b"precnapprox;\x09\xe2\xaa\xb9precneqq;\x09\xe2\xaa\xb5precnsim;\x09\xe2\x8b\xa8precsim;\x09\xe2\x89\xbe"
+    b"prime;\x09\xe2\x80\xb2primes;\x09\xe2\x84\x99prnE;\x09\xe2\xaa\xb5prnap;\x09\xe2\xaa\xb9prnsim;\x09\xe2\x8b\xa8prod;\x09\xe2\x88\x8f"
+    b"profalar;\x09\xe2\x8c\xaeprofline;\x09\xe2\x8c\x92profsurf;\x09\xe2\x8c\x93prop;\x09\xe2\x88\x9dpropto;\x09\xe2\x88\x9d"
+    b"prsim;\x09\xe2\x89\xbeprurel;\x09\xe2\x8a\xb0pscr;\x09\xf0\x9d\x93\x85psi;\x09\xcf\x88puncsp;\x09\xe2\x80\x88qfr;\x09\xf0\x9d\x94\xae"
+    b"qint;\x09\xe2\xa8\x8cqopf;\x09\xf0\x9d\x95\xa2qprime;\x09\xe2\x81\x97qscr;\x09\xf0\x9d\x93\x86quaternions;\x09\xe2\x84\x8d"
+    b"quatint;\x09\xe2\xa8\x96quest;\x09?questeq;\x09\xe2\x89\x9fquot\x09\"quot;\x09\"rAarr;\x09\xe2\x87\x9b"
+    b"rArr;\x09\xe2\x87\x92rAtail;\x09\xe2\xa4\x9crBarr;\x09\xe2\xa4\x8frHar;\x09\xe2\xa5\xa4race;\x09\xe2\x88\xbd\xcc\xb1racute;\x09\xc5\x95"
+    b"radic;\x09\xe2\x88\x9araemptyv;\x09\xe2\xa6\xb3rang;\x09\xe2\x9f\xa9rangd;\x09\xe2\xa6\x92range;\x09\xe2\xa6\xa5"
+    b"rangle;\x09\xe2\x9f\xa9raquo\x09\xc2\xbbraquo;\x09\xc2\xbbrarr;\x09\xe2\x86\x92rarrap;\x09\xe2\xa5\xb5rarrb;\x09\xe2\x87\xa5"
+    b"rarrbfs;\x09\xe2\xa4\xa0rarrc;\x09\xe2\xa4\xb3rarrfs;\x09\xe2\xa4\x9erarrhk;\x09\xe2\x86\xaararrlp;\x09\xe2\x86\xac"
+    b"rarrpl;\x09\xe2\xa5\x85rarrsim;\x09\xe2\xa5\xb4rarrtl;\x09\xe2\x86\xa3rarrw;\x09\xe2\x86\x9dratail;\x09\xe2\xa4\x9a"
+    b"ratio;\x09\xe2\x88\xb6rationals;\x09\xe2\x84\x9arbarr;\x09\xe2\xa4\x8drbbrk;\x09\xe2\x9d\xb3rbrace;\x09}"
+    b"rbrack;\x09]rbrke;\x09\xe2\xa6\x8crbrksld;\x09\xe2\xa6\x8erbrkslu;\x09\xe2\xa6\x90rcaron;\x09\xc5\x99"
+    b"rcedil;\x09\xc5\x97rceil;\x09\xe2\x8c\x89rcub;\x09}rcy;\x09\xd1\x80rdca;\x09\xe2\xa4\xb7rdldhar;\x09\xe2\xa5\xa9"
+    b"rdquo;\x09\xe2\x80\x9drdquor;\x09\xe2\x80\x9drdsh;\x09\xe2\x86\xb3real;\x09\xe2\x84\x9crealine;\x09\xe2\x84\x9b"
+    b"realpart;\x09\xe2\x84\x9creals;\x09\xe2\x84\x9drect;\x09\xe2\x96\xadreg\x09\xc2\xaereg;\x09\xc2\xaerfisht;\x09\xe2\xa5\xbd"
+    b"rfloor;\x09\xe2\x8c\x8brfr;\x09\xf0\x9d\x94\xafrhard;\x09\xe2\x87\x81rharu;\x09\xe2\x87\x80rharul;\x09\xe2\xa5\xacrho;\x09\xcf\x81"
+    b"rhov;\x09\xcf\xb1rightarrow;\x09\xe2\x86\x92rightarrowtail;\x09\xe2\x86\xa3"
+    b"rightharpoondown;\x09\xe2\x87\x81rightharpoonup;\x09\xe2\x87\x80rightleftarrows;\x09\xe2\x87\x84"
+    b"rightleftharpoons;\x09\xe2\x87\x8crightrightarrows;\x09\xe2\x87\x89"
+    b"rightsquigarrow;\x09\xe2\x86\x9drightthreetimes;\x09\xe2\x8b\x8cring;\x09\xcb\x9a"
+    b"risingdotseq;\x09\xe2\x89\x93rlarr;\x09\xe2\x87\x84rlhar;\x09\xe2\x87\x8crlm;\x09\xe2\x80\x8frmoust;\x09\xe2\x8e\xb1"
+    b"rmoustache;\x09\xe2\x8e\xb1rnmid;\x09\xe2\xab\xaeroang;\x09\xe2\x9f\xadroarr;\x09\xe2\x87\xberobrk;\x09\xe2\x9f\xa7"
+    b"ropar;\x09\xe2\xa6\x86ropf;\x09\xf0\x9d\x95\xa3roplus;\x09\xe2\xa8\xaerotimes;\x09\xe2\xa8\xb5rpar;\x09)"
+    b"rpargt;\x09\xe2\xa6\x94rppolint;\x09\xe2\xa8\x92rrarr;\x09\xe2\x87\x89rsaquo;\x09\xe2\x80\xbarscr;\x09\xf0\x9d\x93\x87"
+    b"rsh;\x09\xe2\x86\xb1rsqb;\x09]rsquo;\x09\xe2\x80\x99rsquor;\x09\xe2\x80\x99rthree;\x09\xe2\x8b\x8crtimes;\x09\xe2\x8b\x8a"
+    b"rtri;\x09\xe2\x96\xb9rtrie;\x09\xe2\x8a\xb5rtrif;\x09\xe2\x96\xb8rtriltri;\x09\xe2\xa7\x8eruluhar;\x09\xe2\xa5\xa8"
+    b"rx;\x09\xe2\x84\x9esacute;\x09\xc5\x9bsbquo;\x09\xe2\x80\x9asc;\x09\xe2\x89\xbbscE;\x09\xe2\xaa\xb4scap;\x09\xe2\xaa\xb8"
+    b"scaron;\x09\xc5\xa1sccue;\x09\xe2\x89\xbdsce;\x09\xe2\xaa\xb0scedil;\x09\xc5\x9fscirc;\x09\xc5\x9dscnE;\x09\xe2\xaa\xb6"
+    b"scnap;\x09\xe2\xaa\xbascnsim;\x09\xe2\x8b\xa9scpolint;\x09\xe2\xa8\x93scsim;\x09\xe2\x89\xbfscy;\x09\xd1\x81sdot;\x09\xe2\x8b\x85"
+    b"sdotb;\x09\xe2\x8a\xa1sdote;\x09\xe2\xa9\xa6seArr;\x09\xe2\x87\x98searhk;\x09\xe2\xa4\xa5searr;\x09\xe2\x86\x98"
+    b"searrow;\x09\xe2\x86\x98sect\x09\xc2\xa7sect;\x09\xc2\xa7semi;\x09;seswar;\x09\xe2\xa4\xa9setminus;\x09\xe2\x88\x96"
+    b"setmn;\x09\xe2\x88\x96sext;\x09\xe2\x9c\xb6sfr;\x09\xf0\x9d\x94\xb0sfrown;\x09\xe2\x8c\xa2sharp;\x09\xe2\x99\xafshchcy;\x09\xd1\x89"
+    b"shcy;\x09\xd1\x88shortmid;\x09\xe2\x88\xa3shortparallel;\x09\xe2\x88\xa5shy\x09\xc2\xadshy;\x09\xc2\xad"
+    b"sigma;\x09\xcf\x83sigmaf;\x09\xcf\x82sigmav;\x09\xcf\x82sim;\x09\xe2\x88\xbcsimdot;\x09\xe2\xa9\xaasime;\x09\xe2\x89\x83"
+    b"simeq;\x09\xe2\x89\x83simg;\x09\xe2\xaa\x9esimgE;\x09\xe2\xaa\xa0siml;\x09\xe2\xaa\x9dsimlE;\x09\xe2\xaa\x9fsimne;\x09\xe2\x89\x86"
+    b"simplus;\x09\xe2\xa8\xa4simrarr;\x09\xe2\xa5\xb2slarr;\x09\xe2\x86\x90smallsetminus;\x09\xe2\x88\x96"
+    b"smashp;\x09\xe2\xa8\xb3smeparsl;\x09\xe2\xa7\xa4smid;\x09\xe2\x88\xa3smile;\x09\xe2\x8c\xa3smt;\x09\xe2\xaa\xaasmte;\x09\xe2\xaa\xac"
+    b"smtes;\x09\xe2\xaa\xac\xef\xb8\x80softcy;\x09\xd1\x8csol;\x09/solb;\x09\xe2\xa7\x84solbar;\x09\xe2\x8c\xbfsopf;\x09\xf0\x9d\x95\xa4"
+    b"spades;\x09\xe2\x99\xa0spadesuit;\x09\xe2\x99\xa0spar;\x09\xe2\x88\xa5sqcap;\x09\xe2\x8a\x93sqcaps;\x09\xe2\x8a\x93\xef\xb8\x80"
+    b"sqcup;\x09\xe2\x8a\x94sqcups;\x09\xe2\x8a\x94\xef\xb8\x80sqsub;\x09\xe2\x8a\x8fsqsube;\x09\xe2\x8a\x91sqsubset;\x09\xe2\x8a\x8f"
+    b"sqsubseteq;\x09\xe2\x8a\x91sqsup;\x09\xe2\x8a\x90sqsupe;\x09\xe2\x8a\x92sqsupset;\x09\xe2\x8a\x90"
+    b"sqsupseteq;\x09\xe2\x8a\x92squ;\x09\xe2\x96\xa1square;\x09\xe2\x96\xa1squarf;\x09\xe2\x96\xaasquf;\x09\xe2\x96\xaa"
+    b"srarr;\x09\xe2\x86\x92sscr;\x09\xf0\x9d\x93\x88ssetmn;\x09\xe2\x88\x96ssmile;\x09\xe2\x8c\xa3sstarf;\x09\xe2\x8b\x86"
+    b"star;\x09\xe2\x98\x86starf;\x09\xe2\x98\x85straightepsilon;\x09\xcf\xb5straightphi;\x09\xcf\x95"
+    b"strns;\x09\xc2\xafsub;\x09\xe2\x8a\x82subE;\x09\xe2\xab\x85subdot;\x09\xe2\xaa\xbdsube;\x09\xe2\x8a\x86subedot;\x09\xe2\xab\x83"
+    b"submult;\x09\xe2\xab\x81subnE;\x09\xe2\xab\x8bsubne;\x09\xe2\x8a\x8asubplus;\x09\xe2\xaa\xbfsubrarr;\x09\xe2\xa5\xb9"
+    b"subset;\x09\xe2\x8a\x82subseteq;\x09\xe2\x8a\x86subseteqq;\x09\xe2\xab\x85subsetneq;\x09\xe2\x8a\x8a"
+    b"subsetneqq;\x09\xe2\xab\x8bsubsim;\x09\xe2\xab\x87subsub;\x09\xe2\xab\x95subsup;\x09\xe2\xab\x93succ;\x09\xe2\x89\xbb"
+    b"succapprox;\x09\xe2\xaa\xb8succcurlyeq;\x09\xe2\x89\xbdsucceq;\x09\xe2\xaa\xb0succnapprox;\x09\xe2\xaa\xba"
+    b"succneqq;\x09\xe2\xaa\xb6succnsim;\x09\xe2\x8b\xa9succsim;\x09\xe2\x89\xbfsum;\x09\xe2\x88\x91sung;\x09\xe2\x99\xaa"
+    b"sup1\x09\xc2\xb9sup1;\x09\xc2\xb9sup2\x09\xc2\xb2sup2;\x09\xc2\xb2sup3\x09\xc2\xb3sup3;\x09\xc2\xb3sup;\x09\xe2\x8a\x83"
+    b"supE;\x09\xe2\xab\x86supdot;\x09\xe2\xaa\xbesupdsub;\x09\xe2\xab\x98supe;\x09\xe2\x8a\x87supedot;\x09\xe2\xab\x84"
+    b"suphsol;\x09\xe2\x9f\x89suphsub;\x09\xe2\xab\x97suplarr;\x09\xe2\xa5\xbbsupmult;\x09\xe2\xab\x82supnE;\x09\xe2\xab\x8c"
+    b"supne;\x09\xe2\x8a\x8bsupplus;\x09\xe2\xab\x80supset;\x09\xe2\x8a\x83supseteq;\x09\xe2\x8a\x87supseteqq;\x09\xe2\xab\x86"
+    b"supsetneq;\x09\xe2\x8a\x8bsupsetneqq;\x09\xe2\xab\x8csupsim;\x09\xe2\xab\x88supsub;\x09\xe2\xab\x94"
+    b"supsup;\x09\xe2\xab\x96swArr;\x09\xe2\x87\x99swarhk;\x09\xe2\xa4\xa6swarr;\x09\xe2\x86\x99swarrow;\x09\xe2\x86\x99"
+    b"swnwar;\x09\xe2\xa4\xaaszlig\x09\xc3\x9fszlig;\x09\xc3\x9ftarget;\x09\xe2\x8c\x96tau;\x09\xcf\x84tbrk;\x09\xe2\x8e\xb4"
+    b"tcaron;\x09\xc5\xa5tcedil;\x09\xc5\xa3tcy;\x09\xd1\x82tdot;\x09\xe2\x83\x9btelrec;\x09\xe2\x8c\x95tfr;\x09\xf0\x9d\x94\xb1"
+    b"there4;\x09\xe2\x88\xb4therefore;\x09\xe2\x88\xb4theta;\x09\xce\xb8thetasym;\x09\xcf\x91thetav;\x09\xcf\x91"
+    b"thickapprox;\x09\xe2\x89\x88thicksim;\x09\xe2\x88\xbcthinsp;\x09\xe2\x80\x89thkap;\x09\xe2\x89\x88"
+    b"thksim;\x09\xe2\x88\xbcthorn\x09\xc3\xbethorn;\x09\xc3\xbetilde;\x09\xcb\x9ctimes\x09\xc3\x97times;\x09\xc3\x97"
+    b"timesb;\x09\xe2\x8a\xa0timesbar;\x09\xe2\xa8\xb1timesd;\x09\xe2\xa8\xb0tint;\x09\xe2\x88\xadtoea;\x09\xe2\xa4\xa8"
+    b"top;\x09\xe2\x8a\xa4topbot;\x09\xe2\x8c\xb6topcir;\x09\xe2\xab\xb1topf;\x09\xf0\x9d\x95\xa5topfork;\x09\xe2\xab\x9a"
+    b"tosa;\x09\xe2\xa4\xa9tprime;\x09\xe2\x80\xb4trade;\x09\xe2\x84\xa2triangle;\x09\xe2\x96\xb5triangledown;\x09\xe2\x96\xbf"
+    b"triangleleft;\x09\xe2\x97\x83trianglelefteq;\x09\xe2\x8a\xb4triangleq;\x09\xe2\x89\x9c"
+    b"triangleright;\x09\xe2\x96\xb9trianglerighteq;\x09\xe2\x8a\xb5tridot;\x09\xe2\x97\xactrie;\x09\xe2\x89\x9c"
+    b"triminus;\x09\xe2\xa8\xbatriplus;\x09\xe2\xa8\xb9trisb;\x09\xe2\xa7\x8dtritime;\x09\xe2\xa8\xbbtrpezium;\x09\xe2\x8f\xa2"
+    b"tscr;\x09\xf0\x9d\x93\x89tscy;\x09\xd1\x86tshcy;\x09\xd1\x9btstrok;\x09\xc5\xa7twixt;\x09\xe2\x89\xac"
+    b"twoheadleftarrow;\x09\xe2\x86\x9etwoheadrightarrow;\x09\xe2\x86\xa0uArr;\x09\xe2\x87\x91"
+    b"uHar;\x09\xe2\xa5\xa3uacute\x09\xc3\xbauacute;\x09\xc3\xbauarr;\x09\xe2\x86\x91ubrcy;\x09\xd1\x9eubreve;\x09\xc5\xad"
+    b"ucirc\x09\xc3\xbbucirc;\x09\xc3\xbbucy;\x09\xd1\x83udarr;\x09\xe2\x87\x85udblac;\x09\xc5\xb1udhar;\x09\xe2\xa5\xae"
+    b"ufisht;\x09\xe2\xa5\xbeufr;\x09\xf0\x9d\x94\xb2ugrave\x09\xc3\xb9ugrave;\x09\xc3\xb9uharl;\x09\xe2\x86\xbfuharr;\x09\xe2\x86\xbe"
+    b"uhblk;\x09\xe2\x96\x80ulcorn;\x09\xe2\x8c\x9culcorner;\x09\xe2\x8c\x9culcrop;\x09\xe2\x8c\x8fultri;\x09\xe2\x97\xb8"
+    b"umacr;\x09\xc5\xabuml\x09\xc2\xa8uml;\x09\xc2\xa8uogon;\x09\xc5\xb3uopf;\x09\xf0\x9d\x95\xa6uparrow;\x09\xe2\x86\x91"
+    b"updownarrow;\x09\xe2\x86\x95upharpoonleft;\x09\xe2\x86\xbfupharpoonright;\x09\xe2\x86\xbe"
+    b"uplus;\x09\xe2\x8a\x8eupsi;\x09\xcf\x85upsih;\x09\xcf\x92upsilon;\x09\xcf\x85upuparrows;\x09\xe2\x87\x88"
+    b"urcorn;\x09\xe2\x8c\x9durcorner;\x09\xe2\x8c\x9durcrop;\x09\xe2\x8c\x8euring;\x09\xc5\xafurtri;\x09\xe2\x97\xb9"
+    b"uscr;\x09\xf0\x9d\x93\x8autdot;\x09\xe2\x8b\xb0utilde;\x09\xc5\xa9utri;\x09\xe2\x96\xb5utrif;\x09\xe2\x96\xb4uuarr;\x09\xe2\x87\x88"
+    b"uuml\x09\xc3\xbcuuml;\x09\xc3\xbcuwangle;\x09\xe2\xa6\xa7vArr;\x09\xe2\x87\x95vBar;\x09\xe2\xab\xa8vBarv;\x09\xe2\xab\xa9"
+    b"vDash;\x09\xe2\x8a\xa8vangrt;\x09\xe2\xa6\x9cvarepsilon;\x09\xcf\xb5varkappa;\x09\xcf\xb0"
+    b"varnothing;\x09\xe2\x88\x85varphi;\x09\xcf\x95varpi;\x09\xcf\x96varpropto;\x09\xe2\x88\x9dvarr;\x09\xe2\x86\x95"
+    b"varrho;\x09\xcf\xb1varsigma;\x09\xcf\x82varsubsetneq;\x09\xe2\x8a\x8a\xef\xb8\x80"
+    b"varsubsetneqq;\x09\xe2\xab\x8b\xef\xb8\x80varsupsetneq;\x09\xe2\x8a\x8b\xef\xb8\x80"
+    b"varsupsetneqq;\x09\xe2\xab\x8c\xef\xb8\x80vartheta;\x09\xcf\x91vartriangleleft;\x09\xe2\x8a\xb2"
+    b"vartriangleright;\x09\xe2\x8a\xb3vcy;\x09\xd0\xb2vdash;\x09\xe2\x8a\xa2vee;\x09\xe2\x88\xa8veebar;\x09\xe2\x8a\xbb"
+    b"veeeq;\x09\xe2\x89\x9avellip;\x09\xe2\x8b\xaeverbar;\x09|vert;\x09|vfr;\x09\xf0\x9d\x94\xb3vltri;\x09\xe2\x8a\xb2"
+    b"vnsub;\x09\xe2\x8a\x82\xe2\x83\x92vnsup;\x09\xe2\x8a\x83\xe2\x83\x92vopf;\x09\xf0\x9d\x95\xa7vprop;\x09\xe2\x88\x9dvrtri;\x09\xe2\x8a\xb3"
+    b"vscr;\x09\xf0\x9d\x93\x8bvsubnE;\x09\xe2\xab\x8b\xef\xb8\x80vsubne;\x09\xe2\x8a\x8a\xef\xb8\x80vsupnE;\x09\xe2\xab\x8c\xef\xb8\x80"
+    b"vsupne;\x09\xe2\x8a\x8b\xef\xb8\x80vzigzag;\x09\xe2\xa6\x9awcirc;\x09\xc5\xb5wedbar;\x09\xe2\xa9\x9fwedge;\x09\xe2\x88\xa7"
+    b"wedgeq;\x09\xe2\x89\x99weierp;\x09\xe2\x84\x98wfr;\x09\xf0\x9d\x94\xb4wopf;\x09\xf0\x9d\x95\xa8wp;\x09\xe2\x84\x98wr;\x09\xe2\x89\x80"
+    b"wreath;\x09\xe2\x89\x80wscr;\x09\xf0\x9d\x93\x8cxcap;\x09\xe2\x8b\x82xcirc;\x09\xe2\x97\xafxcup;\x09\xe2\x8b\x83xdtri;\x09\xe2\x96\xbd"
+    b"xfr;\x09\xf0\x9d\x94\xb5xhArr;\x09\xe2\x9f\xbaxharr;\x09\xe2\x9f\xb7xi;\x09\xce\xbexlArr;\x09\xe2\x9f\xb8xlarr;\x09\xe2\x9f\xb5"
+    b"xmap;\x09\xe2\x9f\xbcxnis;\x09\xe2\x8b\xbbxodot;\x09\xe2\xa8\x80xopf;\x09\xf0\x9d\x95\xa9xoplus;\x09\xe2\xa8\x81xotime;\x09\xe2\xa8\x82"
+    b"xrArr;\x09\xe2\x9f\xb9xrarr;\x09\xe2\x9f\xb6xscr;\x09\xf0\x9d\x93\x8dxsqcup;\x09\xe2\xa8\x86xuplus;\x09\xe2\xa8\x84"
+    b"xutri;\x09\xe2\x96\xb3xvee;\x09\xe2\x8b\x81xwedge;\x09\xe2\x8b\x80yacute\x09\xc3\xbdyacute;\x09\xc3\xbdyacy;\x09\xd1\x8f"
+    b"ycirc;\x09\xc5\xb7ycy;\x09\xd1\x8byen\x09\xc2\xa5yen;\x09\xc2\xa5yfr;\x09\xf0\x9d\x94\xb6yicy;\x09\xd1\x97yopf;\x09\xf0\x9d\x95\xaa"
+    b"yscr;\x09\xf0\x9d\x93\x8eyucy;\x09\xd1\x8eyuml\x09\xc3\xbfyuml;\x09\xc3\xbfzacute;\x09\xc5\xbazcaron;\x09\xc5\xbezcy;\x09\xd0\xb7"
+    b"zdot;\x09\xc5\xbczeetrf;\x09\xe2\x84\xa8zeta;\x09\xce\xb6zfr;\x09\xf0\x9d\x94\xb7zhcy;\x09\xd0\xb6zigrarr;\x09\xe2\x87\x9d"
+    b"zopf;\x09\xf0\x9d\x95\xabzscr;\x09\xf0\x9d\x93\x8fzwj;\x09\xe2\x80\x8dzwnj;\x09\xe2\x80\x8c"
+)
+_HTML5_INDEX = (
+    b"\x00\x00\x08\x00\x11\x00\x16\x00\x1c\x00%\x00/\x009\x00A\x00J\x00"
+    b"Q\x00Z\x00c\x00m\x00v\x00\x7f\x00\x87\x00\x90\x00\x9a\x00\xac\x00"
+    b"\xb4\x00\xbd\x00\xc7\x00\xd2\x00\xdb\x00\xe5\x00\xec\x00\xf4\x00\x02\x01\x0b\x01"
+    b"\x16\x01\x1d\x01)\x018\x01@\x01I\x01S\x01\\\x01e\x01p\x01"
+    b"x\x01\x7f\x01\x87\x01\x91\x01\x99\x01\xb2\x01\xbe\x01\xc8\x01\xd1\x01\xdb\x01"
+    b"\xe4\x01\xf0\x01\xf8\x01\x03\x02\x10\x02\x18\x02\x1f\x02-\x02=\x02L\x02"
+    b"\\\x02y\x02\x93\x02\xa7\x02\xb1\x02\xbc\x02\xca\x02\xd5\x02\xe9\x02\xf2\x02"
+    b"\x00\x03$\x03.\x038\x03@\x03K\x03R\x03_\x03g\x03o\x03"
+    b"w\x03\x82\x03\x8b\x03\x95\x03\x9f\x03\xa6\x03\xae\x03\xb7\x03\xc0\x03\xd4\x03"
+    b"\xe6\x03\x00\x04\x13\x04'\x043\x04E\x04O\x04V\x04a\x04n\x04"
+    b"\x88\x04\x95\x04\xa9\x04\xbd\x04\xd6\x04\xe8\x04\x00\x05\x1d\x056\x05K\x05"
+    b"^\x05p\x05\x86\x05\x9c\x05\xaa\x05\xbb\x05\xd0\x05\xdd\x05\xf5\x05\x0b\x06"
+    b"\x1e\x064\x06K\x06_\x06v\x06\x82\x06\x93\x06\xa1\x06\xab\x06\xb5\x06"
+    b"\xbc\x06\xc2\x06\xc9\x06\xd2\x06\xdc\x06\xe6\x06\xee\x06\xf7\x06\xfe\x06\x06\x07"
+    b"\x0f\x07\x18\x07\"\x07.\x077\x07L\x07e\x07n\x07x\x07\x83\x07"
+    b"\x8d\x07\x9c\x07\xac\x07\xb5\x07\xbe\x07\xc5\x07\xcc\x07\xd4\x07\xdf\x07\xf0\x07"
+    b"\xf7\x07\x00\x08\x16\x080\x08:\x08E\x08T\x08]\x08e\x08i\x08"
+    b"n\x08w\x08\x81\x08\x8b\x08\x95\x08\x9e\x08\xa5\x08\xad\x08\xb6\x08\xbd\x08"
+    b"\xc7\x08\xd8\x08\xed\x08\x02\x09\x15\x09%\x09;\x09L\x09V\x09]\x09"
+    b"g\x09p\x09v\x09\x7f\x09\x87\x09\x98\x09\xa1\x09\xb4\x09\xbd\x09\xc7\x09"
+    b"\xd8\x09\xe6\x09\xee\x09\xf7\x09\xff\x09\x08\x0a\x12\x0a\x1a\x0a#\x0a*\x0a"
+    b"2\x0a:\x0aC\x0aM\x0aT\x0a]\x0al\x0ax\x0a\x80\x0a\x8d\x0a"
+    b"\x9e\x0a\xb1\x0a\xc4\x0a\xcd\x0a\xd7\x0a\xdf\x0a\xe8\x0a\xf2\x0a\xfb\x0a\x02\x0b"
+    b"\x0a\x0b\x13\x0b\x1a\x0b#\x0b-\x0b7\x0bA\x0bJ\x0bR\x0bZ\x0b"
+    b"c\x0bm\x0bt\x0b}\x0b\x87\x0b\x91\x0b\x99\x0b\x9d\x0b\xa2\x0b\xac\x0b"
+    b"\xb6\x0b\xbf\x0b\xce\x0b\xd7\x0b\xe1\x0b\xeb\x0b\xf2\x0b\x07\x0c\x15\x0c&\x0c"
+    b">\x0cN\x0cd\x0cz\x0c\x8d\x0c\xa3\x0c\xb1\x0c\xc4\x0c\xd8\x0c\xe4\x0c"
+    b"\xf5\x0c\x07\x0d\x18\x0d,\x0dB\x0dW\x0dk\x0d|\x0d\x90\x0d\x9f\x0d"
+    b"\xb1\x0d\xbf\x0d\xd2\x0d\xe7\x0d\xf9\x0d\x09\x0e\x16\x0e)\x0e7\x0e@\x0e"
+    b"G\x0eV\x0e`\x0er\x0e\x89\x0e\x9c\x0e\xae\x0e\xc5\x0e\xd8\x0e\xe2\x0e"
+    b"\xf5\x0e\x09\x0f\x12\x0f\x1a\x0f$\x0f+\x0f3\x0f:\x0fJ\x0fX\x0f"
+    b"a\x0fo\x0fy\x0f\x82\x0f\x88\x0f\x90\x0f\x9a\x0f\xa4\x0f\xae\x0f\xb5\x0f"
+    b"\xcd\x0f\xe4\x0f\xfa\x0f\x14\x10-\x10@\x10J\x10S\x10_\x10s\x10"
+    b"|\x10\x84\x10\x95\x10\xa3\x10\xbc\x10\xcb\x10\xd8\x10\xec\x10\xfa\x10\x09\x11"
+    b"\x1d\x117\x11O\x11b\x11}\x11\x91\x11\xa7\x11\xba\x11\xce\x11\xe7\x11"
+    b"\x00\x12\x0c\x12\x1d\x120\x12B\x12Z\x12k\x12\x89\x12\xa1\x12\xb1\x12"
+    b"\xc8\x12\xe2\x12\xf8\x12\x0d\x13'\x13A\x13W\x13p\x13\x88\x13\xa3\x13"
+    b"\xb4\x13\xc7\x13\xd7\x13\xee\x13\x08\x14\x1f\x142\x14G\x14T\x14f\x14"
+    b"|\x14\x8e\x14\xa1\x14\xab\x14\xb4\x14\xbe\x14\xc4\x14\xcd\x14\xd6\x14\xe0\x14"
+    b"\xe8\x14\xf1\x14\xf8\x14\x02\x15\x0b\x15\x14\x15\x1e\x15'\x150\x15;\x15"
+    b"E\x15^\x15q\x15x\x15\x82\x15\x8b\x15\x95\x15\x9e\x15\xa8\x15\xb3\x15"
+    b"\xba\x15\xc2\x15\xce\x15\xdc\x15\xec\x15\x00\x16\x0d\x16\x14\x16\x1d\x16$\x16"
+    b"*\x167\x16I\x16R\x16Y\x16f\x16x\x16\x8f\x16\xa1\x16\xab\x16"
+    b"\xb7\x16\xc6\x16\xd7\x16\xe1\x16\xe8\x16\xee\x16\xf5\x16\xfe\x16\x07\x17\x11\x17"
+    b"\x1b\x17!\x17(\x172\x17;\x17D\x17O\x17Y\x17c\x17j\x17"
+    b"q\x17\x84\x17\x9b\x17\xb4\x17\xbc\x17\xc3\x17\xd9\x17\xe8\x17\xfa\x17\x12\x18"
+    b"#\x18:\x18Q\x18e\x18|\x18\x8b\x18\x98\x18\xaa\x18\xbd\x18\xcf\x18"
+    b"\xe4\x18\xfb\x18\x11\x19&\x198\x19M\x19]\x19p\x19\x7f\x19\x88\x19"
+    b"\x99\x19\xa9\x19\xb2\x19\xba\x19\xca\x19\xd4\x19\xdc\x19\xe6\x19\xf0\x19\xf7\x19"
+    b"\x01\x1a\x0b\x1a\x14\x1a\x1b\x1a$\x1a7\x1aJ\x1a^\x1ao\x1ax\x1a"
+    b"\x88\x1a\x92\x1a\x9b\x1a\xa6\x1a\xbd\x1a\xce\x1a\xe4\x1a\xf7\x1a\x0f\x1b\x1f\x1b"
+    b")\x1b2\x1b:\x1bE\x1bU\x1bb\x1bt\x1b\x8b\x1b\x9d\x1b\xaa\x1b"
+    b"\xb2\x1b\xba\x1b\xc7\x1b\xd9\x1b\xe4\x1b\xec\x1b\xf5\x1b\xff\x1b\x08\x1c\x10\x1c"
+    b"\x16\x1c\x1d\x1c'\x1c1\x1c8\x1cA\x1cO\x1cX\x1cj\x1cx\x1c"
+    b"\x82\x1c\x91\x1c\xa4\x1c\xb3\x1c\xbd\x1c\xcb\x1c\xd5\x1c\xdf\x1c\xe8\x1c\xf2\x1c"
+    b"\xfb\x1c\x08\x1d\x11\x1d\x1b\x1d#\x1d,\x1d3\x1d=\x1dF\x1dO\x1d"
+    b"Y\x1db\x1dm\x1d|\x1d\x8d\x1d\xa2\x1d\xac\x1d\xba\x1d\xc3\x1d\xcd\x1d"
+    b"\xd9\x1d\xe8\x1d\xfd\x1d\x0d\x1e\x1f\x1e)\x1e8\x1eD\x1eT\x1eg\x1e"
+    b"{\x1e\x83\x1e\x8e\x1e\x97\x1e\xa1\x1e\xab\x1e\xb2\x1e\xba\x1e\xc4\x1e\xcd\x1e"
+    b"\xd4\x1e\xde\x1e\xe9\x1e\xf1\x1e\xfc\x1e\x05\x1f\x15\x1f$\x1f:\x1fL\x1f"
+    b"^\x1fg\x1fq\x1f{\x1f\x86\x1f\x8f\x1f\x99\x1f\xa2\x1f\xac\x1f\xb6\x1f"
+    b"\xbf\x1f\xc5\x1f\xcf\x1f\xd9\x1f\xe1\x1f\xe9\x1f\xf1\x1f\xfa\x1f\x04 \x0d "
+    b"\x14 \x1d ' 1 9 A K U \\ d "
+    b"w \x7f \x87 \x90 \x9a \xa3 \xad \xb7 \xbe \xc8 "
+    b"\xd0 \xd8 \xe1 \xe9 \xf2 \xf9 \x01!\x0a!\x11!\x1a!"
+    b"#!-!9!C!L!U!_!d!j!r!"
+    b"}!\x86!\x93!\x9c!\xa4!\xad!\xb7!\xc2!\xcf!\xdc!"
+    b"\xe9!\xf6!\x03\"\x10\"\x1d\"*\"4\"@\"M\"X\""
+    b"a\"m\"v\"\x80\"\x87\"\x8f\"\x9a\"\xa2\"\xab\"\xb2\""
+    b"\xbd\"\xca\"\xd2\"\xdb\"\xe5\"\xeb\"\xf5\"\x01#\x0a#\x14#"
+    b"\x1b###0#:#C#P#_#m#y#\x87#"
+    b"\x92#\x9d#\xaa#\xb3#\xc0#\xca#\xd1#\xdb#\xe6#\xf2#"
+    b"\xfe#\x07$\x12$\x1a$#$/$8$C$O$Z$"
+    b"f$s$\x81$\x8e$\x9a$\xae$\xc0$\xcd$\xd8$\xe5$"
+    b"\xf0$\x01%\x11%#%9%O%f%p%z%\x84%"
+    b"\x8e%\x98%\xa1%\xb0%\xb9%\xc3%\xcb%\xd6%\xe1%\xeb%"
+    b"\xf5%\xff%\x09&\x12&\x1c&&&0&:&D&N&"
+    b"X&b&k&u&\x7f&\x89&\x93&\x9d&\xa7&\xb2&"
+    b"\xbc&\xc6&\xd0&\xda&\xe3&\xed&\xf7&\x01'\x0b'\x18'"
+    b"$'1';'E'O'Y'b'l'v'\x80'"
+    b"\x8a'\x94'\x9e'\xa9'\xb2'\xbb'\xc5'\xcf'\xd9'\xe2'"
+    b"\xec'\xf3'\xfd'\x0a(\x13(\x1e('(1(;(F("
+    b"P(X(c(p({(\x86(\x91(\x9d(\xa7(\xb0("
+    b"\xba(\xc4(\xcd(\xd7(\xe0(\xea(\xf6(\xfe(\x06)\x0f)"
+    b"\x1b)\")*)7)@)H)R)`)g)o)"
+    b"x)\x80)\x8b)\x9f)\xb4)\xc0)\xcd)\xdc)\xec)\xfc)"
+    b"\x05*\x12*\x1d*)*3*@*H*S*_*g*"
+    b"p*y*\x84*\x93*\xa1*\xaa*\xb6*\xc1*\xcb*\xd6*"
+    b"\xdd*\xe5*\xf0*\xfa*\x04+\x0e+\x17+!+*+4+"
+    b">+J+V+`+j+u+\x81+\x89+\x96+\xa1+"
+    b"\xac+\xb7+\xc1+\xcd+\xd8+\xe4+\xf4+\x04,\x11, ,"
+    b"),3,F,Z,d,n,{,\x85,\x90,\x99,"
+    b"\xa2,\xad,\xb8,\xc1,\xca,\xd4,\xe0,\xe9,\xf3,\xfa,"
+    b"\x01-\x0d-\x17-#-)-0-9-E-P-Y-"
+    b"c-m-v-\x82-\x92-\x9c-\xa3-\xae-\xb8-\xbf-"
+    b"\xc8-\xd2-\xe4-\xef-\xf7-\x02.\x0d.\x16. .'."
+    b"1.>.K.W.e.x.\x86.\x99.\xad.\xc2."
+    b"\xcf.\xda.\xe5.\xef.\xf7.\x00/\x0a/\x14/\x1d/'/"
+    b"1/;/G/O/\\/f/o/x/\x82/\x8d/"
+    b"\x97/\xa0/\xa8/\xb1/\xbc/\xc3/\xcb/\xd2/\xdc/\xe5/"
+    b"\xec/\xf5/\xff/\x070\x120\x190&0.060A0"
+    b"J0T0a0l0w0\x820\x8b0\x920\x9b0\xa40"
+    b"\xae0\xb70\xc20\xcc0\xd40\xdf0\xe80\xf30\xff0\x091"
+    b"\x181(111<1F1R1_1i1s1|1"
+    b"\x861\x8f1\x961\x9c1\xa31\xaa1\xb21\xbb1\xc21\xcc1"
+    b"\xdc1\xed1\xff1\x062\x112\x1c2&212:2D2"
+    b"M2V2`2j2r2|2\x872\x902\x9a2\xa72"
+    b"\xb02\xba2\xc52\xce2\xd82\xe32\xee2\xf92\x043\x0f3"
+    b"\x183\"3-383C3N3Y3d3n3x3"
+    b"\x823\x893\x913\x9b3\xa43\xae3\xb63\xc03\xc93\xd03"
+    b"\xd83\xdf3\xe73\xef3\xf83\x054\x0d4\x174\"4.4"
+    b";4G4R4[4b4j4t4|4\x834\x8b4"
+    b"\x934\x9b4\xa34\xac4\xb94\xc14\xca4\xd44\xde4\xe84"
+    b"\xf04\xf94\x025\x0c5\x165\x1a5\x1f5(525<5"
+    b"G5S5a5l5w5\x855\x945\xa05\xab5\xbc5"
+    b"\xc85\xd15\xdc5\xe45\xef5\xf95\x026\x0e6\x186!6"
+    b"*656C6N6Y6b6o6|6\x866\x916"
+    b"\xa36\xb66\xc06\xcb6\xd56\xe06\xea6\xf56\x007\x097"
+    b"\x137\x1a7\"7+727:7B7K7S7\\7"
+    b"e7o7v7\x817\x8b7\x967\xa07\xa97\xb27\xbc7"
+    b"\xc97\xd67\xdf7\xe87\xf17\xf87\x038\x0d8\x1a8$8"
+    b",878D8Q8^8j8r8{8\x858\x8d8"
+    b"\x978\xa08\xaa8\xb48\xbd8\xc78\xd38\xdd8\xe88\xf28"
+    b"\xf98\x039\x0c9\x139\x1b9$9+949=9G9"
+    b"Q9[9d9m9w9\x819\x889\x919\x9b9\xa39"
+    b"\xab9\xb59\xbf9\xc99\xd29\xdd9\xe79\xee9\xf69\xff9"
+    b"\x09:\x16:!:+:4:>:I:Q:Y:b:"
+    b"k:u:\x81:\x8c:\x97:\xa2:\xad:\xb9:\xc4:\xcc:"
+    b"\xd7:\xe0:\xed:\xf7:\x01;\x0a;\x13;\x1d;);5;"
+    b"?;I;S;Z;a;j;t;\x7f;\x8b;\x98;"
+    b"\xa1;\xa8;\xb6;\xc8;\xdc;\xee;\x01<\x14<(<><"
+    b"V<i<q<y<\x82<\x8f<\x97<\xa1<\xac<\xb8<"
+    b"\xc5<\xd1<\xdc<\xeb<\xf7<\x05=\x14= =,=7="
+    b"B=K=R=Z=d=n=y=\x83=\x8b=\x92="
+    b"\x9c=\xa9=\xb4=\xbe=\xc8=\xd3=\xe2=\xea=\xf3=\x00>"
+    b"\x08>\x11>\x1b>%>/>9>C>U>l>{>"
+    b"\x8e>\xa0>\xb3>\xbd>\xc7>\xd2>\xde>\xe9>\xf2>\xfa>"
+    b"\x06?\x0f?\x16?!?+?8?B?M?U?_?"
+    b"j?t?|?\x85?\x8f?\x99?\xa0?\xaa?\xb5?\xbf?"
+    b"\xc3?\xc8?\xd1?\xdb?\xe5?\xf0?\xfb?\x06@\x12@\x1d@"
+    b"&@0@:@G@S@d@p@z@\x81@\x89@"
+    b"\x92@\x9b@\xa7@\xaf@\xba@\xc9@\xd8@\xe5@\xf0@\xfb@"
+    b"\x02A\x0cA\x1eA'A/A7A@AHAQA\\A"
+    b"eAoAyA\x84A\x8fA\x9bA\xa4A\xadA\xb8A\xc3A"
+    b"\xcdA\xd4A\xdeA\xe9A\xefA\xfcA\x06B\x10B\x1bB&B"
+    b"5BIBSB^BiByB\x84B\x8fB\x99B\xa3B"
+    b"\xafB\xb7B\xc2B\xceB\xd7B\xe3B\xedB\xf9B\x06C\x0dC"
+    b"\x15C!C.C7CACKCUCdCmCtC"
+    b"~C\x85C\x8fC\x9aC\xa4C\xb0C\xbcC\xc7C\xd2C\xdeC"
+    b"\xe9C\xf5C\xfeC\x08D\x10D\x19D%D5D@DJD"
+    b"RD[DeDoDyD\x80D\x88D\x91D\x99D\xa1D"
+    b"\xabD\xb5D\xbfD\xc8D\xd0D\xdfD\xf3D\xfcD\x08E\x18E"
+    b"#E-E7E?EIETE]EgEmEtE"
+    b"~E\x8bE\x9aE\xa6E\xb2E\xbeE\xc8E\xd4E\xe0E\xecE"
+    b"\xf5E\x03F\x11F\x1dF)F1F<FGFQF_F"
+    b"iFsF\x80F\x8dF\x9dF\xa7F\xb2F\xbaF\xc5F\xd0F"
+    b"\xdaF\xe8F\xfbF\x04G\x0eG\x19G#G-G9GEG"
+    b"NGZGdGsG\x81G\x92G\x9cG\xaaG\xb3G\xbfG"
+    b"\xc9G\xd8G\xe6G\xf7G\x00H\x09H\x13H\x1cH.HBH"
+    b"UHjHpHvH\x81H\x8bH\x96H\xa1H\xadH\xb8H"
+    b"\xc4H\xceH\xdaH\xe5H\xf1H\xfbH\x0aI\x15I$I1I"
+    b";IFIPI\\IgInIwI\x81I\x8aI\x93I"
+    b"\x9bI\xa4I\xabI\xb5I\xbfI\xc8I\xd1I\xdcI\xe5I\xefI"
+    b"\xf8I\x00J\x09J\x13J\x1bJ%J,J5J?JIJ"
+    b"UJ_JgJpJyJ\x84J\x8dJ\x98J\xa2J\xabJ"
+    b"\xb5J\xbfJ\xc6J\xd0J\xd8J\xe2J\xeeJ\xf5J\xfdJ\x04K"
+    b"\x0cK\x17K K,K4K=KFKPKYKbK"
+    b"lKwK\x84K\x8bK\x93K\x9dK\xa5K\xacK\xb4K\xc1K"
+    b"\xccK\xd6K\xdfK\xe6K\xefK\xf8K\x03L\x0cL\x18L!L"
+    b"(L0L;LELKLYL`LkLwL\x82L"
+    b"\x89L\x96L\xa0L\xacL\xb7L\xc2L\xccL\xd5L\xdfL\xebL"
+    b"\xf7L\xfdL\x0aM\x14M\x1cM%M,M4M=MGM"
+    b"OMXMgMwM\x82M\x92M\x9fM\xacM\xb8M\xc2M"
+    b"\xcdM\xd6M\xe0M\xebM\xf4M\x01N\x0eN\x1bN$N/N"
+    b"9NDNNNUN`NiNrN|N\x87N\x91N"
+    b"\xa1N\xadN\xb5N\xc1N\xc7N\xceN\xd8N\xe1N\xecN\xf6N"
+    b"\xffN\x0aO\x14O\x1eO+O4O>OHOSO[O"
+    b"dOmOxO\x82O\x8eO\x98O\xa3O\xaeO\xb9O\xc4O"
+    b"\xd0O\xdbO\xe5O\xf0O\xfaO\x08P\x12P\x1cP%P.P"
+    b"8PDPPPZPdPnPuP|P\x85P\x91P"
+    b"\x9bP\xa6P\xafP\xb8P\xc4P\xd1P\xdbP\xe4P\xeaP\xf1P"
+    b"\xfcP\x07Q\x10Q\x1aQ$Q/Q6Q>QMQ`Q"
+    b"uQ\x88Q\x9cQ\xb2Q\xc7Q\xdbQ\xefQ\xf7Q\x08R\x12R"
+    b"\x1cR$R/R>RHRRR\\RfRpRzR"
+    b"\x85R\x91R\x98R\xa3R\xb0R\xbaR\xc5R\xcfR\xd7R\xdeR"
+    b"\xe8R\xf3R\xfeR\x09S\x12S\x1cS&S3S?SFS"
+    b"PSZSaSiSrS|S\x86S\x8eS\x98S\xa1S"
+    b"\xaaS\xb4S\xbfS\xccS\xd6S\xddS\xe6S\xf0S\xfaS\x04T"
+    b"\x0fT\x19T%T,T4T;TFTST]TfT"
+    b"oTzT\x84T\x8eT\x96T\xa3T\xb5T\xbbT\xc2T\xcbT"
+    b"\xd5T\xdfT\xe7T\xf2T\xfbT\x05U\x0eU\x18U!U+U"
+    b"5UAUMUWUiUtU\x81U\x8aU\x94U\x9cU"
+    b"\xa5U\xb2U\xbcU\xc2U\xcbU\xd6U\xe0U\xebU\xf9U\x02V"
+    b"\x0cV\x1aV$V2V<VGVTVcVmVxV"
+    b"\x85V\x94V\x9cV\xa7V\xb2V\xbbV\xc5V\xcfV\xdaV\xe5V"
+    b"\xf0V\xf9V\x03W\x16W%W.W6W?WJWSW"
+    b"_WkWuW\x7fW\x8bW\x97W\xa2W\xafW\xbdW\xcbW"
+    b"\xdaW\xe5W\xf0W\xfbW\x04X\x13X#X.X>XKX"
+    b"XXdXlXuX|X\x84X\x8bX\x93X\x9aX\xa2X"
+    b"\xaaX\xb3X\xbeX\xcaX\xd3X\xdfX\xebX\xf7X\x03Y\x0fY"
+    b"\x19Y#Y/Y:YGYUYcYrY}Y\x88Y"
+    b"\x93Y\x9dY\xa8Y\xb2Y\xbeY\xc9Y\xd1Y\xdaY\xe5Y\xecY"
+    b"\xf5Y\xffY\x09Z\x10Z\x19Z$Z-Z8ZFZOZ"
+    b"[ZeZuZ\x82Z\x8dZ\x97Z\xa2Z\xaaZ\xb3Z\xbcZ"
+    b"\xc4Z\xcdZ\xd8Z\xe5Z\xf0Z\xf9Z\x02[\x0a[\x15[ ["
+    b"*[6[?[J[T[a[r[\x83[\x96[\xa4["
+    b"\xb6[\xca[\xd5[\xde[\xeb[\xf7[\x01\\\x0d\\\x1a\\$\\"
+    b",\\5\\?\\I\\^\\t\\}\\\x86\\\x8f\\\x99\\"
+    b"\xa2\\\xab\\\xb5\\\xbd\\\xc6\\\xcd\\\xd7\\\xe1\\\xeb\\\xf6\\"
+    b"\xff\\\x08]\x12]\x1c]&]0];]H]S]]]"
+    b"f]l]s]|]\x86]\x92]\xa2]\xb4]\xc7]\xd1]"
+    b"\xd9]\xe2]\xed]\xfc]\x07^\x14^\x1f^(^2^<^"
+    b"F^P^Y^c^m^t^|^\x88^\x91^\x9a^"
+    b"\xa4^\xae^\xb9^\xc7^\xd3^\xe2^\xec^\xf5^\x03_\x0c_"
+    b"\x16_\"_6_K___t_\x80_\x94_\xa9_\xb0_"
+    b"\xba_\xc2_\xcd_\xd7_\xe2_\xeb_\xf2_\xfb_\x05`\x12`"
+    b"\x1f`)`3`=`G`U`c`q`\x7f`\x8b`"
+    b"\x94`\x9f`\xa9`\xb4`\xbf`\xc8`\xd2`\xd9`\xe0`\xeb`"
+    b"\xf5`\xfe`\x08a\x11a\x1ba$a.a8a>aHa"
+    b"Ra[adanaxa\x83a\x8ea\x98a\xa2a\xaca"
+    b"\xb7a\xc2a\xcca\xd5a\xe0a\xe9a\xf3a\xfba\x04b\x0bb"
+    b"\x11b\x18b!b)b3b=bEbLbTb^b"
+    b"hbobwb\x82b\x8ab\x93b\x9bb\xa7b\xb1b\xbbb"
+    b"\xc3b"
+)
+# END TABLES
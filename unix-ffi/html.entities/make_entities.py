@@ -0,0 +1,62 @@
+# Regenerate the tables in html/entities.py from CPython's html.entities.
+#
+# Run with CPython from this directory: python3 make_entities.py
+
+import html.entities
+import re
+
+TARGET = "html/entities.py"
+
+
+def table(name, items):
+    # Records of "name\tvalue" (UTF-8), sorted by name, and the offset of
+    # each record as a 16-bit little-endian integer.
+    data = b""
+    index = b""
+    lines = []
+    line = b""
+    for key, value in sorted((k.encode(), v.encode()) for k, v in items):
+        index += len(data).to_bytes(2, "little")
+        record = key + b"\t" + value
+        data += record
+        if len(line) + len(record) > 60:
+            lines.append(line)
+            line = b""
+        line += record
+    lines.append(line)
+    assert len(data) < 0x10000
+
+    out = [name + " = ("]
+    out += ["    " + literal(l) for l in lines]
+    out.append(")")
+    out.append(name + "_INDEX = (")
+    for i in range(0, len(index), 20):
+        out.append("    " + literal(index[i : i + 20]))
+    out.append(")")
+    return out
+
+
+def literal(b):
+    s = 'b"'
+    for c in b:
+        if c == 0x22 or c == 0x5C:
+            s += "\\" + chr(c)
+        elif 0x20 <= c < 0x7F:
+            s += chr(c)
+        else:
+            s += "\\x%02x" % c
+    return s + '"'
+
+
+lines = ["# BEGIN TABLES"]
+lines += table(
+    "_NAME2CODEPOINT", ((k, chr(v)) for k, v in html.entities.name2codepoint.items())
+)
+lines += table("_HTML5", html.entities.html5.items())
+lines.append("# END TABLES")
+
+with open(TARGET) as f:
+    src = f.read()
+src = re.sub("# BEGIN TABLES\n.*# END TABLES", lambda m: "\n".join(lines), src, flags=re.S)
+with open(TARGET, "w") as f:
+    f.write(src)
@@ -0,0 +1,18 @@
+from html import entities
+
+assert entities.html5_get("amp;") == "&"
+assert entities.html5_get("amp") == "&"
+assert entities.html5_get("NewLine;") == "\n"
+assert entities.html5_get("zwnj;") == "\u200c"
+assert entities.html5_get("nope;") is None
+assert entities.html5_get("AElig", "?") == "\xc6"
+assert entities.name2codepoint_get("euro") == 0x20AC
+assert entities.name2codepoint_get("euro;") is None
+
+# The dicts are built on first access.
+assert entities.name2codepoint["AElig"] == 0xC6
+assert entities.codepoint2name[0x3C] == "lt"
+assert entities.entitydefs["quot"] == '"'
+assert len(entities.html5) == 2231
+for name, value in entities.html5.items():
+    assert entities.html5_get(name) == value
@@ -0,0 +1,66 @@
+# Parse a synthetic corpus of pages, typical of scraped HTML (nested markup,
+# attributes, entity and character references, a script block), fed in
+# network-sized chunks.
+import time
+from html.parser import HTMLParser
+
+PAGES = 20
+CHUNK = 1460
+
+
+def page(n):
+    rows = []
+    for i in range(200):
+        rows.append(
+            '<tr class="row r%d" data-id=%d><td><a href="/item?id=%d&amp;p=%d" title=\'Item %d\'>'
+            "Item&nbsp;%d &mdash; &#169; caf&eacute;</a></td><td>%d.%02d &euro;</td>"
+            '<td><img src=/i/%d.png alt="" /><br></td></tr>\n'
+            % (i % 2, i, i, n, i, i, i, i % 100, i)
+        )
+    return (
+        "<!DOCTYPE html>\n<html><head><title>Page %d</title>"
+        '<meta charset="utf-8"><script>var x = "<b>" && 1 < 2;</script></head>\n'
+        '<body><!-- listing --><table id="items">\n%s</table></body></html>\n' % (n, "".join(rows))
+    )
+
+
+class Counter(HTMLParser):
+    def reset(self):
+        super().reset()
+        self.events = 0
+
+    def handle_starttag(self, tag, attrs):
+        self.events += 1
+
+    def handle_endtag(self, tag):
+        self.events += 1
+
+    def handle_data(self, data):
+        self.events += 1
+
+    def handle_entityref(self, name):
+        self.events += 1
+
+    def handle_charref(self, name):
+        self.events += 1
+
+
+corpus = [page(n) for n in range(PAGES)]
+size = sum(len(p) for p in corpus)
+
+p = Counter()
+t = time.time()
+for doc in corpus:
+    p.reset()
+    for i in range(0, len(doc), CHUNK):
+        p.feed(doc[i : i + CHUNK])
+    p.close()
+t = time.time() - t
+print("%d pages, %d bytes: %.3fs, %.0f KB/s" % (PAGES, size, t, size / t / 1024))
+
+s = '<a title="caf&eacute; &amp; cr&egrave;me &#233;t&#xe9; &notin; &copy2024">'
+t = time.time()
+for i in range(5000):
+    p.unescape(s)
+t = time.time() - t
+print("unescape: %.1f us/call" % (t / 5000 * 1e6))
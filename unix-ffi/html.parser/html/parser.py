@@ -7,7 +7,6 @@
 # data -- only char and entity references and end tags are special)
 # and CDATA (character data -- only end tags are special).
 
-
 import _markupbase
 import re
 import warnings
@@ -80,6 +79,101 @@ endendtag = re.compile(">")
 # </ and the tag name, so maybe this should be fixed
 endtagfind = re.compile("</\s*([a-zA-Z][-.a-zA-Z0-9:_]*)\s*>")
 
+# Character classes for the index-based scanner, which handles the common
+# cases of tags, references and text without going through re.  Anything
+# it doesn't recognise is left to the regular expressions above.
+_LETTERS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_DIGITS = "0123456789"
+_HEXDIGITS = "0123456789abcdefABCDEF"
+_ALNUM = _LETTERS + _DIGITS
+_WORD = _ALNUM + "_"
+_WS = " \t\n\r\f\v"
+_TAGCHARS = _ALNUM + "-.:_"
+_ENTITYCHARS = _ALNUM + "-."
+# Characters that end an attribute name (or make the scanner give up).
+_ATTRNAME_END = _WS + "/>=\"'<`"
+
+
+# Replacements of recently seen entity references.
+_ref_cache = {}
+
+
+# Replace the character or entity reference s (the text after "&").
+def _replace_ref(s):
+    if s[0] == "#":
+        t = s[1:]
+        try:
+            if t[0] in "xX":
+                return chr(int(t[1:].rstrip(";"), 16))
+            return chr(int(t.rstrip(";")))
+        except ValueError:
+            return "&" + s
+    value = _ref_cache.get(s)
+    if value is None:
+        if len(_ref_cache) >= 256:
+            _ref_cache.clear()
+        value = _ref_cache[s] = _lookup_ref(s)
+    return value
+
+
+def _lookup_ref(s):
+    from html.entities import html5_get
+
+    # An exact match, otherwise (without a trailing ";") the shortest entity
+    # name of at least 2 characters that is a prefix of s.
+    value = html5_get(s)
+    if value is not None:
+        return value
+    if s[-1] != ";":
+        for x in range(2, len(s)):
+            value = html5_get(s[:x])
+            if value is not None:
+                return value + s[x:]
+    return "&" + s
+
+
+def _unescape(s):
+    # Equivalent to re.sub(r"&(#?[xX]?(?:[0-9a-fA-F]+;|\w{1,32};?))", ...)
+    # with re.ASCII, scanning by index.
+    chunks = []
+    n = len(s)
+    i = 0
+    while True:
+        j = s.find("&", i)
+        if j < 0:
+            break
+        p = j + 1
+        if p < n and s[p] == "#":
+            p += 1
+        x = p < n and s[p] in "xX"
+        if x:
+            p += 1
+        end = p
+        while end < n and s[end] in _HEXDIGITS:
+            end += 1
+        if end > p and end < n and s[end] == ";":
+            end += 1
+        else:
+            if x and not (p < n and s[p] in _WORD):
+                # Let \w match the "x" itself.
+                p -= 1
+            end = p
+            while end < n and end - p < 32 and s[end] in _WORD:
+                end += 1
+            if end == p:
+                chunks.append(s[i:p])
+                i = p
+                continue
+            if end < n and s[end] == ";":
+                end += 1
+        chunks.append(s[i:j])
+        chunks.append(_replace_ref(s[j + 1 : end]))
+        i = end
+    if not chunks:
+        return s
+    chunks.append(s[i:])
+    return "".join(chunks)
+
 
 class HTMLParseError(Exception):
     """Exception raised for all parse errors."""
@@ -178,14 +272,24 @@ class HTMLParser(_markupbase.ParserBase):
         rawdata = self.rawdata
         i = 0
         n = len(rawdata)
+        # Positions of the next "<" and "&" (n if none) in normal mode.
+        lt = amp = -1
         while i < n:
-            match = self.interesting.search(rawdata, i)  # < or &
-            if match:
+            if self.cdata_elem:
+                match = self.interesting.search(rawdata, i)
+                if not match:
+                    break
                 j = match.start()
             else:
-                if self.cdata_elem:
-                    break
-                j = n
+                if lt < i:
+                    lt = rawdata.find("<", i)
+                    if lt < 0:
+                        lt = n
+                if amp < i:
+                    amp = rawdata.find("&", i)
+                    if amp < 0:
+                        amp = n
+                j = lt if lt < amp else amp
             if i < j:
                 self.handle_data(rawdata[i:j])
             i = self.updatepos(i, j)
@@ -193,7 +297,7 @@ class HTMLParser(_markupbase.ParserBase):
                 break
             startswith = rawdata.startswith
             if startswith("<", i):
-                if starttagopen.match(rawdata, i):  # < + letter
+                if i + 1 < n and rawdata[i + 1] in _LETTERS:  # < + letter
                     k = self.parse_starttag(i)
                 elif startswith("</", i):
                     k = self.parse_endtag(i)
@@ -226,6 +330,10 @@ class HTMLParser(_markupbase.ParserBase):
                     self.handle_data(rawdata[i:k])
                 i = self.updatepos(i, k)
             elif startswith("&#", i):
+                k = self._scan_charref(i)
+                if k:
+                    i = self.updatepos(i, k)
+                    continue
                 match = charref.match(rawdata, i)
                 if match:
                     name = match.group()[2:-1]
@@ -241,6 +349,10 @@ class HTMLParser(_markupbase.ParserBase):
                         i = self.updatepos(i, 2)
                     break
             elif startswith("&", i):
+                k = self._scan_entityref(i)
+                if k:
+                    i = self.updatepos(i, k)
+                    continue
                 match = entityref.match(rawdata, i)
                 if match:
                     name = match.group(1)
@@ -278,12 +390,46 @@ class HTMLParser(_markupbase.ParserBase):
             i = self.updatepos(i, n)
         self.rawdata = rawdata[i:]
 
+    # Internal -- handle a character reference "&#...", return its end, or 0
+    # to fall back to the regular expression.
+    def _scan_charref(self, i):
+        rawdata = self.rawdata
+        n = len(rawdata)
+        j = i + 2
+        if j < n and rawdata[j] in "xX":
+            j += 1
+            chars = _HEXDIGITS
+        else:
+            chars = _DIGITS
+        start = j
+        while j < n and rawdata[j] in chars:
+            j += 1
+        if j == start or j == n or rawdata[j] in _HEXDIGITS:
+            return 0
+        self.handle_charref(rawdata[i + 2 : j])
+        return j + 1 if rawdata[j] == ";" else j
+
+    # Internal -- handle an entity reference "&name", return its end, or 0
+    # to fall back to the regular expression.
+    def _scan_entityref(self, i):
+        rawdata = self.rawdata
+        n = len(rawdata)
+        j = i + 1
+        if j == n or rawdata[j] not in _LETTERS:
+            return 0
+        while j < n and rawdata[j] in _ENTITYCHARS:
+            j += 1
+        if j == n:
+            return 0
+        self.handle_entityref(rawdata[i + 1 : j])
+        return j + 1 if rawdata[j] == ";" else j
+
     # Internal -- parse html declarations, return length or -1 if not terminated
     # See w3.org/TR/html5/tokenization.html#markup-declaration-open-state
     # See also parse_declaration in _markupbase
     def parse_html_declaration(self, i):
         rawdata = self.rawdata
-        assert rawdata[i : i + 2] == "<!", "unexpected call to " "parse_html_declaration()"
+        assert rawdata[i : i + 2] == "<!", "unexpected call to parse_html_declaration()"
         if rawdata[i : i + 4] == "<!--":
             # this case is actually already handled in goahead()
             return self.parse_comment(i)
@@ -303,7 +449,7 @@ class HTMLParser(_markupbase.ParserBase):
     # see http://www.w3.org/TR/html5/tokenization.html#bogus-comment-state
     def parse_bogus_comment(self, i, report=1):
         rawdata = self.rawdata
-        assert rawdata[i : i + 2] in ("<!", "</"), "unexpected call to " "parse_comment()"
+        assert rawdata[i : i + 2] in ("<!", "</"), "unexpected call to parse_comment()"
         pos = rawdata.find(">", i + 2)
         if pos == -1:
             return -1
@@ -323,9 +469,85 @@ class HTMLParser(_markupbase.ParserBase):
         j = match.end()
         return j
 
+    # Internal -- scan a start tag made of a name and whitespace-separated
+    # name, name=value, name="value" or name='value' attributes, ending in
+    # ">" or "/>".  Return the end of the tag and the tag name, attributes
+    # and whether it is an empty tag, or None for anything else, including
+    # a tag that runs past the end of the data.
+    def _scan_starttag(self, i):
+        rawdata = self.rawdata
+        n = len(rawdata)
+        j = i + 1
+        while j < n and rawdata[j] in _TAGCHARS:
+            j += 1
+        tag = rawdata[i + 1 : j].lower()
+        attrs = []
+        while True:
+            k = j
+            while k < n and rawdata[k] in _WS:
+                k += 1
+            if k == n:
+                return None
+            c = rawdata[k]
+            if c == ">":
+                return k + 1, tag, attrs, False
+            if c == "/":
+                if k + 1 < n and rawdata[k + 1] == ">":
+                    return k + 2, tag, attrs, True
+                return None
+            if k == j or c in _ATTRNAME_END:
+                return None
+            j = k + 1
+            while j < n and rawdata[j] not in _ATTRNAME_END:
+                j += 1
+            name = rawdata[k:j].lower()
+            k = j
+            while k < n and rawdata[k] in _WS:
+                k += 1
+            if k == n:
+                return None
+            if rawdata[k] != "=":
+                attrs.append((name, None))
+                continue
+            k += 1
+            while k < n and rawdata[k] in _WS:
+                k += 1
+            if k == n:
+                return None
+            c = rawdata[k]
+            if c == '"' or c == "'":
+                j = rawdata.find(c, k + 1)
+                if j < 0:
+                    return None
+                value = rawdata[k + 1 : j]
+                j += 1
+            else:
+                j = k
+                while j < n and rawdata[j] not in _WS and rawdata[j] != ">":
+                    j += 1
+                if j == k or c == "=" or c == "<" or c == "`":
+                    return None
+                value = rawdata[k:j]
+            if value and "&" in value:
+                value = _unescape(value)
+            attrs.append((name, value))
+
     # Internal -- handle starttag, return end or -1 if not terminated
     def parse_starttag(self, i):
         self.__starttag_text = None
+        if not self.strict:
+            scanned = self._scan_starttag(i)
+            if scanned:
+                endpos, tag, attrs, empty = scanned
+                self.__starttag_text = self.rawdata[i:endpos]
+                self.lasttag = tag
+                if empty:
+                    self.handle_startendtag(tag, attrs)
+                else:
+                    self.handle_starttag(tag, attrs)
+                    if tag in self.CDATA_CONTENT_ELEMENTS:
+                        self.set_cdata_mode(tag)
+                return endpos
         endpos = self.check_for_whole_start_tag(i)
         if endpos < 0:
             return endpos
@@ -406,7 +628,7 @@ class HTMLParser(_markupbase.ParserBase):
             if next == "":
                 # end of input
                 return -1
-            if next in ("abcdefghijklmnopqrstuvwxyz=/" "ABCDEFGHIJKLMNOPQRSTUVWXYZ"):
+            if next in ("abcdefghijklmnopqrstuvwxyz=/ABCDEFGHIJKLMNOPQRSTUVWXYZ"):
                 # end of input in or before attribute value, or we have the
                 # '/' from a '/>' ending
                 return -1
@@ -423,6 +645,23 @@ class HTMLParser(_markupbase.ParserBase):
     def parse_endtag(self, i):
         rawdata = self.rawdata
         assert rawdata[i : i + 2] == "</", "unexpected call to parse_endtag"
+        # Fast path for "</name>".
+        n = len(rawdata)
+        j = i + 2
+        if j < n and rawdata[j] in _LETTERS:
+            while j < n and rawdata[j] in _TAGCHARS:
+                j += 1
+            k = j
+            while k < n and rawdata[k] in _WS:
+                k += 1
+            if k < n and rawdata[k] == ">":
+                elem = rawdata[i + 2 : j].lower()
+                if self.cdata_elem is not None and elem != self.cdata_elem:
+                    self.handle_data(rawdata[i : k + 1])
+                else:
+                    self.handle_endtag(elem)
+                    self.clear_cdata_mode()
+                return k + 1
         match = endendtag.search(rawdata, i + 1)  # >
         if not match:
             return -1
@@ -506,32 +745,4 @@ class HTMLParser(_markupbase.ParserBase):
     def unescape(self, s):
         if "&" not in s:
             return s
-
-        def replaceEntities(s):
-            s = s.groups()[0]
-            try:
-                if s[0] == "#":
-                    s = s[1:]
-                    if s[0] in ["x", "X"]:
-                        c = int(s[1:].rstrip(";"), 16)
-                    else:
-                        c = int(s.rstrip(";"))
-                    return chr(c)
-            except ValueError:
-                return "&#" + s
-            else:
-                from html.entities import html5
-
-                if s in html5:
-                    return html5[s]
-                elif s.endswith(";"):
-                    return "&" + s
-                for x in range(2, len(s)):
-                    if s[:x] in html5:
-                        return html5[s[:x]] + s[x:]
-                else:
-                    return "&" + s
-
-        return re.sub(
-            r"&(#?[xX]?(?:[0-9a-fA-F]+;|\w{1,32};?))", replaceEntities, s, flags=re.ASCII
-        )
+        return _unescape(s)
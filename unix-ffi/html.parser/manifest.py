@@ -1,4 +1,4 @@
-metadata(version="3.3.4")
+metadata(version="3.3.6")
 
 require("_markupbase")
 require("warnings")
@@ -0,0 +1,83 @@
+from html.parser import HTMLParser
+
+
+class Recorder(HTMLParser):
+    def reset(self):
+        super().reset()
+        self.events = []
+
+    def handle_starttag(self, tag, attrs):
+        self.events.append(("start", tag, attrs))
+
+    def handle_startendtag(self, tag, attrs):
+        self.events.append(("startend", tag, attrs))
+
+    def handle_endtag(self, tag):
+        self.events.append(("end", tag))
+
+    def handle_data(self, data):
+        if self.events and self.events[-1][0] == "data":
+            data = self.events.pop()[1] + data
+        self.events.append(("data", data))
+
+    def handle_entityref(self, name):
+        self.events.append(("entityref", name))
+
+    def handle_charref(self, name):
+        self.events.append(("charref", name))
+
+    def handle_comment(self, data):
+        self.events.append(("comment", data))
+
+    def handle_decl(self, decl):
+        self.events.append(("decl", decl))
+
+
+def parse(doc, chunk=None):
+    p = Recorder()
+    for i in range(0, len(doc), chunk or len(doc)):
+        p.feed(doc[i : i + (chunk or len(doc))])
+    p.close()
+    return p.events
+
+
+doc = (
+    "<!DOCTYPE html><P Class=x id='a&amp;b' checked data-v=1/2>Caf&eacute; &#233;&#xE9;"
+    '<br/><img src="a.png" alt=""><!-- c --><script>if (a < b && c) {}</script>'
+    "</p ><a\nhref=/x>t</a>"
+)
+expected = [
+    ("decl", "DOCTYPE html"),
+    ("start", "p", [("class", "x"), ("id", "a&b"), ("checked", None), ("data-v", "1/2")]),
+    ("data", "Caf"),
+    ("entityref", "eacute"),
+    ("data", " "),
+    ("charref", "233"),
+    ("charref", "xE9"),
+    ("startend", "br", []),
+    ("start", "img", [("src", "a.png"), ("alt", "")]),
+    ("comment", " c "),
+    ("start", "script", []),
+    ("data", "if (a < b && c) {}"),
+    ("end", "script"),
+    ("end", "p"),
+    ("start", "a", [("href", "/x")]),
+    ("data", "t"),
+    ("end", "a"),
+]
+assert parse(doc) == expected, parse(doc)
+# The result doesn't depend on how the input is split.
+for chunk in (1, 2, 3, 7):
+    assert parse(doc, chunk) == expected, chunk
+
+# Markup outside the fast path.
+assert parse("<a b='1'c=2>") == [("start", "a", [("b", "1"), ("c", "2")])]
+assert parse('<a b="1"/c>') == [("start", "a", [("b", "1"), ("c", None)])]
+assert parse("<a b==c>") == [("start", "a", [("b", "c")])]
+assert parse("</ a>") == [("end", "a")]
+
+p = HTMLParser()
+assert p.unescape("a &lt; b &amp;&amp c") == "a < b && c"
+assert p.unescape("&#65;&#x42;&#X43&#xZZ;") == "ABC&#xZZ;"
+assert p.unescape("&notit; &notit &notin; &unknown;") == "&notit; ¬it ∉ &unknown;"
+assert p.unescape("&copy2024 &ampx") == "©2024 &x"
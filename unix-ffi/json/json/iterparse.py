@@ -0,0 +1,318 @@
+"""Incremental, event-based JSON parser
+
+Reads a JSON document from a stream in fixed-size chunks and yields events
+as they are recognised, so documents far larger than the heap can be
+processed.  Events follow the conventions of the ``ijson`` package::
+
+    >>> from io import StringIO
+    >>> from json.iterparse import iterparse, load_items
+    >>> for prefix, event, value in iterparse(StringIO('{"a": [1, true]}')):
+    ...     print(prefix, event, value)
+     start_map None
+     map_key a
+    a start_array None
+    a.item number 1
+    a.item boolean True
+    a end_array None
+     end_map None
+    >>> list(load_items(StringIO('{"rows": [{"x": 1}, {"x": 2}]}'), "rows.item"))
+    [{'x': 1}, {'x': 2}]
+
+Memory use is bounded by the nesting depth of the document and the size of
+the largest string or number in it, plus one chunk of input.
+"""
+
+from .decoder import BACKSLASH, _CONSTANTS
+
+__all__ = ["basic_parse", "iterparse", "load_items"]
+
+DEFAULT_BUFFER_SIZE = 4096
+
+_WS = " \t\n\r"
+# Characters that terminate a number or a bare literal.
+_DELIMITERS = " \t\n\r,:]}"
+_LITERALS = {
+    "true": ("boolean", True),
+    "false": ("boolean", False),
+    "null": ("null", None),
+}
+
+# Parser states: what the next token is allowed to be.
+_VALUE = 0
+_VALUE_OR_END = 1  # just after "["
+_KEY = 2
+_KEY_OR_END = 3  # just after "{"
+_COLON = 4
+_COMMA_OR_END = 5
+_DONE = 6
+
+
+def _chunks(fp, buf_size):
+    # Yield the stream as str chunks.  Binary streams are decoded as UTF-8,
+    # holding back a multi-byte sequence split across two reads.
+    tail = b""
+    while True:
+        data = fp.read(buf_size)
+        if isinstance(data, str):
+            if not data:
+                return
+            yield data
+            continue
+        if tail:
+            data = tail + data
+            tail = b""
+        if not data:
+            return
+        end = len(data)
+        i = end - 1
+        while i > 0 and i > end - 4 and data[i] & 0xC0 == 0x80:
+            i -= 1
+        lead = data[i]
+        if lead >= 0xC0:
+            need = 2 if lead < 0xE0 else 3 if lead < 0xF0 else 4
+            if end - i < need:
+                tail = data[i:]
+                data = data[:i]
+        if data:
+            yield data.decode("utf-8")
+
+
+def _unescape(s):
+    chunks = []
+    i = 0
+    while True:
+        j = s.find("\\", i)
+        if j < 0:
+            chunks.append(s[i:])
+            return "".join(chunks)
+        chunks.append(s[i:j])
+        esc = s[j + 1 : j + 2]
+        if esc == "u":
+            uni = int(s[j + 2 : j + 6], 16)
+            i = j + 6
+            if 0xD800 <= uni <= 0xDBFF and s[i : i + 2] == "\\u":
+                uni2 = int(s[i + 2 : i + 6], 16)
+                uni = 0x10000 + (((uni - 0xD800) << 10) | (uni2 - 0xDC00))
+                i += 6
+            chunks.append(chr(uni))
+        else:
+            try:
+                chunks.append(BACKSLASH[esc])
+            except KeyError:
+                raise ValueError("Invalid \\escape: {0!r}".format(esc))
+            i = j + 2
+
+
+def _tokens(fp, buf_size):
+    # Yield (kind, value) tokens.  Structural characters are their own kind;
+    # scalars use the event names "string", "number", "boolean" and "null".
+    chunks = _chunks(fp, buf_size)
+    buf = ""
+    pos = 0
+    while True:
+        n = len(buf)
+        while pos < n and buf[pos] in _WS:
+            pos += 1
+        if pos == n:
+            buf = next(chunks, "")
+            pos = 0
+            if not buf:
+                return
+            continue
+
+        c = buf[pos]
+        if c in "{}[]:,":
+            pos += 1
+            yield c, None
+        elif c == '"':
+            end = pos + 1
+            while True:
+                end = buf.find('"', end)
+                if end < 0:
+                    more = next(chunks, "")
+                    if not more:
+                        raise ValueError("Unterminated string")
+                    end = len(buf) - pos
+                    buf = buf[pos:] + more
+                    pos = 0
+                    continue
+                # The quote is escaped if preceded by an odd number of backslashes.
+                k = end - 1
+                while buf[k] == "\\":
+                    k -= 1
+                if (end - k) & 1:
+                    break
+                end += 1
+            s = buf[pos + 1 : end]
+            pos = end + 1
+            yield "string", _unescape(s) if "\\" in s else s
+        else:
+            end = pos
+            while True:
+                while end < n and buf[end] not in _DELIMITERS:
+                    end += 1
+                if end < n:
+                    break
+                more = next(chunks, "")
+                if not more:
+                    break
+                end -= pos
+                buf = buf[pos:] + more
+                pos = 0
+                n = len(buf)
+            s = buf[pos:end]
+            pos = end
+            if s in _LITERALS:
+                yield _LITERALS[s]
+            elif s in _CONSTANTS:
+                yield "number", _CONSTANTS[s]
+            else:
+                try:
+                    if "." in s or "e" in s or "E" in s:
+                        yield "number", float(s)
+                    else:
+                        yield "number", int(s)
+                except ValueError:
+                    raise ValueError("Invalid JSON value {0!r}".format(s))
+
+
+def basic_parse(fp, buf_size=DEFAULT_BUFFER_SIZE):
+    """Parse the JSON document read from ``fp`` and yield ``(event, value)``
+    pairs.
+
+    Events are ``start_map``, ``map_key``, ``end_map``, ``start_array``,
+    ``end_array``, ``string``, ``number``, ``boolean`` and ``null``.  The
+    value is None for the start and end events.
+
+    ``fp`` is read ``buf_size`` characters (or bytes) at a time.
+    """
+    stack = []
+    state = _VALUE
+    for kind, value in _tokens(fp, buf_size):
+        if state <= _VALUE_OR_END:
+            if kind == "{":
+                stack.append(kind)
+                state = _KEY_OR_END
+                yield "start_map", None
+                continue
+            elif kind == "[":
+                stack.append(kind)
+                state = _VALUE_OR_END
+                yield "start_array", None
+                continue
+            elif kind == "]" and state == _VALUE_OR_END:
+                stack.pop()
+                yield "end_array", None
+            elif value is not None or kind == "null":
+                yield kind, value
+            else:
+                raise ValueError("Expecting value, got {0!r}".format(kind))
+        elif state <= _KEY_OR_END:
+            if kind == "string":
+                state = _COLON
+                yield "map_key", value
+                continue
+            elif kind == "}" and state == _KEY_OR_END:
+                stack.pop()
+                yield "end_map", None
+            else:
+                raise ValueError("Expecting property name enclosed in double quotes")
+        elif state == _COLON:
+            if kind != ":":
+                raise ValueError("Expecting ':' delimiter")
+            state = _VALUE
+            continue
+        elif state == _COMMA_OR_END:
+            if kind == ",":
+                state = _KEY if stack[-1] == "{" else _VALUE
+                continue
+            elif kind == "}" and stack[-1] == "{":
+                stack.pop()
+                yield "end_map", None
+            elif kind == "]" and stack[-1] == "[":
+                stack.pop()
+                yield "end_array", None
+            else:
+                raise ValueError("Expecting ',' delimiter")
+        else:
+            raise ValueError("Extra data")
+        # A complete value was just produced.
+        state = _COMMA_OR_END if stack else _DONE
+    if state != _DONE:
+        raise ValueError("Incomplete JSON document")
+
+
+def iterparse(fp, buf_size=DEFAULT_BUFFER_SIZE):
+    """Parse the JSON document read from ``fp`` and yield
+    ``(prefix, event, value)`` tuples.
+
+    ``prefix`` is the dot-separated path to the current value, where object
+    members contribute their key and array elements contribute ``item``.
+    Events are as for ``basic_parse``.
+    """
+    prefixes = []
+    prefix = ""
+    for event, value in basic_parse(fp, buf_size):
+        if event == "map_key":
+            parent = prefixes[-1]
+            yield parent, event, value
+            prefix = parent + "." + value if parent else value
+        elif event == "start_map":
+            yield prefix, event, value
+            prefixes.append(prefix)
+        elif event == "start_array":
+            yield prefix, event, value
+            prefixes.append(prefix)
+            prefix = prefix + ".item" if prefix else "item"
+        elif event == "end_map" or event == "end_array":
+            prefix = prefixes.pop()
+            yield prefix, event, value
+        else:
+            yield prefix, event, value
+
+
+def _build(events, event):
+    # Consume events up to the end of the container opened by event.
+    root = {} if event == "start_map" else []
+    containers = [root]
+    keys = [None]
+    for _, event, value in events:
+        if event == "map_key":
+            keys[-1] = value
+            continue
+        if event == "end_map" or event == "end_array":
+            containers.pop()
+            keys.pop()
+            if not containers:
+                return root
+            continue
+        if event == "start_map":
+            value = {}
+        elif event == "start_array":
+            value = []
+        top = containers[-1]
+        if type(top) is list:
+            top.append(value)
+        else:
+            top[keys[-1]] = value
+        if event == "start_map" or event == "start_array":
+            containers.append(value)
+            keys.append(None)
+    raise ValueError("Incomplete JSON document")
+
+
+def load_items(fp, prefix, buf_size=DEFAULT_BUFFER_SIZE):
+    """Yield each value in the JSON document read from ``fp`` whose path
+    equals ``prefix`` (as reported by ``iterparse``), fully materialised.
+
+    Only the matching values are built, so e.g. ``load_items(fp,
+    "rows.item")`` walks a large array one element at a time.
+    """
+    events = iterparse(fp, buf_size)
+    for current, event, value in events:
+        if current != prefix or event in ("map_key", "end_map", "end_array"):
+            continue
+        if event == "start_map" or event == "start_array":
+            yield _build(events, event)
+        else:
+            yield value
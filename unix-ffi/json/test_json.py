@@ -11,3 +11,23 @@ print(outp)
 
 # Doesn't work because JSON doesn't have tuples
 # assert inp == outp
+
+# Incremental parsing, reading a few characters at a time
+from io import StringIO
+from json.iterparse import iterparse, load_items
+
+events = list(iterparse(StringIO('{"a": [1, "b\\"c"]}'), 3))
+print(events)
+assert events == [
+    ("", "start_map", None),
+    ("", "map_key", "a"),
+    ("a", "start_array", None),
+    ("a.item", "number", 1),
+    ("a.item", "string", 'b"c'),
+    ("a", "end_array", None),
+    ("", "end_map", None),
+]
+
+items = list(load_items(StringIO(s), "item.bar"))
+print(items)
+assert items == [["baz", None, 1, 2]]
@@ -0,0 +1,6 @@
+metadata(version="0.1.1")
+
+require("ffilib")
+require("os")
+
+module("mmap.py")
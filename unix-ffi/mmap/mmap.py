@@ -0,0 +1,250 @@
+"""Memory-mapped files.
+
+Maps a file into memory with mmap(2) so that large files can be scanned
+without reading them into a bytes object.  MicroPython classes cannot
+export the buffer protocol themselves, so the mapped memory is exposed as
+``mmap.buf``, a bytearray aliasing the mapping: ``memoryview(m.buf)`` gives
+zero-copy access for code that takes a buffer.  Writing through ``buf`` to
+a mapping opened with ACCESS_READ crashes the process.
+"""
+
+import os
+import ffilib
+import uctypes
+
+libc = ffilib.libc()
+
+# void *mmap(void *addr, size_t length, int prot, int flags, int fd, off_t offset);
+mmap_ = libc.func("p", "mmap", "pLiiil")
+# int munmap(void *addr, size_t length);
+munmap_ = libc.func("i", "munmap", "pL")
+# int msync(void *addr, size_t length, int flags);
+msync_ = libc.func("i", "msync", "pLi")
+# int madvise(void *addr, size_t length, int advice);
+madvise_ = libc.func("i", "madvise", "pLi")
+# off_t lseek(int fd, off_t offset, int whence);
+lseek_ = libc.func("l", "lseek", "ili")
+# long sysconf(int name);
+sysconf_ = libc.func("l", "sysconf", "i")
+
+PROT_READ = 1
+PROT_WRITE = 2
+
+MAP_SHARED = 1
+MAP_PRIVATE = 2
+
+ACCESS_DEFAULT = 0
+ACCESS_READ = 1
+ACCESS_WRITE = 2
+ACCESS_COPY = 3
+
+MADV_NORMAL = 0
+MADV_RANDOM = 1
+MADV_SEQUENTIAL = 2
+MADV_WILLNEED = 3
+MADV_DONTNEED = 4
+
+_MS_SYNC = 4
+_SC_PAGESIZE = 30
+
+PAGESIZE = sysconf_(_SC_PAGESIZE)
+ALLOCATIONGRANULARITY = PAGESIZE
+
+# (void *)-1 as returned through an unsigned pointer type.
+_MAP_FAILED = (1 << ffilib.bitness) - 1
+
+# Bytes examined per step by find() and readline().
+_CHUNK = 65536
+
+error = OSError
+
+
+def _file_size(fd):
+    pos = lseek_(fd, 0, 1)
+    os.check_error(pos)
+    size = lseek_(fd, 0, 2)
+    lseek_(fd, pos, 0)
+    os.check_error(size)
+    return size
+
+
+class mmap:
+    def __init__(
+        self,
+        fileno,
+        length,
+        flags=MAP_SHARED,
+        prot=PROT_READ | PROT_WRITE,
+        access=ACCESS_DEFAULT,
+        offset=0,
+    ):
+        if access == ACCESS_READ:
+            flags, prot = MAP_SHARED, PROT_READ
+        elif access == ACCESS_WRITE:
+            flags, prot = MAP_SHARED, PROT_READ | PROT_WRITE
+        elif access == ACCESS_COPY:
+            flags, prot = MAP_PRIVATE, PROT_READ | PROT_WRITE
+        elif access != ACCESS_DEFAULT:
+            raise ValueError("mmap invalid access parameter.")
+        if length < 0 or offset < 0:
+            raise OverflowError("memory mapped length must be positive")
+        if offset % ALLOCATIONGRANULARITY:
+            raise ValueError("offset must be a multiple of ALLOCATIONGRANULARITY")
+        if not length:
+            length = _file_size(fileno) - offset
+            if length <= 0:
+                raise ValueError("cannot mmap an empty file")
+        addr = mmap_(None, length, prot, flags, fileno, offset)
+        if addr == _MAP_FAILED or addr == -1:
+            os.raise_error()
+        self._fd = fileno
+        self._addr = addr
+        self._size = length
+        self._writable = bool(prot & PROT_WRITE)
+        self._pos = 0
+        self.buf = uctypes.bytearray_at(addr, length)
+        self._mv = memoryview(self.buf)
+
+    @property
+    def closed(self):
+        return self._addr is None
+
+    def _check(self, write=False):
+        if self._addr is None:
+            raise ValueError("mmap closed or invalid")
+        if write and not self._writable:
+            raise TypeError("mmap can't modify a readonly memory map.")
+
+    def close(self):
+        if self._addr is not None:
+            self._mv = self.buf = None
+            r = munmap_(self._addr, self._size)
+            self._addr = None
+            os.check_error(r)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, key):
+        self._check()
+        if isinstance(key, slice):
+            if key.step is None or key.step == 1:
+                return bytes(self._mv[key.start : key.stop])
+            return bytes(self.buf[key])
+        return self.buf[key]
+
+    def __setitem__(self, key, value):
+        self._check(True)
+        self._mv[key] = value
+
+    def size(self):
+        """Return the size of the underlying file."""
+        self._check()
+        return _file_size(self._fd)
+
+    def find(self, sub, start=None, end=None):
+        """Return the lowest index of sub in mmap[start:end], or -1.
+
+        The mapping is searched a chunk at a time, so at most one chunk
+        of it is copied to the heap at once.
+        """
+        self._check()
+        size = self._size
+        start = 0 if start is None else start + size if start < 0 else start
+        end = size if end is None else end + size if end < 0 else min(end, size)
+        n = len(sub)
+        mv = self._mv
+        while start + n <= end:
+            stop = min(start + _CHUNK + n - 1, end)
+            i = bytes(mv[start:stop]).find(sub)
+            if i >= 0:
+                return start + i
+            start = stop - n + 1
+        return -1
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, pos, whence=0):
+        if whence == 1:
+            pos += self._pos
+        elif whence == 2:
+            pos += self._size
+        if not 0 <= pos <= self._size:
+            raise ValueError("seek out of range")
+        self._pos = pos
+        return pos
+
+    def read(self, n=None):
+        self._check()
+        pos = self._pos
+        end = self._size if n is None or n < 0 else min(pos + n, self._size)
+        self._pos = end
+        return bytes(self._mv[pos:end])
+
+    def readinto(self, b):
+        self._check()
+        pos = self._pos
+        n = min(len(b), self._size - pos)
+        b[:n] = self._mv[pos : pos + n]
+        self._pos = pos + n
+        return n
+
+    def read_byte(self):
+        self._check()
+        if self._pos >= self._size:
+            raise ValueError("read byte out of range")
+        self._pos += 1
+        return self.buf[self._pos - 1]
+
+    def readline(self):
+        self._check()
+        pos = self._pos
+        i = self.find(b"\n", pos)
+        end = self._size if i < 0 else i + 1
+        self._pos = end
+        return bytes(self._mv[pos:end])
+
+    def write(self, b):
+        self._check(True)
+        pos = self._pos
+        n = len(b)
+        if pos + n > self._size:
+            raise ValueError("data out of range")
+        self._mv[pos : pos + n] = b
+        self._pos = pos + n
+        return n
+
+    def write_byte(self, byte):
+        self._check(True)
+        if self._pos >= self._size:
+            raise ValueError("write byte out of range")
+        self.buf[self._pos] = byte
+        self._pos += 1
+
+    def flush(self, offset=0, size=None):
+        """Write changes in mmap[offset:offset + size] back to the file.
+        offset must be a multiple of PAGESIZE."""
+        self._check()
+        if size is None:
+            size = self._size - offset
+        if offset < 0 or size < 0 or offset + size > self._size:
+            raise ValueError("flush values out of range")
+        os.check_error(msync_(self._addr + offset, size, _MS_SYNC))
+
+    def madvise(self, option, start=0, length=None):
+        """Advise the kernel how mmap[start:start + length] will be used,
+        e.g. MADV_SEQUENTIAL before a single pass over a large file.
+        start must be a multiple of PAGESIZE."""
+        self._check()
+        if length is None or start + length > self._size:
+            length = self._size - start
+        if start < 0 or start >= self._size:
+            raise ValueError("madvise start out of bounds")
+        os.check_error(madvise_(self._addr + start, length, option))
@@ -0,0 +1,83 @@
+import os
+import mmap
+import tarfile
+
+
+FN = "test_mmap.dat"
+data = b"".join(b"line %d\n" % i for i in range(20000))
+with open(FN, "wb") as f:
+    f.write(data)
+
+fd = os.open(FN, os.O_RDONLY)
+m = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+os.close(fd)
+assert len(m) == len(data)
+assert m[:7] == b"line 0\n"
+assert m[5] == ord("0")
+assert m[-6:] == data[-6:]
+assert m.find(b"line 19999") == data.find(b"line 19999")
+assert m.find(b"line 123\n", 100) == data.find(b"line 123\n", 100)
+assert m.find(b"nope") == -1
+assert m.readline() == b"line 0\n"
+assert m.read(7) == b"line 1\n"
+m.seek(-6, 2)
+assert m.read() == data[-6:]
+buf = bytearray(10)
+m.seek(-4, 2)
+assert m.readinto(buf) == 4
+assert buf[:4] == data[-4:]
+assert m.readinto(buf) == 0
+m.seek(0)
+assert m.readinto(memoryview(buf)[2:]) == 8
+assert buf[2:] == data[:8]
+assert bytes(memoryview(m.buf)[:4]) == b"line"
+m.madvise(mmap.MADV_SEQUENTIAL)
+try:
+    m.write(b"x")
+    assert False
+except TypeError:
+    pass
+m.close()
+assert m.closed
+
+fd = os.open(FN, os.O_RDWR)
+with mmap.mmap(fd, mmap.PAGESIZE, offset=mmap.PAGESIZE) as m:
+    assert m[:] == data[mmap.PAGESIZE : 2 * mmap.PAGESIZE]
+    m[0:4] = b"LINE"
+    m.seek(10)
+    m.write(b"WXYZ")
+    m.flush()
+os.close(fd)
+
+with open(FN, "rb") as f:
+    f.seek(mmap.PAGESIZE)
+    chunk = f.read(14)
+assert chunk[:4] == b"LINE" and chunk[10:] == b"WXYZ"
+
+# A mapping can stand in for a file, e.g. to read a tar archive in place.
+header = bytearray(512)
+header[0:5] = b"a.txt"
+header[124:136] = b"%011o\0" % len(data)
+header[156] = ord("0")
+header[257:263] = b"ustar\0"
+with open(FN, "wb") as f:
+    f.write(header)
+    f.write(data)
+    f.write(bytes(-len(data) % 512 + 1024))
+
+fd = os.open(FN, os.O_RDONLY)
+with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as m:
+    t = tarfile.TarFile(fileobj=m)
+    assert t.getnames() == ["a.txt"]
+    f = t.extractfile("a.txt")
+    buf = bytearray(4096)
+    out = []
+    while True:
+        n = f.readinto(buf)
+        if not n:
+            break
+        out.append(bytes(buf[:n]))
+    assert b"".join(out) == data
+os.close(fd)
+
+os.unlink(FN)
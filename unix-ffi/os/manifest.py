@@ -1,4 +1,4 @@
-metadata(version="0.6.0")
+metadata(version="0.7.1")
 
 # Originally written by Paul Sokolovsky.
 
@@ -7,3 +7,5 @@ require("errno")
 require("stat")
 
 package("os")
+# scandir() and DirEntry are shared with the python-stdlib os package.
+package("os", files=("_scandir.py",), base_path="../../python-stdlib/os")
@@ -1,7 +1,6 @@
 import array
 import ustruct as struct
 import errno as errno_
-import stat as stat_
 import ffilib
 import uos
 
@@ -40,6 +39,7 @@ if libc:
     getcwd_ = libc.func("s", "getcwd", "si")
     opendir_ = libc.func("P", "opendir", "s")
     readdir_ = libc.func("P", "readdir", "P")
+    closedir_ = libc.func("i", "closedir", "P")
     open_ = libc.func("i", "open", "sii")
     read_ = libc.func("i", "read", "ipi")
     write_ = libc.func("i", "write", "iPi")
@@ -128,18 +128,25 @@ else:
         dir = opendir_(path)
         if not dir:
             raise_error()
-        res = []
+        is_str = type(path) is not bytes
         dirent_fmt = "LLHB256s"
-        while True:
-            dirent = readdir_(dir)
-            if not dirent:
-                break
-            import uctypes
+        import uctypes
 
-            dirent = uctypes.bytes_at(dirent, struct.calcsize(dirent_fmt))
-            dirent = struct.unpack(dirent_fmt, dirent)
-            dirent = (dirent[-1].split(b"\0", 1)[0], dirent[-2], dirent[0])
-            yield dirent
+        try:
+            while True:
+                dirent = readdir_(dir)
+                if not dirent:
+                    break
+                dirent = uctypes.bytes_at(dirent, struct.calcsize(dirent_fmt))
+                dirent = struct.unpack(dirent_fmt, dirent)
+                name = dirent[-1].split(b"\0", 1)[0]
+                if is_str:
+                    name = fsdecode(name)
+                # d_type is the file type bits of st_mode shifted down by 12,
+                # report it as st_mode bits like uos.ilistdir() does.
+                yield (name, dirent[-2] << 12, dirent[0])
+        finally:
+            closedir_(dir)
 
 
 def listdir(path="."):
@@ -158,21 +165,24 @@ def listdir(path="."):
     return res
 
 
+from ._scandir import DirEntry, scandir
+
+
 def walk(top, topdown=True):
     files = []
     dirs = []
-    for dirent in ilistdir(top):
-        mode = dirent[1] << 12
-        fname = fsdecode(dirent[0])
-        if stat_.S_ISDIR(mode):
-            if fname != "." and fname != "..":
-                dirs.append(fname)
+    for entry in scandir(top):
+        # Like the listing itself, don't follow symlinks (or stat entries
+        # whose type the filesystem didn't report).
+        if entry.is_dir(follow_symlinks=False):
+            dirs.append(fsdecode(entry.name))
         else:
-            files.append(fname)
+            files.append(fsdecode(entry.name))
     if topdown:
         yield top, dirs, files
+    prefix = top if top.endswith("/") else top + "/"
     for d in dirs:
-        yield from walk(top + "/" + d, topdown)
+        yield from walk(prefix + d, topdown)
     if not topdown:
         yield top, dirs, files
 
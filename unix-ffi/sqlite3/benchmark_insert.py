@@ -0,0 +1,45 @@
+# Compare row-by-row inserts with a batched executemany(), and autocommit
+# inserts into an on-disk database with and without WAL journaling.
+import os
+import time
+import sqlite3
+
+
+N = 5000
+
+conn = sqlite3.connect(":memory:")
+conn.execute("CREATE TABLE t(a int, b text)")
+
+t = time.time()
+conn.execute("BEGIN")
+for i in range(N):
+    conn.execute("INSERT INTO t VALUES (?, ?)", (i, "row"))
+conn.execute("COMMIT")
+print("execute:     %d rows/s" % (N / (time.time() - t)))
+
+t = time.time()
+conn.executemany("INSERT INTO t VALUES (?, ?)", ((i, "row") for i in range(N)))
+print("executemany: %d rows/s" % (N / (time.time() - t)))
+
+assert conn.execute("SELECT count(*) FROM t").fetchone() == (2 * N,)
+conn.close()
+
+
+DB = "benchmark_insert.db"
+N = 200
+for name, pragmas in (
+    ("default", None),
+    ("wal", {"journal_mode": "WAL", "synchronous": "NORMAL"}),
+):
+    conn = sqlite3.connect(DB, pragmas=pragmas)
+    conn.execute("CREATE TABLE t(a int, b text)")
+    t = time.time()
+    for i in range(N):
+        conn.execute("INSERT INTO t VALUES (?, ?)", (i, "row"))
+    print("%-12s %d rows/s" % (name + ":", N / (time.time() - t)))
+    conn.close()
+    for f in (DB, DB + "-wal", DB + "-shm"):
+        try:
+            os.remove(f)
+        except OSError:
+            pass
@@ -1,4 +1,4 @@
-metadata(version="0.2.4")
+metadata(version="0.4.2")
 
 # Originally written by Paul Sokolovsky.
 
@@ -1,5 +1,8 @@
 import sys
+import time
 import ffilib
+import uctypes
+from collections import OrderedDict
 
 
 sq3 = ffilib.open("libsqlite3")
@@ -15,23 +18,71 @@ sqlite3_close = sq3.func("i", "sqlite3_close", "p")
 #  const char **pzTail     /* OUT: Pointer to unused portion of zSql */
 # );
 sqlite3_prepare = sq3.func("i", "sqlite3_prepare", "psipp")
+# int sqlite3_prepare_v2(...), same arguments as sqlite3_prepare
+sqlite3_prepare_v2 = sq3.func("i", "sqlite3_prepare_v2", "psipp")
 # int sqlite3_finalize(sqlite3_stmt *pStmt);
 sqlite3_finalize = sq3.func("i", "sqlite3_finalize", "p")
+# sqlite3_stmt *sqlite3_next_stmt(sqlite3 *pDb, sqlite3_stmt *pStmt);
+sqlite3_next_stmt = sq3.func("p", "sqlite3_next_stmt", "pp")
 # int sqlite3_step(sqlite3_stmt*);
 sqlite3_step = sq3.func("i", "sqlite3_step", "p")
+# int sqlite3_reset(sqlite3_stmt *pStmt);
+sqlite3_reset = sq3.func("i", "sqlite3_reset", "p")
+# int sqlite3_clear_bindings(sqlite3_stmt*);
+sqlite3_clear_bindings = sq3.func("i", "sqlite3_clear_bindings", "p")
+# int sqlite3_bind_parameter_count(sqlite3_stmt*);
+sqlite3_bind_parameter_count = sq3.func("i", "sqlite3_bind_parameter_count", "p")
+# const char *sqlite3_bind_parameter_name(sqlite3_stmt*, int);
+sqlite3_bind_parameter_name = sq3.func("s", "sqlite3_bind_parameter_name", "pi")
+# int sqlite3_bind_null(sqlite3_stmt*, int);
+sqlite3_bind_null = sq3.func("i", "sqlite3_bind_null", "pi")
+# int sqlite3_bind_int64(sqlite3_stmt*, int, sqlite3_int64);
+sqlite3_bind_int64 = sq3.func("i", "sqlite3_bind_int64", "piq")
+# int sqlite3_bind_double(sqlite3_stmt*, int, double);
+sqlite3_bind_double = sq3.func("i", "sqlite3_bind_double", "pid")
+# int sqlite3_bind_text(sqlite3_stmt*, int, const char*, int, void(*)(void*));
+sqlite3_bind_text = sq3.func("i", "sqlite3_bind_text", "pipip")
+# int sqlite3_bind_blob(sqlite3_stmt*, int, const void*, int n, void(*)(void*));
+sqlite3_bind_blob = sq3.func("i", "sqlite3_bind_blob", "pipip")
 # int sqlite3_column_count(sqlite3_stmt *pStmt);
 sqlite3_column_count = sq3.func("i", "sqlite3_column_count", "p")
+# const char *sqlite3_column_name(sqlite3_stmt*, int N);
+sqlite3_column_name = sq3.func("s", "sqlite3_column_name", "pi")
 # int sqlite3_column_type(sqlite3_stmt*, int iCol);
 sqlite3_column_type = sq3.func("i", "sqlite3_column_type", "pi")
 sqlite3_column_int = sq3.func("i", "sqlite3_column_int", "pi")
+# sqlite3_int64 sqlite3_column_int64(sqlite3_stmt*, int iCol);
+sqlite3_column_int64 = sq3.func("q", "sqlite3_column_int64", "pi")
 # using "d" return type gives wrong results
 sqlite3_column_double = sq3.func("d", "sqlite3_column_double", "pi")
 sqlite3_column_text = sq3.func("s", "sqlite3_column_text", "pi")
+# const void *sqlite3_column_blob(sqlite3_stmt*, int iCol);
+sqlite3_column_blob = sq3.func("p", "sqlite3_column_blob", "pi")
+# int sqlite3_column_bytes(sqlite3_stmt*, int iCol);
+sqlite3_column_bytes = sq3.func("i", "sqlite3_column_bytes", "pi")
 # sqlite3_int64 sqlite3_last_insert_rowid(sqlite3*);
-# TODO: should return long int
-sqlite3_last_insert_rowid = sq3.func("i", "sqlite3_last_insert_rowid", "p")
+sqlite3_last_insert_rowid = sq3.func("q", "sqlite3_last_insert_rowid", "p")
+# int sqlite3_changes(sqlite3*);
+sqlite3_changes = sq3.func("i", "sqlite3_changes", "p")
+# int sqlite3_get_autocommit(sqlite3*);
+sqlite3_get_autocommit = sq3.func("i", "sqlite3_get_autocommit", "p")
 # const char *sqlite3_errmsg(sqlite3*);
 sqlite3_errmsg = sq3.func("s", "sqlite3_errmsg", "p")
+# int sqlite3_busy_timeout(sqlite3*, int ms);
+sqlite3_busy_timeout = sq3.func("i", "sqlite3_busy_timeout", "pi")
+# sqlite3_backup *sqlite3_backup_init(
+#  sqlite3 *pDest, const char *zDestName,
+#  sqlite3 *pSource, const char *zSourceName
+# );
+sqlite3_backup_init = sq3.func("p", "sqlite3_backup_init", "psps")
+# int sqlite3_backup_step(sqlite3_backup *p, int nPage);
+sqlite3_backup_step = sq3.func("i", "sqlite3_backup_step", "pi")
+# int sqlite3_backup_finish(sqlite3_backup *p);
+sqlite3_backup_finish = sq3.func("i", "sqlite3_backup_finish", "p")
+# int sqlite3_backup_remaining(sqlite3_backup *p);
+sqlite3_backup_remaining = sq3.func("i", "sqlite3_backup_remaining", "p")
+# int sqlite3_backup_pagecount(sqlite3_backup *p);
+sqlite3_backup_pagecount = sq3.func("i", "sqlite3_backup_pagecount", "p")
 
 # Too recent
 ##const char *sqlite3_errstr(int);
@@ -41,6 +92,7 @@ sqlite3_errmsg = sq3.func("s", "sqlite3_errmsg", "p")
 SQLITE_OK = 0
 SQLITE_ERROR = 1
 SQLITE_BUSY = 5
+SQLITE_LOCKED = 6
 SQLITE_MISUSE = 21
 SQLITE_ROW = 100
 SQLITE_DONE = 101
@@ -51,86 +103,383 @@ SQLITE_TEXT = 3
 SQLITE_BLOB = 4
 SQLITE_NULL = 5
 
+# Destructor argument telling sqlite to take its own copy of bound data.
+SQLITE_TRANSIENT = -1
+
+_PTR_SIZE = ffilib.bitness // 8
+
+# Statements before which a transaction is implicitly opened when
+# isolation_level is not None.
+_DML = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+
+
+def _is_dml(sql):
+    # MicroPython's str.startswith() does not take a tuple.
+    head = sql.lstrip()[:7].upper()
+    for word in _DML:
+        if head.startswith(word):
+            return True
+    return False
+
 
 class Error(Exception):
     pass
 
 
+class ProgrammingError(Error):
+    pass
+
+
 def check_error(db, s):
     if s != SQLITE_OK:
         raise Error(s, sqlite3_errmsg(db))
 
 
-class Connections:
-    def __init__(self, h):
+def _bind(db, stmt, params):
+    if isinstance(params, dict):
+        # Named parameters: ":name", "@name" or "$name".
+        values = [
+            params[sqlite3_bind_parameter_name(stmt, i)[1:]]
+            for i in range(1, sqlite3_bind_parameter_count(stmt) + 1)
+        ]
+    else:
+        values = params
+    i = 0
+    for v in values:
+        i += 1
+        if v is None:
+            s = sqlite3_bind_null(stmt, i)
+        elif isinstance(v, int):
+            s = sqlite3_bind_int64(stmt, i, v)
+        elif isinstance(v, float):
+            s = sqlite3_bind_double(stmt, i, v)
+        elif isinstance(v, str):
+            v = v.encode()
+            s = sqlite3_bind_text(stmt, i, v, len(v), SQLITE_TRANSIENT)
+        elif isinstance(v, (bytes, bytearray, memoryview)):
+            s = sqlite3_bind_blob(stmt, i, v, len(v), SQLITE_TRANSIENT)
+        else:
+            raise Error("Error binding parameter %d: type %s is not supported" % (i, type(v)))
+        check_error(db, s)
+
+
+class Connection:
+    def __init__(self, h, cached_statements=128, isolation_level=None):
         self.h = h
+        self.cached_statements = cached_statements
+        # None: autocommit, each statement is its own transaction.  Otherwise
+        # "", "DEFERRED", "IMMEDIATE" or "EXCLUSIVE": a transaction of that
+        # kind is opened before DML and lasts until commit() or rollback().
+        self.isolation_level = isolation_level
+        # Prepared statements keyed by SQL text, least recently used first.
+        # A statement is removed while a cursor is using it.
+        self._stmts = OrderedDict()
+
+    def _check(self):
+        # After close() the handle, and every statement prepared on it, is
+        # freed: nothing may be passed to sqlite any more.
+        if self._stmts is None:
+            raise ProgrammingError("Cannot operate on a closed database.")
+
+    def _prepare(self, sql):
+        self._check()
+        stmt = self._stmts.pop(sql, None)
+        if stmt is None:
+            b = bytearray(_PTR_SIZE)
+            s = sqlite3_prepare_v2(self.h, sql, -1, b, None)
+            check_error(self.h, s)
+            stmt = int.from_bytes(b, sys.byteorder)
+        return stmt
+
+    def _release(self, sql, stmt):
+        # Reset a statement and put it back in the cache for reuse.
+        if not stmt or self._stmts is None:
+            return
+        sqlite3_reset(stmt)
+        sqlite3_clear_bindings(stmt)
+        if sql in self._stmts or not self.cached_statements:
+            sqlite3_finalize(stmt)
+            return
+        self._stmts[sql] = stmt
+        if len(self._stmts) > self.cached_statements:
+            sqlite3_finalize(self._stmts.pop(next(iter(self._stmts))))
 
     def cursor(self):
-        return Cursor(self.h)
+        return Cursor(self)
+
+    def execute(self, sql, params=None):
+        return self.cursor().execute(sql, params)
+
+    def executemany(self, sql, seq_of_params):
+        return self.cursor().executemany(sql, seq_of_params)
+
+    @property
+    def in_transaction(self):
+        self._check()
+        return not sqlite3_get_autocommit(self.h)
+
+    def _begin(self):
+        if self.isolation_level:
+            self.execute("BEGIN " + self.isolation_level)
+        else:
+            self.execute("BEGIN")
+
+    def commit(self):
+        if self.in_transaction:
+            self.execute("COMMIT")
+
+    def rollback(self):
+        if self.in_transaction:
+            self.execute("ROLLBACK")
+
+    def __enter__(self):
+        # Scope a transaction to the with block, also in autocommit mode.
+        if not self.in_transaction:
+            self._begin()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    def pragma(self, name, value=None):
+        """Set (if value is given) and return the value of a PRAGMA."""
+        if not name.replace("_", "").isalpha():
+            raise Error("Invalid pragma name: %s" % name)
+        sql = "PRAGMA " + name
+        if value is not None:
+            sql += "=" + str(value)
+        rows = self.execute(sql).fetchall()
+        return rows[0][0] if rows else None
+
+    def backup(self, target, *, pages=-1, progress=None, name="main", sleep=0.250):
+        """Copy database ``name`` of this connection into the main database
+        of the ``target`` connection, ``pages`` pages at a time.
+
+        ``progress(status, remaining, total)`` is called after each step.
+        """
+        self._check()
+        if target.in_transaction:
+            raise Error("target is in transaction")
+        b = sqlite3_backup_init(target.h, "main", self.h, name)
+        if not b:
+            raise Error(sqlite3_errmsg(target.h))
+        try:
+            while True:
+                s = sqlite3_backup_step(b, pages)
+                if progress:
+                    progress(s, sqlite3_backup_remaining(b), sqlite3_backup_pagecount(b))
+                if s == SQLITE_DONE:
+                    break
+                if s == SQLITE_BUSY or s == SQLITE_LOCKED:
+                    time.sleep(sleep)
+                elif s != SQLITE_OK:
+                    raise Error(s, sqlite3_errmsg(target.h))
+        finally:
+            s = sqlite3_backup_finish(b)
+        check_error(target.h, s)
 
     def close(self):
+        # Finalize cached statements and any still held by open cursors,
+        # which from now on raise ProgrammingError instead of using them.
+        if self._stmts is None:
+            return
+        self._stmts = None
+        while True:
+            stmt = sqlite3_next_stmt(self.h, None)
+            if not stmt:
+                break
+            sqlite3_finalize(stmt)
         s = sqlite3_close(self.h)
         check_error(self.h, s)
 
 
+# Original name of the Connection class.
+Connections = Connection
+
+
 class Cursor:
-    def __init__(self, h):
-        self.h = h
+    def __init__(self, conn):
+        self.conn = conn
+        self.h = conn.h
         self.stmnt = None
+        self.sql = None
+        self.num_cols = 0
+        self.arraysize = 1
+        self.rowcount = -1
+        self.lastrowid = None
+        self.description = None
+
+    def _finish(self):
+        # Return the current statement to the connection's cache.
+        if self.stmnt is not None:
+            stmt = self.stmnt
+            self.stmnt = None
+            self.conn._release(self.sql, stmt)
+
+    def _fail(self, s):
+        self._finish()
+        raise Error(s, sqlite3_errmsg(self.h))
 
     def execute(self, sql, params=None):
+        self._finish()
+        conn = self.conn
+        conn._check()
+        if conn.isolation_level is not None and not conn.in_transaction and _is_dml(sql):
+            conn._begin()
+        self.stmnt = conn._prepare(sql)
+        self.sql = sql
+        if not self.stmnt:
+            # Empty statement (e.g. only a comment).
+            self.num_cols = 0
+            self.description = None
+            return self
         if params:
-            params = [quote(v) for v in params]
-            sql = sql % tuple(params)
-        print(sql)
-        b = bytearray(4)
-        s = sqlite3_prepare(self.h, sql, -1, b, None)
-        check_error(self.h, s)
-        self.stmnt = int.from_bytes(b, sys.byteorder)
-        # print("stmnt", self.stmnt)
+            try:
+                _bind(self.h, self.stmnt, params)
+            except:
+                self._finish()
+                raise
         self.num_cols = sqlite3_column_count(self.stmnt)
-        # print("num_cols", self.num_cols)
-        # If it's not select, actually execute it here
         # num_cols == 0 for statements which don't return data (=> modify it)
+        # so actually execute it here.
         if not self.num_cols:
-            v = self.fetchone()
-            assert v is None
+            self.description = None
+            s = sqlite3_step(self.stmnt)
+            if s != SQLITE_DONE:
+                self._fail(s)
+            self.rowcount = sqlite3_changes(self.h)
             self.lastrowid = sqlite3_last_insert_rowid(self.h)
+            self._finish()
+        else:
+            self.rowcount = -1
+            self.description = tuple(
+                (sqlite3_column_name(self.stmnt, i), None, None, None, None, None, None)
+                for i in range(self.num_cols)
+            )
+        return self
+
+    def executemany(self, sql, seq_of_params):
+        # The statement is prepared once and, unless a transaction is already
+        # open, all rows are written in a single transaction.  In autocommit
+        # mode that transaction is committed here, otherwise it is left open
+        # for commit().
+        self._finish()
+        conn = self.conn
+        stmt = conn._prepare(sql)
+        own_txn = not conn.in_transaction
+        if own_txn:
+            conn._begin()
+        rowcount = 0
+        try:
+            for params in seq_of_params:
+                _bind(self.h, stmt, params)
+                s = sqlite3_step(stmt)
+                if s != SQLITE_DONE:
+                    if s == SQLITE_ROW:
+                        raise Error("executemany() can only execute DML statements")
+                    raise Error(s, sqlite3_errmsg(self.h))
+                rowcount += sqlite3_changes(self.h)
+                sqlite3_reset(stmt)
+            if own_txn and conn.isolation_level is None:
+                conn.execute("COMMIT")
+        except:
+            if own_txn:
+                conn.rollback()
+            raise
+        finally:
+            conn._release(sql, stmt)
+        self.rowcount = rowcount
+        self.lastrowid = sqlite3_last_insert_rowid(self.h)
+        self.description = None
+        return self
 
     def close(self):
-        s = sqlite3_finalize(self.stmnt)
-        check_error(self.h, s)
+        self._finish()
 
     def make_row(self):
+        stmt = self.stmnt
         res = []
         for i in range(self.num_cols):
-            t = sqlite3_column_type(self.stmnt, i)
-            # print("type", t)
+            t = sqlite3_column_type(stmt, i)
             if t == SQLITE_INTEGER:
-                res.append(sqlite3_column_int(self.stmnt, i))
+                res.append(sqlite3_column_int64(stmt, i))
             elif t == SQLITE_FLOAT:
-                res.append(sqlite3_column_double(self.stmnt, i))
+                res.append(sqlite3_column_double(stmt, i))
             elif t == SQLITE_TEXT:
-                res.append(sqlite3_column_text(self.stmnt, i))
+                res.append(sqlite3_column_text(stmt, i))
+            elif t == SQLITE_BLOB:
+                n = sqlite3_column_bytes(stmt, i)
+                res.append(
+                    bytes(uctypes.bytearray_at(sqlite3_column_blob(stmt, i), n)) if n else b""
+                )
             else:
-                raise NotImplementedError
+                res.append(None)
         return tuple(res)
 
     def fetchone(self):
-        res = sqlite3_step(self.stmnt)
-        # print("step:", res)
-        if res == SQLITE_DONE:
+        if self.stmnt is None or not self.num_cols:
             return None
+        self.conn._check()
+        res = sqlite3_step(self.stmnt)
         if res == SQLITE_ROW:
             return self.make_row()
-        check_error(self.h, res)
+        if res == SQLITE_DONE:
+            self._finish()
+            return None
+        self._fail(res)
+
+    def fetchmany(self, size=None):
+        if size is None:
+            size = self.arraysize
+        rows = []
+        while len(rows) < size:
+            row = self.fetchone()
+            if row is None:
+                break
+            rows.append(row)
+        return rows
+
+    def fetchall(self):
+        rows = []
+        while True:
+            row = self.fetchone()
+            if row is None:
+                return rows
+            rows.append(row)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        row = self.fetchone()
+        if row is None:
+            raise StopIteration
+        return row
+
+
+def connect(fname, timeout=5.0, isolation_level=None, cached_statements=128, pragmas=None):
+    """Open the database ``fname``.
 
+    ``timeout`` is how long, in seconds, to wait for a lock held by another
+    connection before failing with SQLITE_BUSY.  ``pragmas`` is a dict of
+    PRAGMAs applied in order after opening, for example::
 
-def connect(fname):
-    b = bytearray(4)
-    sqlite3_open(fname, b)
+        connect("log.db", pragmas={"journal_mode": "WAL", "synchronous": "NORMAL"})
+    """
+    b = bytearray(_PTR_SIZE)
+    s = sqlite3_open(fname, b)
     h = int.from_bytes(b, sys.byteorder)
-    return Connections(h)
+    check_error(h, s)
+    if timeout:
+        sqlite3_busy_timeout(h, int(timeout * 1000))
+    conn = Connection(h, cached_statements, isolation_level)
+    if pragmas:
+        for name, value in pragmas.items():
+            conn.pragma(name, value)
+    return conn
 
 
 def quote(val):
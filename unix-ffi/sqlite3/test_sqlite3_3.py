@@ -0,0 +1,72 @@
+import sqlite3
+
+
+conn = sqlite3.connect(":memory:")
+
+cur = conn.cursor()
+cur.execute("CREATE TABLE foo(a int, b text, c blob, d real)")
+
+# Positional parameters, including values that quoting could not express.
+cur.execute("INSERT INTO foo VALUES (?, ?, ?, ?)", (1 << 40, "it's", b"\x00\xff", 1.5))
+assert cur.rowcount == 1
+assert cur.lastrowid == 1
+
+# Named parameters.
+cur.execute("INSERT INTO foo VALUES (:a, :b, NULL, NULL)", {"a": -1, "b": "x"})
+assert cur.lastrowid == 2
+
+cur.executemany("INSERT INTO foo(a) VALUES (?)", [(i,) for i in range(100)])
+assert cur.rowcount == 100
+
+cur.execute("SELECT * FROM foo WHERE a > ?", (1000,))
+assert cur.description[0][0] == "a"
+assert cur.fetchall() == [(1 << 40, "it's", b"\x00\xff", 1.5)]
+
+cur.execute("SELECT a, b, c FROM foo WHERE a = ?", (-1,))
+assert cur.fetchone() == (-1, "x", None)
+assert cur.fetchone() is None
+
+# The same statement text is served from the cache.
+for i in range(3):
+    row = conn.execute("SELECT count(*) FROM foo WHERE a < ?", (i,)).fetchone()
+assert row == (3,)
+
+cur = conn.execute("SELECT a FROM foo WHERE b IS NULL ORDER BY a")
+assert cur.fetchmany(2) == [(0,), (1,)]
+assert len(list(cur)) == 98
+
+# A failed batch is rolled back as a whole.
+conn.execute("CREATE TABLE uniq(a int UNIQUE)")
+try:
+    conn.executemany("INSERT INTO uniq VALUES (?)", [(1,), (2,), (1,)])
+    assert False
+except sqlite3.Error:
+    pass
+assert conn.execute("SELECT count(*) FROM uniq").fetchone() == (0,)
+
+# A cursor left open when the connection is closed does not touch its
+# (finalized) statement again.
+cur = conn.execute("SELECT a FROM foo")
+assert cur.fetchone() is not None
+
+conn.close()
+conn.close()
+
+for f in (
+    cur.fetchone,
+    cur.fetchall,
+    lambda: cur.execute("SELECT 1"),
+    lambda: conn.in_transaction,
+):
+    try:
+        f()
+        assert False
+    except sqlite3.ProgrammingError:
+        pass
+cur.close()
+
+try:
+    conn.execute("SELECT 1")
+    assert False
+except sqlite3.Error:
+    pass
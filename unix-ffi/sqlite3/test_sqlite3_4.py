@@ -0,0 +1,52 @@
+import os
+import sqlite3
+
+
+DB = "test_sqlite3_4.db"
+for f in (DB, DB + "-wal", DB + "-shm", DB + ".bak"):
+    try:
+        os.remove(f)
+    except OSError:
+        pass
+
+conn = sqlite3.connect(DB, pragmas={"journal_mode": "WAL", "synchronous": "NORMAL"})
+assert conn.pragma("journal_mode") == "wal"
+assert conn.pragma("synchronous") == 1
+conn.execute("CREATE TABLE t(a int)")
+
+# Transaction scoped to a with block.
+with conn:
+    assert conn.in_transaction
+    conn.execute("INSERT INTO t VALUES (1)")
+assert not conn.in_transaction
+
+try:
+    with conn:
+        conn.execute("INSERT INTO t VALUES (2)")
+        raise ValueError
+except ValueError:
+    pass
+assert conn.execute("SELECT count(*) FROM t").fetchone() == (1,)
+
+# Implicit transactions, committed explicitly.
+conn.isolation_level = ""
+conn.execute("INSERT INTO t VALUES (3)")
+assert conn.in_transaction
+conn.rollback()
+conn.executemany("INSERT INTO t VALUES (?)", [(4,), (5,)])
+assert conn.in_transaction
+conn.commit()
+assert not conn.in_transaction
+assert conn.execute("SELECT a FROM t ORDER BY a").fetchall() == [(1,), (4,), (5,)]
+
+# Online backup into a second database.
+steps = []
+dst = sqlite3.connect(DB + ".bak")
+conn.backup(dst, pages=1, progress=lambda s, remaining, total: steps.append(remaining))
+assert steps[-1] == 0
+assert dst.execute("SELECT count(*) FROM t").fetchone() == (3,)
+dst.close()
+conn.close()
+
+for f in (DB, DB + ".bak"):
+    os.remove(f)
@@ -1,4 +1,4 @@
-metadata(version="0.1.2")
+metadata(version="0.2.0")
 
 # Originally written by Paul Sokolovsky.
 
@@ -87,45 +87,83 @@ KEYMAP = {
 
 ALL_MOUSE_EVENTS = 0xFF
 
+# SGR sequence for each combination of attributes.
+_SGR = [
+    "\x1b[0%s%s%sm"
+    % (";1" if a & A_BOLD else "", ";4" if a & A_UNDERLINE else "", ";7" if a & A_REVERSE else "")
+    for a in range(8)
+]
+# Unchanged cells between two changes are rewritten rather than skipped
+# over if there are at most this many, as a cursor movement is longer.
+_GAP = 4
+
 
 def _wr(s):
     # TODO: When Python is 3.5, update this to use only bytes
     if isinstance(s, str):
         s = bytes(s, "utf-8")
-    os.write(1, s)
-
-
-def _move(row, col):
-    # TODO: When Python is 3.5, update this to use bytes
-    _wr("\x1b[%d;%dH" % (row + 1, col + 1))
-
-
-# Clear specified number of positions
-def _clear_num_pos(num):
-    if num > 0:
-        _wr("\x1b[%dX" % num)
-
-
-def _draw_box(left, top, width, height):
-    bottom = top + height - 1
-    _move(top, left)
-    _wr(ACS_ULCORNER)
-    hor = ACS_HLINE * (width - 2)
-    _wr(hor)
-    _wr(ACS_URCORNER)
-
-    _move(bottom, left)
-    _wr(ACS_LLCORNER)
-    _wr(hor)
-    _wr(ACS_LRCORNER)
-
-    top += 1
-    while top < bottom:
-        _move(top, left)
-        _wr(ACS_VLINE)
-        _move(top, left + width - 1)
-        _wr(ACS_VLINE)
-        top += 1
+    while s:
+        s = s[os.write(1, s) :]
+
+
+def _str(s):
+    if isinstance(s, int):
+        return chr(s)
+    if isinstance(s, bytes):
+        return str(s, "utf-8")
+    return s
+
+
+class _Screen:
+    # Rows of cells, as a list of characters and a bytearray of attributes
+    # per row. The screen grows to fit the windows refreshed onto it.
+    def __init__(self):
+        self.text = []
+        self.attr = []
+        self.cols = 0
+
+    def resize(self, lines, cols):
+        if cols > self.cols:
+            n = cols - self.cols
+            for r in range(len(self.text)):
+                self.text[r].extend([" "] * n)
+                self.attr[r].extend(bytearray(n))
+            self.cols = cols
+        while len(self.text) < lines:
+            self.text.append([" "] * self.cols)
+            self.attr.append(bytearray(self.cols))
+
+    def blank(self):
+        for r in range(len(self.text)):
+            self.text[r] = [" "] * self.cols
+            self.attr[r] = bytearray(self.cols)
+
+
+# The virtual screen, which windows are copied onto by noutrefresh(), and
+# the contents of the terminal as of the last doupdate(). A cell of the
+# latter holding None is in an unknown state.
+_newscr = _Screen()
+_curscr = _Screen()
+_cleared = False
+# Where doupdate() is to leave the terminal cursor, and where it is (None
+# if unknown).
+_cursor = (0, 0)
+_pos = None
+
+
+def _motion(y, x, row, col):
+    # Return the shortest sequence moving the cursor from (y, x) to
+    # (row, col). x is None if the column is unknown.
+    if x is not None:
+        if row == y:
+            if col == x:
+                return ""
+            if col > x:
+                return "\x1b[%dC" % (col - x)
+            return "\x1b[%dD" % (x - col)
+        if col == 0 and row == y + 1:
+            return "\r\n"
+    return "\x1b[%d;%dH" % (row + 1, col + 1)
 
 
 class error(Exception):
@@ -133,6 +171,8 @@ class error(Exception):
 
 
 class Window:
+    # Drawing goes to a buffer of cells; refresh() puts the changes on the
+    # terminal.
     def __init__(self, lines, cols, y, x):
         self.lines = lines
         self.cols = cols
@@ -142,28 +182,40 @@ class Window:
         self.keybuf = None
         self.keyi = 0
         self.keydelay = -1
-
-    def _goto(self, row, col):
-        _move(self.y + row, self.x + col)
+        self.text = [[" "] * cols for i in range(lines)]
+        self.attr = [bytearray(cols) for i in range(lines)]
+        # Rows changed since the last refresh.
+        self.touched = bytearray(lines)
+        self.cy = 0
+        self.cx = 0
+
+    def _put(self, y, x, s, attr):
+        # Store s at (y, x), clipped to the window.
+        s = _str(s)
+        if x < 0:
+            s = s[-x:]
+            x = 0
+        n = min(len(s), self.cols - x)
+        if 0 <= y < self.lines and n > 0:
+            self.text[y][x : x + n] = list(s[:n])
+            self.attr[y][x : x + n] = bytes((attr,)) * n
+            self.touched[y] = 1
+            x += n
+        self.cy = y
+        self.cx = x
 
     def move(self, y, x):
-        # Maybe need to cache coords?
-        self._goto(y, x)
+        self.cy = y
+        self.cx = x
 
     def getmaxyx(self):
         return (self.lines, self.cols)
 
     def addstr(self, y, x, str, attr=A_NORMAL):
-        self._goto(y, x)
         # TODO: Should be "ORed"
         if attr == A_NORMAL:
             attr = self.bkgattr
-        if attr != A_NORMAL:
-            _wr(ATTRMAP[attr])
-            _wr(str)
-            _wr(ATTRMAP[A_NORMAL])
-        else:
-            _wr(str)
+        self._put(y, x, str, attr)
 
     def addnstr(self, y, x, str, n, attr=A_NORMAL):
         self.addstr(y, x, str[:n], attr)
@@ -187,26 +239,55 @@ class Window:
 
     def erase(self):
         for i in range(self.lines):
-            self._goto(i, 0)
-            _clear_num_pos(self.cols)
+            self.text[i] = [" "] * self.cols
+            self.attr[i] = bytearray(self.cols)
+            self.touched[i] = 1
+        self.cy = self.cx = 0
 
     def border(self):
-        _draw_box(self.x, self.y, self.cols, self.lines)
+        hor = ACS_HLINE * (self.cols - 2)
+        bottom = self.lines - 1
+        self._put(0, 0, ACS_ULCORNER + hor + ACS_URCORNER, A_NORMAL)
+        self._put(bottom, 0, ACS_LLCORNER + hor + ACS_LRCORNER, A_NORMAL)
+        for i in range(1, bottom):
+            self._put(i, 0, ACS_VLINE, A_NORMAL)
+            self._put(i, self.cols - 1, ACS_VLINE, A_NORMAL)
 
     def hline(self, y, x, ch, n):
-        self.move(y, x)
-        _wr(ch * n)
+        self._put(y, x, _str(ch) * n, A_NORMAL)
 
     def vline(self, y, x, ch, n):
+        ch = _str(ch)
         for i in range(n):
-            self.move(y + i, x)
-            _wr(ch)
+            self._put(y + i, x, ch, A_NORMAL)
+
+    def noutrefresh(self):
+        # Copy the changed rows onto the virtual screen.
+        global _cursor
+        y = max(self.y, 0)
+        x = max(self.x, 0)
+        _newscr.resize(self.y + self.lines, self.x + self.cols)
+        skip = x - self.x
+        for i in range(y - self.y, self.lines):
+            if self.touched[i]:
+                _newscr.text[self.y + i][x : self.x + self.cols] = self.text[i][skip:]
+                _newscr.attr[self.y + i][x : self.x + self.cols] = self.attr[i][skip:]
+                self.touched[i] = 0
+        _cursor = (self.y + self.cy, self.x + self.cx)
 
     def refresh(self):
-        pass
+        self.noutrefresh()
+        doupdate()
 
     def redrawwin(self):
-        pass
+        # Rewrite the whole window on the next refresh, whatever the
+        # terminal is thought to show.
+        _curscr.resize(self.y + self.lines, self.x + self.cols)
+        x = max(self.x, 0)
+        for i in range(max(self.y, 0), self.y + self.lines):
+            _curscr.text[i][x : self.x + self.cols] = [None] * (self.x + self.cols - x)
+        for i in range(self.lines):
+            self.touched[i] = 1
 
     def keypad(self, yes):
         pass
@@ -221,6 +302,8 @@ class Window:
             self.keydelay = -1
 
     def getch(self):
+        if any(self.touched):
+            self.refresh()
         if self.keybuf and self.keyi < len(self.keybuf):
             c = self.keybuf[self.keyi]
             self.keyi += 1
@@ -272,12 +355,65 @@ def initscr():
 
 
 def doupdate():
-    pass
+    # Write the differences between the virtual screen and the terminal
+    # with a single write.
+    global _cleared, _pos
+    out = []
+    y, x = _pos or (-1, None)
+    if not _cleared:
+        out.append("\x1b[0m\x1b[H\x1b[2J")
+        _curscr.blank()
+        _cleared = True
+        y = x = 0
+    _curscr.resize(len(_newscr.text), _newscr.cols)
+    cols = _newscr.cols
+    a = A_NORMAL
+    for r in range(len(_newscr.text)):
+        nt = _newscr.text[r]
+        na = _newscr.attr[r]
+        ct = _curscr.text[r]
+        ca = _curscr.attr[r]
+        if nt == ct and na == ca:
+            continue
+        c = 0
+        while c < cols:
+            if nt[c] == ct[c] and na[c] == ca[c]:
+                c += 1
+                continue
+            # A run of changes, up to a gap of more than _GAP unchanged cells.
+            end = j = c + 1
+            while j < cols and j - end <= _GAP:
+                if nt[j] != ct[j] or na[j] != ca[j]:
+                    end = j + 1
+                j += 1
+            out.append(_motion(y, x, r, c))
+            while c < end:
+                if na[c] != a:
+                    a = na[c]
+                    out.append(_SGR[a])
+                k = c + 1
+                while k < end and na[k] == a:
+                    k += 1
+                out.append("".join(nt[c:k]))
+                c = k
+            y = r
+            # After the last column the terminal may be about to wrap.
+            x = end if end < cols else None
+        ct[:] = nt
+        ca[:] = na
+    if a != A_NORMAL:
+        out.append(_SGR[A_NORMAL])
+    out.append(_motion(y, x, _cursor[0], _cursor[1]))
+    _pos = _cursor
+    out = "".join(out)
+    if out:
+        _wr(out)
 
 
 def endwin():
-    global org_termios
+    global org_termios, _pos
     _wr(b"\r")
+    _pos = None
     termios.tcsetattr(0, termios.TCSANOW, org_termios)
 
 
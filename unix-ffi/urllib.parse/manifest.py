@@ -1,4 +1,4 @@
-metadata(version="0.5.2")
+metadata(version="0.5.4")
 
 require("re")
 require("collections")
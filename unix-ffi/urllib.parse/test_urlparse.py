@@ -912,6 +912,28 @@ class UrlParseTestCase(unittest.TestCase):
         self.assertEqual(p1.path, "863-1234")
         self.assertEqual(p1.params, "phone-context=+1-914-555")
 
+    def test_parse_cache(self):
+        urllib.parse.clear_cache()
+        url = "http://www.python.org/a;b?c#d"
+        p1 = urllib.parse.urlparse(url)
+        self.assertIs(urllib.parse.urlparse(url), p1)
+        for i in range(urllib.parse.MAX_CACHE_SIZE + 10):
+            urllib.parse.urlsplit("http://h/%d" % i)
+            self.assertTrue(len(urllib.parse._parse_cache) <= urllib.parse.MAX_CACHE_SIZE)
+        # The cache was emptied when it became full.
+        self.assertNotIn(("http://h/0", "", True), urllib.parse._parse_cache)
+        self.assertIn(("http://h/137", "", True), urllib.parse._parse_cache)
+        self.assertEqual(urllib.parse.urlsplit(url.encode()).path, b"/a;b")
+
+    def test_quote_tables(self):
+        self.assertEqual(urllib.parse.quote("a b/cé", safe="é"), "a%20b%2Fc%C3%A9")
+        self.assertEqual(urllib.parse.quote("abc/-_."), "abc/-_.")
+        self.assertEqual(urllib.parse.quote_plus("a b+c", safe=" "), "a+b%2Bc")
+        self.assertEqual(urllib.parse.quote_plus(b"a b+c", safe="+"), "a+b+c")
+        self.assertEqual(urllib.parse.urlencode({"a b": b"c&d", 1: 2.5}), "a+b=c%26d&1=2.5")
+        self.assertEqual(urllib.parse.unquote("a%2Fb%zzé%C3%A9"), "a/b%zzéé")
+        self.assertRaises(TypeError, urllib.parse.quote_plus, 5)
+
 
 def test_main():
     support.run_unittest(UrlParseTestCase)
@@ -159,15 +159,25 @@ uses_fragment = [
 # Characters valid in scheme names
 scheme_chars = "abcdefghijklmnopqrstuvwxyz" "ABCDEFGHIJKLMNOPQRSTUVWXYZ" "0123456789" "+-."
 
-# XXX: Consider replacing with functools.lru_cache
-MAX_CACHE_SIZE = 20
+# Results of urlsplit() and urlparse().  Plain dicts, emptied when full:
+# MicroPython's ordered dicts are searched linearly, which would make an LRU
+# slower than parsing again.
+MAX_CACHE_SIZE = 128
 _parse_cache = {}
+_parse6_cache = {}
 
 
 def clear_cache():
     """Clear the parse cache and the quoters cache."""
     _parse_cache.clear()
-    _safe_quoters.clear()
+    _parse6_cache.clear()
+    _quote_tables.clear()
+
+
+def _cache_put(cache, key, v):
+    if len(cache) >= MAX_CACHE_SIZE:  # avoid runaway growth
+        cache.clear()
+    cache[key] = v
 
 
 # Helpers for bytes handling
@@ -406,13 +416,18 @@ def urlparse(url, scheme="", allow_fragments=True):
     Note that we don't break the components up in smaller bits
     (e.g. netloc is a single string) and we don't expand % escapes."""
     url, scheme, _coerce_result = _coerce_args(url, scheme)
-    splitresult = urlsplit(url, scheme, allow_fragments)
-    scheme, netloc, url, query, fragment = splitresult
-    if scheme in uses_params and ";" in url:
-        url, params = _splitparams(url)
-    else:
-        params = ""
-    result = ParseResult(scheme, netloc, url, params, query, fragment)
+    allow_fragments = bool(allow_fragments)
+    key = url, scheme, allow_fragments
+    result = _parse6_cache.get(key)
+    if result is None:
+        splitresult = urlsplit(url, scheme, allow_fragments)
+        scheme, netloc, url, query, fragment = splitresult
+        if scheme in uses_params and ";" in url:
+            url, params = _splitparams(url)
+        else:
+            params = ""
+        result = ParseResult(scheme, netloc, url, params, query, fragment)
+        _cache_put(_parse6_cache, key, result)
     return _coerce_result(result)
 
 
@@ -443,12 +458,10 @@ def urlsplit(url, scheme="", allow_fragments=True):
     (e.g. netloc is a single string) and we don't expand % escapes."""
     url, scheme, _coerce_result = _coerce_args(url, scheme)
     allow_fragments = bool(allow_fragments)
-    key = url, scheme, allow_fragments, type(url), type(scheme)
-    cached = _parse_cache.get(key, None)
+    key = url, scheme, allow_fragments
+    cached = _parse_cache.get(key)
     if cached:
         return _coerce_result(cached)
-    if len(_parse_cache) >= MAX_CACHE_SIZE:  # avoid runaway growth
-        clear_cache()
     netloc = query = fragment = ""
     i = url.find(":")
     if i > 0:
@@ -464,7 +477,7 @@ def urlsplit(url, scheme="", allow_fragments=True):
             if "?" in url:
                 url, query = url.split("?", 1)
             v = SplitResult(scheme, netloc, url, query, fragment)
-            _parse_cache[key] = v
+            _cache_put(_parse_cache, key, v)
             return _coerce_result(v)
         for c in url[:i]:
             if c not in scheme_chars:
@@ -486,7 +499,7 @@ def urlsplit(url, scheme="", allow_fragments=True):
     if "?" in url:
         url, query = url.split("?", 1)
     v = SplitResult(scheme, netloc, url, query, fragment)
-    _parse_cache[key] = v
+    _cache_put(_parse_cache, key, v)
     return _coerce_result(v)
 
 
@@ -607,12 +620,13 @@ def unquote_to_bytes(string):
     res = [bits[0]]
     append = res.append
     for item in bits[1:]:
-        try:
-            append(_hextobyte[item[:2]])
-            append(item[2:])
-        except KeyError:
+        b = _hextobyte.get(item[:2])
+        if b is None:
             append(b"%")
             append(item)
+        else:
+            append(b)
+            append(item[2:])
     return b"".join(res)
 
 
@@ -636,6 +650,13 @@ def unquote(string, encoding="utf-8", errors="replace"):
         encoding = "utf-8"
     if errors is None:
         errors = "replace"
+    try:
+        bs = string.encode("utf-8")
+    except UnicodeError:
+        bs = None
+    if bs is not None and len(bs) == len(string):
+        # All ASCII, so there is just one run of escapes to decode.
+        return unquote_to_bytes(bs).decode(encoding, errors)
     bits = _asciire.split(string)
     res = [bits[0]]
     append = res.append
@@ -742,7 +763,48 @@ _ALWAYS_SAFE = frozenset(
     b"ABCDEFGHIJKLMNOPQRSTUVWXYZ" b"abcdefghijklmnopqrstuvwxyz" b"0123456789" b"_.-"
 )
 _ALWAYS_SAFE_BYTES = bytes(_ALWAYS_SAFE)
-_safe_quoters = {}
+_ALWAYS_SAFE_STR = _ALWAYS_SAFE_BYTES.decode()
+_quote_tables = {}
+
+
+def _quote_table(safe, plus=False):
+    # Return the safe characters for safe (a str or bytes) as str and bytes,
+    # and a table of the quoted form of each byte value; with plus, space
+    # is quoted as "+".
+    key = safe, plus
+    try:
+        return _quote_tables[key]
+    except KeyError:
+        pass
+    if isinstance(safe, str):
+        safe = safe.encode()
+    # Non-ASCII safe characters are ignored.
+    safe = bytes([c for c in safe if c < 128])
+    if plus:
+        safe = safe.replace(b" ", b"")
+    table = ["%{:02X}".format(c) for c in range(256)]
+    for c in _ALWAYS_SAFE_BYTES + safe:
+        table[c] = chr(c)
+    if plus:
+        table[32] = "+"
+    chars = _ALWAYS_SAFE_STR + safe.decode()
+    if len(_quote_tables) >= MAX_CACHE_SIZE:
+        _quote_tables.clear()
+    r = _quote_tables[key] = (chars, chars.encode(), table)
+    return r
+
+
+def _quote(string, quoting, encoding=None, errors=None):
+    # Quote string (a str or bytes) using a _quote_table() entry.
+    chars, bchars, table = quoting
+    if isinstance(string, str):
+        if not string.rstrip(chars):
+            # Nothing to quote, so no need to encode.
+            return string
+        string = string.encode(encoding or "utf-8", errors or "strict")
+    elif not string.rstrip(bchars):
+        return string.decode()
+    return "".join([table[c] for c in string])
 
 
 class Quoter(collections.defaultdict):
@@ -799,18 +861,11 @@ def quote(string, safe="/", encoding=None, errors=None):
     errors='strict' (unsupported characters raise a UnicodeEncodeError).
     """
     if isinstance(string, str):
-        if not string:
-            return string
-        if encoding is None:
-            encoding = "utf-8"
-        if errors is None:
-            errors = "strict"
-        string = string.encode(encoding, errors)
-    else:
-        if encoding is not None:
-            raise TypeError("quote() doesn't support 'encoding' for bytes")
-        if errors is not None:
-            raise TypeError("quote() doesn't support 'errors' for bytes")
+        return _quote(string, _quote_table(safe), encoding, errors)
+    if encoding is not None:
+        raise TypeError("quote() doesn't support 'encoding' for bytes")
+    if errors is not None:
+        raise TypeError("quote() doesn't support 'errors' for bytes")
     return quote_from_bytes(string, safe)
 
 
@@ -819,18 +874,14 @@ def quote_plus(string, safe="", encoding=None, errors=None):
     HTML form values. Plus signs in the original string are escaped unless
     they are included in safe. It also does not have safe default to '/'.
     """
-    # Check if ' ' in string, where string may either be a str or bytes.  If
-    # there are no spaces, the regular quote will produce the right answer.
-    if (isinstance(string, str) and " " not in string) or (
-        isinstance(string, bytes) and b" " not in string
-    ):
-        return quote(string, safe, encoding, errors)
-    if isinstance(safe, str):
-        space = " "
-    else:
-        space = b" "
-    string = quote(string, safe + space, encoding, errors)
-    return string.replace(" ", "+")
+    if not isinstance(string, str):
+        if not isinstance(string, (bytes, bytearray)):
+            raise TypeError("quote_from_bytes() expected bytes")
+        if encoding is not None:
+            raise TypeError("quote() doesn't support 'encoding' for bytes")
+        if errors is not None:
+            raise TypeError("quote() doesn't support 'errors' for bytes")
+    return _quote(string, _quote_table(safe, True), encoding, errors)
 
 
 def quote_from_bytes(bs, safe="/"):
@@ -840,20 +891,7 @@ def quote_from_bytes(bs, safe="/"):
     """
     if not isinstance(bs, (bytes, bytearray)):
         raise TypeError("quote_from_bytes() expected bytes")
-    if not bs:
-        return ""
-    if isinstance(safe, str):
-        # Normalize 'safe' by converting to bytes and removing non-ASCII chars
-        safe = safe.encode("ascii", "ignore")
-    else:
-        safe = bytes([c for c in safe if c < 128])
-    if not bs.rstrip(_ALWAYS_SAFE_BYTES + safe):
-        return bs.decode()
-    try:
-        quoter = _safe_quoters[safe]
-    except KeyError:
-        _safe_quoters[safe] = quoter = Quoter(safe).__getitem__
-    return "".join([quoter(char) for char in bs])
+    return _quote(bs, _quote_table(safe))
 
 
 def urlencode(query, doseq=False, safe="", encoding=None, errors=None):
@@ -891,31 +929,26 @@ def urlencode(query, doseq=False, safe="", encoding=None, errors=None):
                 "not a valid non-string sequence " "or mapping object"
             )  # .with_traceback(tb)
 
+    # As quote_plus(), with the table for safe looked up once.
+    quoting = _quote_table(safe, True)
     l = []
     if not doseq:
         for k, v in query:
-            if isinstance(k, bytes):
-                k = quote_plus(k, safe)
-            else:
-                k = quote_plus(str(k), safe, encoding, errors)
-
-            if isinstance(v, bytes):
-                v = quote_plus(v, safe)
-            else:
-                v = quote_plus(str(v), safe, encoding, errors)
-            l.append(k + "=" + v)
+            if not isinstance(k, bytes):
+                k = str(k)
+            if not isinstance(v, bytes):
+                v = str(v)
+            l.append(
+                _quote(k, quoting, encoding, errors) + "=" + _quote(v, quoting, encoding, errors)
+            )
     else:
         for k, v in query:
-            if isinstance(k, bytes):
-                k = quote_plus(k, safe)
-            else:
-                k = quote_plus(str(k), safe, encoding, errors)
+            if not isinstance(k, bytes):
+                k = str(k)
+            k = _quote(k, quoting, encoding, errors)
 
-            if isinstance(v, bytes):
-                v = quote_plus(v, safe)
-                l.append(k + "=" + v)
-            elif isinstance(v, str):
-                v = quote_plus(v, safe, encoding, errors)
+            if isinstance(v, (bytes, str)):
+                v = _quote(v, quoting, encoding, errors)
                 l.append(k + "=" + v)
             else:
                 try:
@@ -923,16 +956,14 @@ def urlencode(query, doseq=False, safe="", encoding=None, errors=None):
                     x = len(v)
                 except TypeError:
                     # not a sequence
-                    v = quote_plus(str(v), safe, encoding, errors)
+                    v = _quote(str(v), quoting, encoding, errors)
                     l.append(k + "=" + v)
                 else:
                     # loop over the sequence
                     for elt in v:
-                        if isinstance(elt, bytes):
-                            elt = quote_plus(elt, safe)
-                        else:
-                            elt = quote_plus(str(elt), safe, encoding, errors)
-                        l.append(k + "=" + elt)
+                        if not isinstance(elt, bytes):
+                            elt = str(elt)
+                        l.append(k + "=" + _quote(elt, quoting, encoding, errors))
     return "&".join(l)
 
 